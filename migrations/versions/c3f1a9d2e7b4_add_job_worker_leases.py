@@ -0,0 +1,37 @@
+"""add_job_worker_leases
+
+Revision ID: c3f1a9d2e7b4
+Revises: 114ec95d9e6a
+Create Date: 2026-10-16 10:12:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c3f1a9d2e7b4"
+down_revision: str | None = "114ec95d9e6a"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add worker lease columns used by SKIP LOCKED job claiming."""
+    op.add_column("jobs", sa.Column("worker_id", sa.String(length=100), nullable=True))
+    op.add_column(
+        "jobs",
+        sa.Column("lease_expires_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index(
+        op.f("ix_jobs_lease_expires_at"), "jobs", ["lease_expires_at"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Remove worker lease columns."""
+    op.drop_index(op.f("ix_jobs_lease_expires_at"), table_name="jobs")
+    op.drop_column("jobs", "lease_expires_at")
+    op.drop_column("jobs", "worker_id")
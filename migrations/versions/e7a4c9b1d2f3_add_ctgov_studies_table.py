@@ -0,0 +1,73 @@
+"""add_ctgov_studies_table
+
+Revision ID: e7a4c9b1d2f3
+Revises: d5e8b2c4a1f6
+Create Date: 2026-10-16 13:20:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "e7a4c9b1d2f3"
+down_revision: str | None = "d5e8b2c4a1f6"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+INDEXED_COLUMNS = (
+    "phase",
+    "status",
+    "sponsor_class",
+    "last_update_posted_date",
+    "investment_score",
+    "fetched_at",
+)
+
+
+def upgrade() -> None:
+    """Add ctgov_studies table for locally persisted ClinicalTrials.gov studies."""
+    op.create_table(
+        "ctgov_studies",
+        sa.Column("nct_id", sa.String(length=20), nullable=False),
+        sa.Column("title", sa.Text(), nullable=True),
+        sa.Column("phase", sa.String(length=50), nullable=True),
+        sa.Column("status", sa.String(length=50), nullable=True),
+        sa.Column("study_type", sa.String(length=50), nullable=True),
+        sa.Column("sponsor_name", sa.Text(), nullable=True),
+        sa.Column("sponsor_class", sa.String(length=50), nullable=True),
+        sa.Column("enrollment_count", sa.Integer(), nullable=True),
+        sa.Column("start_date", sa.Date(), nullable=True),
+        sa.Column("primary_completion_date", sa.Date(), nullable=True),
+        sa.Column("completion_date", sa.Date(), nullable=True),
+        sa.Column("last_update_posted_date", sa.Date(), nullable=True),
+        sa.Column("conditions", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column(
+            "interventions", postgresql.JSONB(astext_type=sa.Text()), nullable=True
+        ),
+        sa.Column("investment_score", sa.Float(), nullable=True),
+        sa.Column("has_results", sa.Boolean(), nullable=False),
+        sa.Column("raw", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("content_hash", sa.String(length=64), nullable=False),
+        sa.Column("fetched_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("nct_id"),
+    )
+    for column in INDEXED_COLUMNS:
+        op.create_index(
+            op.f(f"ix_ctgov_studies_{column}"),
+            "ctgov_studies",
+            [column],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    """Remove ctgov_studies table."""
+    for column in INDEXED_COLUMNS:
+        op.drop_index(op.f(f"ix_ctgov_studies_{column}"), table_name="ctgov_studies")
+    op.drop_table("ctgov_studies")
@@ -16,7 +16,22 @@ from typing import Any
 import psutil
 
 from bio_mcp.models.document import Document
-from bio_mcp.services.chunking import AbstractChunker, ChunkingConfig
+from bio_mcp.services.chunking import AbstractChunker, BaseTokenizer, ChunkingConfig
+
+
+class CountingTokenizer(BaseTokenizer):
+    """Wrap a tokenizer to count how many texts chunking tokenizes."""
+
+    def __init__(self, tokenizer: BaseTokenizer):
+        self.tokenizer = tokenizer
+        self.calls = 0
+
+    def count_tokens(self, text: str) -> int:
+        self.calls += 1
+        return self.tokenizer.count_tokens(text)
+
+    def get_identifier(self) -> str:
+        return self.tokenizer.get_identifier()
 
 
 def generate_synthetic_documents(count: int, size: str = "medium") -> list[Document]:
@@ -76,6 +91,8 @@ def benchmark_chunking_speed(
     """Benchmark chunking speed with multiple iterations."""
 
     chunker = AbstractChunker(config)
+    tokenizer = CountingTokenizer(chunker.tokenizer)
+    chunker.tokenizer = tokenizer
     times = []
     chunk_counts = []
 
@@ -83,6 +100,7 @@ def benchmark_chunking_speed(
 
     for i in range(iterations):
         gc.collect()  # Clear memory before each run
+        tokenizer.calls = 0
         start_memory = measure_memory_usage()
         start_time = time.perf_counter()
 
@@ -99,7 +117,7 @@ def benchmark_chunking_speed(
         chunk_counts.append(total_chunks)
 
         print(
-            f"      Iteration {i + 1}: {elapsed:.3f}s, {total_chunks} chunks, {end_memory - start_memory:.1f}MB memory delta"
+            f"      Iteration {i + 1}: {elapsed:.3f}s, {total_chunks} chunks, {tokenizer.calls} tokenizer calls, {end_memory - start_memory:.1f}MB memory delta"
         )
 
     return {
@@ -113,6 +131,7 @@ def benchmark_chunking_speed(
         "total_chunks": mean(chunk_counts),
         "docs_per_second": len(documents) / mean(times),
         "chunks_per_second": mean(chunk_counts) / mean(times),
+        "tokenizer_calls_per_chunk": tokenizer.calls / max(1, chunk_counts[-1]),
     }
 
 
@@ -136,6 +155,9 @@ def benchmark_scalability(iterations: int = 3) -> dict[str, Any]:
         print(f"      ⏱️  Avg time: {benchmark_result['avg_time']:.3f}s")
         print(f"      📊 Docs/sec: {benchmark_result['docs_per_second']:.1f}")
         print(f"      🧩 Chunks/sec: {benchmark_result['chunks_per_second']:.1f}")
+        print(
+            f"      🔢 Tokenizer calls/chunk: {benchmark_result['tokenizer_calls_per_chunk']:.1f}"
+        )
 
     return results
 
@@ -167,6 +189,9 @@ def benchmark_document_sizes(iterations: int = 3) -> dict[str, Any]:
         print(f"      ⏱️  Avg time: {benchmark_result['avg_time']:.3f}s")
         print(f"      📏 Avg chars: {avg_doc_chars:.0f}")
         print(f"      📊 Chars/sec: {results[size]['chars_per_second']:.0f}")
+        print(
+            f"      🔢 Tokenizer calls/chunk: {benchmark_result['tokenizer_calls_per_chunk']:.1f}"
+        )
 
     return results
 
@@ -103,6 +103,29 @@ class DocumentChunkBenchmark:
             "docs_per_sec": len(documents) / total_time,
         }
 
+    async def benchmark_bulk_storage(self, documents):
+        """Benchmark batched storage of the same documents."""
+        print(f"\n📦 Benchmarking bulk storage of {len(documents)} documents...")
+
+        start_time = time.time()
+        results = await self.service.store_documents_chunks(
+            documents, quality_scores={doc.uid: 0.8 for doc in documents}
+        )
+        total_time = time.time() - start_time
+
+        total_chunks = sum(len(r.chunk_uuids) for r in results)
+        failed = sum(1 for r in results if not r.success)
+        print(f"  {total_chunks} chunks in {total_time:.3f}s ({failed} failed docs)")
+
+        return {
+            "documents": len(documents),
+            "chunks": total_chunks,
+            "failed_documents": failed,
+            "total_time": total_time,
+            "chunks_per_sec": total_chunks / total_time,
+            "docs_per_sec": len(documents) / total_time,
+        }
+
     async def benchmark_search(self, queries):
         """Benchmark search performance."""
         print(f"\n🔍 Benchmarking {len(queries)} search queries...")
@@ -138,6 +161,7 @@ class DocumentChunkBenchmark:
 
             # Storage benchmark
             storage_results = await self.benchmark_storage(documents)
+            bulk_results = await self.benchmark_bulk_storage(documents)
 
             # Search benchmark
             queries = [
@@ -155,6 +179,7 @@ class DocumentChunkBenchmark:
             print("=" * 50)
             print(f"Model: {self.config.openai_embedding_model}")
             print(f"Storage: {storage_results['chunks_per_sec']:.1f} chunks/sec")
+            print(f"Bulk storage: {bulk_results['chunks_per_sec']:.1f} chunks/sec")
             print(f"Search: {search_results['queries_per_sec']:.1f} queries/sec")
             print(f"Total chunks: {storage_results['chunks']}")
 
@@ -163,6 +188,7 @@ class DocumentChunkBenchmark:
                 "timestamp": datetime.now().isoformat(),
                 "model": self.config.openai_embedding_model,
                 "storage": storage_results,
+                "bulk_storage": bulk_results,
                 "search": search_results,
             }
 
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Benchmark PubMed EFetch XML parsing.
+
+Compares the xmltodict-based parser against the streaming iterparse parser on
+recorded EFetch fixtures, reporting parse time and peak memory.
+"""
+
+import argparse
+import re
+import time
+import tracemalloc
+from pathlib import Path
+from statistics import mean
+from typing import Any
+
+import xmltodict
+
+from bio_mcp.sources.pubmed.client import parse_efetch_response
+from bio_mcp.sources.pubmed.parser import PARSER_BACKEND, parse_efetch_xml
+
+FIXTURE_DIR = Path(__file__).parent.parent / "tests" / "fixtures" / "pubmed"
+ARTICLE_RE = re.compile(rb"<PubmedArticle>.*?</PubmedArticle>", re.DOTALL)
+CHUNK_SIZE = 64 * 1024
+
+
+def load_fixture_articles() -> list[bytes]:
+    """Collect the <PubmedArticle> records from every recorded fixture."""
+    articles = []
+    for path in sorted(FIXTURE_DIR.glob("*.xml")):
+        articles.extend(ARTICLE_RE.findall(path.read_bytes()))
+    return articles
+
+
+def build_payload(articles: list[bytes], count: int) -> bytes:
+    """Build an EFetch response with ``count`` articles by cycling the fixtures."""
+    records = [articles[i % len(articles)] for i in range(count)]
+    return (
+        b'<?xml version="1.0" ?>\n<PubmedArticleSet>\n'
+        + b"\n".join(records)
+        + b"\n</PubmedArticleSet>\n"
+    )
+
+
+def parse_with_xmltodict(payload: bytes) -> int:
+    return len(parse_efetch_response(xmltodict.parse(payload)))
+
+
+def parse_streaming(payload: bytes) -> int:
+    # Feed in HTTP-sized chunks, as PubMedClient does
+    chunks = (payload[i : i + CHUNK_SIZE] for i in range(0, len(payload), CHUNK_SIZE))
+    return len(parse_efetch_xml(chunks))
+
+
+def measure(parse, payload: bytes, iterations: int) -> dict[str, Any]:
+    """Time ``parse`` over several runs and record peak traced memory once."""
+    parse(payload)  # warmup
+
+    times = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        parsed = parse(payload)
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    parse(payload)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "articles": parsed,
+        "mean_time": mean(times),
+        "min_time": min(times),
+        "articles_per_sec": parsed / mean(times),
+        "peak_memory_mb": peak / 1024 / 1024,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark PubMed EFetch parsing")
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[200, 1000, 5000],
+        help="Articles per simulated EFetch response",
+    )
+    parser.add_argument("--iterations", type=int, default=5)
+    args = parser.parse_args()
+
+    articles = load_fixture_articles()
+    if not articles:
+        raise SystemExit(f"No EFetch fixtures found in {FIXTURE_DIR}")
+
+    print(f"📄 {len(articles)} recorded articles, streaming backend: {PARSER_BACKEND}")
+    print(f"{'articles':>9} {'parser':>10} {'mean s':>9} {'art/s':>10} {'peak MB':>9}")
+
+    for size in args.sizes:
+        payload = build_payload(articles, size)
+        for name, parse in (
+            ("xmltodict", parse_with_xmltodict),
+            ("streaming", parse_streaming),
+        ):
+            result = measure(parse, payload, args.iterations)
+            print(
+                f"{size:>9} {name:>10} {result['mean_time']:>9.4f} "
+                f"{result['articles_per_sec']:>10.0f} {result['peak_memory_mb']:>9.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
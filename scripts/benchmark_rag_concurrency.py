@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Benchmark rag.search latency under parallel load.
+
+Compares blocking Weaviate queries on the event loop (the old synchronous
+client) against the async client used by DocumentChunkService. Reports p50/p99
+request latency and the worst event-loop stall observed by a heartbeat task.
+
+By default the Weaviate round trip is simulated with a fixed delay, so the
+benchmark runs anywhere. Pass --live to query the configured Weaviate instead.
+"""
+
+import argparse
+import asyncio
+import time
+from statistics import quantiles
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+from bio_mcp.services.document_chunk_service import DocumentChunkService
+
+
+def percentile(samples: list[float], pct: int) -> float:
+    return quantiles(samples, n=100, method="inclusive")[pct - 1]
+
+
+def simulated_service(blocking: bool, delay: float) -> DocumentChunkService:
+    """Service whose hybrid query takes ``delay`` seconds (blocking or not)."""
+    # Searches never chunk, so skip the OpenAI-backed tokenizer
+    with patch("bio_mcp.services.document_chunk_service.AbstractChunker"):
+        service = DocumentChunkService()
+
+    def response() -> Any:
+        item = MagicMock(properties={"section": "Results", "year": 2024})
+        item.metadata.score = 0.5
+        item.uuid = "00000000-0000-0000-0000-000000000000"
+        return MagicMock(objects=[item])
+
+    async def hybrid(**kwargs):
+        if blocking:
+            time.sleep(delay)  # What the sync client did inside async def
+        else:
+            await asyncio.sleep(delay)
+        return response()
+
+    collection = MagicMock()
+    collection.query.hybrid = hybrid
+    service.weaviate_client = MagicMock()
+    service.weaviate_client.async_client.collections.get.return_value = collection
+    service._initialized = True
+    return service
+
+
+async def live_blocking_search(service: DocumentChunkService, query: str) -> Any:
+    """Old code path: sync client query directly on the event loop."""
+    collection = service.weaviate_client.client.collections.get(service.collection_name)
+    return collection.query.hybrid(query=query, limit=10)
+
+
+async def run_load(search, rate: float, requests: int) -> dict[str, float]:
+    """Issue ``requests`` searches arriving at ``rate`` per second (open loop)."""
+    latencies: list[float] = []
+    max_stall = 0.0
+    done = asyncio.Event()
+
+    async def heartbeat() -> None:
+        nonlocal max_stall
+        interval = 0.005
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(interval)
+            max_stall = max(max_stall, time.perf_counter() - start - interval)
+
+    t0 = time.perf_counter()
+
+    async def one(i: int) -> None:
+        # Latency is measured from the scheduled arrival, so it includes time
+        # spent waiting for a loop blocked by someone else's query
+        arrival = t0 + i / rate
+        await asyncio.sleep(max(0.0, arrival - time.perf_counter()))
+        await search(f"metformin diabetes {i}")
+        latencies.append(time.perf_counter() - arrival)
+
+    monitor = asyncio.create_task(heartbeat())
+    await asyncio.gather(*[one(i) for i in range(requests)])
+    wall = time.perf_counter() - t0
+    done.set()
+    await monitor
+
+    return {
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "max_loop_stall_ms": max_stall * 1000,
+        "throughput_rps": requests / wall,
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rate", type=float, default=100.0, help="Requests/second")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument(
+        "--delay-ms", type=float, default=40.0, help="Simulated query latency"
+    )
+    parser.add_argument(
+        "--live", action="store_true", help="Query the configured Weaviate"
+    )
+    args = parser.parse_args()
+
+    if args.live:
+        service = DocumentChunkService()
+        await service.connect()
+        variants = {
+            "blocking (sync client)": lambda q: live_blocking_search(service, q),
+            "async client": lambda q: service.search_chunks(q, limit=10),
+        }
+    else:
+        delay = args.delay_ms / 1000
+        blocking = simulated_service(True, delay)
+        non_blocking = simulated_service(False, delay)
+        variants = {
+            "blocking (sync client)": lambda q: blocking.search_chunks(q),
+            "async client": lambda q: non_blocking.search_chunks(q),
+        }
+
+    print(
+        f"{args.requests} rag.search requests at {args.rate:.0f} req/s"
+        f"{' (live)' if args.live else f', {args.delay_ms:.0f} ms simulated'}"
+    )
+    for name, search in variants.items():
+        stats = await run_load(search, args.rate, args.requests)
+        print(
+            f"{name:<24} p50 {stats['p50_ms']:8.1f} ms  p99 {stats['p99_ms']:8.1f} ms"
+            f"  max loop stall {stats['max_loop_stall_ms']:7.1f} ms"
+            f"  {stats['throughput_rps']:7.1f} req/s"
+        )
+
+    if args.live:
+        await service.disconnect()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
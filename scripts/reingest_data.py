@@ -26,9 +26,12 @@ def cli():
 @click.option("--since-days", type=int, help="Process documents from N days ago")
 @click.option("--pmids", help="Comma-separated list of PMIDs to process")
 @click.option("--dry-run", is_flag=True, help="Validate without storing")
+@click.option(
+    "--force", is_flag=True, help="Re-process documents even if already current"
+)
 @click.option("--batch-size", type=int, default=100, help="Batch size for processing")
 @click.option("--concurrency", type=int, default=10, help="Max concurrent operations")
-def start(mode, source, since_days, pmids, dry_run, batch_size, concurrency):
+def start(mode, source, since_days, pmids, dry_run, force, batch_size, concurrency):
     """Start a re-ingestion job."""
 
     async def _start():
@@ -56,6 +59,7 @@ def start(mode, source, since_days, pmids, dry_run, batch_size, concurrency):
                 date_filter=date_filter,
                 pmid_list=pmid_list,
                 dry_run=dry_run,
+                force=force,
             )
 
             click.echo(f"Started re-ingestion job: {job_id}")
@@ -67,7 +71,9 @@ def start(mode, source, since_days, pmids, dry_run, batch_size, concurrency):
                 click.echo("\nJob completed!")
                 click.echo(f"Documents processed: {result['documents_processed']}")
                 click.echo(f"Documents failed: {result['documents_failed']}")
+                click.echo(f"Documents unchanged: {result['documents_skipped']}")
                 click.echo(f"Chunks created: {result['chunks_created']}")
+                click.echo(f"Chunks deleted: {result['chunks_deleted']}")
                 click.echo(f"Success rate: {result['success_rate']:.1%}")
                 click.echo(f"Processing rate: {result['docs_per_minute']:.1f} docs/min")
 
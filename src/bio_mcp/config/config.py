@@ -57,28 +57,56 @@ class Config:
 
     # Weaviate (defaults to local for Phase 1A)
     weaviate_url: str = "http://localhost:8080"
+    weaviate_grpc_port: int = 50051
 
     # OpenAI Embedding Configuration
     openai_embedding_model: str = "text-embedding-3-small"
     openai_embedding_dimensions: int | None = 1536
+    # Process-wide OpenAI request budget shared by RAG search and query parsing
+    openai_rate_limit: float = 5.0
+    openai_rate_burst: int = 10
+    # Local SQLite file caching chunk vectors by content hash (None = disabled)
+    embedding_cache_path: str | None = None
 
     # Legacy - kept for backward compatibility during migration
     biobert_model_name: str = "pritamdeka/BioBERT-mnli-snli-scinli-scitail-mednli-stsb"
     biobert_max_tokens: int = 512
 
+    # Raw document archive behind s3_raw_uri (None = disabled). Sealed segments
+    # go to the S3 bucket when one is set; the endpoint can point at MinIO.
+    raw_archive_path: str | None = None
+    raw_archive_segment_mb: int = 256
+    raw_archive_s3_bucket: str | None = None
+    raw_archive_s3_prefix: str = "raw/"
+    raw_archive_s3_endpoint: str | None = None
+
     # Collection Configuration
     weaviate_collection_v2: str = "DocumentChunk_v2"
 
+    # Weaviate batch ingestion (batch size 0 = let the client size batches dynamically)
+    weaviate_batch_size: int = 200
+    weaviate_batch_concurrency: int = 2
+
+    # Reconstructed documents kept for rag.get / rag.get_many (0 = disabled)
+    document_cache_size: int = 1024
+    document_cache_ttl: int = 3600
+
+    # /v1/mcp/invoke idempotency (memory = single node, database = shared)
+    idempotency_backend: str = "memory"
+    idempotency_ttl_seconds: int = 86400
+
     # Model configuration
     uuid_namespace: uuid.UUID = None  # Set in __post_init__
     document_schema_version: int = 1
-    chunker_version: str = "v1.2.0"
+    chunker_version: str = "v1.3.0"
 
     # Chunking configuration
     chunker_target_tokens: int = 325
     chunker_max_tokens: int = 450
     chunker_min_tokens: int = 120
     chunker_overlap_tokens: int = 50
+    # Worker processes for batch chunking (1 = chunk in the calling process)
+    chunker_workers: int = 1
 
     # Search boosting configuration
     boost_results_section: str = "0.15"
@@ -109,6 +137,7 @@ class Config:
             or os.getenv("BIO_MCP_OPENAI_API_KEY"),
             database_url=os.getenv("BIO_MCP_DATABASE_URL", "sqlite:///:memory:"),
             weaviate_url=os.getenv("BIO_MCP_WEAVIATE_URL", "http://localhost:8080"),
+            weaviate_grpc_port=int(os.getenv("BIO_MCP_WEAVIATE_GRPC_PORT", "50051")),
             # OpenAI Embedding Configuration
             openai_embedding_model=os.getenv(
                 "OPENAI_EMBEDDING_MODEL", "text-embedding-3-small"
@@ -118,16 +147,36 @@ class Config:
             )
             if os.getenv("OPENAI_EMBEDDING_DIMENSIONS")
             else None,
+            embedding_cache_path=os.getenv("BIO_MCP_EMBEDDING_CACHE_PATH"),
+            openai_rate_limit=float(os.getenv("BIO_MCP_OPENAI_RATE_LIMIT", "5.0")),
+            openai_rate_burst=int(os.getenv("BIO_MCP_OPENAI_RATE_BURST", "10")),
             # Legacy BioBERT Configuration (backward compatibility)
             biobert_model_name=os.getenv(
                 "BIO_MCP_EMBED_MODEL",
                 "pritamdeka/BioBERT-mnli-snli-scinli-scitail-mednli-stsb",
             ),
             biobert_max_tokens=int(os.getenv("BIO_MCP_EMBED_MAX_TOKENS", "512")),
+            raw_archive_path=os.getenv("BIO_MCP_RAW_ARCHIVE_PATH"),
+            raw_archive_segment_mb=int(
+                os.getenv("BIO_MCP_RAW_ARCHIVE_SEGMENT_MB", "256")
+            ),
+            raw_archive_s3_bucket=os.getenv("BIO_MCP_RAW_ARCHIVE_S3_BUCKET"),
+            raw_archive_s3_prefix=os.getenv("BIO_MCP_RAW_ARCHIVE_S3_PREFIX", "raw/"),
+            raw_archive_s3_endpoint=os.getenv("BIO_MCP_RAW_ARCHIVE_S3_ENDPOINT"),
             # Collection Configuration
             weaviate_collection_v2=os.getenv(
                 "BIO_MCP_WEAVIATE_COLLECTION_V2", "DocumentChunk_v2"
             ),
+            weaviate_batch_size=int(os.getenv("BIO_MCP_WEAVIATE_BATCH_SIZE", "200")),
+            weaviate_batch_concurrency=int(
+                os.getenv("BIO_MCP_WEAVIATE_BATCH_CONCURRENCY", "2")
+            ),
+            document_cache_size=int(os.getenv("BIO_MCP_DOCUMENT_CACHE_SIZE", "1024")),
+            document_cache_ttl=int(os.getenv("BIO_MCP_DOCUMENT_CACHE_TTL", "3600")),
+            idempotency_backend=os.getenv("BIO_MCP_IDEMPOTENCY_BACKEND", "memory"),
+            idempotency_ttl_seconds=int(
+                os.getenv("BIO_MCP_IDEMPOTENCY_TTL_SECONDS", "86400")
+            ),
             # Chunking configuration
             chunker_target_tokens=int(
                 os.getenv("BIO_MCP_CHUNKER_TARGET_TOKENS", "325")
@@ -137,6 +186,7 @@ class Config:
             chunker_overlap_tokens=int(
                 os.getenv("BIO_MCP_CHUNKER_OVERLAP_TOKENS", "50")
             ),
+            chunker_workers=int(os.getenv("BIO_MCP_CHUNKER_WORKERS", "1")),
             # Search boosting configuration
             boost_results_section=os.getenv("BIO_MCP_BOOST_RESULTS_SECTION", "0.15"),
             boost_conclusions_section=os.getenv(
@@ -167,8 +217,8 @@ class Config:
             self.document_schema_version = int(
                 os.getenv("BIO_MCP_DOCUMENT_SCHEMA_VERSION", "1")
             )
-        if not hasattr(self, "chunker_version") or self.chunker_version == "v1.2.0":
-            self.chunker_version = os.getenv("BIO_MCP_CHUNKER_VERSION", "v1.2.0")
+        if not hasattr(self, "chunker_version") or self.chunker_version == "v1.3.0":
+            self.chunker_version = os.getenv("BIO_MCP_CHUNKER_VERSION", "v1.3.0")
 
         # Initialize orchestrator config lazily to avoid circular imports
         # Note: orchestrator field will be None until explicitly requested via get_orchestrator_config()
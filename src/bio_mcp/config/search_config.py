@@ -15,6 +15,9 @@ class SearchConfig:
     MIN_TOP_K: int = 1
     MAX_TOP_K: int = 50
 
+    # rag.get_many batch limit
+    RAG_GET_MANY_MAX_IDS: int = 100
+
     # PubMed search limits
     PUBMED_DEFAULT_LIMIT: int = 10
     PUBMED_MIN_LIMIT: int = 1
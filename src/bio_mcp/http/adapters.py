@@ -1,12 +1,16 @@
 """Async-safe tool adapter for HTTP endpoints."""
 
 import inspect
+import time
 from collections.abc import Callable
 from typing import Any
 from unittest.mock import AsyncMock
 
 import anyio
 
+from bio_mcp.http.errors import classify_exception
+from bio_mcp.http.observability.metrics import get_global_collector
+
 
 def is_async_callable(func: Callable) -> bool:
     """Check if a callable is async (coroutine function or async mock).
@@ -48,3 +52,28 @@ async def invoke_tool_safely(
     else:
         # Sync tool - run in thread pool to avoid blocking
         return await anyio.to_thread.run_sync(tool_func, tool_name, params)
+
+
+async def invoke_tool_observed(
+    tool_func: Callable, tool_name: str, params: dict[str, Any], trace_id: str
+) -> Any:
+    """Invoke a tool via ``invoke_tool_safely``, recording it in the metrics.
+
+    Counts the request by status and errors by error code, tracks in-flight
+    invocations and records the latency histogram for ``tool_name``.
+    """
+    collector = get_global_collector()
+    collector.increment_inflight(tool_name)
+    start = time.perf_counter()
+    try:
+        result = await invoke_tool_safely(tool_func, tool_name, params, trace_id)
+    except Exception as e:
+        collector.increment_request(tool_name, "error")
+        collector.increment_error(tool_name, classify_exception(e, tool_name).value)
+        raise
+    else:
+        collector.increment_request(tool_name, "success")
+        return result
+    finally:
+        collector.record_latency(tool_name, (time.perf_counter() - start) * 1000)
+        collector.decrement_inflight(tool_name)
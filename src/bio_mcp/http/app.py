@@ -1,19 +1,43 @@
 """FastAPI application for Bio-MCP HTTP adapter."""
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any
 
 from fastapi import FastAPI, HTTPException, status
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, JSONResponse, PlainTextResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 
-from bio_mcp.http.adapters import invoke_tool_safely
-from bio_mcp.http.errors import ErrorCode, classify_exception, create_error_envelope
+from bio_mcp.http.adapters import invoke_tool_observed
+from bio_mcp.http.errors import (
+    ErrorCode,
+    classify_exception,
+    create_error_envelope,
+    is_error_result,
+)
+from bio_mcp.http.idempotency import (
+    IDEMPOTENT_REPLAY_HEADER,
+    IdempotencyError,
+    IdempotencyKeyReuseError,
+    IdempotencyManager,
+    build_idempotency_manager,
+)
 from bio_mcp.http.jobs.api import create_job_router
+from bio_mcp.http.jobs.notify import get_job_notifier
 from bio_mcp.http.jobs.service import JobService
 from bio_mcp.http.jobs.storage import SQLAlchemyJobRepository
-from bio_mcp.http.lifecycle import check_readiness, get_health_status
+from bio_mcp.http.lifecycle import (
+    check_readiness,
+    get_health_status,
+    shutdown,
+    startup,
+)
+from bio_mcp.http.observability.metrics import (
+    PrometheusExporter,
+    get_global_collector,
+)
 from bio_mcp.http.registry import ToolRegistry, build_registry
 from bio_mcp.http.tracing import TraceContext, generate_trace_id
 from bio_mcp.shared.clients.database import get_database_manager
@@ -75,16 +99,31 @@ def create_error_response(
     )
 
 
-def create_app(registry: ToolRegistry | None = None) -> FastAPI:
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Run lifecycle startup and shutdown tasks around the app."""
+    await startup()
+    try:
+        yield
+    finally:
+        await shutdown()
+
+
+def create_app(
+    registry: ToolRegistry | None = None,
+    idempotency: IdempotencyManager | None = None,
+) -> FastAPI:
     """Create and configure the FastAPI application.
 
     Args:
         registry: Optional tool registry. If None, builds default registry.
+        idempotency: Optional idempotency manager. If None, builds one from config.
     """
     app = FastAPI(
         title="Bio-MCP HTTP Adapter",
         description="HTTP adapter for Bio-MCP server tools",
         version="1.0.0",
+        lifespan=lifespan,
     )
 
     # Use provided registry or build default
@@ -93,6 +132,7 @@ def create_app(registry: ToolRegistry | None = None) -> FastAPI:
 
     # Store registry in app state
     app.state.registry = registry
+    app.state.idempotency = idempotency or build_idempotency_manager()
 
     # Add static files serving for the UI
     static_dir = Path(__file__).parent / "static"
@@ -105,7 +145,7 @@ def create_app(registry: ToolRegistry | None = None) -> FastAPI:
         db_manager = get_database_manager()
         session = db_manager.get_session()
         repository = SQLAlchemyJobRepository(session)
-        return JobService(repository)
+        return JobService(repository, notifier=get_job_notifier())
 
     # Create and include job router with service factory
     job_router = create_job_router(job_service_factory=create_job_service)
@@ -150,6 +190,14 @@ def create_app(registry: ToolRegistry | None = None) -> FastAPI:
                 },
             )
 
+    @app.get("/metrics", response_class=PlainTextResponse)
+    async def metrics():
+        """Tool request, error, in-flight and latency metrics (Prometheus text)."""
+        exporter = PrometheusExporter(get_global_collector())
+        return PlainTextResponse(
+            exporter.export(), media_type=PrometheusExporter.CONTENT_TYPE
+        )
+
     @app.get("/", response_class=FileResponse)
     async def serve_ui():
         """Serve the MCP testing UI."""
@@ -209,8 +257,38 @@ def create_app(registry: ToolRegistry | None = None) -> FastAPI:
                         detail=error_envelope.model_dump(),
                     )
 
+                if request.idempotency_key:
+                    # Replay or coalesce retries instead of re-executing the tool
+                    async def run_tool() -> dict[str, Any]:
+                        result = await invoke_tool_observed(
+                            tool_func=tool_func,
+                            tool_name=request.tool,
+                            params=request.params,
+                            trace_id=trace_id,
+                        )
+                        return InvokeResponse(
+                            tool=request.tool, result=result, trace_id=trace_id
+                        ).model_dump(mode="json")
+
+                    body, replayed = await app.state.idempotency.execute(
+                        request.tool,
+                        request.idempotency_key,
+                        request.params,
+                        run_tool,
+                        # Tools report most failures in their result
+                        is_failure=lambda body: is_error_result(body["result"]),
+                    )
+
+                    trace.add_metadata("idempotent_replay", replayed)
+                    trace.set_success(body["result"])
+
+                    return JSONResponse(
+                        content=body,
+                        headers={IDEMPOTENT_REPLAY_HEADER: str(replayed).lower()},
+                    )
+
                 # Execute tool with async-safe adapter
-                result = await invoke_tool_safely(
+                result = await invoke_tool_observed(
                     tool_func=tool_func,
                     tool_name=request.tool,
                     params=request.params,
@@ -227,6 +305,25 @@ def create_app(registry: ToolRegistry | None = None) -> FastAPI:
             except HTTPException:
                 # Re-raise HTTP exceptions (like 404) as-is
                 raise
+            except IdempotencyError as e:
+                if isinstance(e, IdempotencyKeyReuseError):
+                    error_code = ErrorCode.IDEMPOTENCY_KEY_REUSED
+                    status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
+                else:
+                    error_code = ErrorCode.IDEMPOTENCY_IN_PROGRESS
+                    status_code = status.HTTP_409_CONFLICT
+
+                error_envelope = create_error_envelope(
+                    error_code=error_code,
+                    message=str(e),
+                    trace_id=trace_id,
+                    tool_name=request.tool,
+                )
+                trace.set_error(e)
+
+                raise HTTPException(
+                    status_code=status_code, detail=error_envelope.model_dump()
+                )
             except Exception as e:
                 # Classify exception and create proper error envelope
                 error_code = classify_exception(e, request.tool)
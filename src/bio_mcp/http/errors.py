@@ -1,5 +1,6 @@
 """Error envelope and classification system for HTTP adapter."""
 
+import json
 import re
 from enum import Enum
 from typing import Any
@@ -17,6 +18,10 @@ class ErrorCode(Enum):
     # Request validation errors
     VALIDATION_ERROR = "VALIDATION_ERROR"
 
+    # Idempotency errors
+    IDEMPOTENCY_KEY_REUSED = "IDEMPOTENCY_KEY_REUSED"
+    IDEMPOTENCY_IN_PROGRESS = "IDEMPOTENCY_IN_PROGRESS"
+
     # External service errors
     WEAVIATE_TIMEOUT = "WEAVIATE_TIMEOUT"
     WEAVIATE_CONNECTION_ERROR = "WEAVIATE_CONNECTION_ERROR"
@@ -98,6 +103,49 @@ def classify_exception(exc: Exception, tool_name: str) -> ErrorCode:
     return ErrorCode.TOOL_EXECUTION_ERROR
 
 
+# Leading text of the error messages tools return instead of raising
+ERROR_TEXT_PREFIXES = ("Error", "❌")
+JSON_FENCE_RE = re.compile(r"^```(?:json)?\s*(.*?)\s*```$", re.DOTALL)
+
+
+def is_error_result(result: Any) -> bool:
+    """Check whether a tool result reports a failure instead of raising.
+
+    MCP tools catch their own exceptions and return them as content: an
+    ``isError`` flag, a ``success: false`` JSON response (MCPResponseBuilder)
+    or text starting with "Error". Works on TextContent objects and on their
+    JSON-serialized dicts.
+    """
+    if isinstance(result, dict):
+        if result.get("isError") or result.get("success") is False:
+            return True
+        content = result.get("content")
+        return content is not None and is_error_result(content)
+    if getattr(result, "isError", False) is True:
+        return True
+    if not isinstance(result, list | tuple) or not result:
+        return False
+
+    first = result[0]
+    text = (
+        first.get("text") if isinstance(first, dict) else getattr(first, "text", None)
+    )
+    if not isinstance(text, str):
+        return False
+    text = text.strip()
+    if text.startswith(ERROR_TEXT_PREFIXES):
+        return True
+
+    fenced = JSON_FENCE_RE.match(text)
+    if fenced:
+        try:
+            payload = json.loads(fenced.group(1))
+        except ValueError:
+            return False
+        return isinstance(payload, dict) and payload.get("success") is False
+    return False
+
+
 def sanitize_error_message(message: str) -> str:
     """Sanitize error message to remove potentially sensitive information.
 
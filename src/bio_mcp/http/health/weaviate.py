@@ -1,21 +1,30 @@
 """Weaviate health checker implementation."""
 
 import time
+from urllib.parse import urlparse
 
 import weaviate
 
+from bio_mcp.config.config import config
 from bio_mcp.http.health.interface import HealthChecker, HealthCheckResult
 
 
 class WeaviateHealthChecker(HealthChecker):
     """Weaviate connectivity and schema health checker."""
 
-    def __init__(self, weaviate_url: str, timeout_seconds: float = 5.0):
+    def __init__(
+        self,
+        weaviate_url: str,
+        timeout_seconds: float = 5.0,
+        grpc_port: int | None = None,
+    ):
         """Initialize Weaviate health checker.
 
         Args:
             weaviate_url: Weaviate connection URL
             timeout_seconds: Timeout for health checks
+            grpc_port: Weaviate gRPC port; defaults to the port the Weaviate
+                client connects to (``BIO_MCP_WEAVIATE_GRPC_PORT``)
 
         Raises:
             ValueError: If Weaviate URL is invalid
@@ -24,6 +33,7 @@ class WeaviateHealthChecker(HealthChecker):
             raise ValueError("Invalid Weaviate URL")
 
         self.weaviate_url = weaviate_url
+        self.grpc_port = grpc_port or config.weaviate_grpc_port
         self._timeout_seconds = timeout_seconds
         self._required_classes = ["PubmedDocument"]  # Expected schema classes
 
@@ -46,10 +56,8 @@ class WeaviateHealthChecker(HealthChecker):
         start_time = time.time()
 
         try:
-            # Connect to Weaviate
-            async with weaviate.connect_to_weaviate_cloud(
-                cluster_url=self.weaviate_url
-            ) as client:
+            # Connect to Weaviate without blocking the event loop
+            async with self._connect() as client:
                 # Check if Weaviate is live and ready
                 is_live = await client.is_live()
                 is_ready = await client.is_ready()
@@ -116,6 +124,22 @@ class WeaviateHealthChecker(HealthChecker):
                 checker_name=self.name,
             )
 
+    def _connect(self) -> weaviate.WeaviateAsyncClient:
+        """Create an async client for the configured URL."""
+        parsed = urlparse(self.weaviate_url)
+        secure = parsed.scheme == "https"
+        host = parsed.hostname or "localhost"
+
+        return weaviate.use_async_with_custom(
+            http_host=host,
+            http_port=parsed.port or (443 if secure else 80),
+            http_secure=secure,
+            grpc_host=host,
+            grpc_port=self.grpc_port,
+            grpc_secure=secure,
+            skip_init_checks=True,
+        )
+
     async def _check_cluster_status(self, client) -> dict[str, any]:
         """Check Weaviate cluster health.
 
@@ -126,11 +150,13 @@ class WeaviateHealthChecker(HealthChecker):
             Dict with cluster status information
         """
         try:
-            nodes_status = await client.cluster.get_nodes_status()
-            nodes = nodes_status.get("nodes", [])
+            nodes = [
+                {"name": node.name, "status": node.status, "version": node.version}
+                for node in await client.cluster.nodes()
+            ]
 
             healthy_nodes = [
-                node for node in nodes if node.get("status", "").upper() == "HEALTHY"
+                node for node in nodes if (node["status"] or "").upper() == "HEALTHY"
             ]
 
             return {
@@ -153,10 +179,8 @@ class WeaviateHealthChecker(HealthChecker):
             Dict with schema status information
         """
         try:
-            schema = await client.schema.get()
-            existing_classes = [
-                cls.get("class", "") for cls in schema.get("classes", [])
-            ]
+            collections = await client.collections.list_all(simple=True)
+            existing_classes = list(collections)
 
             missing_classes = [
                 cls for cls in self._required_classes if cls not in existing_classes
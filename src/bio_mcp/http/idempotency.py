@@ -0,0 +1,416 @@
+"""Idempotent tool invocation for /v1/mcp/invoke.
+
+Successful responses are stored per ``(tool, idempotency_key)`` and replayed
+for a TTL; failures (raised, or reported in the response) are not. Concurrent
+duplicates in one process share a single execution; across replicas the
+database store's in-flight claim row makes duplicates wait for the first
+execution instead of re-running it.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.dialects.postgresql import insert
+
+from bio_mcp.shared.models.database_models import IdempotencyRecord
+
+logger = logging.getLogger(__name__)
+
+IN_FLIGHT = "in_flight"
+COMPLETED = "completed"
+
+IDEMPOTENT_REPLAY_HEADER = "Idempotent-Replayed"
+
+
+class IdempotencyError(Exception):
+    """Base exception for idempotency errors."""
+
+    pass
+
+
+class IdempotencyKeyReuseError(IdempotencyError):
+    """Raised when a key is reused with different parameters."""
+
+    pass
+
+
+class IdempotencyInProgressError(IdempotencyError):
+    """Raised when another replica is still executing the same key."""
+
+    pass
+
+
+def params_fingerprint(params: dict[str, Any]) -> str:
+    """Stable SHA-256 of tool parameters (key order independent)."""
+    canonical = json.dumps(params, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class StoredResponse:
+    """State stored for one (tool, idempotency_key)."""
+
+    params_hash: str
+    status: str
+    response: dict[str, Any] | None = None
+
+    @property
+    def is_completed(self) -> bool:
+        """Check if a response is available for replay."""
+        return self.status == COMPLETED
+
+
+class IdempotencyStore(ABC):
+    """Abstract storage for idempotency keys."""
+
+    @abstractmethod
+    async def get(self, tool: str, key: str) -> StoredResponse | None:
+        """Get the unexpired entry for a key, if any."""
+        pass
+
+    @abstractmethod
+    async def claim(
+        self, tool: str, key: str, params_hash: str, ttl_seconds: float
+    ) -> bool:
+        """Mark a key in flight; returns False if another caller holds it."""
+        pass
+
+    @abstractmethod
+    async def complete(
+        self, tool: str, key: str, response: dict[str, Any], ttl_seconds: float
+    ) -> None:
+        """Store the response for a claimed key."""
+        pass
+
+    @abstractmethod
+    async def release(self, tool: str, key: str) -> None:
+        """Drop an in-flight claim so a retry can execute again."""
+        pass
+
+
+class MemoryIdempotencyStore(IdempotencyStore):
+    """Process-local store for single-node deployments."""
+
+    def __init__(self, max_entries: int = 10000):
+        """Initialize store.
+
+        Args:
+            max_entries: Maximum keys kept (least recently used are evicted)
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str], tuple[StoredResponse, float]] = (
+            OrderedDict()
+        )
+
+    async def get(self, tool: str, key: str) -> StoredResponse | None:
+        """Get the unexpired entry for a key, if any."""
+        slot = (tool, key)
+        entry = self._entries.get(slot)
+        if entry is None:
+            return None
+
+        stored, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._entries[slot]
+            return None
+
+        self._entries.move_to_end(slot)
+        return stored
+
+    async def claim(
+        self, tool: str, key: str, params_hash: str, ttl_seconds: float
+    ) -> bool:
+        """Mark a key in flight; returns False if another caller holds it."""
+        if await self.get(tool, key) is not None:
+            return False
+
+        self._set(tool, key, StoredResponse(params_hash, IN_FLIGHT), ttl_seconds)
+        return True
+
+    async def complete(
+        self, tool: str, key: str, response: dict[str, Any], ttl_seconds: float
+    ) -> None:
+        """Store the response for a claimed key."""
+        entry = self._entries.get((tool, key))
+        params_hash = entry[0].params_hash if entry else ""
+        self._set(
+            tool, key, StoredResponse(params_hash, COMPLETED, response), ttl_seconds
+        )
+
+    async def release(self, tool: str, key: str) -> None:
+        """Drop an in-flight claim so a retry can execute again."""
+        entry = self._entries.get((tool, key))
+        if entry is not None and not entry[0].is_completed:
+            del self._entries[(tool, key)]
+
+    def _set(
+        self, tool: str, key: str, stored: StoredResponse, ttl_seconds: float
+    ) -> None:
+        slot = (tool, key)
+        self._entries[slot] = (stored, time.monotonic() + ttl_seconds)
+        self._entries.move_to_end(slot)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+class SQLAlchemyIdempotencyStore(IdempotencyStore):
+    """PostgreSQL-backed store shared by all HTTP replicas."""
+
+    def __init__(self, session_factory: Callable[[], Any]):
+        """Initialize store.
+
+        Args:
+            session_factory: Callable returning a new AsyncSession
+        """
+        self.session_factory = session_factory
+
+    async def get(self, tool: str, key: str) -> StoredResponse | None:
+        """Get the unexpired entry for a key, if any."""
+        stmt = select(IdempotencyRecord).where(
+            IdempotencyRecord.tool_name == tool,
+            IdempotencyRecord.idempotency_key == key,
+            IdempotencyRecord.expires_at > datetime.now(UTC),
+        )
+        async with self.session_factory() as session:
+            result = await session.execute(stmt)
+            record = result.scalar_one_or_none()
+
+        if record is None:
+            return None
+        return StoredResponse(record.params_hash, record.status, record.response)
+
+    async def claim(
+        self, tool: str, key: str, params_hash: str, ttl_seconds: float
+    ) -> bool:
+        """Insert an in-flight row, taking over only rows that have expired."""
+        now = datetime.now(UTC)
+        values = {
+            "tool_name": tool,
+            "idempotency_key": key,
+            "params_hash": params_hash,
+            "status": IN_FLIGHT,
+            "response": None,
+            "created_at": now,
+            "expires_at": now + timedelta(seconds=ttl_seconds),
+        }
+        insert_stmt = insert(IdempotencyRecord).values(**values)
+        stmt = insert_stmt.on_conflict_do_update(
+            index_elements=[
+                IdempotencyRecord.tool_name,
+                IdempotencyRecord.idempotency_key,
+            ],
+            set_={
+                name: insert_stmt.excluded[name]
+                for name in values
+                if name not in ("tool_name", "idempotency_key")
+            },
+            where=IdempotencyRecord.expires_at <= now,
+        ).returning(IdempotencyRecord.tool_name)
+
+        async with self.session_factory() as session:
+            result = await session.execute(stmt)
+            claimed = result.first() is not None
+            await session.commit()
+
+        return claimed
+
+    async def complete(
+        self, tool: str, key: str, response: dict[str, Any], ttl_seconds: float
+    ) -> None:
+        """Store the response for a claimed key."""
+        stmt = (
+            update(IdempotencyRecord)
+            .where(
+                IdempotencyRecord.tool_name == tool,
+                IdempotencyRecord.idempotency_key == key,
+            )
+            .values(
+                status=COMPLETED,
+                response=response,
+                expires_at=datetime.now(UTC) + timedelta(seconds=ttl_seconds),
+            )
+        )
+        async with self.session_factory() as session:
+            await session.execute(stmt)
+            await session.commit()
+
+    async def release(self, tool: str, key: str) -> None:
+        """Drop an in-flight claim so a retry can execute again."""
+        stmt = delete(IdempotencyRecord).where(
+            IdempotencyRecord.tool_name == tool,
+            IdempotencyRecord.idempotency_key == key,
+            IdempotencyRecord.status == IN_FLIGHT,
+        )
+        async with self.session_factory() as session:
+            await session.execute(stmt)
+            await session.commit()
+
+
+class IdempotencyManager:
+    """Run tool invocations at most once per (tool, idempotency_key)."""
+
+    def __init__(
+        self,
+        store: IdempotencyStore,
+        ttl_seconds: float = 86400,
+        in_flight_ttl_seconds: float = 3600,
+        wait_timeout_seconds: float = 60.0,
+        poll_interval_seconds: float = 0.5,
+    ):
+        """Initialize manager.
+
+        Args:
+            store: Storage backend for keys and responses
+            ttl_seconds: How long successful responses are replayed
+            in_flight_ttl_seconds: How long a claim survives a crashed owner
+            wait_timeout_seconds: How long to wait on another replica's execution
+            poll_interval_seconds: Poll interval while waiting on another replica
+        """
+        self.store = store
+        self.ttl_seconds = ttl_seconds
+        self.in_flight_ttl_seconds = in_flight_ttl_seconds
+        self.wait_timeout_seconds = wait_timeout_seconds
+        self.poll_interval_seconds = poll_interval_seconds
+        self._in_flight: dict[tuple[str, str], tuple[str, asyncio.Future]] = {}
+
+    async def execute(
+        self,
+        tool: str,
+        key: str,
+        params: dict[str, Any],
+        operation: Callable[[], Awaitable[dict[str, Any]]],
+        is_failure: Callable[[dict[str, Any]], bool] | None = None,
+    ) -> tuple[dict[str, Any], bool]:
+        """Execute ``operation`` once for the key, or replay its response.
+
+        Args:
+            tool: Tool name
+            key: Client supplied idempotency key
+            params: Tool parameters (must match on every use of the key)
+            operation: Coroutine factory producing a JSON-serializable response
+            is_failure: Detects responses that report a failure; these are
+                returned but the key is released instead of storing them
+
+        Returns:
+            Tuple of (response, replayed)
+
+        Raises:
+            IdempotencyKeyReuseError: If the key was used with other parameters
+            IdempotencyInProgressError: If another replica is still executing
+        """
+        params_hash = params_fingerprint(params)
+        slot = (tool, key)
+
+        in_flight = self._in_flight.get(slot)
+        if in_flight is not None:
+            self._check_params(tool, key, in_flight[0], params_hash)
+            return await asyncio.shield(in_flight[1]), True
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[slot] = (params_hash, future)
+        try:
+            response, replayed = await self._execute_once(
+                tool, key, params_hash, operation, is_failure
+            )
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved when nobody else is waiting
+            raise
+        else:
+            future.set_result(response)
+            return response, replayed
+        finally:
+            self._in_flight.pop(slot, None)
+
+    async def _execute_once(
+        self,
+        tool: str,
+        key: str,
+        params_hash: str,
+        operation: Callable[[], Awaitable[dict[str, Any]]],
+        is_failure: Callable[[dict[str, Any]], bool] | None = None,
+    ) -> tuple[dict[str, Any], bool]:
+        deadline = time.monotonic() + self.wait_timeout_seconds
+
+        while True:
+            stored = await self.store.get(tool, key)
+            if stored is not None:
+                self._check_params(tool, key, stored.params_hash, params_hash)
+                if stored.is_completed:
+                    logger.info(f"Replaying stored response for {tool} ({key})")
+                    return stored.response, True
+            elif await self.store.claim(
+                tool, key, params_hash, self.in_flight_ttl_seconds
+            ):
+                break
+
+            if time.monotonic() >= deadline:
+                raise IdempotencyInProgressError(
+                    f"A request with this idempotency key for '{tool}' is still "
+                    "in progress"
+                )
+            await asyncio.sleep(self.poll_interval_seconds)
+
+        try:
+            response = await operation()
+        except BaseException:
+            # Failures are not replayed - let the client retry
+            await self._release(tool, key)
+            raise
+
+        if is_failure is not None and is_failure(response):
+            logger.info(f"Not storing failed response for {tool} ({key})")
+            await self._release(tool, key)
+        else:
+            await self.store.complete(tool, key, response, self.ttl_seconds)
+        return response, False
+
+    async def _release(self, tool: str, key: str) -> None:
+        try:
+            await self.store.release(tool, key)
+        except Exception as e:
+            logger.error(f"Failed to release idempotency claim for {tool}: {e}")
+
+    @staticmethod
+    def _check_params(tool: str, key: str, stored_hash: str, params_hash: str) -> None:
+        if stored_hash and stored_hash != params_hash:
+            raise IdempotencyKeyReuseError(
+                f"Idempotency key '{key}' was already used for '{tool}' with "
+                "different parameters"
+            )
+
+
+def build_idempotency_manager(config: Any = None) -> IdempotencyManager:
+    """Create an idempotency manager from configuration.
+
+    ``idempotency_backend`` selects ``memory`` (single node) or ``database``
+    (shared across replicas).
+    """
+    if config is None:
+        from bio_mcp.config.config import config as default_config
+
+        config = default_config
+
+    if config.idempotency_backend == "database":
+        from bio_mcp.shared.clients.database import get_database_manager
+
+        store: IdempotencyStore = SQLAlchemyIdempotencyStore(
+            lambda: get_database_manager().get_session()
+        )
+    else:
+        store = MemoryIdempotencyStore()
+
+    return IdempotencyManager(store, ttl_seconds=config.idempotency_ttl_seconds)
@@ -23,6 +23,8 @@ class JobData:
     error_message: str | None = None
     started_at: datetime | None = None
     completed_at: datetime | None = None
+    worker_id: str | None = None
+    lease_expires_at: datetime | None = None
 
     @classmethod
     def create_new(
@@ -83,14 +85,22 @@ class JobData:
         self.status = JobStatus.COMPLETED
         self.result = result
         self.completed_at = datetime.now(UTC)
+        self.release_lease()
 
     def fail_with_error(self, error_message: str) -> None:
         """Mark job as failed with error."""
         self.status = JobStatus.FAILED
         self.error_message = error_message
         self.completed_at = datetime.now(UTC)
+        self.release_lease()
 
     def cancel(self) -> None:
         """Mark job as cancelled."""
         self.status = JobStatus.CANCELLED
         self.completed_at = datetime.now(UTC)
+        self.release_lease()
+
+    def release_lease(self) -> None:
+        """Drop the worker lease once the job reaches a terminal state."""
+        self.worker_id = None
+        self.lease_expires_at = None
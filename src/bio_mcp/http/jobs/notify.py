@@ -0,0 +1,164 @@
+"""Job notifications so workers start new jobs without waiting for a poll."""
+
+import asyncio
+import logging
+from collections.abc import Callable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+JOB_CHANNEL = "bio_mcp_jobs"
+
+JobListener = Callable[[str], None]
+
+
+class InProcessJobNotifier:
+    """Notify workers running in the same process (single-node deployments)."""
+
+    def __init__(self):
+        """Initialize notifier with no listeners."""
+        self._listeners: list[JobListener] = []
+
+    def add_listener(self, listener: JobListener) -> None:
+        """Register a callback invoked with the job ID of each new job."""
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: JobListener) -> None:
+        """Unregister a previously added callback."""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    async def start(self) -> None:
+        """Start receiving notifications (no-op in process)."""
+
+    async def close(self) -> None:
+        """Stop receiving notifications."""
+        self._listeners.clear()
+
+    async def notify(self, job_id: str) -> None:
+        """Announce that a job is ready to be claimed."""
+        self._dispatch(job_id)
+
+    def _dispatch(self, job_id: str) -> None:
+        for listener in list(self._listeners):
+            try:
+                listener(job_id)
+            except Exception as e:
+                logger.error(f"Job listener failed for {job_id}: {e}")
+
+
+class PostgresJobNotifier(InProcessJobNotifier):
+    """Notify workers across replicas using PostgreSQL LISTEN/NOTIFY.
+
+    Holds one dedicated asyncpg connection that LISTENs on ``channel``;
+    ``notify`` issues ``pg_notify`` so every replica's workers wake up. An
+    asyncpg connection runs one query at a time, so notifications sent
+    concurrently take turns on it.
+    """
+
+    def __init__(self, dsn: str, channel: str = JOB_CHANNEL):
+        """Initialize notifier.
+
+        Args:
+            dsn: PostgreSQL DSN (``postgresql://`` or ``postgresql+asyncpg://``)
+            channel: LISTEN/NOTIFY channel name
+        """
+        super().__init__()
+        self.dsn = dsn.replace("postgresql+asyncpg://", "postgresql://", 1)
+        self.channel = channel
+        self._connection: Any = None
+        self._send_lock = asyncio.Lock()
+
+    async def start(self) -> None:
+        """Open the listening connection."""
+        if self._connection is not None:
+            return
+
+        import asyncpg
+
+        self._connection = await asyncpg.connect(self.dsn)
+        await self._connection.add_listener(self.channel, self._on_notification)
+        logger.info(f"Listening for jobs on channel {self.channel}")
+
+    async def close(self) -> None:
+        """Close the listening connection."""
+        async with self._send_lock:
+            if self._connection is not None:
+                try:
+                    await self._connection.remove_listener(
+                        self.channel, self._on_notification
+                    )
+                finally:
+                    await self._connection.close()
+                    self._connection = None
+        await super().close()
+
+    async def notify(self, job_id: str) -> None:
+        """Publish a job notification to every listening replica."""
+        if self._connection is None:
+            # Not listening yet - still wake local workers
+            self._dispatch(job_id)
+            return
+        async with self._send_lock:
+            await self._connection.execute(
+                "SELECT pg_notify($1, $2)", self.channel, job_id
+            )
+
+    def _on_notification(
+        self, connection: Any, pid: int, channel: str, payload: str
+    ) -> None:
+        self._dispatch(payload)
+
+
+_notifier: InProcessJobNotifier | None = None
+
+
+def get_job_notifier() -> InProcessJobNotifier:
+    """Get the process-wide job notifier."""
+    global _notifier
+    if _notifier is None:
+        _notifier = InProcessJobNotifier()
+    return _notifier
+
+
+def set_job_notifier(notifier: InProcessJobNotifier | None) -> None:
+    """Replace the process-wide job notifier (e.g. with PostgresJobNotifier)."""
+    global _notifier
+    _notifier = notifier
+
+
+def _is_postgres_url(database_url: str) -> bool:
+    scheme = database_url.split(":", 1)[0].split("+", 1)[0]
+    return scheme in ("postgresql", "postgres")
+
+
+async def start_job_notifier(database_url: str) -> InProcessJobNotifier:
+    """Install and start the notifier for the job database (app/worker startup).
+
+    PostgreSQL gets a ``PostgresJobNotifier`` so new jobs wake workers on every
+    replica; other databases keep the in-process notifier. If the listening
+    connection cannot be opened, workers still wake locally and fall back to
+    polling.
+    """
+    notifier = get_job_notifier()
+    if _is_postgres_url(database_url) and not isinstance(notifier, PostgresJobNotifier):
+        previous = notifier
+        notifier = PostgresJobNotifier(database_url)
+        for listener in previous._listeners:
+            notifier.add_listener(listener)
+        set_job_notifier(notifier)
+
+    try:
+        await notifier.start()
+    except Exception as e:
+        logger.warning(f"Job notifications unavailable, workers will poll: {e}")
+    return notifier
+
+
+async def stop_job_notifier() -> None:
+    """Close the process-wide job notifier (app/worker shutdown)."""
+    global _notifier
+    if _notifier is not None:
+        notifier, _notifier = _notifier, None
+        await notifier.close()
@@ -1,10 +1,13 @@
 """Job service layer for business logic and job management."""
 
+import logging
 from abc import ABC, abstractmethod
 from typing import Any
 
 from bio_mcp.http.jobs.models import JobData, JobStatus
 
+logger = logging.getLogger(__name__)
+
 
 class JobNotFoundError(Exception):
     """Raised when a job is not found."""
@@ -37,13 +40,33 @@ class JobRepository(ABC):
         """Remove expired jobs and return count of removed jobs."""
         pass
 
+    @abstractmethod
+    async def claim_jobs(
+        self, limit: int, worker_id: str, lease_seconds: float
+    ) -> list[JobData]:
+        """Atomically lease up to ``limit`` runnable jobs to ``worker_id``."""
+        pass
+
+    @abstractmethod
+    async def extend_leases(
+        self, job_ids: list[str], worker_id: str, lease_seconds: float
+    ) -> int:
+        """Extend leases still held by ``worker_id`` and return how many were."""
+        pass
+
 
 class JobService:
     """Business logic service for job management."""
 
-    def __init__(self, repository: JobRepository):
-        """Initialize job service with repository."""
+    def __init__(self, repository: JobRepository, notifier: Any = None):
+        """Initialize job service with repository.
+
+        Args:
+            repository: Job persistence backend
+            notifier: Optional job notifier used to wake workers on new jobs
+        """
         self.repository = repository
+        self.notifier = notifier
 
     async def create_job(
         self,
@@ -71,6 +94,14 @@ class JobService:
         )
 
         await self.repository.save(job_data)
+
+        # Best effort: the job is saved, and workers poll if the wake-up is lost
+        if self.notifier is not None:
+            try:
+                await self.notifier.notify(job_data.id)
+            except Exception as e:
+                logger.warning(f"Failed to notify workers of job {job_data.id}: {e}")
+
         return job_data.id
 
     async def get_job_status(self, job_id: str) -> JobData:
@@ -175,6 +206,41 @@ class JobService:
         """
         return await self.repository.list_jobs(JobStatus.PENDING, limit, 0)
 
+    async def claim_jobs(
+        self, limit: int, worker_id: str, lease_seconds: float = 60.0
+    ) -> list[JobData]:
+        """Lease pending (or abandoned) jobs to a worker.
+
+        Claimed jobs are already RUNNING, so no other worker or replica can
+        pick them up until the lease expires without a heartbeat.
+
+        Args:
+            limit: Maximum jobs to claim
+            worker_id: Identifier of the claiming worker
+            lease_seconds: Lease duration
+
+        Returns:
+            List of claimed JobData objects
+        """
+        return await self.repository.claim_jobs(limit, worker_id, lease_seconds)
+
+    async def heartbeat(
+        self, job_ids: list[str], worker_id: str, lease_seconds: float = 60.0
+    ) -> int:
+        """Extend the leases of jobs a worker is still executing.
+
+        Args:
+            job_ids: Jobs currently running on the worker
+            worker_id: Identifier of the worker holding the leases
+            lease_seconds: New lease duration from now
+
+        Returns:
+            Number of leases extended
+        """
+        if not job_ids:
+            return 0
+        return await self.repository.extend_leases(job_ids, worker_id, lease_seconds)
+
     async def cleanup_expired_jobs(self) -> int:
         """Remove expired jobs from storage.
 
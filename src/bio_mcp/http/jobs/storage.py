@@ -1,8 +1,9 @@
 """Job storage implementation using SQLAlchemy."""
 
-from datetime import UTC, datetime
+import uuid
+from datetime import UTC, datetime, timedelta
 
-from sqlalchemy import delete, select
+from sqlalchemy import and_, delete, func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from bio_mcp.http.jobs.models import JobData
@@ -39,6 +40,8 @@ class SQLAlchemyJobRepository(JobRepository):
             existing_record.error_message = job_data.error_message
             existing_record.started_at = job_data.started_at
             existing_record.completed_at = job_data.completed_at
+            existing_record.worker_id = job_data.worker_id
+            existing_record.lease_expires_at = job_data.lease_expires_at
             # Note: Don't update immutable fields like id, tool_name, parameters, etc.
         else:
             # Create new record
@@ -135,6 +138,95 @@ class SQLAlchemyJobRepository(JobRepository):
 
         return [record.to_job_data() for record in records]
 
+    async def claim_jobs(
+        self, limit: int, worker_id: str, lease_seconds: float
+    ) -> list[JobData]:
+        """Atomically claim runnable jobs for a worker.
+
+        Selects PENDING jobs, plus RUNNING jobs whose lease expired (their
+        worker died), with ``FOR UPDATE SKIP LOCKED`` so concurrent workers
+        never claim the same row, and flips them to RUNNING in one statement.
+
+        Args:
+            limit: Maximum jobs to claim
+            worker_id: Identifier of the claiming worker
+            lease_seconds: Lease duration
+
+        Returns:
+            List of claimed JobData objects ordered by creation time
+        """
+        if limit <= 0:
+            return []
+
+        now = datetime.now(UTC)
+        candidates = (
+            select(JobRecord.id)
+            .where(
+                or_(
+                    JobRecord.status == JobStatus.PENDING,
+                    and_(
+                        JobRecord.status == JobStatus.RUNNING,
+                        JobRecord.lease_expires_at < now,
+                    ),
+                )
+            )
+            .order_by(JobRecord.created_at.asc())  # FIFO processing
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(JobRecord)
+            .where(JobRecord.id.in_(candidates.scalar_subquery()))
+            .values(
+                status=JobStatus.RUNNING,
+                worker_id=worker_id,
+                lease_expires_at=now + timedelta(seconds=lease_seconds),
+                started_at=func.coalesce(JobRecord.started_at, now),
+            )
+            .returning(JobRecord)
+            .execution_options(synchronize_session=False)
+        )
+
+        result = await self.session.execute(stmt)
+        records = result.scalars().all()
+        await self.session.commit()
+
+        jobs = [record.to_job_data() for record in records]
+        return sorted(jobs, key=lambda job: job.created_at)
+
+    async def extend_leases(
+        self, job_ids: list[str], worker_id: str, lease_seconds: float
+    ) -> int:
+        """Extend leases still held by a worker.
+
+        Args:
+            job_ids: Jobs currently running on the worker
+            worker_id: Identifier of the worker holding the leases
+            lease_seconds: New lease duration from now
+
+        Returns:
+            Number of leases extended
+        """
+        if not job_ids:
+            return 0
+
+        stmt = (
+            update(JobRecord)
+            .where(
+                JobRecord.id.in_([uuid.UUID(job_id) for job_id in job_ids]),
+                JobRecord.worker_id == worker_id,
+                JobRecord.status == JobStatus.RUNNING,
+            )
+            .values(
+                lease_expires_at=datetime.now(UTC) + timedelta(seconds=lease_seconds)
+            )
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
+        await self.session.commit()
+
+        return result.rowcount
+
     async def get_jobs_by_status(self, status: JobStatus) -> list[JobData]:
         """Get all jobs with specific status.
 
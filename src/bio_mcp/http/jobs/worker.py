@@ -2,10 +2,15 @@
 
 import asyncio
 import logging
+import os
+import socket
+import uuid
 from abc import ABC, abstractmethod
 from typing import Any
 
 from bio_mcp.http.jobs.models import JobData
+from bio_mcp.http.jobs.notify import get_job_notifier
+from bio_mcp.shared.core.rate_governor import Priority, upstream_priority
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +33,9 @@ class JobWorker:
         job_service: Any,  # JobService - avoiding circular import
         max_concurrent_jobs: int = 10,
         poll_interval_seconds: float = 1.0,
+        worker_id: str | None = None,
+        lease_seconds: float = 60.0,
+        notifier: Any = None,
     ):
         """Initialize job worker.
 
@@ -35,12 +43,23 @@ class JobWorker:
             tool_executor: Tool execution interface
             job_service: Job service for status updates
             max_concurrent_jobs: Maximum concurrent jobs
-            poll_interval_seconds: Interval between polling for new jobs
+            poll_interval_seconds: Fallback interval between claims when no
+                job notification arrives
+            worker_id: Lease owner identifier (defaults to host-pid-random)
+            lease_seconds: Lease duration; renewed every third of it
+            notifier: Job notifier that wakes the pool on new jobs (defaults
+                to the process-wide notifier when the pool starts)
         """
         self.tool_executor = tool_executor
         self.job_service = job_service
         self.max_concurrent_jobs = max_concurrent_jobs
         self.poll_interval_seconds = poll_interval_seconds
+        self.worker_id = (
+            worker_id or f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        )
+        self.lease_seconds = lease_seconds
+        self.heartbeat_interval_seconds = lease_seconds / 3
+        self.notifier = notifier
 
         # Concurrency control
         self.job_semaphore = asyncio.Semaphore(max_concurrent_jobs)
@@ -49,6 +68,7 @@ class JobWorker:
         # Worker control
         self.is_running = False
         self._stop_event = asyncio.Event()
+        self._wake_event = asyncio.Event()
 
     async def execute_job(self, job_data: JobData) -> None:
         """Execute a single job with proper error handling.
@@ -59,14 +79,16 @@ class JobWorker:
         job_id = job_data.id
 
         try:
-            # Mark job as started
-            await self.job_service.start_job(job_id)
+            # Claimed jobs are already RUNNING under our lease
+            if job_data.is_pending:
+                await self.job_service.start_job(job_id)
             logger.info(f"Started job {job_id}: {job_data.tool_name}")
 
-            # Execute the tool
-            result = await self.tool_executor.execute_tool(
-                job_data.tool_name, job_data.parameters
-            )
+            # Execute the tool; queued jobs yield upstream budget to live requests
+            with upstream_priority(Priority.BACKGROUND):
+                result = await self.tool_executor.execute_tool(
+                    job_data.tool_name, job_data.parameters
+                )
 
             # Mark job as completed
             await self.job_service.complete_job(job_id, result)
@@ -89,60 +111,66 @@ class JobWorker:
             await self.execute_job(job_data)
 
     async def start_worker_pool(self) -> None:
-        """Start the worker pool to process pending jobs."""
+        """Start the worker pool to process pending jobs.
+
+        Jobs are leased with ``claim_jobs`` so several workers (or HTTP
+        replicas) never execute the same job. The pool claims as soon as it is
+        woken by a job notification or a finished job, and falls back to
+        polling every ``poll_interval_seconds``.
+        """
         self.is_running = True
         self._stop_event.clear()
 
+        notifier = self.notifier if self.notifier is not None else get_job_notifier()
+        notifier.add_listener(self.wake)
+        heartbeat_task = asyncio.create_task(self._heartbeat_loop())
+
         logger.info(
-            f"Starting job worker pool (max_concurrent={self.max_concurrent_jobs})"
+            f"Starting job worker pool {self.worker_id} "
+            f"(max_concurrent={self.max_concurrent_jobs})"
         )
 
         try:
             while self.is_running:
-                # Check for pending jobs
-                try:
-                    pending_jobs = await self.job_service.get_pending_jobs(
-                        limit=self.max_concurrent_jobs
-                    )
+                self._wake_event.clear()
 
-                    # Start jobs up to concurrency limit
-                    for job_data in pending_jobs:
-                        if len(self.running_jobs) >= self.max_concurrent_jobs:
-                            break
-
-                        # Start job execution
-                        task = asyncio.create_task(
-                            self._execute_job_with_semaphore(job_data)
+                try:
+                    self._reap_completed_jobs()
+
+                    available_slots = self.max_concurrent_jobs - len(self.running_jobs)
+                    if available_slots > 0:
+                        claimed_jobs = await self.job_service.claim_jobs(
+                            limit=available_slots,
+                            worker_id=self.worker_id,
+                            lease_seconds=self.lease_seconds,
                         )
-                        self.running_jobs[job_data.id] = task
 
-                        logger.debug(f"Started executing job {job_data.id}")
+                        for job_data in claimed_jobs:
+                            task = asyncio.create_task(
+                                self._execute_job_with_semaphore(job_data)
+                            )
+                            # A freed slot should be refilled without waiting
+                            task.add_done_callback(lambda _: self._wake_event.set())
+                            self.running_jobs[job_data.id] = task
 
-                    # Clean up completed tasks
-                    completed_job_ids = []
-                    for job_id, task in self.running_jobs.items():
-                        if task.done():
-                            completed_job_ids.append(job_id)
-
-                    for job_id in completed_job_ids:
-                        del self.running_jobs[job_id]
+                            logger.debug(f"Started executing job {job_data.id}")
 
                 except Exception as e:
                     logger.error(f"Error in worker pool: {e}")
 
-                # Wait before next poll or until stop requested
+                # Wait for a notification, a finished job, stop, or the poll timeout
                 try:
                     await asyncio.wait_for(
-                        self._stop_event.wait(), timeout=self.poll_interval_seconds
+                        self._wake_event.wait(), timeout=self.poll_interval_seconds
                     )
-                    # Stop event was set
-                    break
                 except TimeoutError:
                     # Normal polling timeout, continue
                     continue
 
         finally:
-            # Wait for running jobs to complete
+            notifier.remove_listener(self.wake)
+
+            # Wait for running jobs to complete (leases keep being renewed)
             if self.running_jobs:
                 logger.info(f"Waiting for {len(self.running_jobs)} jobs to complete...")
                 await asyncio.gather(
@@ -150,8 +178,36 @@ class JobWorker:
                 )
                 self.running_jobs.clear()
 
+            heartbeat_task.cancel()
+            await asyncio.gather(heartbeat_task, return_exceptions=True)
+
             logger.info("Job worker pool stopped")
 
+    def wake(self, job_id: str | None = None) -> None:
+        """Wake the pool to claim jobs immediately (job notifier callback)."""
+        self._wake_event.set()
+
+    def _reap_completed_jobs(self) -> None:
+        """Drop finished tasks from running job tracking."""
+        completed_job_ids = [
+            job_id for job_id, task in self.running_jobs.items() if task.done()
+        ]
+        for job_id in completed_job_ids:
+            del self.running_jobs[job_id]
+
+    async def _heartbeat_loop(self) -> None:
+        """Periodically extend the leases of jobs this worker is executing."""
+        while True:
+            await asyncio.sleep(self.heartbeat_interval_seconds)
+            if not self.running_jobs:
+                continue
+            try:
+                await self.job_service.heartbeat(
+                    list(self.running_jobs), self.worker_id, self.lease_seconds
+                )
+            except Exception as e:
+                logger.error(f"Failed to renew job leases: {e}")
+
     async def stop_worker_pool(self) -> None:
         """Stop the worker pool gracefully."""
         if not self.is_running:
@@ -160,6 +216,7 @@ class JobWorker:
         logger.info("Stopping job worker pool...")
         self.is_running = False
         self._stop_event.set()
+        self._wake_event.set()
 
     def get_worker_stats(self) -> dict[str, Any]:
         """Get current worker statistics.
@@ -173,4 +230,5 @@ class JobWorker:
             "current_running_jobs": len(self.running_jobs),
             "available_slots": self.max_concurrent_jobs - len(self.running_jobs),
             "running_job_ids": list(self.running_jobs.keys()),
+            "worker_id": self.worker_id,
         }
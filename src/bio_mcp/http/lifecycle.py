@@ -2,10 +2,12 @@
 
 import os
 
+from bio_mcp.config.config import config
 from bio_mcp.http.health.database import DatabaseHealthChecker
 from bio_mcp.http.health.interface import HealthCheckResult
 from bio_mcp.http.health.orchestrator import HealthOrchestrator
 from bio_mcp.http.health.weaviate import WeaviateHealthChecker
+from bio_mcp.http.jobs.notify import start_job_notifier, stop_job_notifier
 
 # Global health orchestrator instance
 _health_orchestrator: HealthOrchestrator | None = None
@@ -65,19 +67,23 @@ async def get_health_status() -> HealthCheckResult:
 async def startup() -> None:
     """Application startup tasks.
 
-    Currently a no-op, but will be used in later phases for:
+    - Job notifier (PostgreSQL LISTEN/NOTIFY when the job database is Postgres)
+
+    Will be used in later phases for:
     - Database connection pool initialization
     - Weaviate client setup
     - Other service initialization
     """
-    pass
+    await start_job_notifier(config.database_url)
 
 
 async def shutdown() -> None:
     """Application shutdown tasks.
 
-    Currently a no-op, but will be used in later phases for:
+    - Job notifier connection cleanup
+
+    Will be used in later phases for:
     - Graceful database connection cleanup
     - Service shutdown procedures
     """
-    pass
+    await stop_job_notifier()
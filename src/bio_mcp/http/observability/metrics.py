@@ -1,71 +1,79 @@
 """Metrics collection and export."""
 
 import json
-import math
 from collections import defaultdict
 from datetime import UTC, datetime
 from typing import Any
 
+from bio_mcp.monitoring.histogram import DEFAULT_LATENCY_BOUNDS_MS, LatencyHistogram
+
 
 class MetricsCollector:
     """Collect and aggregate metrics."""
 
     def __init__(self, max_labels: int = 1000):
+        # Cap on distinct labelled series; samples for new series past the cap
+        # are dropped and counted in dropped_samples
         self.max_labels = max_labels
-        self.label_count = 0
+        self._series: set[tuple[str, ...]] = set()
+        self.dropped_samples = 0
 
         # Counters
         self.request_counts = defaultdict(lambda: defaultdict(int))
         self.error_counts = defaultdict(lambda: defaultdict(int))
 
-        # Histograms (store all values for percentile calculation)
-        self.latencies = defaultdict(list)
+        # Histograms (fixed-memory log buckets per tool)
+        self.latencies: dict[str, LatencyHistogram] = {}
 
         # Gauges
         self.inflight_requests = defaultdict(int)
 
+    @property
+    def label_count(self) -> int:
+        """Number of distinct labelled series being tracked."""
+        return len(self._series)
+
+    def _admit(self, *series: str) -> bool:
+        """Whether a sample may be recorded under the label cardinality cap."""
+        if series in self._series:
+            return True
+        if len(self._series) >= self.max_labels:
+            self.dropped_samples += 1
+            return False
+        self._series.add(series)
+        return True
+
     def increment_request(self, tool: str, status: str):
         """Increment request counter."""
-        if self.label_count < self.max_labels:
+        if self._admit("requests", tool, status):
             self.request_counts[tool][status] += 1
-            self.label_count += 1
 
     def increment_error(self, tool: str, error_code: str):
         """Increment error counter."""
-        if self.label_count < self.max_labels:
+        if self._admit("errors", tool, error_code):
             self.error_counts[tool][error_code] += 1
-            self.label_count += 1
 
     def record_latency(self, tool: str, latency_ms: float):
         """Record latency measurement."""
-        self.latencies[tool].append(latency_ms)
+        if self._admit("latency", tool):
+            histogram = self.latencies.get(tool)
+            if histogram is None:
+                histogram = self.latencies[tool] = LatencyHistogram()
+            histogram.record(latency_ms)
 
     def increment_inflight(self, tool: str):
         """Increment inflight requests gauge."""
-        self.inflight_requests[tool] += 1
+        if self._admit("inflight", tool):
+            self.inflight_requests[tool] += 1
 
     def decrement_inflight(self, tool: str):
         """Decrement inflight requests gauge."""
-        if self.inflight_requests[tool] > 0:
+        if self.inflight_requests.get(tool, 0) > 0:
             self.inflight_requests[tool] -= 1
 
-    def _calculate_percentile(self, values: list[float], percentile: float) -> float:
-        """Calculate percentile from list of values."""
-        if not values:
-            return 0.0
-
-        sorted_values = sorted(values)
-        index = (len(sorted_values) - 1) * percentile / 100
-        lower = math.floor(index)
-        upper = math.ceil(index)
-
-        if lower == upper:
-            return sorted_values[int(index)]
-
-        # Linear interpolation
-        return sorted_values[lower] * (upper - index) + sorted_values[upper] * (
-            index - lower
-        )
+    def get_latency_histograms(self) -> dict[str, LatencyHistogram]:
+        """Snapshots of the per-tool latency histograms (mergeable)."""
+        return {tool: hist.snapshot() for tool, hist in self.latencies.items()}
 
     def get_metrics(self) -> dict[str, Any]:
         """Get current metrics snapshot."""
@@ -77,25 +85,37 @@ class MetricsCollector:
         }
 
         # Calculate histogram statistics
-        for tool, latencies in self.latencies.items():
-            if latencies:
+        for tool, histogram in self.latencies.items():
+            if histogram.count:
                 metrics["bio_mcp_latency_ms"][tool] = {
-                    "count": len(latencies),
-                    "sum": sum(latencies),
-                    "mean": sum(latencies) / len(latencies),
-                    "p50": self._calculate_percentile(latencies, 50),
-                    "p95": self._calculate_percentile(latencies, 95),
-                    "p99": self._calculate_percentile(latencies, 99),
+                    "count": histogram.count,
+                    "sum": histogram.sum,
+                    "mean": histogram.mean,
+                    "p50": histogram.quantile(0.50),
+                    "p95": histogram.quantile(0.95),
+                    "p99": histogram.quantile(0.99),
                 }
 
         return metrics
 
 
+def _label(value: str) -> str:
+    """Escape a Prometheus label value."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
 class PrometheusExporter:
     """Export metrics in Prometheus format."""
 
-    def __init__(self, collector: MetricsCollector):
+    CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(
+        self,
+        collector: MetricsCollector,
+        latency_bounds_ms: tuple[float, ...] = DEFAULT_LATENCY_BOUNDS_MS,
+    ):
         self.collector = collector
+        self.latency_bounds_ms = latency_bounds_ms
 
     def export(self) -> str:
         """Export metrics as Prometheus text."""
@@ -109,7 +129,8 @@ class PrometheusExporter:
             for tool, statuses in metrics["bio_mcp_requests_total"].items():
                 for status, count in statuses.items():
                     lines.append(
-                        f'bio_mcp_requests_total{{tool="{tool}",status="{status}"}} {count}'
+                        f'bio_mcp_requests_total{{tool="{_label(tool)}",'
+                        f'status="{_label(status)}"}} {count}'
                     )
 
         # Export error counters
@@ -119,34 +140,53 @@ class PrometheusExporter:
             for tool, errors in metrics["bio_mcp_errors_total"].items():
                 for error_code, count in errors.items():
                     lines.append(
-                        f'bio_mcp_errors_total{{tool="{tool}",error_code="{error_code}"}} {count}'
+                        f'bio_mcp_errors_total{{tool="{_label(tool)}",'
+                        f'error_code="{_label(error_code)}"}} {count}'
                     )
 
-        # Export latency histograms
-        if metrics["bio_mcp_latency_ms"]:
+        # Export latency histograms as cumulative buckets
+        histograms = self.collector.get_latency_histograms()
+        if histograms:
             lines.append("# HELP bio_mcp_latency_ms Request latency in milliseconds")
             lines.append("# TYPE bio_mcp_latency_ms histogram")
-            for tool, stats in metrics["bio_mcp_latency_ms"].items():
+            for tool, histogram in histograms.items():
+                tool_label = _label(tool)
+                for bound, count in histogram.cumulative_counts(self.latency_bounds_ms):
+                    lines.append(
+                        f'bio_mcp_latency_ms_bucket{{tool="{tool_label}",'
+                        f'le="{bound:g}"}} {count}'
+                    )
+                lines.append(
+                    f'bio_mcp_latency_ms_bucket{{tool="{tool_label}",le="+Inf"}} '
+                    f"{histogram.count}"
+                )
+                lines.append(
+                    f'bio_mcp_latency_ms_sum{{tool="{tool_label}"}} {histogram.sum}'
+                )
                 lines.append(
-                    f'bio_mcp_latency_ms_count{{tool="{tool}"}} {stats["count"]}'
+                    f'bio_mcp_latency_ms_count{{tool="{tool_label}"}} {histogram.count}'
                 )
-                lines.append(f'bio_mcp_latency_ms_sum{{tool="{tool}"}} {stats["sum"]}')
-                # Add percentile buckets
-                for percentile in ["p50", "p95", "p99"]:
-                    if percentile in stats:
-                        quantile = percentile[1:] + ".0"  # p50 -> 50.0
-                        lines.append(
-                            f'bio_mcp_latency_ms{{tool="{tool}",quantile="0.{quantile[:-2]}"}} {stats[percentile]}'
-                        )
 
         # Export inflight gauges
         if metrics["bio_mcp_inflight_requests"]:
             lines.append("# HELP bio_mcp_inflight_requests Number of inflight requests")
             lines.append("# TYPE bio_mcp_inflight_requests gauge")
             for tool, count in metrics["bio_mcp_inflight_requests"].items():
-                lines.append(f'bio_mcp_inflight_requests{{tool="{tool}"}} {count}')
+                lines.append(
+                    f'bio_mcp_inflight_requests{{tool="{_label(tool)}"}} {count}'
+                )
+
+        # Samples dropped by the label cardinality cap
+        lines.append(
+            "# HELP bio_mcp_metrics_dropped_samples_total "
+            "Samples dropped by the label cardinality cap"
+        )
+        lines.append("# TYPE bio_mcp_metrics_dropped_samples_total counter")
+        lines.append(
+            f"bio_mcp_metrics_dropped_samples_total {self.collector.dropped_samples}"
+        )
 
-        return "\n".join(lines)
+        return "\n".join(lines) + "\n"
 
 
 class CloudWatchEMFExporter:
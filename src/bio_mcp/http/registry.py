@@ -11,7 +11,11 @@ from bio_mcp.mcp.corpus_tools import (
     corpus_checkpoint_get_tool,
     corpus_checkpoint_list_tool,
 )
-from bio_mcp.mcp.rag_tools import rag_get_tool, rag_search_tool
+from bio_mcp.mcp.rag_tools import (
+    rag_get_many_tool,
+    rag_get_tool,
+    rag_search_tool,
+)
 from bio_mcp.mcp.tool_definitions import (
     get_corpus_tool_definitions,
     get_ping_tool_definition,
@@ -107,6 +111,9 @@ def build_registry() -> ToolRegistry:
 
     registry.register("rag.search", rag_search_tool, rag_def_map.get("rag.search"))
     registry.register("rag.get", rag_get_tool, rag_def_map.get("rag.get"))
+    registry.register(
+        "rag.get_many", rag_get_many_tool, rag_def_map.get("rag.get_many")
+    )
 
     # Register corpus management tools with definitions
     corpus_defs = get_corpus_tool_definitions()
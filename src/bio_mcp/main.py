@@ -28,7 +28,11 @@ from bio_mcp.mcp.corpus_tools import (
     corpus_checkpoint_get_tool,
     corpus_checkpoint_list_tool,
 )
-from bio_mcp.mcp.rag_tools import rag_get_tool, rag_search_tool
+from bio_mcp.mcp.rag_tools import (
+    rag_get_many_tool,
+    rag_get_tool,
+    rag_search_tool,
+)
 from bio_mcp.mcp.resources import list_resources, read_resource
 from bio_mcp.mcp.tool_definitions import get_all_tool_definitions
 from bio_mcp.monitoring.metrics import record_tool_call
@@ -136,6 +140,9 @@ Server Info:
         elif name == "rag.get":
             return await rag_get_tool(name, arguments)
 
+        elif name == "rag.get_many":
+            return await rag_get_many_tool(name, arguments)
+
         elif name == "corpus.checkpoint.create":
             return await corpus_checkpoint_create_tool(name, arguments)
 
@@ -466,6 +466,14 @@ def format_investment_summary_response(summary: dict[str, Any]) -> list[TextCont
             for sponsor, count in sponsor_dist.items():
                 lines.append(f"- {sponsor}: {count}")
 
+        # Status distribution
+        status_dist = summary.get("status_distribution", {})
+        if status_dist:
+            lines.append("")
+            lines.append("**Status Distribution:**")
+            for status, count in status_dist.items():
+                lines.append(f"- {status}: {count}")
+
         # Top conditions
         top_conditions = summary.get("top_conditions", [])
         if top_conditions:
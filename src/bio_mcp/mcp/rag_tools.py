@@ -5,6 +5,7 @@ Phase 4A: Basic RAG Tools - Semantic search and document retrieval.
 Implements MCP tools for:
 - rag.search: Semantic search over document corpus
 - rag.get: Retrieve specific document by ID
+- rag.get_many: Retrieve several documents in one call
 """
 
 import time
@@ -20,6 +21,7 @@ from bio_mcp.mcp.response_builder import (
     ErrorCodes,
     MCPResponseBuilder,
     format_rag_get_human,
+    format_rag_get_many_human,
     format_rag_search_human,
     get_format_preference,
 )
@@ -69,6 +71,9 @@ class RAGToolsManager:
         alpha: float = 0.5,
         return_chunks: bool = False,  # New parameter
         enhance_query: bool = True,  # New parameter
+        fetch_siblings: bool = False,
+        return_properties: Sequence[str] | None = None,
+        include_metadata: bool = False,
     ) -> RAGSearchResult:
         """
         Search documents using hybrid, semantic, or BM25 search.
@@ -80,9 +85,17 @@ class RAGToolsManager:
             filters: Metadata filters (future enhancement)
             rerank_by_quality: Whether to apply quality score boosting
             alpha: Hybrid search weighting (0.0=pure BM25, 1.0=pure vector)
+            return_chunks: Return matching chunks instead of documents
+            enhance_query: Expand the query with biomedical synonyms
+            fetch_siblings: Fetch each document's non-matching chunks so
+                abstracts are reconstructed in full (one extra query)
+            return_properties: Chunk properties to fetch (defaults to the
+                chunk service's compact SEARCH_RETURN_PROPERTIES)
+            include_metadata: Load full chunk metadata for the final results
 
         Returns:
-            RAGSearchResult with found documents
+            RAGSearchResult with found documents (exactly ``top_k`` distinct
+            documents when the corpus has that many matches)
         """
         # Enhance query for biomedical context if requested
         search_query = self._enhance_biomedical_query(query) if enhance_query else query
@@ -95,6 +108,7 @@ class RAGToolsManager:
             mode=search_mode,
             alpha=alpha,
             return_chunks=return_chunks,
+            fetch_siblings=fetch_siblings,
         )
 
         search_start_time = time.time()
@@ -102,26 +116,50 @@ class RAGToolsManager:
         try:
             await self.document_chunk_service.initialize()
 
-            # Perform search with specified mode using the chunk-based approach
-            # Get more chunks if we're reconstructing documents
-            search_limit = top_k * 3 if not return_chunks else top_k
-
             search_time_start = time.time()
-            results = await self.document_chunk_service.search_chunks(
-                query=search_query,
-                limit=search_limit,
-                search_mode=search_mode,
-                alpha=alpha,
-                filters=filters,
-            )
+            if return_chunks:
+                results = await self.document_chunk_service.search_chunks(
+                    query=search_query,
+                    limit=top_k,
+                    search_mode=search_mode,
+                    alpha=alpha,
+                    filters=filters,
+                    return_properties=return_properties,
+                )
+            else:
+                # Documents are grouped by parent_uid server-side
+                groups = await self.document_chunk_service.search_documents(
+                    query=search_query,
+                    top_k=top_k,
+                    search_mode=search_mode,
+                    alpha=alpha,
+                    filters=filters,
+                    fetch_siblings=fetch_siblings,
+                    return_properties=return_properties,
+                )
             search_time_ms = (time.time() - search_time_start) * 1000
 
             # Apply quality-based reranking if enabled
             quality_time_start = time.time()
             if rerank_by_quality:
-                results = self.quality_scorer.apply_quality_boost(results)
+                if return_chunks:
+                    results = self.quality_scorer.apply_quality_boost(results)
+                else:
+                    for group in groups:
+                        group["chunks"] = self.quality_scorer.apply_quality_boost(
+                            group["chunks"]
+                        )
             quality_time_ms = (time.time() - quality_time_start) * 1000
 
+            # Full metadata only for what is returned, in one batched fetch
+            if include_metadata:
+                if return_chunks:
+                    await self.document_chunk_service.load_chunk_meta(results)
+                else:
+                    await self.document_chunk_service.load_chunk_meta(
+                        [group["chunks"][0] for group in groups]
+                    )
+
             # Calculate total processing time
             total_time_ms = (time.time() - search_start_time) * 1000
 
@@ -162,11 +200,21 @@ class RAGToolsManager:
                     # Include hybrid search explanation if available
                     if "explain_score" in result:
                         formatted_result["explain_score"] = result["explain_score"]
+                    if include_metadata:
+                        formatted_result["meta"] = result.get("meta", {})
 
                     formatted_results.append(formatted_result)
             else:
-                # Reconstruct documents from chunks
-                reconstructed_docs = self._reconstruct_documents(results)
+                # Reconstruct documents from their matched (and sibling) chunks
+                reconstructed_docs = [
+                    self._reconstruct_document(
+                        group["parent_uid"], group["chunks"], group["siblings"]
+                    )
+                    for group in groups
+                ]
+                reconstructed_docs.sort(
+                    key=lambda x: x.get("best_score", 0), reverse=True
+                )
 
                 # Format reconstructed documents
                 formatted_results = []
@@ -193,6 +241,8 @@ class RAGToolsManager:
                         "content": self._truncate_content(doc.get("abstract", "")),
                         "search_mode": search_mode,
                     }
+                    if include_metadata:
+                        formatted_result["meta"] = doc.get("meta", {})
 
                     formatted_results.append(formatted_result)
 
@@ -241,78 +291,105 @@ class RAGToolsManager:
         self, doc_id: str, include_chunks: bool = False
     ) -> RAGGetResult:
         """
-        Get a specific document by ID (PMID or UUID).
+        Get a specific document by ID (PMID or document UID).
 
         Args:
-            doc_id: Document ID (PMID or UUID)
+            doc_id: Document ID (PMID, "pmid:<id>", NCT id or "<source>:<id>")
             include_chunks: Whether to include document chunks
 
         Returns:
             RAGGetResult with document data
         """
-        logger.info("RAG get document", doc_id=doc_id, include_chunks=include_chunks)
-
-        try:
-            await self.document_chunk_service.initialize()
-
-            # For chunk-based approach, search for chunks by parent_uid
-            if doc_id.startswith("pmid:"):
-                parent_uid = doc_id  # Already in format "pmid:12345678"
-            else:
-                parent_uid = f"pubmed:{doc_id}"  # Convert PMID to parent_uid format
-
-            # Search for all chunks belonging to this document
-            from weaviate.classes.query import Filter
+        results = await self.get_documents([doc_id], include_chunks=include_chunks)
+        return results[0]
 
-            collection = self.embedding_service.weaviate_client.client.collections.get(
-                "DocumentChunk"
-            )
+    async def get_documents(
+        self, doc_ids: Sequence[str], include_chunks: bool = False
+    ) -> list[RAGGetResult]:
+        """
+        Get several documents with batched filtered queries.
 
-            response = collection.query.fetch_objects(
-                filters=Filter.by_property("parent_uid").equal(parent_uid)
-            )
+        Documents are rebuilt from their chunks in chunk_idx order and served
+        from the chunk service's hot-document cache when present.
 
-            if not response.objects:
-                return RAGGetResult(doc_id=doc_id, found=False)
-
-            # Reconstruct document from first chunk's metadata
-            first_chunk = response.objects[0]
-            document = {
-                "uuid": str(first_chunk.uuid),
-                "pmid": parent_uid.replace("pubmed:", "")
-                if parent_uid.startswith("pubmed:")
-                else parent_uid,
-                "title": first_chunk.properties.get("title", ""),
-                "abstract": "",  # We'll combine all chunk texts
-                "journal": "",  # Not available in chunks
-                "publication_date": first_chunk.properties.get("published_at", ""),
-                "parent_uid": parent_uid,
-            }
+        Args:
+            doc_ids: Document IDs, as for get_document
+            include_chunks: Whether to include document chunks
 
-            chunks = []
-            combined_text = []
-            for obj in response.objects:
-                chunk = {
-                    "chunk_id": obj.properties["chunk_id"],
-                    "text": obj.properties.get("text", ""),
-                    "section": obj.properties.get("section", ""),
-                    "tokens": obj.properties.get("tokens", 0),
-                    "chunk_idx": obj.properties.get("chunk_idx", 0),
-                }
-                chunks.append(chunk)
-                combined_text.append(obj.properties.get("text", ""))
-
-            # Combine all chunk texts to form the full abstract
-            document["abstract"] = " ".join(combined_text)
-
-            result_chunks = chunks if include_chunks else None
-            return RAGGetResult(
-                doc_id=doc_id, found=True, document=document, chunks=result_chunks
-            )
+        Returns:
+            One RAGGetResult per requested ID, in request order
+        """
+        logger.info(
+            "RAG get documents", count=len(doc_ids), include_chunks=include_chunks
+        )
 
+        parent_uids = [self._to_parent_uid(doc_id) for doc_id in doc_ids]
+        try:
+            await self.document_chunk_service.initialize()
+            documents = await self.document_chunk_service.get_documents(parent_uids)
         except Exception as e:
-            logger.error("RAG get document failed", doc_id=doc_id, error=str(e))
-            return RAGGetResult(doc_id=doc_id, found=False)
+            logger.error("RAG get documents failed", doc_ids=doc_ids, error=str(e))
+            return [RAGGetResult(doc_id=doc_id, found=False) for doc_id in doc_ids]
+
+        results = []
+        for doc_id, parent_uid in zip(doc_ids, parent_uids):
+            document = documents.get(parent_uid)
+            if document is None:
+                results.append(RAGGetResult(doc_id=doc_id, found=False))
+                continue
+            results.append(
+                RAGGetResult(
+                    doc_id=doc_id,
+                    found=True,
+                    document=self._format_document(document),
+                    chunks=document["chunks"] if include_chunks else None,
+                )
+            )
+        return results
+
+    @staticmethod
+    def _to_parent_uid(doc_id: str) -> str:
+        """Map a PMID, NCT id or document UID to the chunks' parent_uid."""
+        doc_id = doc_id.strip()
+        if doc_id.lower().startswith("pmid:"):
+            return f"pubmed:{doc_id[5:]}"
+        if ":" in doc_id:
+            return doc_id
+        if doc_id.upper().startswith("NCT"):
+            return f"ctgov:{doc_id}"
+        return f"pubmed:{doc_id}"
+
+    @staticmethod
+    def _format_document(document: dict[str, Any]) -> dict[str, Any]:
+        """Shape a reconstructed document for rag.get responses."""
+        parent_uid = document["parent_uid"]
+        source = document.get("source", "")
+        src_meta = document.get("meta", {}).get("src", {}).get(source) or {}
+
+        pub_date = document.get("published_at") or ""
+        if hasattr(pub_date, "isoformat"):
+            pub_date = pub_date.isoformat()
+
+        formatted = {
+            "uuid": document["chunks"][0]["uuid"],
+            "pmid": parent_uid.split(":", 1)[-1]
+            if parent_uid.startswith("pubmed:")
+            else parent_uid,
+            "title": document.get("title", ""),
+            # Chunks arrive in chunk_idx order
+            "abstract": " ".join(
+                c["text"] for c in document["chunks"] if c.get("text")
+            ),
+            "journal": src_meta.get("journal", ""),
+            "publication_date": pub_date,
+            "parent_uid": parent_uid,
+            "authors": src_meta.get("authors", []),
+            "doi": (src_meta.get("identifiers") or {}).get("doi"),
+            "quality": document.get("quality_total"),
+        }
+        if src_meta.get("mesh_terms"):
+            formatted["mesh_terms"] = src_meta["mesh_terms"]
+        return formatted
 
     def _reconstruct_documents(
         self, chunks: list[dict[str, Any]]
@@ -330,50 +407,61 @@ class RAGToolsManager:
                 doc_chunks[parent_uid].append(chunk)
 
         # Reconstruct each document
-        documents = []
-        for parent_uid, chunks_list in doc_chunks.items():
-            if not chunks_list:
-                continue
-
-            # Use first chunk for metadata
-            first_chunk = chunks_list[0]
-
-            # Reconstruct abstract without title duplication
-            abstract = self._reconstruct_abstract(chunks_list)
-
-            document = {
-                "uid": parent_uid,
-                "pmid": parent_uid.split(":")[-1] if ":" in parent_uid else parent_uid,
-                "source": first_chunk.get("source", ""),
-                "title": first_chunk.get("title", ""),
-                "abstract": abstract,
-                "published_at": first_chunk.get("published_at"),
-                "year": first_chunk.get("year"),
-                "quality_total": first_chunk.get("quality_total", 0.0),
-                "chunk_count": len(chunks_list),
-                "sections_found": list(
-                    set(c.get("section", "Unstructured") for c in chunks_list)
-                ),
-                "best_score": max((c.get("score", 0) for c in chunks_list), default=0),
-                "avg_score": sum(c.get("score", 0) for c in chunks_list)
-                / len(chunks_list)
-                if chunks_list
-                else 0,
-                "meta": first_chunk.get("meta", {}),
-            }
-
-            # Add source URL if PubMed
-            if document["source"] == "pubmed" and ":" in parent_uid:
-                pmid = parent_uid.split(":")[-1]
-                document["source_url"] = f"https://pubmed.ncbi.nlm.nih.gov/{pmid}/"
-
-            documents.append(document)
+        documents = [
+            self._reconstruct_document(parent_uid, chunks_list)
+            for parent_uid, chunks_list in doc_chunks.items()
+            if chunks_list
+        ]
 
         # Sort by best chunk score
         documents.sort(key=lambda x: x.get("best_score", 0), reverse=True)
 
         return documents
 
+    def _reconstruct_document(
+        self,
+        parent_uid: str,
+        chunks_list: list[dict[str, Any]],
+        siblings: Sequence[dict[str, Any]] = (),
+    ) -> dict[str, Any]:
+        """
+        Build one document from its matched chunks.
+
+        Scores come from the matched chunks only; unscored sibling chunks add
+        to the reconstructed abstract and the chunk count.
+        """
+        # Use first chunk for metadata
+        first_chunk = chunks_list[0]
+        all_chunks = [*chunks_list, *siblings]
+
+        # Reconstruct abstract without title duplication
+        abstract = self._reconstruct_abstract(all_chunks)
+
+        document = {
+            "uid": parent_uid,
+            "pmid": parent_uid.split(":")[-1] if ":" in parent_uid else parent_uid,
+            "source": first_chunk.get("source", ""),
+            "title": first_chunk.get("title", ""),
+            "abstract": abstract,
+            "published_at": first_chunk.get("published_at"),
+            "year": first_chunk.get("year"),
+            "quality_total": first_chunk.get("quality_total", 0.0),
+            "chunk_count": len(all_chunks),
+            "sections_found": list(
+                set(c.get("section", "Unstructured") for c in all_chunks)
+            ),
+            "best_score": max((c.get("score", 0) for c in chunks_list), default=0),
+            "avg_score": sum(c.get("score", 0) for c in chunks_list) / len(chunks_list),
+            "meta": first_chunk.get("meta", {}),
+        }
+
+        # Add source URL if PubMed
+        if document["source"] == "pubmed" and ":" in parent_uid:
+            pmid = parent_uid.split(":")[-1]
+            document["source_url"] = f"https://pubmed.ncbi.nlm.nih.gov/{pmid}/"
+
+        return document
+
     def _reconstruct_abstract(self, chunks: list[dict[str, Any]]) -> str:
         """
         Reconstruct abstract from chunks without title duplication.
@@ -524,6 +612,8 @@ async def rag_search_tool(
         search_mode: 'hybrid' (default), 'semantic', or 'bm25'
         alpha: Hybrid search weighting (0.0=pure BM25, 1.0=pure vector, 0.5=balanced)
         rerank_by_quality: Whether to boost results by quality (default: true)
+        fetch_siblings: Fetch non-matching chunks to reconstruct full abstracts
+        include_metadata: Include full chunk metadata (authors, identifiers)
         filters: Metadata filters for date ranges, journals, etc.
 
     Returns:
@@ -551,6 +641,8 @@ async def rag_search_tool(
     search_mode = arguments.get("search_mode", "hybrid").lower()
     alpha = float(arguments.get("alpha", 0.5))
     rerank_by_quality = arguments.get("rerank_by_quality", True)
+    fetch_siblings = arguments.get("fetch_siblings", False)
+    include_metadata = arguments.get("include_metadata", False)
     filters = arguments.get("filters", {})
 
     # Validate alpha parameter
@@ -578,6 +670,8 @@ async def rag_search_tool(
             filters=filters,
             rerank_by_quality=rerank_by_quality,
             alpha=alpha,
+            fetch_siblings=fetch_siblings,
+            include_metadata=include_metadata,
         )
 
         # Format results for JSON response
@@ -603,6 +697,8 @@ async def rag_search_tool(
                 formatted_result["distance"] = doc["distance"]
             if "explain_score" in doc:
                 formatted_result["explain_score"] = doc["explain_score"]
+            if "meta" in doc:
+                formatted_result["meta"] = doc["meta"]
 
             formatted_results.append(formatted_result)
 
@@ -647,7 +743,7 @@ async def rag_get_tool(name: str, arguments: dict[str, Any]) -> Sequence[TextCon
     MCP tool: Get a specific document from the RAG corpus.
 
     Args:
-        doc_id: Document ID to retrieve (PMID or UUID)
+        doc_id: Document ID to retrieve (PMID or document UID)
         format: Response format ('json' or 'human', default: 'json')
 
     Returns:
@@ -680,46 +776,8 @@ async def rag_get_tool(name: str, arguments: dict[str, Any]) -> Sequence[TextCon
                 format_type=format_type,
             )
 
-        doc = result.document
-
-        # Format document for JSON response
-        document_data = {
-            "doc_id": doc_id,
-            "document": {
-                "uuid": doc["uuid"],
-                "pmid": doc.get("pmid", ""),
-                "title": doc.get("title", ""),
-                "abstract": doc.get("abstract", ""),
-                "journal": doc.get("journal", ""),
-                "publication_date": doc.get("publication_date", ""),
-                "doi": doc.get("doi"),
-                "authors": doc.get("authors", []),
-                "keywords": doc.get("keywords", []),
-                "pub_types": doc.get("pub_types", []),
-                "quality": doc.get("quality"),
-            },
-        }
-
-        # Add optional fields if present
-        if "mesh_terms" in doc:
-            document_data["document"]["mesh_terms"] = doc["mesh_terms"]
-        if "edat" in doc:
-            document_data["document"]["entry_date"] = doc["edat"]
-        if "lr" in doc:
-            document_data["document"]["last_revision"] = doc["lr"]
-        if result.chunks:
-            document_data["chunks"] = [
-                {
-                    "chunk_id": chunk["chunk_id"],
-                    "text": chunk.get("text", ""),
-                    "section": chunk.get("section", ""),
-                    "tokens": chunk.get("tokens", 0),
-                }
-                for chunk in result.chunks
-            ]
-
         return builder.success(
-            data=document_data,
+            data=_document_data(result),
             format_type=format_type,
             human_formatter=format_rag_get_human,
         )
@@ -732,3 +790,107 @@ async def rag_get_tool(name: str, arguments: dict[str, Any]) -> Sequence[TextCon
             details={"doc_id": doc_id},
             format_type=format_type,
         )
+
+
+async def rag_get_many_tool(
+    name: str, arguments: dict[str, Any]
+) -> Sequence[TextContent]:
+    """
+    MCP tool: Get several documents from the RAG corpus in one call.
+
+    Args:
+        doc_ids: Document IDs to retrieve (PMIDs or document UIDs)
+        include_chunks: Whether to include each document's chunks
+        format: Response format ('json' or 'human', default: 'json')
+
+    Returns:
+        Found documents in request order plus the IDs that were not found
+    """
+    builder = MCPResponseBuilder("rag.get_many")
+    format_type = get_format_preference(arguments)
+
+    doc_ids = [
+        str(doc_id).strip()
+        for doc_id in arguments.get("doc_ids") or []
+        if str(doc_id).strip()
+    ]
+    if not doc_ids:
+        return builder.error(
+            ErrorCodes.MISSING_PARAMETER,
+            "doc_ids parameter is required",
+            format_type=format_type,
+        )
+    if len(doc_ids) > SEARCH_CONFIG.RAG_GET_MANY_MAX_IDS:
+        return builder.error(
+            ErrorCodes.INVALID_PARAMETER,
+            f"At most {SEARCH_CONFIG.RAG_GET_MANY_MAX_IDS} doc_ids per call",
+            format_type=format_type,
+        )
+    include_chunks = arguments.get("include_chunks", False)
+
+    logger.info("RAG get_many tool called", count=len(doc_ids))
+
+    try:
+        manager = get_rag_manager()
+        results = await manager.get_documents(doc_ids, include_chunks=include_chunks)
+
+        response_data = {
+            "documents": [_document_data(r) for r in results if r.found],
+            "not_found": [r.doc_id for r in results if not r.found],
+        }
+        return builder.success(
+            data=response_data,
+            format_type=format_type,
+            human_formatter=format_rag_get_many_human,
+        )
+
+    except Exception as e:
+        logger.error("RAG get_many tool failed", count=len(doc_ids), error=str(e))
+        return builder.error(
+            ErrorCodes.OPERATION_FAILED,
+            f"Failed to retrieve documents: {e!s}",
+            details={"doc_ids": doc_ids},
+            format_type=format_type,
+        )
+
+
+def _document_data(result: RAGGetResult) -> dict[str, Any]:
+    """Format a found RAGGetResult for a tool response."""
+    doc = result.document
+
+    document_data = {
+        "doc_id": result.doc_id,
+        "document": {
+            "uuid": doc["uuid"],
+            "pmid": doc.get("pmid", ""),
+            "title": doc.get("title", ""),
+            "abstract": doc.get("abstract", ""),
+            "journal": doc.get("journal", ""),
+            "publication_date": doc.get("publication_date", ""),
+            "doi": doc.get("doi"),
+            "authors": doc.get("authors", []),
+            "keywords": doc.get("keywords", []),
+            "pub_types": doc.get("pub_types", []),
+            "quality": doc.get("quality"),
+        },
+    }
+
+    # Add optional fields if present
+    if "mesh_terms" in doc:
+        document_data["document"]["mesh_terms"] = doc["mesh_terms"]
+    if "edat" in doc:
+        document_data["document"]["entry_date"] = doc["edat"]
+    if "lr" in doc:
+        document_data["document"]["last_revision"] = doc["lr"]
+    if result.chunks:
+        document_data["chunks"] = [
+            {
+                "chunk_id": chunk["chunk_id"],
+                "text": chunk.get("text", ""),
+                "section": chunk.get("section", ""),
+                "tokens": chunk.get("tokens", 0),
+            }
+            for chunk in result.chunks
+        ]
+
+    return document_data
@@ -220,3 +220,21 @@ def format_rag_get_human(response: dict[str, Any]) -> str:
 **Vector Database UUID:** {doc["uuid"]}
 
 Execution time: {metadata["execution_time_ms"]}ms"""
+
+
+def format_rag_get_many_human(response: dict[str, Any]) -> str:
+    """Format RAG get_many response for human consumption."""
+    data = response["data"]
+    metadata = response["metadata"]
+
+    lines = [f"📚 **Documents Retrieved:** {len(data['documents'])}", ""]
+    for i, entry in enumerate(data["documents"], 1):
+        doc = entry["document"]
+        lines.append(f"**{i}. {doc['title']}**")
+        lines.append(f"   PMID: {doc['pmid']} | Date: {doc['publication_date']}")
+
+    if data["not_found"]:
+        lines.extend(["", f"**Not found:** {', '.join(data['not_found'])}"])
+
+    lines.extend(["", f"Execution time: {metadata['execution_time_ms']}ms"])
+    return "\n".join(lines)
@@ -155,6 +155,16 @@ def get_rag_tool_definitions() -> list[Tool]:
                         "description": "Boost results by PubMed quality metrics, journal impact, and investment relevance",
                         "default": True,
                     },
+                    "fetch_siblings": {
+                        "type": "boolean",
+                        "description": "Fetch each result's non-matching chunks to reconstruct full abstracts (one extra query)",
+                        "default": False,
+                    },
+                    "include_metadata": {
+                        "type": "boolean",
+                        "description": "Include full source metadata (authors, identifiers, provenance) for each result",
+                        "default": False,
+                    },
                     "filters": {
                         "type": "object",
                         "description": "Metadata filters for date ranges, journals, etc.",
@@ -195,6 +205,29 @@ def get_rag_tool_definitions() -> list[Tool]:
                 "additionalProperties": False,
             },
         ),
+        Tool(
+            name="rag.get_many",
+            description="Get several documents from the RAG corpus in one call",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "doc_ids": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Document IDs to retrieve (PMIDs or document UIDs)",
+                        "minItems": 1,
+                        "maxItems": SEARCH_CONFIG.RAG_GET_MANY_MAX_IDS,
+                    },
+                    "include_chunks": {
+                        "type": "boolean",
+                        "description": "Include each document's chunks",
+                        "default": False,
+                    },
+                },
+                "required": ["doc_ids"],
+                "additionalProperties": False,
+            },
+        ),
     ]
 
 
@@ -0,0 +1,151 @@
+"""
+Fixed-memory streaming latency histograms.
+
+Values are counted in logarithmic buckets (HDR-style) whose width grows with
+the value, so every quantile is accurate to ``relative_accuracy`` while the
+bucket count stays bounded by the tracked range rather than by the number of
+samples. Histograms with the same accuracy merge by adding bucket counts.
+"""
+
+import math
+from collections.abc import Iterable
+
+# Prometheus-style upper bounds (milliseconds) for exported latency buckets
+DEFAULT_LATENCY_BOUNDS_MS: tuple[float, ...] = (
+    5,
+    10,
+    25,
+    50,
+    100,
+    250,
+    500,
+    1000,
+    2500,
+    5000,
+    10000,
+    30000,
+    60000,
+)
+
+
+class LatencyHistogram:
+    """Streaming histogram with log-spaced buckets and bounded memory."""
+
+    def __init__(
+        self,
+        relative_accuracy: float = 0.01,
+        min_value: float = 0.001,
+        max_value: float = 3_600_000.0,
+    ):
+        """Initialize the histogram.
+
+        Args:
+            relative_accuracy: Maximum relative error of reported quantiles
+            min_value: Values at or below this are counted in a zero bucket
+            max_value: Values above this are clamped into the top bucket
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+
+        self.relative_accuracy = relative_accuracy
+        self.min_value = min_value
+        self.max_value = max_value
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+
+        self._buckets: dict[int, int] = {}
+        self._zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min: float | None = None
+        self.max: float | None = None
+
+    def record(self, value: float) -> None:
+        """Add one observation."""
+        self.count += 1
+        self.sum += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+        if value <= self.min_value:
+            self._zero_count += 1
+            return
+        index = self._index(min(value, self.max_value))
+        self._buckets[index] = self._buckets.get(index, 0) + 1
+
+    def quantile(self, q: float) -> float:
+        """Estimate the value at quantile ``q`` (0-1); 0.0 when empty."""
+        if self.count == 0:
+            return 0.0
+
+        rank = q * (self.count - 1)
+        seen = self._zero_count
+        if rank < seen:
+            return self._clamp(0.0)
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if rank < seen:
+                return self._clamp(self._value(index))
+        return self._clamp(self.max or 0.0)
+
+    @property
+    def mean(self) -> float:
+        """Mean of all observations (0.0 when empty)."""
+        return self.sum / self.count if self.count else 0.0
+
+    def cumulative_counts(
+        self, bounds: Iterable[float] = DEFAULT_LATENCY_BOUNDS_MS
+    ) -> list[tuple[float, int]]:
+        """Observations at or below each upper bound, Prometheus ``le`` style.
+
+        The bucket holding a bound is counted at or below it, so boundaries
+        are accurate to ``relative_accuracy``.
+        """
+        indexes = sorted(self._buckets)
+        counts: list[tuple[float, int]] = []
+        position = 0
+        running = self._zero_count
+        for bound in sorted(bounds):
+            last = self._index(bound) if bound > self.min_value else -math.inf
+            while position < len(indexes) and indexes[position] <= last:
+                running += self._buckets[indexes[position]]
+                position += 1
+            counts.append((bound, running))
+        return counts
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add another histogram's observations into this one."""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge histograms with different accuracy")
+
+        for index, count in other._buckets.items():
+            self._buckets[index] = self._buckets.get(index, 0) + count
+        self._zero_count += other._zero_count
+        self.count += other.count
+        self.sum += other.sum
+        if other.min is not None:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+        if other.max is not None:
+            self.max = other.max if self.max is None else max(self.max, other.max)
+
+    def snapshot(self) -> "LatencyHistogram":
+        """Independent copy, safe to read or merge while recording continues."""
+        copy = LatencyHistogram(self.relative_accuracy, self.min_value, self.max_value)
+        copy.merge(self)
+        return copy
+
+    def _index(self, value: float) -> int:
+        """Bucket covering (gamma^(i-1), gamma^i] for a positive value."""
+        return math.ceil(math.log(value) / self._log_gamma)
+
+    def _value(self, index: int) -> float:
+        """Representative value of a bucket (relative error <= accuracy)."""
+        return 2 * self._gamma**index / (self._gamma + 1)
+
+    def _clamp(self, value: float) -> float:
+        """Keep an estimate within the observed range."""
+        if self.min is not None:
+            value = max(value, self.min)
+        if self.max is not None:
+            value = min(value, self.max)
+        return value
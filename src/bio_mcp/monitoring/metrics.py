@@ -11,6 +11,9 @@ from threading import Lock
 from typing import Any
 
 from bio_mcp.config.config import config
+from bio_mcp.monitoring.histogram import LatencyHistogram
+from bio_mcp.shared.core.rate_governor import get_rate_governor
+from bio_mcp.shared.core.single_flight import get_coalescing_registry
 
 
 @dataclass
@@ -26,6 +29,9 @@ class ToolMetrics:
     min_duration_ms: float | None
     max_duration_ms: float | None
     last_called: str | None
+    p50_duration_ms: float | None = None
+    p95_duration_ms: float | None = None
+    p99_duration_ms: float | None = None
 
 
 @dataclass
@@ -52,7 +58,9 @@ class MetricsCollector:
         self._tool_calls: dict[str, int] = defaultdict(int)
         self._tool_successes: dict[str, int] = defaultdict(int)
         self._tool_errors: dict[str, int] = defaultdict(int)
-        self._tool_durations: dict[str, list[float]] = defaultdict(list)
+        self._tool_durations: dict[str, LatencyHistogram] = defaultdict(
+            LatencyHistogram
+        )
         self._tool_last_called: dict[str, datetime | None] = defaultdict(lambda: None)
 
         # Recent calls for detailed analysis
@@ -77,7 +85,7 @@ class MetricsCollector:
                 self._tool_errors[tool_name] += 1
 
             # Update timing
-            self._tool_durations[tool_name].append(duration_ms)
+            self._tool_durations[tool_name].record(duration_ms)
             self._tool_last_called[tool_name] = now
 
             # Record detailed call info
@@ -93,24 +101,40 @@ class MetricsCollector:
     def get_tool_metrics(self, tool_name: str) -> ToolMetrics | None:
         """Get metrics for a specific tool."""
         with self._lock:
-            if tool_name not in self._tool_calls:
-                return None
-
-            durations = self._tool_durations[tool_name]
-
-            return ToolMetrics(
-                name=tool_name,
-                call_count=self._tool_calls[tool_name],
-                success_count=self._tool_successes[tool_name],
-                error_count=self._tool_errors[tool_name],
-                total_duration_ms=sum(durations),
-                avg_duration_ms=sum(durations) / len(durations) if durations else 0,
-                min_duration_ms=min(durations) if durations else None,
-                max_duration_ms=max(durations) if durations else None,
-                last_called=self._tool_last_called[tool_name].isoformat()
-                if self._tool_last_called[tool_name]
-                else None,
-            )
+            return self._tool_metrics(tool_name)
+
+    def _tool_metrics(self, tool_name: str) -> ToolMetrics | None:
+        """Build a tool's metrics (caller holds the lock)."""
+        if tool_name not in self._tool_calls:
+            return None
+
+        durations = self._tool_durations[tool_name]
+        has_durations = durations.count > 0
+
+        return ToolMetrics(
+            name=tool_name,
+            call_count=self._tool_calls[tool_name],
+            success_count=self._tool_successes[tool_name],
+            error_count=self._tool_errors[tool_name],
+            total_duration_ms=durations.sum,
+            avg_duration_ms=durations.mean,
+            min_duration_ms=durations.min,
+            max_duration_ms=durations.max,
+            last_called=self._tool_last_called[tool_name].isoformat()
+            if self._tool_last_called[tool_name]
+            else None,
+            p50_duration_ms=durations.quantile(0.50) if has_durations else None,
+            p95_duration_ms=durations.quantile(0.95) if has_durations else None,
+            p99_duration_ms=durations.quantile(0.99) if has_durations else None,
+        )
+
+    def get_duration_histograms(self) -> dict[str, LatencyHistogram]:
+        """Snapshots of the per-tool duration histograms (mergeable)."""
+        with self._lock:
+            return {
+                tool: durations.snapshot()
+                for tool, durations in self._tool_durations.items()
+            }
 
     def get_all_metrics(self) -> ServerMetrics:
         """Get comprehensive server metrics."""
@@ -120,7 +144,7 @@ class MetricsCollector:
             # Collect tool metrics
             tool_metrics = []
             for tool_name in self._tool_calls:
-                tool_metric = self.get_tool_metrics(tool_name)
+                tool_metric = self._tool_metrics(tool_name)
                 if tool_metric:
                     tool_metrics.append(tool_metric)
 
@@ -189,5 +213,7 @@ def get_metrics_dict() -> dict[str, Any]:
             ),
         },
         "tools": [asdict(tool) for tool in metrics.tools],
+        "upstreams": get_rate_governor().metrics(),
+        "coalescing": get_coalescing_registry().metrics(),
         "version": config.version,
     }
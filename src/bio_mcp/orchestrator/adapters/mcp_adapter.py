@@ -5,23 +5,34 @@ from datetime import UTC, datetime
 from typing import Any
 
 from bio_mcp.orchestrator.config import OrchestratorConfig
+from bio_mcp.orchestrator.middleware.tool_cache import ToolResultCache, get_tool_cache
 from bio_mcp.orchestrator.types import NodeResult
 
+CACHE_POLICIES = ("cache_then_network", "cache_only", "network_only")
+
 
 class MCPToolAdapter:
     """Adapter for MCP tool integration with caching and fallback patterns."""
 
-    def __init__(self, config: OrchestratorConfig, db_manager: Any):
+    def __init__(
+        self,
+        config: OrchestratorConfig,
+        db_manager: Any,
+        cache: ToolResultCache | None = None,
+    ):
         """Initialize the MCP tool adapter.
 
         Args:
             config: Orchestrator configuration
             db_manager: Database manager for tool data access
+            cache: Tool-result cache (defaults to the process-wide cache)
         """
         self.config = config
         self.db_manager = db_manager
         self._tools: dict[str, Any] = {}
-        self.cache: Any | None = None
+        self.cache: ToolResultCache | None = cache
+        if self.cache is None and config.cache_enabled:
+            self.cache = get_tool_cache(config)
 
     async def execute_tool(
         self,
@@ -41,8 +52,38 @@ class MCPToolAdapter:
         """
         start_time = datetime.now(UTC)
 
-        # TODO: Implement caching when cache backend is available
-        # For now, cache policies are ignored and we always execute directly
+        if cache_policy not in CACHE_POLICIES:
+            return NodeResult(
+                success=False,
+                error_code="INVALID_CACHE_POLICY",
+                error_message=f"Unknown cache policy {cache_policy}",
+                latency_ms=int((datetime.now(UTC) - start_time).total_seconds() * 1000),
+                cache_hit=False,
+                node_name=tool_name,
+            )
+
+        if self.cache is not None and cache_policy != "network_only":
+            hit, cached = await self.cache.get(tool_name, args)
+            if hit:
+                return NodeResult(
+                    success=True,
+                    data=cached,
+                    latency_ms=int(
+                        (datetime.now(UTC) - start_time).total_seconds() * 1000
+                    ),
+                    cache_hit=True,
+                    node_name=tool_name,
+                )
+
+        if cache_policy == "cache_only":
+            return NodeResult(
+                success=False,
+                error_code="CACHE_MISS",
+                error_message=f"No cached result for {tool_name}",
+                latency_ms=int((datetime.now(UTC) - start_time).total_seconds() * 1000),
+                cache_hit=False,
+                node_name=tool_name,
+            )
 
         # Check if tool exists (after cache checks)
         if tool_name not in self._tools:
@@ -59,15 +100,6 @@ class MCPToolAdapter:
         tool = self._tools[tool_name]
         try:
             result = await tool.execute(args)
-
-            return NodeResult(
-                success=True,
-                data=result,
-                latency_ms=int((datetime.now(UTC) - start_time).total_seconds() * 1000),
-                cache_hit=False,
-                node_name=tool_name,
-            )
-
         except Exception as e:
             return NodeResult(
                 success=False,
@@ -78,6 +110,18 @@ class MCPToolAdapter:
                 node_name=tool_name,
             )
 
+        # network_only still refreshes the cache for later callers
+        if self.cache is not None:
+            await self.cache.set(tool_name, args, result)
+
+        return NodeResult(
+            success=True,
+            data=result,
+            latency_ms=int((datetime.now(UTC) - start_time).total_seconds() * 1000),
+            cache_hit=False,
+            node_name=tool_name,
+        )
+
     async def batch_execute(
         self, tool_calls: list[dict[str, Any]], max_concurrency: int = 5
     ) -> list[NodeResult]:
@@ -48,6 +48,24 @@ class OrchestratorConfig(BaseModel):
     # Cache Policy
     default_fetch_policy: str = Field(default="cache_then_network")
     cache_ttl: int = Field(default=3600, description="Cache TTL in seconds")
+    cache_enabled: bool = Field(default=True, description="Cache tool results")
+    cache_max_entries: int = Field(
+        default=1024, description="Max tool results held in process"
+    )
+    cache_tool_ttls: dict[str, int] = Field(
+        default_factory=lambda: {
+            "pubmed.get": 86400,
+            "clinicaltrials.get": 21600,
+            "rag.search": 900,
+        },
+        description="Per-tool TTL overrides in seconds (0 disables caching)",
+    )
+    cache_db_path: str | None = Field(
+        default=None, description="SQLite file for the shared cache tier"
+    )
+    cache_db_max_entries: int = Field(
+        default=20000, description="Max tool results held in the shared tier"
+    )
 
     # Features
     enable_streaming: bool = Field(default=True, description="Enable streaming results")
@@ -7,16 +7,22 @@ from typing import Any
 
 from bio_mcp.orchestrator.middleware.rate_limiter import TokenBucketRateLimiter
 from bio_mcp.orchestrator.types import NodeResult
+from bio_mcp.shared.core.rate_governor import UpstreamBudget
 
 
 class ParallelExecutor:
     """Coordinator for parallel task execution with rate limiting and concurrency control."""
 
-    def __init__(self, rate_limiter: TokenBucketRateLimiter, max_concurrency: int = 5):
+    def __init__(
+        self,
+        rate_limiter: TokenBucketRateLimiter | UpstreamBudget | None,
+        max_concurrency: int = 5,
+    ):
         """Initialize the parallel executor.
 
         Args:
-            rate_limiter: Token bucket rate limiter for throttling
+            rate_limiter: Token bucket for throttling (None = tasks throttle
+                themselves, e.g. through their client's upstream budget)
             max_concurrency: Maximum number of concurrent tasks
         """
         self.rate_limiter = rate_limiter
@@ -84,7 +90,8 @@ class ParallelExecutor:
             token_cost: int = task.get("token_cost", 1)
 
             # Acquire rate limiting tokens
-            await self.rate_limiter.acquire(token_cost)
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire(token_cost)
 
             # Acquire concurrency semaphore
             async with self._semaphore:
@@ -65,9 +65,20 @@ def build_orchestrator_graph(config: OrchestratorConfig) -> StateGraph:
     else:
         routing_map["rag_search"] = "pubmed_search"  # Fallback
 
-    workflow.add_conditional_edges("router", routing_function, routing_map)
-
-    # All tool nodes lead to synthesizer
+    def route_to_tools(state: OrchestratorState) -> list[str]:
+        """Resolve routing targets to available nodes, fanning out in parallel."""
+        targets = routing_function(state)
+        if isinstance(targets, str):
+            targets = [targets]
+        # Fallbacks can map two targets to one node; run each node once
+        return list(dict.fromkeys(routing_map[t] for t in targets if t in routing_map))
+
+    workflow.add_conditional_edges(
+        "router", route_to_tools, sorted(set(routing_map.values()))
+    )
+
+    # All tool nodes lead to synthesizer. Parallel branches finish in the same
+    # step, so the synthesizer runs once with every branch's results merged.
     for node_name in ["pubmed_search", "ctgov_search", "rag_search"]:
         if node_name in node_instances:
             workflow.add_edge(node_name, "synthesizer")
@@ -0,0 +1,443 @@
+"""Tool-result cache for MCP tool execution.
+
+Results are keyed by normalized tool name plus a digest of the canonicalized
+arguments and held in two tiers: an in-process LRU with per-entry TTLs, and an
+optional SQLite file shared between processes.
+"""
+
+import asyncio
+import copy
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from typing import Any
+
+from bio_mcp.config.logging_config import get_logger
+from bio_mcp.orchestrator.config import OrchestratorConfig
+from bio_mcp.orchestrator.interfaces import BaseMetricsCollector
+
+logger = get_logger(__name__)
+
+
+def normalize_tool_name(tool_name: str) -> str:
+    """Normalize a tool name for use in cache keys."""
+    return tool_name.strip().lower()
+
+
+def canonicalize_args(value: Any) -> Any:
+    """Canonicalize tool arguments so equivalent calls share a cache key.
+
+    Dict keys are sorted, None values dropped, string whitespace collapsed and
+    sets ordered. List order is preserved since it can be meaningful.
+    """
+    if isinstance(value, dict):
+        return {
+            str(k): canonicalize_args(v)
+            for k, v in sorted(value.items(), key=lambda item: str(item[0]))
+            if v is not None
+        }
+    if isinstance(value, list | tuple):
+        return [canonicalize_args(v) for v in value]
+    if isinstance(value, set | frozenset):
+        return sorted(
+            (canonicalize_args(v) for v in value),
+            key=lambda v: json.dumps(v, default=str),
+        )
+    if isinstance(value, str):
+        return " ".join(value.split())
+    return value
+
+
+def make_cache_key(tool_name: str, args: dict[str, Any]) -> str:
+    """Build the cache key for a tool call."""
+    payload = json.dumps(
+        canonicalize_args(args), sort_keys=True, separators=(",", ":"), default=str
+    )
+    digest = hashlib.sha256(payload.encode()).hexdigest()
+    return f"{normalize_tool_name(tool_name)}:{digest}"
+
+
+class LRUTTLCache:
+    """In-process LRU cache with per-entry TTL."""
+
+    def __init__(self, max_entries: int = 1024, default_ttl: int = 3600):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Entries kept before least recently used ones are evicted
+            default_ttl: TTL in seconds when ``set`` is not given one
+        """
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.evictions = 0
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: str) -> Any | None:
+        """Get a copy of a cached value, or None if missing or expired."""
+        entry = self.get_entry(key)
+        return entry[0] if entry else None
+
+    def get_entry(self, key: str) -> tuple[Any, float] | None:
+        """Get a copy of a cached value and its remaining TTL in seconds."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        remaining = expires_at - time.monotonic()
+        if remaining <= 0:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return copy.deepcopy(value), remaining
+
+    async def set(self, key: str, value: Any, ttl: int | float | None = None) -> None:
+        """Store a copy of a value, evicting least recently used entries."""
+        ttl = self.default_ttl if ttl is None else ttl
+        self._entries[key] = (time.monotonic() + ttl, copy.deepcopy(value))
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    async def delete(self, key: str) -> None:
+        """Remove a cached value."""
+        self._entries.pop(key, None)
+
+    async def clear(self) -> None:
+        """Remove all cached values."""
+        self._entries.clear()
+
+
+class SQLiteCacheTier:
+    """Shared cache tier in a local SQLite file.
+
+    Values are stored as JSON, so results that do not serialize are only held
+    in the in-process tier. The async methods run SQLite in a worker thread so
+    lookups never block the event loop; a lock serializes use of the connection.
+    """
+
+    # Expired and over-limit rows are pruned every N writes
+    PRUNE_INTERVAL = 100
+
+    def __init__(self, db_path: str, max_entries: int = 20000):
+        """Initialize the shared tier.
+
+        Args:
+            db_path: SQLite database path
+            max_entries: Rows kept before the oldest are pruned
+        """
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.evictions = 0
+        self._writes = 0
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._initialize_tables()
+
+    def _initialize_tables(self) -> None:
+        """Create the cache table if needed."""
+        cursor = self.conn.cursor()
+        # WAL lets several processes read while one writes
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS tool_result_cache (
+                cache_key TEXT PRIMARY KEY,
+                tool_name TEXT NOT NULL,
+                value TEXT NOT NULL,
+                expires_at REAL NOT NULL,
+                created_at REAL NOT NULL
+            )
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_tool_result_cache_expires
+            ON tool_result_cache (expires_at)
+        """)
+        self.conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            cursor = self.conn.execute("SELECT COUNT(*) FROM tool_result_cache")
+            return cursor.fetchone()[0]
+
+    async def get(self, key: str) -> Any | None:
+        """Get a cached value, or None if missing or expired."""
+        entry = await self.get_entry(key)
+        return entry[0] if entry else None
+
+    async def get_entry(self, key: str) -> tuple[Any, float] | None:
+        """Get a cached value and its remaining TTL in seconds."""
+        return await asyncio.to_thread(self._get_entry, key)
+
+    def _get_entry(self, key: str) -> tuple[Any, float] | None:
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT value, expires_at FROM tool_result_cache WHERE cache_key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+
+            value, expires_at = row
+            remaining = expires_at - time.time()
+            if remaining <= 0:
+                self.conn.execute(
+                    "DELETE FROM tool_result_cache WHERE cache_key = ?", (key,)
+                )
+                self.conn.commit()
+                return None
+
+        return json.loads(value), remaining
+
+    async def set(self, key: str, value: Any, ttl: int | float | None = None) -> None:
+        """Store a value; values that do not serialize to JSON are skipped."""
+        try:
+            payload = json.dumps(value)
+        except (TypeError, ValueError) as e:
+            logger.debug("Skipping shared cache write", key=key, error=str(e))
+            return
+
+        await asyncio.to_thread(self._set, key, payload, ttl or 0)
+
+    def _set(self, key: str, payload: str, ttl: int | float) -> None:
+        now = time.time()
+        with self._lock:
+            self.conn.execute(
+                """
+                INSERT OR REPLACE INTO tool_result_cache
+                (cache_key, tool_name, value, expires_at, created_at)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (key, key.split(":", 1)[0], payload, now + ttl, now),
+            )
+            self.conn.commit()
+            self._writes += 1
+            prune = self._writes % self.PRUNE_INTERVAL == 0
+
+        if prune:
+            self.prune()
+
+    def prune(self) -> None:
+        """Drop expired rows, then the oldest rows beyond ``max_entries``."""
+        with self._lock:
+            self._prune()
+
+    def _prune(self) -> None:
+        cursor = self.conn.cursor()
+        cursor.execute(
+            "DELETE FROM tool_result_cache WHERE expires_at <= ?", (time.time(),)
+        )
+        cursor.execute(
+            """
+            DELETE FROM tool_result_cache WHERE cache_key IN (
+                SELECT cache_key FROM tool_result_cache
+                ORDER BY created_at DESC LIMIT -1 OFFSET ?
+            )
+            """,
+            (self.max_entries,),
+        )
+        self.evictions += cursor.rowcount
+        self.conn.commit()
+
+    async def delete(self, key: str) -> None:
+        """Remove a cached value."""
+        await asyncio.to_thread(
+            self._execute, "DELETE FROM tool_result_cache WHERE cache_key = ?", (key,)
+        )
+
+    async def clear(self) -> None:
+        """Remove all cached values."""
+        await asyncio.to_thread(self._execute, "DELETE FROM tool_result_cache")
+
+    def _execute(self, sql: str, params: tuple = ()) -> None:
+        with self._lock:
+            self.conn.execute(sql, params)
+            self.conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self.conn.close()
+
+
+class ToolResultCache:
+    """Two-tier tool-result cache with per-tool TTLs and hit/miss metrics."""
+
+    def __init__(
+        self,
+        local: LRUTTLCache | None = None,
+        shared: SQLiteCacheTier | None = None,
+        default_ttl: int = 3600,
+        tool_ttls: dict[str, int] | None = None,
+        metrics: BaseMetricsCollector | None = None,
+    ):
+        """Initialize the cache.
+
+        Args:
+            local: In-process tier
+            shared: Optional tier shared between processes
+            default_ttl: TTL in seconds for tools without an override
+            tool_ttls: Per-tool TTL overrides; a TTL of 0 disables caching
+            metrics: Optional collector notified of every hit and miss
+        """
+        self.local = local or LRUTTLCache(default_ttl=default_ttl)
+        self.shared = shared
+        self.default_ttl = default_ttl
+        self.tool_ttls = {
+            normalize_tool_name(name): ttl for name, ttl in (tool_ttls or {}).items()
+        }
+        self.metrics = metrics
+        self._hits: dict[str, int] = defaultdict(int)
+        self._misses: dict[str, int] = defaultdict(int)
+        self._shared_hits = 0
+
+    @classmethod
+    def from_config(
+        cls, config: OrchestratorConfig, metrics: BaseMetricsCollector | None = None
+    ) -> "ToolResultCache":
+        """Create a cache from orchestrator configuration."""
+        shared = (
+            SQLiteCacheTier(config.cache_db_path, config.cache_db_max_entries)
+            if config.cache_db_path
+            else None
+        )
+        return cls(
+            local=LRUTTLCache(config.cache_max_entries, config.cache_ttl),
+            shared=shared,
+            default_ttl=config.cache_ttl,
+            tool_ttls=config.cache_tool_ttls,
+            metrics=metrics,
+        )
+
+    def ttl_for(self, tool_name: str) -> int:
+        """TTL in seconds for a tool's results."""
+        return self.tool_ttls.get(normalize_tool_name(tool_name), self.default_ttl)
+
+    async def get(self, tool_name: str, args: dict[str, Any]) -> tuple[bool, Any]:
+        """Look up a tool result.
+
+        Returns:
+            Tuple of (hit, value)
+        """
+        tool = normalize_tool_name(tool_name)
+        key = make_cache_key(tool, args)
+
+        entry = self.local.get_entry(key)
+        if entry is None and self.shared is not None:
+            entry = await self.shared.get_entry(key)
+            if entry is not None:
+                self._shared_hits += 1
+                # Promote for the remaining lifetime only
+                await self.local.set(key, entry[0], ttl=entry[1])
+
+        hit = entry is not None
+        if hit:
+            self._hits[tool] += 1
+        else:
+            self._misses[tool] += 1
+        if self.metrics:
+            self.metrics.record_cache_hit(tool, hit)
+
+        return hit, entry[0] if entry else None
+
+    async def set(self, tool_name: str, args: dict[str, Any], value: Any) -> None:
+        """Store a tool result under the tool's TTL."""
+        ttl = self.ttl_for(tool_name)
+        if ttl <= 0 or value is None:
+            return
+
+        key = make_cache_key(tool_name, args)
+        await self.local.set(key, value, ttl=ttl)
+        if self.shared is not None:
+            await self.shared.set(key, value, ttl=ttl)
+
+    async def invalidate(self, tool_name: str, args: dict[str, Any]) -> None:
+        """Drop a cached tool result from every tier."""
+        key = make_cache_key(tool_name, args)
+        await self.local.delete(key)
+        if self.shared is not None:
+            await self.shared.delete(key)
+
+    async def clear(self) -> None:
+        """Drop all cached results from every tier."""
+        await self.local.clear()
+        if self.shared is not None:
+            await self.shared.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Hit/miss counters, overall and per tool."""
+        hits = sum(self._hits.values())
+        misses = sum(self._misses.values())
+        tools = sorted(set(self._hits) | set(self._misses))
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+            "shared_hits": self._shared_hits,
+            "local_entries": len(self.local),
+            "local_evictions": self.local.evictions,
+            "shared_entries": len(self.shared) if self.shared is not None else 0,
+            "shared_evictions": self.shared.evictions if self.shared else 0,
+            "by_tool": {
+                tool: {"hits": self._hits[tool], "misses": self._misses[tool]}
+                for tool in tools
+            },
+        }
+
+    def close(self) -> None:
+        """Release the shared tier's resources."""
+        if self.shared is not None:
+            self.shared.close()
+
+
+# Process-wide cache shared by every adapter, and the settings it was built from
+_tool_cache: ToolResultCache | None = None
+_tool_cache_settings: tuple | None = None
+
+
+def _cache_settings(config: OrchestratorConfig) -> tuple:
+    """The configuration fields that shape the tool-result cache."""
+    return (
+        config.cache_max_entries,
+        config.cache_ttl,
+        config.cache_db_path,
+        config.cache_db_max_entries,
+        tuple(sorted(config.cache_tool_ttls.items())),
+    )
+
+
+def get_tool_cache(config: OrchestratorConfig | None = None) -> ToolResultCache:
+    """Get the process-wide tool-result cache, creating it on first use.
+
+    Raises:
+        ValueError: If ``config`` has different cache settings from the config
+            the cache was created with; call ``reset_tool_cache`` to apply them
+    """
+    global _tool_cache, _tool_cache_settings
+    if _tool_cache is None:
+        config = config or OrchestratorConfig()
+        _tool_cache = ToolResultCache.from_config(config)
+        _tool_cache_settings = _cache_settings(config)
+    elif config is not None and _cache_settings(config) != _tool_cache_settings:
+        raise ValueError(
+            "Tool-result cache already created with different cache settings; "
+            "call reset_tool_cache() before applying a new configuration"
+        )
+    return _tool_cache
+
+
+def reset_tool_cache() -> None:
+    """Drop the process-wide cache (used by tests and on config reload)."""
+    global _tool_cache, _tool_cache_settings
+    if _tool_cache is not None:
+        _tool_cache.close()
+    _tool_cache = None
+    _tool_cache_settings = None
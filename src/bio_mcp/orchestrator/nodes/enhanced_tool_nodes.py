@@ -6,8 +6,8 @@ from typing import Any
 from bio_mcp.orchestrator.adapters.mcp_adapter import MCPToolAdapter
 from bio_mcp.orchestrator.config import OrchestratorConfig
 from bio_mcp.orchestrator.execution.parallel_executor import ParallelExecutor
-from bio_mcp.orchestrator.middleware.rate_limiter import TokenBucketRateLimiter
 from bio_mcp.orchestrator.types import NodeResult, OrchestratorState
+from bio_mcp.shared.core.rate_governor import openai_budget
 
 
 class EnhancedPubMedNode:
@@ -18,9 +18,9 @@ class EnhancedPubMedNode:
         self.config = config
         self.adapter = MCPToolAdapter(config, db_manager)
 
-        # Create rate limiter for PubMed (2 requests per second, capacity 5)
-        rate_limiter = TokenBucketRateLimiter(capacity=5, refill_rate=2.0)
-        self.executor = ParallelExecutor(rate_limiter=rate_limiter, max_concurrency=3)
+        # PubMedClient acquires from the shared ncbi-eutils budget, so the
+        # executor only bounds concurrency
+        self.executor = ParallelExecutor(rate_limiter=None, max_concurrency=3)
 
     async def __call__(self, state: OrchestratorState) -> dict[str, Any]:
         """Execute PubMed search with enhanced integration."""
@@ -156,9 +156,9 @@ class EnhancedTrialsNode:
         self.config = config
         self.adapter = MCPToolAdapter(config, db_manager)
 
-        # Create rate limiter for ClinicalTrials (2 requests per second, capacity 3)
-        rate_limiter = TokenBucketRateLimiter(capacity=3, refill_rate=2.0)
-        self.executor = ParallelExecutor(rate_limiter=rate_limiter, max_concurrency=2)
+        # ClinicalTrialsClient acquires from the shared ctgov-v2 budget, so the
+        # executor only bounds concurrency
+        self.executor = ParallelExecutor(rate_limiter=None, max_concurrency=2)
 
     async def __call__(self, state: OrchestratorState) -> dict[str, Any]:
         """Execute ClinicalTrials search with enhanced filtering."""
@@ -382,9 +382,11 @@ class EnhancedRAGNode:
         self.config = config
         self.adapter = MCPToolAdapter(config, db_manager)
 
-        # Create rate limiter for RAG (3 requests per second, capacity 8)
-        rate_limiter = TokenBucketRateLimiter(capacity=8, refill_rate=3.0)
-        self.executor = ParallelExecutor(rate_limiter=rate_limiter, max_concurrency=2)
+        # Each RAG search embeds its query with OpenAI (via the Weaviate
+        # vectorizer), so searches draw on the shared openai budget
+        self.executor = ParallelExecutor(
+            rate_limiter=openai_budget(), max_concurrency=2
+        )
 
     async def __call__(self, state: OrchestratorState) -> dict[str, Any]:
         """Execute RAG search with enhanced querying."""
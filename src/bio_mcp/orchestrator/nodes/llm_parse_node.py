@@ -11,6 +11,7 @@ from pydantic import ValidationError
 from bio_mcp.config.logging_config import get_logger
 from bio_mcp.orchestrator.config import OrchestratorConfig
 from bio_mcp.orchestrator.types import FrameModel, OrchestratorState
+from bio_mcp.shared.core.rate_governor import openai_budget, parse_retry_after
 
 logger = get_logger(__name__)
 
@@ -21,6 +22,7 @@ class LLMParseNode:
     def __init__(self, config: OrchestratorConfig):
         self.config = config
         self.client = openai.AsyncOpenAI()
+        self.rate_limiter = openai_budget()
         self._setup_medical_knowledge()
 
     def _setup_medical_knowledge(self):
@@ -211,13 +213,21 @@ Confidence Scoring:
                 }
             )
 
-        response = await self.client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=messages,
-            response_format={"type": "json_object"},
-            temperature=0.1,  # Low temperature for consistency
-            max_tokens=1000,
-        )
+        await self.rate_limiter.acquire()
+        try:
+            response = await self.client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=messages,
+                response_format={"type": "json_object"},
+                temperature=0.1,  # Low temperature for consistency
+                max_tokens=1000,
+            )
+        except openai.RateLimitError as e:
+            self.rate_limiter.on_throttled(
+                parse_retry_after(e.response.headers.get("retry-after"))
+            )
+            raise
+        self.rate_limiter.on_success()
 
         response_text = response.choices[0].message.content
         if not response_text:
@@ -9,6 +9,15 @@ from bio_mcp.orchestrator.types import OrchestratorState
 
 logger = get_logger(__name__)
 
+# Tool nodes each intent needs; several entries fan out in parallel
+INTENT_ROUTES: dict[str, list[str]] = {
+    "recent_pubs_by_topic": ["pubmed_search"],
+    "indication_phase_trials": ["ctgov_search"],
+    "trials_with_pubs": ["ctgov_search", "pubmed_search"],
+    "hybrid_search": ["rag_search", "pubmed_search"],
+    "company_pipeline": ["ctgov_search"],
+}
+
 
 class RouterNode:
     """Node that routes execution based on parsed intent."""
@@ -19,13 +28,7 @@ class RouterNode:
 
     def _setup_routing_rules(self):
         """Setup intent to node routing rules."""
-        self.routing_map = {
-            "recent_pubs_by_topic": ["pubmed_search"],
-            "indication_phase_trials": ["ctgov_search"],
-            "trials_with_pubs": ["ctgov_search", "pubmed_search"],  # Parallel
-            "hybrid_search": ["rag_search"],
-            "company_pipeline": ["company_search", "ctgov_search"],
-        }
+        self.routing_map = dict(INTENT_ROUTES)
 
     async def __call__(self, state: OrchestratorState) -> dict[str, Any]:
         """Route based on frame intent."""
@@ -77,29 +80,25 @@ class RouterNode:
         }
 
 
-def routing_function(state: OrchestratorState) -> str:
-    """Conditional routing function for LangGraph edges with confidence awareness."""
-    frame = state.get("frame", {})
+def routing_function(state: OrchestratorState) -> str | list[str]:
+    """Conditional routing function for LangGraph edges with confidence awareness.
+
+    Returns a single node name, or a list of node names when the intent needs
+    several sources; LangGraph runs a list of targets as parallel branches.
+    """
+    frame = state.get("frame") or {}
     intent = frame.get("intent", "recent_pubs_by_topic")
-    intent_confidence = state.get("intent_confidence", 0.0)
+    intent_confidence = state.get("intent_confidence") or 0.0
 
-    # Low confidence fallback to hybrid search (M1: still goes to pubmed_search)
+    # Low confidence fallback to hybrid search over the local corpus
     if intent_confidence < 0.5:
         logger.info(
             f"Low confidence ({intent_confidence:.2f}), routing to hybrid search"
         )
-        return "rag_search"  # Note: graph_builder routes this to pubmed_search in M1
-
-    # Map intents to tool nodes (M2: full routing)
-    routing_map = {
-        "recent_pubs_by_topic": "pubmed_search",
-        "indication_phase_trials": "ctgov_search",
-        "trials_with_pubs": "ctgov_search",  # TODO: Enable parallel routing in future
-        "hybrid_search": "rag_search",
-        "company_pipeline": "ctgov_search",
-    }
-
-    return routing_map.get(intent, "pubmed_search")
+        return "rag_search"
+
+    targets = INTENT_ROUTES.get(intent, ["pubmed_search"])
+    return targets[0] if len(targets) == 1 else list(targets)
 
 
 def create_router_node(config: OrchestratorConfig):
@@ -8,6 +8,30 @@ from langgraph.graph.message import add_messages
 from pydantic import BaseModel, Field
 
 
+def merge_branch_lists(left: list[Any] | None, right: list[Any] | None) -> list[Any]:
+    """Reducer for list fields that nodes return in full (``state[key] + [new]``).
+
+    Parallel branches each extend the same snapshot, so only the items past the
+    prefix shared with the current value are appended. A sequential update,
+    which always extends the current value, is taken as is.
+    """
+    left = left or []
+    right = right or []
+    shared = 0
+    for current, update in zip(left, right, strict=False):
+        if current != update:
+            break
+        shared += 1
+    return left + right[shared:]
+
+
+def merge_dicts(
+    left: dict[str, Any] | None, right: dict[str, Any] | None
+) -> dict[str, Any]:
+    """Reducer for dict fields updated by parallel branches."""
+    return {**(left or {}), **(right or {})}
+
+
 # Core state for the orchestrator graph
 class OrchestratorState(TypedDict):
     """Central state for bio-mcp orchestrator workflow."""
@@ -35,11 +59,12 @@ class OrchestratorState(TypedDict):
     rag_results: dict[str, Any] | None
 
     # Metadata and tracing
-    tool_calls_made: list[str]
-    cache_hits: dict[str, bool]
-    latencies: dict[str, float]
-    errors: list[dict[str, Any]]
-    node_path: list[str]  # Execution path through graph
+    # Reducers let parallel tool branches update these in the same step
+    tool_calls_made: Annotated[list[str], merge_branch_lists]
+    cache_hits: Annotated[dict[str, bool], merge_dicts]
+    latencies: Annotated[dict[str, float], merge_dicts]
+    errors: Annotated[list[dict[str, Any]], merge_branch_lists]
+    node_path: Annotated[list[str], merge_branch_lists]  # Execution path through graph
 
     # Output
     answer: str | None
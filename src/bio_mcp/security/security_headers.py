@@ -329,9 +329,12 @@ def validate_tool_input(tool_name: str, arguments: dict[str, Any]) -> RequestCon
             "search_mode": "string",
             "alpha": "number",
             "rerank_by_quality": "boolean",
+            "fetch_siblings": "boolean",
+            "include_metadata": "boolean",
             "filters": "object",
         },
         "rag.get": {"doc_id": "string"},
+        "rag.get_many": {"doc_ids": "array", "include_chunks": "boolean"},
         "corpus.checkpoint.create": {
             "checkpoint_id": "string",
             "name": "string",
@@ -6,12 +6,20 @@ Implements the chunking strategy from CHUNKING_STRATEGY.md with:
 - Token budgets with overlap
 - Numeric safety expansion
 - Deterministic chunk IDs
+- Batch chunking across worker processes
 """
 
+import multiprocessing
+import os
 import re
+import threading
 import unicodedata
 from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from itertools import accumulate
 from typing import ClassVar
 
 from bio_mcp.config.logging_config import get_logger
@@ -28,7 +36,7 @@ class ChunkingConfig:
     max_tokens: int = 450  # Hard maximum tokens
     min_tokens: int = 120  # Minimum section size before chunking
     overlap_tokens: int = 50  # Overlap for long sections
-    chunker_version: str = "v1.2.0"
+    chunker_version: str = "v1.3.0"
 
     # Section boost weights for search
     section_boosts: dict[str, float] = None
@@ -75,6 +83,10 @@ class HuggingFaceTokenizer(BaseTokenizer):
             logger.warning(f"Failed to load HuggingFace tokenizer {model_name}: {e}")
             raise
 
+    def __reduce__(self):
+        # Reload the model in the receiving process instead of pickling it
+        return (type(self), (self.model_name,))
+
     def count_tokens(self, text: str) -> int:
         """Count tokens using HF tokenizer."""
         return len(self.tokenizer.encode(text, add_special_tokens=False))
@@ -100,6 +112,10 @@ class TikTokenTokenizer(BaseTokenizer):
             logger.warning(f"Failed to load tiktoken encoding {encoding_name}: {e}")
             self.encoding = None
 
+    def __reduce__(self):
+        # Reload the encoding in the receiving process instead of pickling it
+        return (type(self), (self.encoding_name,))
+
     def count_tokens(self, text: str) -> int:
         """Count tokens using tiktoken."""
         if self.encoding:
@@ -161,16 +177,58 @@ class SectionDetector:
         r"^\s*(Limitations?|Study Limitations?)\s*[:\-]",
     ]
 
+    # Compiled once per process rather than on every detect_sections() call
+    SECTION_RE: ClassVar[re.Pattern[str]] = re.compile(
+        "|".join(f"({pattern})" for pattern in SECTION_PATTERNS),
+        re.MULTILINE | re.IGNORECASE,
+    )
+    HEADING_RE: ClassVar[re.Pattern[str]] = re.compile(
+        r"^\s*[^:\-]*[:\-]\s*", re.MULTILINE
+    )
+    HEADING_PUNCTUATION_RE: ClassVar[re.Pattern[str]] = re.compile(r"[:\-\s]+")
+
+    # Normalize common variations of heading names
+    SECTION_NAMES: ClassVar[dict[str, str]] = {
+        "background": "Background",
+        "introduction": "Background",
+        "rationale": "Background",
+        "objective": "Objective",
+        "objectives": "Objective",
+        "aim": "Objective",
+        "aims": "Objective",
+        "purpose": "Objective",
+        "goal": "Objective",
+        "goals": "Objective",
+        "methods": "Methods",
+        "method": "Methods",
+        "materials": "Methods",
+        "design": "Methods",
+        "setting": "Methods",
+        "participants": "Methods",
+        "participant": "Methods",
+        "interventions": "Methods",
+        "intervention": "Methods",
+        "measures": "Methods",
+        "results": "Results",
+        "result": "Results",
+        "findings": "Results",
+        "finding": "Results",
+        "outcomes": "Results",
+        "outcome": "Results",
+        "conclusions": "Conclusions",
+        "conclusion": "Conclusions",
+        "interpretation": "Conclusions",
+        "implications": "Conclusions",
+        "implication": "Conclusions",
+        "limitations": "Conclusions",
+        "limitation": "Conclusions",
+    }
+
     def detect_sections(self, text: str) -> list[Section]:
         """Detect sections in abstract text."""
         sections = []
 
-        # Combine all patterns for detection
-        combined_pattern = "|".join(f"({pattern})" for pattern in self.SECTION_PATTERNS)
-
-        matches = list(
-            re.finditer(combined_pattern, text, re.MULTILINE | re.IGNORECASE)
-        )
+        matches = list(self.SECTION_RE.finditer(text))
 
         if not matches:
             # Unstructured abstract
@@ -193,9 +251,7 @@ class SectionDetector:
             section_content = text[section_start:section_end].strip()
 
             # Remove the heading from content
-            section_content = re.sub(
-                r"^\s*[^:\-]*[:\-]\s*", "", section_content, flags=re.MULTILINE
-            )
+            section_content = self.HEADING_RE.sub("", section_content)
 
             if section_content:  # Only add non-empty sections
                 sections.append(
@@ -212,59 +268,58 @@ class SectionDetector:
     def _extract_section_name(self, heading: str) -> str:
         """Extract clean section name from heading."""
         # Remove punctuation and whitespace
-        clean = re.sub(r"[:\-\s]+", "", heading).strip()
-
-        # Normalize common variations
-        name_mapping = {
-            "background": "Background",
-            "introduction": "Background",
-            "rationale": "Background",
-            "objective": "Objective",
-            "objectives": "Objective",
-            "aim": "Objective",
-            "aims": "Objective",
-            "purpose": "Objective",
-            "goal": "Objective",
-            "goals": "Objective",
-            "methods": "Methods",
-            "method": "Methods",
-            "materials": "Methods",
-            "design": "Methods",
-            "setting": "Methods",
-            "participants": "Methods",
-            "participant": "Methods",
-            "interventions": "Methods",
-            "intervention": "Methods",
-            "measures": "Methods",
-            "results": "Results",
-            "result": "Results",
-            "findings": "Results",
-            "finding": "Results",
-            "outcomes": "Results",
-            "outcome": "Results",
-            "conclusions": "Conclusions",
-            "conclusion": "Conclusions",
-            "interpretation": "Conclusions",
-            "implications": "Conclusions",
-            "implication": "Conclusions",
-            "limitations": "Conclusions",
-            "limitation": "Conclusions",
-        }
-
-        return name_mapping.get(clean.lower(), clean.title())
+        clean = self.HEADING_PUNCTUATION_RE.sub("", heading).strip()
+
+        return self.SECTION_NAMES.get(clean.lower(), clean.title())
 
 
 class SentenceSplitter:
     """Sentence splitter optimized for biomedical text."""
 
+    # Fallback splitter patterns: (pattern, protected form, restore pattern)
+    PROTECT_PATTERNS: ClassVar[list[tuple[re.Pattern[str], str, re.Pattern[str]]]] = [
+        (
+            re.compile(r"(\d+\.\d+)"),
+            r"__DECIMAL__\1__",
+            re.compile(r"__DECIMAL__([^_]+)__"),
+        ),
+        (
+            re.compile(r"(p\s*[=<>]\s*0\.\d+)"),
+            r"__PVALUE__\1__",
+            re.compile(r"__PVALUE__([^_]+)__"),
+        ),
+        (
+            re.compile(r"(\d+\s*mg/kg)"),
+            r"__DOSE__\1__",
+            re.compile(r"__DOSE__([^_]+)__"),
+        ),
+    ]
+    VS_RE: ClassVar[re.Pattern[str]] = re.compile(r"(vs\.|vs)")
+    VS_PLACEHOLDER_RE: ClassVar[re.Pattern[str]] = re.compile(r"__VS__")
+    BOUNDARY_RE: ClassVar[re.Pattern[str]] = re.compile(r"(?<=[.!?])\s+(?=[A-Z])")
+
+    # Pipeline components we never use; sentence boundaries come from senter
+    UNUSED_PIPES: ClassVar[tuple[str, ...]] = (
+        "tagger",
+        "parser",
+        "attribute_ruler",
+        "lemmatizer",
+        "ner",
+    )
+    PIPE_BATCH_SIZE: ClassVar[int] = 256
+
     def __init__(self):
         # Try to load spacy model
         self.nlp = None
         try:
             import spacy
 
-            self.nlp = spacy.load("en_core_web_sm")
-            logger.debug("Loaded spaCy model for sentence splitting")
+            self.nlp = spacy.load("en_core_web_sm", exclude=list(self.UNUSED_PIPES))
+            self.nlp.enable_pipe("senter")
+            logger.debug(
+                "Loaded spaCy model for sentence splitting",
+                pipes=self.nlp.pipe_names,
+            )
         except Exception as e:
             logger.warning(
                 f"spaCy model not available ({e}), using fallback sentence splitter"
@@ -277,9 +332,27 @@ class SentenceSplitter:
         else:
             return self._fallback_split(text)
 
+    def split_sentences_batch(
+        self, texts: Sequence[str], batch_size: int | None = None
+    ) -> list[list[str]]:
+        """Split many texts at once, streaming them through ``nlp.pipe``."""
+        if not self.nlp:
+            return [self._fallback_split(text) for text in texts]
+
+        return [
+            self._doc_sentences(doc)
+            for doc in self.nlp.pipe(
+                texts, batch_size=batch_size or self.PIPE_BATCH_SIZE
+            )
+        ]
+
     def _spacy_split(self, text: str) -> list[str]:
         """Use spaCy for sentence splitting."""
-        doc = self.nlp(text)
+        return self._doc_sentences(self.nlp(text))
+
+    @staticmethod
+    def _doc_sentences(doc) -> list[str]:
+        """Collect the non-empty sentences of a processed spaCy doc."""
         sentences = []
 
         for sent in doc.sents:
@@ -297,22 +370,20 @@ class SentenceSplitter:
         protected = text
 
         # Protect decimal numbers, percentages, p-values
-        protected = re.sub(r"(\d+\.\d+)", r"__DECIMAL__\1__", protected)
-        protected = re.sub(r"(p\s*[=<>]\s*0\.\d+)", r"__PVALUE__\1__", protected)
-        protected = re.sub(r"(\d+\s*mg/kg)", r"__DOSE__\1__", protected)
-        protected = re.sub(r"(vs\.|vs)", r"__VS__", protected)
+        for pattern, placeholder, _ in self.PROTECT_PATTERNS:
+            protected = pattern.sub(placeholder, protected)
+        protected = self.VS_RE.sub(r"__VS__", protected)
 
         # Split on sentence boundaries
-        sentences = re.split(r"(?<=[.!?])\s+(?=[A-Z])", protected)
+        sentences = self.BOUNDARY_RE.split(protected)
 
         # Restore protected patterns
         restored_sentences = []
         for sent in sentences:
             restored = sent
-            restored = re.sub(r"__DECIMAL__([^_]+)__", r"\1", restored)
-            restored = re.sub(r"__PVALUE__([^_]+)__", r"\1", restored)
-            restored = re.sub(r"__DOSE__([^_]+)__", r"\1", restored)
-            restored = re.sub(r"__VS__", r"vs", restored)
+            for _, _, placeholder_re in self.PROTECT_PATTERNS:
+                restored = placeholder_re.sub(r"\1", restored)
+            restored = self.VS_PLACEHOLDER_RE.sub(r"vs", restored)
 
             if restored.strip():
                 restored_sentences.append(restored.strip())
@@ -323,6 +394,21 @@ class SentenceSplitter:
 class NumericSafetyExpander:
     """Expands chunks to preserve numerical claims and comparisons."""
 
+    # Patterns that indicate statistical content
+    STAT_PATTERNS: ClassVar[list[re.Pattern[str]]] = [
+        re.compile(pattern, re.IGNORECASE)
+        for pattern in (
+            r"p\s*[=<>]\s*0\.\d+",  # p-values
+            r"\d+\.\d+%",  # percentages
+            r"\d+\.\d+\s*mg/kg",  # dosages
+            r"CI\s*[=:]\s*\d+\.\d+",  # confidence intervals
+            r"vs\.?\s+\d+\.\d+",  # versus comparisons
+            r"compared\s+to\s+\d+\.\d+",  # comparisons
+            r"Δ\s*=\s*[-]?\d+\.\d+",  # delta changes
+        )
+    ]
+    NUMBER_RE: ClassVar[re.Pattern[str]] = re.compile(r"\d+\.\d+")
+
     @staticmethod
     def needs_expansion(sentences: list[str], split_idx: int) -> bool:
         """Check if split would separate important numeric claims."""
@@ -333,19 +419,9 @@ class NumericSafetyExpander:
         current_sent = sentences[split_idx - 1] if split_idx > 0 else ""
         next_sent = sentences[split_idx] if split_idx < len(sentences) else ""
 
-        # Patterns that indicate statistical content
-        stat_patterns = [
-            r"p\s*[=<>]\s*0\.\d+",  # p-values
-            r"\d+\.\d+%",  # percentages
-            r"\d+\.\d+\s*mg/kg",  # dosages
-            r"CI\s*[=:]\s*\d+\.\d+",  # confidence intervals
-            r"vs\.?\s+\d+\.\d+",  # versus comparisons
-            r"compared\s+to\s+\d+\.\d+",  # comparisons
-            r"Δ\s*=\s*[-]?\d+\.\d+",  # delta changes
-        ]
-
         current_has_stats = any(
-            re.search(pattern, current_sent, re.IGNORECASE) for pattern in stat_patterns
+            pattern.search(current_sent)
+            for pattern in NumericSafetyExpander.STAT_PATTERNS
         )
         next_has_context = any(
             word in next_sent.lower()
@@ -361,7 +437,7 @@ class NumericSafetyExpander:
         )
 
         # Also check if current sentence has numerical values and next has comparison context
-        has_numbers = re.search(r"\d+\.\d+", current_sent)
+        has_numbers = NumericSafetyExpander.NUMBER_RE.search(current_sent)
         has_comparison_context = any(
             word in next_sent.lower()
             for word in ["compared", "versus", "vs", "control", "group", "months"]
@@ -379,32 +455,30 @@ class NumericSafetyExpander:
         tokenizer: BaseTokenizer,
         max_tokens: int,
     ) -> tuple[int, int]:
-        """Expand window boundaries to preserve numeric claims."""
+        """Expand window boundaries to preserve numeric claims.
+
+        The cheap regex check runs first so the joined window is only
+        tokenized when an expansion is actually being considered.
+        """
         expanded_start = start_idx
         expanded_end = end_idx
 
         # Try expanding forward first (more important for Results/Conclusions)
-        if expanded_end < len(sentences):
-            test_window = sentences[expanded_start : expanded_end + 1]
-            test_text = " ".join(test_window)
-
-            if tokenizer.count_tokens(
-                test_text
-            ) <= max_tokens and NumericSafetyExpander.needs_expansion(
-                sentences, expanded_end
-            ):
+        if expanded_end < len(sentences) and NumericSafetyExpander.needs_expansion(
+            sentences, expanded_end
+        ):
+            test_text = " ".join(sentences[expanded_start : expanded_end + 1])
+
+            if tokenizer.count_tokens(test_text) <= max_tokens:
                 expanded_end += 1
 
         # Try expanding backward if still room
-        if expanded_start > 0:
-            test_window = sentences[expanded_start - 1 : expanded_end]
-            test_text = " ".join(test_window)
-
-            if tokenizer.count_tokens(
-                test_text
-            ) <= max_tokens and NumericSafetyExpander.needs_expansion(
-                sentences, expanded_start
-            ):
+        if expanded_start > 0 and NumericSafetyExpander.needs_expansion(
+            sentences, expanded_start
+        ):
+            test_text = " ".join(sentences[expanded_start - 1 : expanded_end])
+
+            if tokenizer.count_tokens(test_text) <= max_tokens:
                 expanded_start -= 1
 
         return expanded_start, expanded_end
@@ -413,12 +487,20 @@ class NumericSafetyExpander:
 class AbstractChunker:
     """Main chunking service for biomedical abstracts."""
 
+    HYPHEN_BREAK_RE: ClassVar[re.Pattern[str]] = re.compile(r"-\s*\n\s*")
+    INLINE_SPACE_RE: ClassVar[re.Pattern[str]] = re.compile(r"[ \t]+")
+    EMPTY_LINE_RE: ClassVar[re.Pattern[str]] = re.compile(r"\n\s*\n")
+    SPACE_BEFORE_PUNCT_RE: ClassVar[re.Pattern[str]] = re.compile(r"\s+([.!?])")
+
     def __init__(self, config: ChunkingConfig = None, tokenizer: BaseTokenizer = None):
         self.config = config or ChunkingConfig()
         self.tokenizer = tokenizer or self._create_default_tokenizer()
         self.section_detector = SectionDetector()
         self.sentence_splitter = SentenceSplitter()
         self.safety_expander = NumericSafetyExpander()
+        self._pool: ProcessPoolExecutor | None = None
+        self._pool_workers = 0
+        self._pool_lock = threading.Lock()
 
     def _create_default_tokenizer(self) -> BaseTokenizer:
         """Create default tokenizer that matches the configured embedding model."""
@@ -443,6 +525,108 @@ class AbstractChunker:
         """Chunk a document into optimized chunks."""
         logger.info("Chunking document", document_uid=document.uid)
 
+        sections, multi_section = self._detect_sections(document)
+        section_sentences = [
+            self.sentence_splitter.split_sentences(section.content)
+            for section in sections
+        ]
+
+        return self._chunk_sections(
+            document, sections, section_sentences, multi_section
+        )
+
+    def chunk_documents(
+        self,
+        documents: Sequence[Document],
+        n_workers: int | None = 1,
+        batch_size: int | None = None,
+    ) -> list[list[Chunk]]:
+        """Chunk many documents, returning one chunk list per input document.
+
+        Section texts are streamed through the sentence splitter in batches
+        of ``batch_size``. With ``n_workers`` > 1 (``None`` means one per CPU)
+        documents are sharded ``batch_size`` at a time across a process pool
+        where each worker loads its own tokenizer and spaCy model once. The
+        pool is kept for later calls until ``close``.
+        """
+        documents = list(documents)
+        n_workers = n_workers or os.cpu_count() or 1
+        shard_size = batch_size or self.sentence_splitter.PIPE_BATCH_SIZE
+
+        if n_workers <= 1 or len(documents) <= shard_size:
+            return self._chunk_batch(documents, batch_size)
+
+        shards = [
+            documents[i : i + shard_size] for i in range(0, len(documents), shard_size)
+        ]
+        logger.info(
+            "Chunking documents in worker processes",
+            documents=len(documents),
+            shards=len(shards),
+            workers=n_workers,
+        )
+
+        results: list[list[Chunk]] = []
+        for shard_chunks in self._worker_pool(n_workers).map(_chunk_shard, shards):
+            results.extend(shard_chunks)
+
+        return results
+
+    def _worker_pool(self, n_workers: int) -> ProcessPoolExecutor:
+        """Get the long-lived worker pool, (re)creating it for ``n_workers``.
+
+        Workers are spawned rather than forked: the calling process runs
+        gRPC, database and logging threads that a forked child could inherit
+        mid-operation (and deadlock on).
+        """
+        with self._pool_lock:
+            if self._pool is None or self._pool_workers != n_workers:
+                if self._pool is not None:
+                    self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = ProcessPoolExecutor(
+                    max_workers=n_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_chunk_worker,
+                    initargs=(self.config, self.tokenizer),
+                )
+                self._pool_workers = n_workers
+            return self._pool
+
+    def close(self) -> None:
+        """Shut down the chunking worker pool, if one was started."""
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
+                self._pool_workers = 0
+
+    def _chunk_batch(
+        self, documents: list[Document], batch_size: int | None = None
+    ) -> list[list[Chunk]]:
+        """Chunk documents in-process with one batched sentence-splitting pass."""
+        detected = [self._detect_sections(document) for document in documents]
+
+        # Split every section of every document in a single nlp.pipe stream
+        section_texts = [
+            section.content for sections, _ in detected for section in sections
+        ]
+        all_sentences = iter(
+            self.sentence_splitter.split_sentences_batch(section_texts, batch_size)
+        )
+
+        results = []
+        for document, (sections, multi_section) in zip(documents, detected):
+            section_sentences = [next(all_sentences) for _ in sections]
+            results.append(
+                self._chunk_sections(
+                    document, sections, section_sentences, multi_section
+                )
+            )
+
+        return results
+
+    def _detect_sections(self, document: Document) -> tuple[list[Section], bool]:
+        """Detect sections and whether chunk IDs should be section-prefixed."""
         # Normalize text
         normalized_text = self._normalize_text(document.text)
 
@@ -452,13 +636,29 @@ class AbstractChunker:
             f"Detected {len(sections)} sections", sections=[s.name for s in sections]
         )
 
+        # Chunk IDs are prefixed by section when the raw abstract is structured;
+        # decided once here instead of re-detecting sections for every window
+        multi_section = len(self.section_detector.detect_sections(document.text)) > 1
+
+        return sections, multi_section
+
+    def _chunk_sections(
+        self,
+        document: Document,
+        sections: list[Section],
+        section_sentences: list[list[str]],
+        multi_section: bool,
+    ) -> list[Chunk]:
+        """Build the chunks for a document from its split sections."""
         # Generate chunks
         chunks = []
         chunk_idx = 0
 
-        for section_idx, section in enumerate(sections):
+        for section_idx, (section, sentences) in enumerate(
+            zip(sections, section_sentences)
+        ):
             section_chunks = self._chunk_section(
-                document, section, section_idx, chunk_idx
+                document, section, sentences, section_idx, chunk_idx, multi_section
             )
             chunks.extend(section_chunks)
             chunk_idx += len(section_chunks)
@@ -483,17 +683,17 @@ class AbstractChunker:
         normalized = unicodedata.normalize("NFKC", text)
 
         # Join hyphenated line breaks (but preserve other line breaks)
-        normalized = re.sub(r"-\s*\n\s*", "", normalized)
+        normalized = self.HYPHEN_BREAK_RE.sub("", normalized)
 
         # Collapse multiple spaces within lines (but preserve single line breaks)
-        normalized = re.sub(r"[ \t]+", " ", normalized)
+        normalized = self.INLINE_SPACE_RE.sub(" ", normalized)
 
         # Normalize line breaks but don't completely remove them
-        normalized = re.sub(r"\n\s*\n", "\n", normalized)  # Remove empty lines
+        normalized = self.EMPTY_LINE_RE.sub("\n", normalized)  # Remove empty lines
 
         # Clean up common patterns
-        normalized = re.sub(
-            r"\s+([.!?])", r"\1", normalized
+        normalized = self.SPACE_BEFORE_PUNCT_RE.sub(
+            r"\1", normalized
         )  # Space before punctuation
 
         return normalized.strip()
@@ -502,13 +702,12 @@ class AbstractChunker:
         self,
         document: Document,
         section: Section,
+        sentences: list[str],
         section_idx: int,
         start_chunk_idx: int,
+        multi_section: bool,
     ) -> list[Chunk]:
-        """Chunk a single section."""
-        # Split into sentences
-        sentences = self.sentence_splitter.split_sentences(section.content)
-
+        """Chunk a single, already sentence-split section."""
         if not sentences:
             return []
 
@@ -517,8 +716,7 @@ class AbstractChunker:
 
         if section_tokens <= self.config.max_tokens:
             # Single chunk for this section
-            all_sections = self.section_detector.detect_sections(document.text)
-            chunk_id = f"s{section_idx}" if len(all_sections) > 1 else "w0"
+            chunk_id = f"s{section_idx}" if multi_section else "w0"
 
             return [
                 self._create_chunk(
@@ -534,7 +732,7 @@ class AbstractChunker:
 
         # Multi-chunk section - use windowing
         return self._create_windows(
-            document, section, sentences, section_idx, start_chunk_idx
+            document, section, sentences, section_idx, start_chunk_idx, multi_section
         )
 
     def _create_windows(
@@ -544,8 +742,18 @@ class AbstractChunker:
         sentences: list[str],
         section_idx: int,
         start_chunk_idx: int,
+        multi_section: bool,
     ) -> list[Chunk]:
         """Create overlapping windows from sentences."""
+        # Tokenize each sentence once; prefix[i] is the token count of
+        # sentences[:i], so any run of sentences is sized in O(1)
+        prefix = list(
+            accumulate(
+                (self.tokenizer.count_tokens(sentence) for sentence in sentences),
+                initial=0,
+            )
+        )
+
         windows = []
         current_start = 0
         window_idx = 0
@@ -553,7 +761,7 @@ class AbstractChunker:
         while current_start < len(sentences):
             # Find optimal window end
             window_end = self._find_window_end(
-                sentences,
+                prefix,
                 current_start,
                 self.config.target_tokens,
                 self.config.max_tokens,
@@ -574,7 +782,7 @@ class AbstractChunker:
             window_tokens = self.tokenizer.count_tokens(window_text)
 
             # Generate chunk ID
-            if len(self.section_detector.detect_sections(document.text)) > 1:
+            if multi_section:
                 chunk_id = f"s{section_idx}_{window_idx}"
             else:
                 chunk_id = f"w{window_idx}"
@@ -593,7 +801,7 @@ class AbstractChunker:
 
             # Calculate next start with overlap
             next_start = self._calculate_overlap_start(
-                sentences, expanded_end, self.config.overlap_tokens
+                prefix, expanded_end, self.config.overlap_tokens
             )
 
             if next_start <= current_start:  # Prevent infinite loop
@@ -605,47 +813,36 @@ class AbstractChunker:
         return windows
 
     def _find_window_end(
-        self, sentences: list[str], start: int, target_tokens: int, max_tokens: int
+        self, prefix: list[int], start: int, target_tokens: int, max_tokens: int
     ) -> int:
-        """Find optimal end position for a window."""
-        current_tokens = 0
-        end_idx = start
-
-        for i in range(start, len(sentences)):
-            sentence_tokens = self.tokenizer.count_tokens(sentences[i])
-
-            if current_tokens + sentence_tokens > max_tokens:
-                break
+        """Find optimal end position for a window.
 
-            current_tokens += sentence_tokens
-            end_idx = i + 1
+        Takes sentences from ``start`` until the target is reached, never
+        exceeding the maximum. ``prefix`` holds cumulative sentence tokens.
+        """
+        base = prefix[start]
 
-            if current_tokens >= target_tokens:
-                break
+        # Last end that stays within max_tokens
+        max_end = bisect_right(prefix, base + max_tokens, lo=start) - 1
+        # First end that reaches target_tokens
+        target_end = bisect_left(prefix, base + target_tokens, lo=start + 1)
 
-        return end_idx
+        return min(target_end, max_end)
 
     def _calculate_overlap_start(
-        self, sentences: list[str], window_end: int, overlap_tokens: int
+        self, prefix: list[int], window_end: int, overlap_tokens: int
     ) -> int:
-        """Calculate start position for next window with overlap."""
-        if overlap_tokens <= 0 or window_end >= len(sentences):
-            return window_end
-
-        # Find sentences that fit in overlap
-        overlap_token_count = 0
-        overlap_start = window_end
-
-        for i in range(window_end - 1, -1, -1):
-            sentence_tokens = self.tokenizer.count_tokens(sentences[i])
+        """Calculate start position for next window with overlap.
 
-            if overlap_token_count + sentence_tokens > overlap_tokens:
-                break
-
-            overlap_token_count += sentence_tokens
-            overlap_start = i
+        Walks back from ``window_end`` over whole sentences that fit in
+        ``overlap_tokens``. ``prefix`` holds cumulative sentence tokens.
+        """
+        if overlap_tokens <= 0 or window_end >= len(prefix) - 1:
+            return window_end
 
-        return overlap_start
+        return bisect_left(
+            prefix, prefix[window_end] - overlap_tokens, lo=0, hi=window_end
+        )
 
     def _create_chunk(
         self,
@@ -720,3 +917,18 @@ class AbstractChunker:
             n_sentences=first_chunk.n_sentences,
             meta=first_chunk.meta,
         )
+
+
+# Per-process chunker used by chunk_documents() worker processes
+_worker_chunker: AbstractChunker | None = None
+
+
+def _init_chunk_worker(config: ChunkingConfig, tokenizer: BaseTokenizer) -> None:
+    """Build the worker's chunker (tokenizer and spaCy model) once."""
+    global _worker_chunker
+    _worker_chunker = AbstractChunker(config, tokenizer=tokenizer)
+
+
+def _chunk_shard(documents: list[Document]) -> list[list[Chunk]]:
+    """Chunk one shard of documents inside a worker process."""
+    return _worker_chunker._chunk_batch(documents)
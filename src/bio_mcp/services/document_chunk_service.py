@@ -2,28 +2,167 @@
 Document chunking service for DocumentChunk_v2 with Weaviate OpenAI vectorizer.
 
 This service handles document chunking and storage, while Weaviate manages
-OpenAI embeddings through its text2vec-openai module.
+OpenAI embeddings through its text2vec-openai module. When an embedding cache
+is configured, vectors for previously seen chunk text are supplied on insert
+and the vectorizer only runs for cache misses.
 """
 
 from __future__ import annotations
 
+import asyncio
+import copy
+import time
+from collections import OrderedDict, defaultdict
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass, field
+from itertools import batched
 from typing import Any
 
-from weaviate.classes.query import Filter, MetadataQuery
+from weaviate.classes.query import Filter, GroupBy, MetadataQuery, QueryNested, Sort
 
 from bio_mcp.config.config import config
 from bio_mcp.config.logging_config import get_logger
-from bio_mcp.models.document import Document
+from bio_mcp.models.document import Chunk, Document
 from bio_mcp.services.chunking import AbstractChunker, ChunkingConfig
-from bio_mcp.services.weaviate_schema import CollectionConfig, WeaviateSchemaManager
+from bio_mcp.services.embedding_cache import EmbeddingCache, vectorized_text
+from bio_mcp.services.weaviate_schema import (
+    CollectionConfig,
+    WeaviateSchemaManager,
+    default_vector,
+)
 from bio_mcp.shared.clients.weaviate_client import WeaviateClient, get_weaviate_client
 
 logger = get_logger(__name__)
 
 
+@dataclass
+class DocumentStoreResult:
+    """Per-document outcome of a bulk chunk store."""
+
+    uid: str
+    chunk_uuids: list[str] = field(default_factory=list)
+    failed_chunks: dict[str, str] = field(default_factory=dict)  # uuid -> error
+    error: str | None = None
+
+    @property
+    def success(self) -> bool:
+        return self.error is None and not self.failed_chunks
+
+
+@dataclass
+class DocumentManifest:
+    """What the collection holds for one document."""
+
+    uid: str
+    content_hash: str | None = None
+    chunker_version: str | None = None
+    chunk_uuids: set[str] = field(default_factory=set)
+
+    def add_chunk(
+        self, chunk_uuid: str, content_hash: str | None, chunker_version: str | None
+    ) -> None:
+        """Add a stored chunk; chunks that disagree leave hash/version unknown."""
+        if not self.chunk_uuids:
+            self.content_hash = content_hash
+            self.chunker_version = chunker_version
+        else:
+            if content_hash != self.content_hash:
+                self.content_hash = None
+            if chunker_version != self.chunker_version:
+                self.chunker_version = None
+        self.chunk_uuids.add(chunk_uuid)
+
+    def is_current(self, content_hash: str | None, chunker_version: str) -> bool:
+        """True if the stored chunks came from this content and chunker."""
+        return (
+            bool(self.chunk_uuids)
+            and content_hash is not None
+            and self.content_hash == content_hash
+            and self.chunker_version == chunker_version
+        )
+
+
+class DocumentLRU:
+    """Size-bounded LRU of reconstructed documents keyed by parent_uid.
+
+    Entries are dropped when the service re-ingests or deletes a document;
+    the TTL bounds staleness from writes made by other processes.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 3600):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, parent_uid: str) -> dict[str, Any] | None:
+        """Get a copy of a cached document, or None if missing or expired."""
+        entry = self._entries.get(parent_uid)
+        if entry is None or entry[0] <= time.monotonic():
+            self._entries.pop(parent_uid, None)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(parent_uid)
+        self.hits += 1
+        return copy.deepcopy(entry[1])
+
+    def put(self, parent_uid: str, document: dict[str, Any]) -> None:
+        """Store a copy of a document, evicting least recently used entries."""
+        if self.max_entries <= 0:
+            return
+        self._entries[parent_uid] = (
+            time.monotonic() + self.ttl,
+            copy.deepcopy(document),
+        )
+        self._entries.move_to_end(parent_uid)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, parent_uids: Iterable[str]) -> None:
+        """Drop cached documents."""
+        for parent_uid in parent_uids:
+            self._entries.pop(parent_uid, None)
+
+    def clear(self) -> None:
+        """Drop all cached documents."""
+        self._entries.clear()
+
+
 class DocumentChunkService:
     """Document chunking and storage service with Weaviate OpenAI vectorizer."""
 
+    # Chunks read per query when building document manifests
+    MANIFEST_PAGE_SIZE = 1000
+    # Matching chunks returned per document by document-level search
+    GROUP_CHUNKS_PER_DOCUMENT = 3
+    # Chunks ranked server-side per requested document before grouping
+    GROUP_SEARCH_DEPTH_PER_DOCUMENT = 20
+    # Upper bound on sibling chunks fetched per search hit; also the chunks
+    # per document in each page read when reconstructing documents
+    MAX_SIBLINGS_PER_DOCUMENT = 50
+    # Properties searches return by default; the nested meta object (authors,
+    # identifiers, provenance) is loaded for final results via load_chunk_meta
+    SEARCH_RETURN_PROPERTIES = (
+        "parent_uid",
+        "source",
+        "title",
+        "text",
+        "section",
+        "published_at",
+        "year",
+        "tokens",
+        "quality_total",
+    )
+    # Properties scoring and grouping depend on, always requested
+    SCORING_PROPERTIES = ("parent_uid", "section", "year", "quality_total")
+    # Documents resolved per filtered query by get_documents
+    DOCUMENT_FETCH_BATCH = 100
+
     def __init__(
         self,
         weaviate_client: WeaviateClient | None = None,
@@ -41,6 +180,18 @@ class DocumentChunkService:
             chunker_version=self.config.chunker_version,
         )
         self.chunking_service = AbstractChunker(chunking_config)
+        self.embedding_cache = (
+            EmbeddingCache(
+                self.config.embedding_cache_path,
+                model=self.config.openai_embedding_model,
+                dimensions=self.config.openai_embedding_dimensions,
+            )
+            if self.config.embedding_cache_path
+            else None
+        )
+        self.document_cache = DocumentLRU(
+            self.config.document_cache_size, self.config.document_cache_ttl
+        )
         self.schema_manager = None
         self._initialized = False
 
@@ -63,7 +214,9 @@ class DocumentChunkService:
             )
 
             # Create collection if it doesn't exist
-            if not self.weaviate_client.client.collections.exists(self.collection_name):
+            if not await self.weaviate_client.async_client.collections.exists(
+                self.collection_name
+            ):
                 logger.info(
                     f"Collection {self.collection_name} doesn't exist, creating it..."
                 )
@@ -82,7 +235,8 @@ class DocumentChunkService:
             raise
 
     async def disconnect(self) -> None:
-        """Disconnect from Weaviate."""
+        """Disconnect from Weaviate and stop the chunking worker pool."""
+        await asyncio.to_thread(self.chunking_service.close)
         if self.weaviate_client:
             await self.weaviate_client.close()
             self.weaviate_client = None
@@ -100,6 +254,10 @@ class DocumentChunkService:
             **chunk_metadata,
         }
 
+        # Lets re-ingestion tell whether the source content changed
+        if document.provenance.get("content_hash"):
+            meta["content_hash"] = document.provenance["content_hash"]
+
         # Add source-specific metadata
         if document.source == "pubmed":
             meta["src"] = {
@@ -123,6 +281,133 @@ class DocumentChunkService:
 
         return meta
 
+    def _build_chunk_properties(
+        self, document: Document, chunk: Chunk, quality_score: float | None
+    ) -> dict[str, Any]:
+        """Build the Weaviate property payload for a single chunk."""
+        # Build complete metadata
+        chunk.meta = self._build_chunk_metadata(document, chunk.meta or {})
+
+        # Prepare properties for Weaviate
+        properties = {
+            "parent_uid": chunk.parent_uid,
+            "source": chunk.source,
+            "section": chunk.section or "Unstructured",
+            "title": chunk.title or "",
+            "text": chunk.text,
+            "chunk_id": chunk.chunk_id,
+            "chunk_idx": chunk.chunk_idx,
+            "published_at": (
+                document.published_at.isoformat() + "Z"
+                if document.published_at and document.published_at.tzinfo is None
+                else document.published_at.isoformat()
+            )
+            if document.published_at
+            else None,
+            "year": document.published_at.year if document.published_at else None,
+            "tokens": chunk.tokens,
+            "n_sentences": chunk.n_sentences,
+            "quality_total": quality_score or 0.0,
+            "meta": chunk.meta,
+        }
+
+        # Remove None values and ensure object fields have content
+        properties = {k: v for k, v in properties.items() if v is not None}
+
+        # Ensure nested objects have content (Weaviate requirement)
+        if properties.get("meta"):
+            # Clean up empty nested objects
+            meta = properties["meta"]
+            if "src" in meta:
+                for source_key, source_data in list(meta["src"].items()):
+                    if isinstance(source_data, dict):
+                        # Remove empty dict fields or add default content
+                        cleaned_source = {}
+                        for k, v in source_data.items():
+                            if v is not None and v != {} and v != []:
+                                cleaned_source[k] = v
+
+                        # If provenance is empty, add a default
+                        if "provenance" not in cleaned_source or not cleaned_source.get(
+                            "provenance"
+                        ):
+                            cleaned_source["provenance"] = {
+                                "ingestion_source": "bio-mcp-v2"
+                            }
+
+                        meta["src"][source_key] = cleaned_source
+
+        return properties
+
+    def get_collection(self) -> Any:
+        """Async handle to the chunk collection (queries never block the loop)."""
+        return self.weaviate_client.async_client.collections.get(self.collection_name)
+
+    def embedding_cache_counts(self) -> tuple[int, int]:
+        """Return (hits, misses) of the embedding cache so far."""
+        if self.embedding_cache is None:
+            return 0, 0
+        return self.embedding_cache.hits, self.embedding_cache.misses
+
+    def _lookup_cached_vectors(
+        self, chunk_properties: list[dict[str, Any]]
+    ) -> tuple[list[str | None], dict[str, list[float]]]:
+        """Return each chunk's cache key and the vectors already cached."""
+        if self.embedding_cache is None:
+            return [None] * len(chunk_properties), {}
+
+        keys = [
+            self.embedding_cache.make_key(vectorized_text(properties))
+            for properties in chunk_properties
+        ]
+        return keys, self.embedding_cache.get_many(keys)
+
+    def _store_fetched_vectors(
+        self, objects: Iterable[Any], uncached: Mapping[str, str]
+    ) -> None:
+        """Cache the vectors the vectorizer produced for uncached chunks."""
+        self.embedding_cache.put_many(
+            (uncached[str(obj.uuid)], vector)
+            for obj in objects
+            if str(obj.uuid) in uncached and (vector := default_vector(obj)) is not None
+        )
+
+    async def _backfill_embedding_cache(self, uncached: Mapping[str, str]) -> None:
+        """Read back vectorizer output for ``uncached`` (chunk uuid -> cache key)."""
+        if self.embedding_cache is None or not uncached:
+            return
+
+        try:
+            response = await self.get_collection().query.fetch_objects(
+                filters=Filter.by_id().contains_any(list(uncached)),
+                include_vector=True,
+                limit=len(uncached),
+            )
+            self._store_fetched_vectors(response.objects, uncached)
+        except Exception as e:
+            logger.warning(f"Failed to backfill embedding cache: {e}")
+
+    def _backfill_embedding_cache_sync(
+        self, collection: Any, uncached: Mapping[str, str]
+    ) -> None:
+        """Sync-client variant of ``_backfill_embedding_cache`` for batch imports."""
+        if self.embedding_cache is None or not uncached:
+            return
+
+        uuids = list(uncached)
+        page_size = self.embedding_cache.LOOKUP_BATCH
+        try:
+            for i in range(0, len(uuids), page_size):
+                page = uuids[i : i + page_size]
+                response = collection.query.fetch_objects(
+                    filters=Filter.by_id().contains_any(page),
+                    include_vector=True,
+                    limit=len(page),
+                )
+                self._store_fetched_vectors(response.objects, uncached)
+        except Exception as e:
+            logger.warning(f"Failed to backfill embedding cache: {e}")
+
     def _convert_filters_to_weaviate(self, filters: dict) -> list[Filter]:
         """
         Convert generic filters dict to Weaviate Filter objects.
@@ -135,13 +420,13 @@ class DocumentChunkService:
         """
         conditions = []
 
-        for field, value in filters.items():
+        for prop, value in filters.items():
             if isinstance(value, str | int | float):
                 # Simple equality filter
-                conditions.append(Filter.by_property(field).equal(value))
+                conditions.append(Filter.by_property(prop).equal(value))
             elif isinstance(value, list):
                 # Multiple values - use any_of
-                field_conditions = [Filter.by_property(field).equal(v) for v in value]
+                field_conditions = [Filter.by_property(prop).equal(v) for v in value]
                 if len(field_conditions) == 1:
                     conditions.append(field_conditions[0])
                 else:
@@ -150,20 +435,20 @@ class DocumentChunkService:
                 # Range filters
                 if "gte" in value:
                     conditions.append(
-                        Filter.by_property(field).greater_or_equal(value["gte"])
+                        Filter.by_property(prop).greater_or_equal(value["gte"])
                     )
                 if "gt" in value:
                     conditions.append(
-                        Filter.by_property(field).greater_than(value["gt"])
+                        Filter.by_property(prop).greater_than(value["gt"])
                     )
                 if "lte" in value:
                     conditions.append(
-                        Filter.by_property(field).less_or_equal(value["lte"])
+                        Filter.by_property(prop).less_or_equal(value["lte"])
                     )
                 if "lt" in value:
-                    conditions.append(Filter.by_property(field).less_than(value["lt"]))
+                    conditions.append(Filter.by_property(prop).less_than(value["lt"]))
                 if "eq" in value:
-                    conditions.append(Filter.by_property(field).equal(value["eq"]))
+                    conditions.append(Filter.by_property(prop).equal(value["eq"]))
 
         return conditions
 
@@ -177,6 +462,8 @@ class DocumentChunkService:
         if not self._initialized:
             await self.connect()
 
+        self.document_cache.invalidate([document.uid])
+
         try:
             # Generate chunks
             chunks = self.chunking_service.chunk_document(document)
@@ -185,69 +472,27 @@ class DocumentChunkService:
                 logger.warning(f"No chunks generated for document {document.uid}")
                 return []
 
-            collection = self.weaviate_client.client.collections.get(
-                self.collection_name
-            )
+            collection = self.get_collection()
             chunk_uuids = []
 
-            for chunk in chunks:
-                # Build complete metadata
-                chunk.meta = self._build_chunk_metadata(document, chunk.meta or {})
-
-                # Prepare properties for Weaviate
-                properties = {
-                    "parent_uid": chunk.parent_uid,
-                    "source": chunk.source,
-                    "section": chunk.section or "Unstructured",
-                    "title": chunk.title or "",
-                    "text": chunk.text,
-                    "published_at": (
-                        document.published_at.isoformat() + "Z"
-                        if document.published_at
-                        and document.published_at.tzinfo is None
-                        else document.published_at.isoformat()
-                    )
-                    if document.published_at
-                    else None,
-                    "year": document.published_at.year
-                    if document.published_at
-                    else None,
-                    "tokens": chunk.tokens,
-                    "n_sentences": chunk.n_sentences,
-                    "quality_total": quality_score or 0.0,
-                    "meta": chunk.meta,
-                }
+            chunk_properties = [
+                self._build_chunk_properties(document, chunk, quality_score)
+                for chunk in chunks
+            ]
+            # Cached vectors are supplied on insert so the vectorizer is skipped
+            cache_keys, cached_vectors = self._lookup_cached_vectors(chunk_properties)
+            uncached: dict[str, str] = {}
 
-                # Remove None values and ensure object fields have content
-                properties = {k: v for k, v in properties.items() if v is not None}
-
-                # Ensure nested objects have content (Weaviate requirement)
-                if properties.get("meta"):
-                    # Clean up empty nested objects
-                    meta = properties["meta"]
-                    if "src" in meta:
-                        for source_key, source_data in list(meta["src"].items()):
-                            if isinstance(source_data, dict):
-                                # Remove empty dict fields or add default content
-                                cleaned_source = {}
-                                for k, v in source_data.items():
-                                    if v is not None and v != {} and v != []:
-                                        cleaned_source[k] = v
-
-                                # If provenance is empty, add a default
-                                if (
-                                    "provenance" not in cleaned_source
-                                    or not cleaned_source.get("provenance")
-                                ):
-                                    cleaned_source["provenance"] = {
-                                        "ingestion_source": "bio-mcp-v2"
-                                    }
-
-                                meta["src"][source_key] = cleaned_source
+            for chunk, properties, cache_key in zip(
+                chunks, chunk_properties, cache_keys
+            ):
+                vector = cached_vectors.get(cache_key) if cache_key else None
 
                 # Insert with deterministic UUID (idempotent)
                 try:
-                    collection.data.insert(uuid=chunk.uuid, properties=properties)
+                    await collection.data.insert(
+                        uuid=chunk.uuid, properties=properties, vector=vector
+                    )
                     chunk_uuids.append(chunk.uuid)
                     logger.debug(
                         f"Stored chunk {chunk.uuid} for document {document.uid}"
@@ -263,6 +508,12 @@ class DocumentChunkService:
                     else:
                         logger.error(f"Failed to store chunk {chunk.uuid}: {e}")
                         # Continue with other chunks
+                        continue
+
+                if cache_key and vector is None:
+                    uncached[chunk.uuid] = cache_key
+
+            await self._backfill_embedding_cache(uncached)
 
             logger.info(f"Stored {len(chunk_uuids)} chunks for document {document.uid}")
             return chunk_uuids
@@ -271,6 +522,193 @@ class DocumentChunkService:
             logger.error(f"Failed to store document chunks for {document.uid}: {e}")
             raise
 
+        finally:
+            # A read during the inserts may have re-cached the old chunks
+            self.document_cache.invalidate([document.uid])
+
+    async def store_documents_chunks(
+        self,
+        documents: Iterable[Document],
+        quality_scores: Mapping[str, float] | None = None,
+        batch_size: int | None = None,
+    ) -> list[DocumentStoreResult]:
+        """
+        Chunk many documents and bulk-upsert them through Weaviate batch imports.
+
+        Documents are chunked a shard at a time and their chunks streamed into
+        the batch, so chunk objects are not held for the whole input; the
+        per-document results (with every chunk UUID) still grow with it, so
+        callers should pass corpus-sized inputs in slices. Objects are written
+        with their deterministic UUIDs, which makes re-ingestion an upsert instead
+        of a duplicate-insert error.
+
+        A document repeating the uid of an earlier one in the same call is not
+        chunked or written again; it gets the earlier document's result.
+
+        Args:
+            documents: Documents to chunk and store (any iterable, consumed once)
+            quality_scores: Optional quality score per document uid
+            batch_size: Objects per batch request; defaults to
+                ``config.weaviate_batch_size`` (0 selects dynamic batching)
+
+        Returns:
+            One DocumentStoreResult per input document, in input order (repeated
+            uids share one result object)
+        """
+        if not self._initialized:
+            await self.connect()
+
+        if batch_size is None:
+            batch_size = self.config.weaviate_batch_size
+
+        # Batch imports only exist on the sync client; keep them off the loop.
+        # Cached copies are dropped here on the loop once the batch is flushed,
+        # so reads made while it was written cannot leave the old chunks cached.
+        by_uid: dict[str, DocumentStoreResult] = {}
+        try:
+            return await asyncio.to_thread(
+                self._store_documents_batch,
+                documents,
+                quality_scores or {},
+                batch_size,
+                by_uid,
+            )
+        finally:
+            self.document_cache.invalidate(list(by_uid))
+
+    def _store_documents_batch(
+        self,
+        documents: Iterable[Document],
+        quality_scores: Mapping[str, float],
+        batch_size: int,
+        by_uid: dict[str, DocumentStoreResult],
+    ) -> list[DocumentStoreResult]:
+        """Chunk documents and write them through a sync batch (worker thread).
+
+        ``by_uid`` is filled with the result for each distinct document uid.
+        """
+        collection = self.weaviate_client.client.collections.get(self.collection_name)
+        if batch_size > 0:
+            batch_context = collection.batch.fixed_size(
+                batch_size=batch_size,
+                concurrent_requests=self.config.weaviate_batch_concurrency,
+            )
+        else:
+            batch_context = collection.batch.dynamic()
+
+        results: list[DocumentStoreResult] = []
+        chunk_owners: dict[str, str] = {}
+        uncached: dict[str, str] = {}  # chunk uuid -> embedding cache key
+
+        # Documents are chunked a shard at a time (across chunker workers)
+        shard_size = self.chunking_service.sentence_splitter.PIPE_BATCH_SIZE * max(
+            1, self.config.chunker_workers
+        )
+
+        with batch_context as batch:
+            unique = self._unique_documents(documents, results, by_uid)
+            for shard in batched(unique, shard_size):
+                for document, chunks in zip(shard, self._chunk_documents(shard)):
+                    self._add_document_to_batch(
+                        batch,
+                        document,
+                        chunks,
+                        quality_scores.get(document.uid),
+                        by_uid[document.uid],
+                        chunk_owners,
+                        uncached,
+                    )
+
+        # Attribute server-side failures back to their documents
+        for failed in collection.batch.failed_objects:
+            chunk_uuid = str(failed.original_uuid or failed.object_.uuid)
+            owner = by_uid.get(chunk_owners.get(chunk_uuid, ""))
+            if owner is None:
+                continue
+            owner.failed_chunks[chunk_uuid] = failed.message
+            if chunk_uuid in owner.chunk_uuids:
+                owner.chunk_uuids.remove(chunk_uuid)
+            uncached.pop(chunk_uuid, None)
+
+        self._backfill_embedding_cache_sync(collection, uncached)
+
+        stored = sum(len(r.chunk_uuids) for r in by_uid.values())
+        failed = sum(len(r.failed_chunks) for r in by_uid.values())
+        logger.info(
+            f"Batch stored {stored} chunks for {len(by_uid)} documents "
+            f"({failed} chunk failures)"
+        )
+        return results
+
+    @staticmethod
+    def _unique_documents(
+        documents: Iterable[Document],
+        results: list[DocumentStoreResult],
+        by_uid: dict[str, DocumentStoreResult],
+    ) -> Iterator[Document]:
+        """Yield each uid's first document, recording a result per input."""
+        for document in documents:
+            result = by_uid.get(document.uid)
+            if result is not None:
+                logger.warning(f"Skipping repeated document {document.uid} in batch")
+                results.append(result)
+                continue
+            result = by_uid[document.uid] = DocumentStoreResult(uid=document.uid)
+            results.append(result)
+            yield document
+
+    def _chunk_documents(
+        self, documents: Sequence[Document]
+    ) -> list[list[Chunk] | Exception]:
+        """Chunk documents together, isolating a failure to its own document."""
+        try:
+            return self.chunking_service.chunk_documents(
+                documents, n_workers=self.config.chunker_workers
+            )
+        except Exception as e:
+            logger.warning(f"Batch chunking failed ({e}), chunking one at a time")
+
+        chunked: list[list[Chunk] | Exception] = []
+        for document in documents:
+            try:
+                chunked.append(self.chunking_service.chunk_document(document))
+            except Exception as e:
+                chunked.append(e)
+        return chunked
+
+    def _add_document_to_batch(
+        self,
+        batch: Any,
+        document: Document,
+        chunks: list[Chunk] | Exception,
+        quality_score: float | None,
+        result: DocumentStoreResult,
+        chunk_owners: dict[str, str],
+        uncached: dict[str, str],
+    ) -> None:
+        """Queue one document's chunks on a batch and record them in its result."""
+        if isinstance(chunks, Exception):
+            logger.error(f"Failed to chunk document {document.uid}: {chunks}")
+            result.error = f"Chunking failed: {chunks}"
+            return
+
+        if not chunks:
+            logger.warning(f"No chunks generated for document {document.uid}")
+            return
+
+        chunk_properties = [
+            self._build_chunk_properties(document, chunk, quality_score)
+            for chunk in chunks
+        ]
+        cache_keys, cached_vectors = self._lookup_cached_vectors(chunk_properties)
+        for chunk, properties, cache_key in zip(chunks, chunk_properties, cache_keys):
+            vector = cached_vectors.get(cache_key) if cache_key else None
+            batch.add_object(properties=properties, uuid=chunk.uuid, vector=vector)
+            result.chunk_uuids.append(chunk.uuid)
+            chunk_owners[chunk.uuid] = document.uid
+            if cache_key and vector is None:
+                uncached[chunk.uuid] = cache_key
+
     async def search_chunks(
         self,
         query: str,
@@ -283,6 +721,7 @@ class DocumentChunkService:
         year_filter: tuple[int, int] | None = None,
         section_filter: list[str] | None = None,
         quality_threshold: float | None = None,
+        return_properties: Sequence[str] | None = None,
     ) -> list[dict[str, Any]]:
         """
         Search chunks using different search modes with filtering and quality boosting.
@@ -297,6 +736,8 @@ class DocumentChunkService:
             year_filter: Filter by year range (convenience parameter)
             section_filter: Filter by sections (convenience parameter)
             quality_threshold: Filter by quality threshold (convenience parameter)
+            return_properties: Properties to return; defaults to
+                SEARCH_RETURN_PROPERTIES. Include "meta" to fetch everything.
 
         Returns:
             List of matching chunk results with metadata
@@ -305,171 +746,321 @@ class DocumentChunkService:
             await self.connect()
 
         try:
-            collection = self.weaviate_client.client.collections.get(
-                self.collection_name
+            collection = self.get_collection()
+            where_filter = self._build_search_filter(
+                filters, source_filter, year_filter, section_filter, quality_threshold
+            )
+            response = await self._run_search(
+                collection,
+                query,
+                search_mode,
+                alpha,
+                limit,
+                where_filter,
+                return_properties=self._search_projection(return_properties),
             )
 
-            # Build filter conditions from both generic filters and specific filters
-            where_conditions = []
+            results = [self._score_chunk(item) for item in response.objects]
 
-            # Process generic filters first
-            if filters:
-                generic_conditions = self._convert_filters_to_weaviate(filters)
-                if generic_conditions:
-                    where_conditions.extend(generic_conditions)
+            # Re-sort by final score
+            results.sort(key=lambda x: x["score"], reverse=True)
 
-            if source_filter:
-                where_conditions.append(
-                    Filter.by_property("source").equal(source_filter)
-                )
+            logger.info(f"Found {len(results)} chunks for query: '{query[:50]}...'")
+            return results
 
-            if year_filter:
-                start_year, end_year = year_filter
-                where_conditions.append(
-                    Filter.by_property("year").greater_or_equal(start_year)
-                )
-                where_conditions.append(
-                    Filter.by_property("year").less_or_equal(end_year)
-                )
+        except Exception as e:
+            logger.error(f"Failed to search chunks: {e}")
+            raise
 
-            if section_filter:
-                section_conditions = [
-                    Filter.by_property("section").equal(section)
-                    for section in section_filter
-                ]
-                if len(section_conditions) == 1:
-                    where_conditions.append(section_conditions[0])
-                else:
-                    where_conditions.append(Filter.any_of(section_conditions))
+    async def search_documents(
+        self,
+        query: str,
+        top_k: int = 10,
+        search_mode: str = "hybrid",
+        alpha: float = 0.5,
+        filters: dict | None = None,
+        chunks_per_document: int = GROUP_CHUNKS_PER_DOCUMENT,
+        fetch_siblings: bool = False,
+        return_properties: Sequence[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Search for distinct documents, grouping chunk hits by parent_uid server-side.
 
-            if quality_threshold:
-                where_conditions.append(
-                    Filter.by_property("quality_total").greater_or_equal(
-                        quality_threshold
-                    )
-                )
+        Weaviate's group_by returns at most ``chunks_per_document`` matching
+        chunks for each of the ``top_k`` best documents, so a paper with many
+        matching chunks cannot crowd others out and duplicate chunks are never
+        sent. With ``fetch_siblings`` a second query loads the documents'
+        remaining chunks for abstract reconstruction.
 
-            # Combine conditions
-            where_filter = None
-            if where_conditions:
-                if len(where_conditions) == 1:
-                    where_filter = where_conditions[0]
-                else:
-                    where_filter = Filter.all_of(where_conditions)
-
-            # Execute search based on mode with proper server-side filtering
-            if search_mode == "bm25":
-                # Pure BM25 keyword search
-                if where_filter:
-                    response = collection.query.bm25(
-                        query=query,
-                        filters=where_filter,
-                        limit=limit,
-                        return_metadata=MetadataQuery(score=True),
-                    )
-                else:
-                    response = collection.query.bm25(
-                        query=query,
-                        limit=limit,
-                        return_metadata=MetadataQuery(score=True),
-                    )
-            elif search_mode == "semantic":
-                # Pure semantic search with vectors
-                if where_filter:
-                    response = collection.query.near_text(
-                        query=query,
-                        filters=where_filter,
-                        limit=limit,
-                        return_metadata=MetadataQuery(score=True, distance=True),
-                    )
-                else:
-                    response = collection.query.near_text(
-                        query=query,
-                        limit=limit,
-                        return_metadata=MetadataQuery(score=True, distance=True),
-                    )
-            else:  # hybrid (default)
-                # Hybrid search combining BM25 and vector similarity
-                if where_filter:
-                    response = collection.query.hybrid(
-                        query=query,
-                        alpha=alpha,
-                        filters=where_filter,
-                        limit=limit,
-                        return_metadata=MetadataQuery(score=True, distance=True),
-                    )
-                else:
-                    response = collection.query.hybrid(
-                        query=query,
-                        alpha=alpha,
-                        limit=limit,
-                        return_metadata=MetadataQuery(score=True, distance=True),
-                    )
+        Args:
+            query: Search query text
+            top_k: Number of distinct documents to return
+            search_mode: 'semantic', 'bm25', or 'hybrid' (default)
+            alpha: Hybrid search balance (0.0=pure BM25, 1.0=pure vector)
+            filters: Generic filters dict for flexible filtering
+            chunks_per_document: Matching chunks returned per document
+            fetch_siblings: Also fetch each document's non-matching chunks
+            return_properties: Properties to return, as for search_chunks
 
-            # Process results with enhanced quality boosting
-            results = []
-            for item in response.objects:
-                # Apply enhanced section boost
-                section_boost = self._get_section_boost(
-                    item.properties.get("section", "")
+        Returns:
+            Documents best first, each ``{"parent_uid", "chunks", "siblings"}``
+            where ``chunks`` are scored matches (best first) and ``siblings``
+            the unscored remaining chunks (empty unless ``fetch_siblings``)
+        """
+        if not self._initialized:
+            await self.connect()
+
+        try:
+            collection = self.get_collection()
+            where_filter = self._build_search_filter(filters)
+            projection = self._search_projection(return_properties)
+            group_by = GroupBy(
+                prop="parent_uid",
+                objects_per_group=chunks_per_document,
+                number_of_groups=top_k,
+            )
+            response = await self._run_search(
+                collection,
+                query,
+                search_mode,
+                alpha,
+                top_k * self.GROUP_SEARCH_DEPTH_PER_DOCUMENT,
+                where_filter,
+                group_by=group_by,
+                return_properties=projection,
+            )
+
+            documents = []
+            for group in response.groups.values():
+                chunks = [self._score_chunk(item) for item in group.objects]
+                if not chunks:
+                    continue
+                chunks.sort(key=lambda x: x["score"], reverse=True)
+                documents.append(
+                    {"parent_uid": group.name, "chunks": chunks, "siblings": []}
                 )
 
-                # Apply quality boost
-                quality_total = item.properties.get("quality_total", 0.0)
-                quality_boost = quality_total * float(self.config.quality_boost_factor)
+            documents.sort(key=lambda d: d["chunks"][0]["score"], reverse=True)
+            documents = documents[:top_k]
 
-                # Apply recency boost
-                recency_boost = self._get_recency_boost(item.properties.get("year"))
+            if fetch_siblings and documents:
+                await self._attach_sibling_chunks(collection, documents, projection)
 
-                # Calculate final score
-                base_score = item.metadata.score or 0.0
+            logger.info(
+                f"Found {len(documents)} documents for query: '{query[:50]}...'"
+            )
+            return documents
 
-                # Handle Weaviate's different score formats
-                if base_score == 0.0:
-                    # For semantic search, Weaviate returns distance instead of score
-                    distance = getattr(item.metadata, "distance", None)
-                    if distance is not None:
-                        # Convert distance (0-2 range) to similarity score (0-1 range)
-                        # Lower distance = higher similarity
-                        base_score = max(0.0, 1.0 - (distance / 2.0))
-                    else:
-                        # For BM25 or other searches, use minimal base score
-                        # so quality boosting still has an effect
-                        base_score = 0.1
+        except Exception as e:
+            logger.error(f"Failed to search documents: {e}")
+            raise
 
-                final_score = base_score * (
-                    1 + section_boost + quality_boost + recency_boost
-                )
+    async def _attach_sibling_chunks(
+        self,
+        collection: Any,
+        documents: list[dict[str, Any]],
+        projection: list[str] | None,
+    ) -> None:
+        """Add each document's chunks that were not among its matches."""
+        by_parent = {doc["parent_uid"]: doc for doc in documents}
+        matched = {chunk["uuid"] for doc in documents for chunk in doc["chunks"]}
+
+        response = await collection.query.fetch_objects(
+            filters=Filter.by_property("parent_uid").contains_any(list(by_parent)),
+            limit=len(by_parent) * self.MAX_SIBLINGS_PER_DOCUMENT,
+            return_properties=projection,
+        )
+        for item in response.objects:
+            document = by_parent.get(item.properties.get("parent_uid"))
+            if document is None or str(item.uuid) in matched:
+                continue
+            document["siblings"].append(self._chunk_fields(item))
 
-                result = {
-                    "uuid": str(item.uuid),
-                    "parent_uid": item.properties.get("parent_uid"),
-                    "source": item.properties.get("source"),
-                    "title": item.properties.get("title"),
-                    "text": item.properties.get("text"),
-                    "section": item.properties.get("section"),
-                    "published_at": item.properties.get("published_at"),
-                    "year": item.properties.get("year"),
-                    "tokens": item.properties.get("tokens"),
-                    "quality_total": quality_total,
-                    "score": final_score,
-                    "base_score": base_score,
-                    "section_boost": section_boost,
-                    "quality_boost": quality_boost,
-                    "recency_boost": recency_boost,
-                    "meta": item.properties.get("meta", {}),
-                }
-                results.append(result)
+    def _build_search_filter(
+        self,
+        filters: dict | None = None,
+        source_filter: str | None = None,
+        year_filter: tuple[int, int] | None = None,
+        section_filter: list[str] | None = None,
+        quality_threshold: float | None = None,
+    ) -> Filter | None:
+        """Combine generic and convenience filters into one Weaviate filter."""
+        where_conditions = []
+
+        # Process generic filters first
+        if filters:
+            generic_conditions = self._convert_filters_to_weaviate(filters)
+            if generic_conditions:
+                where_conditions.extend(generic_conditions)
+
+        if source_filter:
+            where_conditions.append(Filter.by_property("source").equal(source_filter))
+
+        if year_filter:
+            start_year, end_year = year_filter
+            where_conditions.append(
+                Filter.by_property("year").greater_or_equal(start_year)
+            )
+            where_conditions.append(Filter.by_property("year").less_or_equal(end_year))
+
+        if section_filter:
+            section_conditions = [
+                Filter.by_property("section").equal(section)
+                for section in section_filter
+            ]
+            if len(section_conditions) == 1:
+                where_conditions.append(section_conditions[0])
+            else:
+                where_conditions.append(Filter.any_of(section_conditions))
 
-            # Re-sort by final score
-            results.sort(key=lambda x: x["score"], reverse=True)
+        if quality_threshold:
+            where_conditions.append(
+                Filter.by_property("quality_total").greater_or_equal(quality_threshold)
+            )
 
-            logger.info(f"Found {len(results)} chunks for query: '{query[:50]}...'")
-            return results
+        # Combine conditions
+        if not where_conditions:
+            return None
+        if len(where_conditions) == 1:
+            return where_conditions[0]
+        return Filter.all_of(where_conditions)
 
-        except Exception as e:
-            logger.error(f"Failed to search chunks: {e}")
-            raise
+    async def _run_search(
+        self,
+        collection: Any,
+        query: str,
+        search_mode: str,
+        alpha: float,
+        limit: int,
+        where_filter: Filter | None,
+        group_by: GroupBy | None = None,
+        return_properties: list[str] | None = None,
+    ) -> Any:
+        """Execute a bm25, semantic or hybrid query with server-side filtering."""
+        options: dict[str, Any] = {
+            "limit": limit,
+            "return_properties": return_properties,
+        }
+        if where_filter:
+            options["filters"] = where_filter
+        if group_by is not None:
+            options["group_by"] = group_by
+
+        if search_mode == "bm25":
+            # Pure BM25 keyword search
+            return await collection.query.bm25(
+                query=query, return_metadata=MetadataQuery(score=True), **options
+            )
+        if search_mode == "semantic":
+            # Pure semantic search with vectors
+            return await collection.query.near_text(
+                query=query,
+                return_metadata=MetadataQuery(score=True, distance=True),
+                **options,
+            )
+        # Hybrid search combining BM25 and vector similarity
+        return await collection.query.hybrid(
+            query=query,
+            alpha=alpha,
+            return_metadata=MetadataQuery(score=True, distance=True),
+            **options,
+        )
+
+    def _search_projection(
+        self, return_properties: Sequence[str] | None
+    ) -> list[str] | None:
+        """Properties to request for a search; None requests all of them."""
+        requested = return_properties or self.SEARCH_RETURN_PROPERTIES
+        if "meta" in requested:
+            # Nested meta has auto-schema fields; fetch everything instead
+            return None
+        return list(dict.fromkeys([*requested, *self.SCORING_PROPERTIES]))
+
+    async def load_chunk_meta(self, chunks: Sequence[dict[str, Any]]) -> None:
+        """Fill in ``meta`` for search results fetched without it.
+
+        Meant for the final top-k only: the objects are read back by id in
+        pages of MANIFEST_PAGE_SIZE and their ``meta`` set in place.
+        """
+        missing = list(dict.fromkeys(c["uuid"] for c in chunks if "meta" not in c))
+        if not missing:
+            return
+
+        collection = self.get_collection()
+        metas: dict[str, dict[str, Any]] = {}
+        for i in range(0, len(missing), self.MANIFEST_PAGE_SIZE):
+            page = missing[i : i + self.MANIFEST_PAGE_SIZE]
+            response = await collection.query.fetch_objects(
+                filters=Filter.by_id().contains_any(page), limit=len(page)
+            )
+            for obj in response.objects:
+                metas[str(obj.uuid)] = obj.properties.get("meta") or {}
+
+        for chunk in chunks:
+            if "meta" not in chunk:
+                chunk["meta"] = metas.get(chunk["uuid"], {})
+
+    @staticmethod
+    def _chunk_fields(item: Any) -> dict[str, Any]:
+        """Chunk properties returned to callers, without scores."""
+        fields = {
+            "uuid": str(item.uuid),
+            "parent_uid": item.properties.get("parent_uid"),
+            "source": item.properties.get("source"),
+            "title": item.properties.get("title"),
+            "text": item.properties.get("text"),
+            "section": item.properties.get("section"),
+            "published_at": item.properties.get("published_at"),
+            "year": item.properties.get("year"),
+            "tokens": item.properties.get("tokens"),
+            "quality_total": item.properties.get("quality_total", 0.0),
+        }
+        # Only present when the projection included it
+        if "meta" in item.properties:
+            fields["meta"] = item.properties["meta"]
+        return fields
+
+    def _score_chunk(self, item: Any) -> dict[str, Any]:
+        """Build a chunk result with section, quality and recency boosting."""
+        # Apply enhanced section boost
+        section_boost = self._get_section_boost(item.properties.get("section", ""))
+
+        # Apply quality boost
+        quality_total = item.properties.get("quality_total", 0.0)
+        quality_boost = quality_total * float(self.config.quality_boost_factor)
+
+        # Apply recency boost
+        recency_boost = self._get_recency_boost(item.properties.get("year"))
+
+        # Calculate final score
+        base_score = item.metadata.score or 0.0
+
+        # Handle Weaviate's different score formats
+        if base_score == 0.0:
+            # For semantic search, Weaviate returns distance instead of score
+            distance = getattr(item.metadata, "distance", None)
+            if distance is not None:
+                # Convert distance (0-2 range) to similarity score (0-1 range)
+                # Lower distance = higher similarity
+                base_score = max(0.0, 1.0 - (distance / 2.0))
+            else:
+                # For BM25 or other searches, use minimal base score
+                # so quality boosting still has an effect
+                base_score = 0.1
+
+        final_score = base_score * (1 + section_boost + quality_boost + recency_boost)
+
+        result = self._chunk_fields(item)
+        result.update(
+            {
+                "score": final_score,
+                "base_score": base_score,
+                "section_boost": section_boost,
+                "quality_boost": quality_boost,
+                "recency_boost": recency_boost,
+            }
+        )
+        return result
 
     def _get_section_boost(self, section: str) -> float:
         """Get boost factor for document section."""
@@ -508,11 +1099,9 @@ class DocumentChunkService:
             await self.connect()
 
         try:
-            collection = self.weaviate_client.client.collections.get(
-                self.collection_name
-            )
+            collection = self.get_collection()
 
-            response = collection.query.fetch_object_by_id(chunk_uuid)
+            response = await collection.query.fetch_object_by_id(chunk_uuid)
 
             if response:
                 return {
@@ -535,19 +1124,190 @@ class DocumentChunkService:
             logger.error(f"Failed to get chunk {chunk_uuid}: {e}")
             return None
 
+    async def get_documents(
+        self, parent_uids: Sequence[str]
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Reconstruct documents from their chunks, ordered by chunk_idx.
+
+        Cached documents are served from the hot-document LRU; the rest are
+        resolved with one parent_uid filter per DOCUMENT_FETCH_BATCH ids.
+
+        Returns:
+            Document dicts keyed by parent_uid, in request order; ids with no
+            stored chunks are missing
+        """
+        if not self._initialized:
+            await self.connect()
+
+        requested = list(dict.fromkeys(parent_uids))
+        documents: dict[str, dict[str, Any]] = {}
+        missing = []
+        for parent_uid in requested:
+            document = self.document_cache.get(parent_uid)
+            if document is None:
+                missing.append(parent_uid)
+            else:
+                documents[parent_uid] = document
+
+        collection = self.get_collection() if missing else None
+        for i in range(0, len(missing), self.DOCUMENT_FETCH_BATCH):
+            page = missing[i : i + self.DOCUMENT_FETCH_BATCH]
+            chunk_objects = await self._fetch_document_chunks(collection, page)
+
+            for parent_uid in page:
+                if parent_uid not in chunk_objects:
+                    continue
+                document = self._assemble_document(
+                    parent_uid, chunk_objects[parent_uid]
+                )
+                self.document_cache.put(parent_uid, document)
+                documents[parent_uid] = document
+
+        return {uid: documents[uid] for uid in requested if uid in documents}
+
+    async def _fetch_document_chunks(
+        self, collection: Any, parent_uids: list[str]
+    ) -> dict[str, list[Any]]:
+        """Read every chunk of the given documents, grouped by parent_uid.
+
+        Pages are read until one comes back short, so long documents are never
+        truncated; sorting by parent_uid first keeps the page order stable.
+        """
+        page_size = len(parent_uids) * self.MAX_SIBLINGS_PER_DOCUMENT
+        chunk_objects: dict[str, list[Any]] = defaultdict(list)
+        offset = 0
+        while True:
+            response = await collection.query.fetch_objects(
+                filters=Filter.by_property("parent_uid").contains_any(parent_uids),
+                sort=Sort.by_property("parent_uid").by_property("chunk_idx"),
+                limit=page_size,
+                offset=offset,
+            )
+            for obj in response.objects:
+                chunk_objects[obj.properties.get("parent_uid")].append(obj)
+
+            if len(response.objects) < page_size:
+                return chunk_objects
+            offset += page_size
+
+    @staticmethod
+    def _assemble_document(parent_uid: str, objects: list[Any]) -> dict[str, Any]:
+        """Build a document dict from its chunk objects (in chunk order)."""
+        first = objects[0].properties
+        chunks = [
+            {
+                "uuid": str(obj.uuid),
+                "chunk_id": obj.properties.get("chunk_id", ""),
+                "chunk_idx": obj.properties.get("chunk_idx", i),
+                "text": obj.properties.get("text", ""),
+                "section": obj.properties.get("section", ""),
+                "tokens": obj.properties.get("tokens", 0),
+            }
+            for i, obj in enumerate(objects)
+        ]
+        return {
+            "parent_uid": parent_uid,
+            "source": first.get("source", ""),
+            "title": first.get("title", ""),
+            "published_at": first.get("published_at"),
+            "year": first.get("year"),
+            "quality_total": first.get("quality_total", 0.0),
+            "meta": first.get("meta") or {},
+            "chunks": chunks,
+        }
+
+    async def get_document_manifests(
+        self, parent_uids: Sequence[str]
+    ) -> dict[str, DocumentManifest]:
+        """Read what is stored for documents: content hash, chunker version, chunks.
+
+        Documents without any stored chunks are absent from the result.
+        """
+        if not self._initialized:
+            await self.connect()
+
+        manifests: dict[str, DocumentManifest] = {}
+        if not parent_uids:
+            return manifests
+
+        collection = self.get_collection()
+        offset = 0
+        while True:
+            response = await collection.query.fetch_objects(
+                filters=Filter.by_property("parent_uid").contains_any(
+                    list(parent_uids)
+                ),
+                return_properties=[
+                    "parent_uid",
+                    QueryNested(
+                        name="meta", properties=["chunker_version", "content_hash"]
+                    ),
+                ],
+                limit=self.MANIFEST_PAGE_SIZE,
+                offset=offset,
+            )
+
+            for obj in response.objects:
+                parent_uid = obj.properties.get("parent_uid")
+                meta = obj.properties.get("meta") or {}
+                manifest = manifests.setdefault(
+                    parent_uid, DocumentManifest(uid=parent_uid)
+                )
+                manifest.add_chunk(
+                    str(obj.uuid), meta.get("content_hash"), meta.get("chunker_version")
+                )
+
+            if len(response.objects) < self.MANIFEST_PAGE_SIZE:
+                return manifests
+            offset += self.MANIFEST_PAGE_SIZE
+
+    async def delete_chunks(
+        self, chunk_uuids: Iterable[str], parent_uid: str | None = None
+    ) -> int:
+        """Delete chunks by UUID. Returns count of deleted chunks.
+
+        ``parent_uid`` names the document the chunks belong to so its cached
+        copy is dropped; without it the whole document cache is cleared.
+        """
+        chunk_uuids = list(chunk_uuids)
+        if not chunk_uuids:
+            return 0
+
+        if not self._initialized:
+            await self.connect()
+
+        if parent_uid is None:
+            self.document_cache.clear()
+        else:
+            self.document_cache.invalidate([parent_uid])
+
+        try:
+            result = await self.get_collection().data.delete_many(
+                where=Filter.by_id().contains_any(chunk_uuids)
+            )
+        finally:
+            # A read during the delete may have re-cached the deleted chunks
+            if parent_uid is None:
+                self.document_cache.clear()
+            else:
+                self.document_cache.invalidate([parent_uid])
+        logger.info(f"Deleted {result.successful} of {len(chunk_uuids)} chunks")
+        return result.successful
+
     async def delete_document_chunks(self, parent_uid: str) -> int:
         """Delete all chunks for a document. Returns count of deleted chunks."""
         if not self._initialized:
             await self.connect()
 
+        self.document_cache.invalidate([parent_uid])
+
         try:
-            collection = self.weaviate_client.client.collections.get(
-                self.collection_name
-            )
+            collection = self.get_collection()
 
             # Use delete_many directly without counting first
             try:
-                result = collection.data.delete_many(
+                result = await collection.data.delete_many(
                     where=Filter.by_property("parent_uid").equal(parent_uid)
                 )
 
@@ -571,7 +1331,7 @@ class DocumentChunkService:
                 logger.warning(f"Delete operation encountered error: {delete_error}")
                 # Try alternative approach: search and delete individual objects
                 try:
-                    search_response = collection.query.bm25(
+                    search_response = await collection.query.bm25(
                         query=parent_uid,  # Search for parent_uid in text
                         limit=1000,
                     )
@@ -580,7 +1340,7 @@ class DocumentChunkService:
                     for obj in search_response.objects:
                         if obj.properties.get("parent_uid") == parent_uid:
                             try:
-                                collection.data.delete_by_id(obj.uuid)
+                                await collection.data.delete_by_id(obj.uuid)
                                 individual_deletes += 1
                             except Exception:
                                 continue
@@ -598,22 +1358,24 @@ class DocumentChunkService:
             logger.error(f"Failed to delete chunks for document {parent_uid}: {e}")
             raise
 
+        finally:
+            # A read during the delete may have re-cached the deleted chunks
+            self.document_cache.invalidate([parent_uid])
+
     async def get_collection_stats(self) -> dict[str, Any]:
         """Get collection statistics for monitoring."""
         if not self._initialized:
             await self.connect()
 
         try:
-            collection = self.weaviate_client.client.collections.get(
-                self.collection_name
-            )
+            collection = self.get_collection()
 
             # Get total count
-            aggregate_response = collection.aggregate.over_all(total_count=True)
+            aggregate_response = await collection.aggregate.over_all(total_count=True)
             total_count = aggregate_response.total_count
 
             # Get source breakdown
-            source_response = collection.aggregate.over_all(group_by="source")
+            source_response = await collection.aggregate.over_all(group_by="source")
 
             source_counts = {}
             for group in source_response.groups:
@@ -655,19 +1417,19 @@ class DocumentChunkService:
                 await self.connect()
 
             # Test basic connectivity
-            if not self.weaviate_client.client.is_ready():
+            if not await self.weaviate_client.async_client.is_ready():
                 return {"status": "unhealthy", "error": "Weaviate client not ready"}
 
             # Test collection access
-            if not self.weaviate_client.client.collections.exists(self.collection_name):
+            if not await self.weaviate_client.async_client.collections.exists(
+                self.collection_name
+            ):
                 return {
                     "status": "unhealthy",
                     "error": f"Collection {self.collection_name} does not exist",
                 }
 
-            collection = self.weaviate_client.client.collections.get(
-                self.collection_name
-            )
+            collection = self.get_collection()
 
             # Test OpenAI embedding generation by inserting a test document
             embeddings_working = True
@@ -700,12 +1462,12 @@ class DocumentChunkService:
                         }
 
                         # Insert test chunk (will generate embedding)
-                        collection.data.insert(
+                        await collection.data.insert(
                             uuid=test_chunk.uuid, properties=test_properties
                         )
 
                         # Verify embedding was generated
-                        retrieved = collection.query.fetch_object_by_id(
+                        retrieved = await collection.query.fetch_object_by_id(
                             test_chunk.uuid, include_vector=True
                         )
 
@@ -719,7 +1481,7 @@ class DocumentChunkService:
                             embedding_error = f"Vector dimension mismatch: expected {self.config.openai_embedding_dimensions or 1536}, got {len(retrieved.vector)}"
 
                         # Clean up test document
-                        collection.data.delete_by_id(test_chunk.uuid)
+                        await collection.data.delete_by_id(test_chunk.uuid)
 
                 except Exception as e:
                     embeddings_working = False
@@ -0,0 +1,118 @@
+"""
+Content-addressed embedding cache for chunk ingestion.
+
+Vectors produced by Weaviate's vectorizer module are kept in a local SQLite
+file keyed by (model, dimensions, sha256 of the vectorized text). Re-ingesting
+a chunk whose text is unchanged then supplies the cached vector on insert, so
+the vectorizer (and its embedding API bill) is only hit for new text.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+from array import array
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Any
+
+from bio_mcp.config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Text properties the text2vec module embeds for a chunk, in schema order
+VECTORIZED_PROPERTIES = ("parent_uid", "source", "title", "text", "section")
+
+
+def vectorized_text(properties: Mapping[str, Any]) -> str:
+    """Return the text a chunk's vector is computed from."""
+    return "\x1f".join(
+        str(properties.get(name) or "") for name in VECTORIZED_PROPERTIES
+    )
+
+
+class EmbeddingCache:
+    """Embedding vectors in a local SQLite file, with hit/miss counters."""
+
+    # Keys per SELECT ... IN (...) query (below SQLite's variable limit)
+    LOOKUP_BATCH = 500
+
+    def __init__(self, db_path: str, model: str, dimensions: int | None = None):
+        """Initialize the cache.
+
+        Args:
+            db_path: SQLite database path
+            model: Embedding model name the vectors come from
+            dimensions: Requested embedding dimensions (None = model default)
+        """
+        self.db_path = db_path
+        self.model = model
+        self.dimensions = dimensions
+        self.hits = 0
+        self.misses = 0
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._initialize_tables()
+
+    def _initialize_tables(self) -> None:
+        """Create the cache table if needed."""
+        cursor = self.conn.cursor()
+        # WAL lets several ingestion processes read while one writes
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS embedding_cache (
+                cache_key TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                dimensions INTEGER,
+                vector BLOB NOT NULL
+            )
+        """)
+        self.conn.commit()
+
+    def __len__(self) -> int:
+        cursor = self.conn.execute("SELECT COUNT(*) FROM embedding_cache")
+        return cursor.fetchone()[0]
+
+    def make_key(self, text: str) -> str:
+        """Build the cache key for a vectorized text."""
+        digest = hashlib.sha256(text.encode()).hexdigest()
+        return f"{self.model}:{self.dimensions or 0}:{digest}"
+
+    def get_many(self, keys: Sequence[str]) -> dict[str, list[float]]:
+        """Look up vectors for keys, counting hits and misses."""
+        unique_keys = list(dict.fromkeys(keys))
+        found: dict[str, list[float]] = {}
+
+        for i in range(0, len(unique_keys), self.LOOKUP_BATCH):
+            batch = unique_keys[i : i + self.LOOKUP_BATCH]
+            placeholders = ",".join("?" * len(batch))
+            rows = self.conn.execute(
+                f"SELECT cache_key, vector FROM embedding_cache "
+                f"WHERE cache_key IN ({placeholders})",
+                batch,
+            ).fetchall()
+            for key, blob in rows:
+                found[key] = array("f", blob).tolist()
+
+        hits = sum(1 for key in keys if key in found)
+        self.hits += hits
+        self.misses += len(keys) - hits
+        return found
+
+    def put_many(self, vectors: Iterable[tuple[str, Sequence[float]]]) -> int:
+        """Store vectors by key; returns the number written."""
+        rows = [
+            (key, self.model, self.dimensions, array("f", vector).tobytes())
+            for key, vector in vectors
+            if vector
+        ]
+        if rows:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO embedding_cache "
+                "(cache_key, model, dimensions, vector) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self.conn.commit()
+        return len(rows)
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        self.conn.close()
@@ -0,0 +1,465 @@
+"""
+Append-only archive of raw source payloads behind ``s3_raw_uri``.
+
+Raw records (e.g. PubMed EFetch dicts) are serialized to JSON, compressed one
+frame per record and appended to segment files. A SQLite index maps each uid
+to its (segment, offset, length), so a record is read back with one slice of
+an mmap'd segment, and a full re-ingest walks segments sequentially in file
+order. Segments are rolled over at a size limit; sealed segments can be
+published to an S3-compatible bucket (a local MinIO works) by the S3 backend.
+
+Uses zstd when ``zstandard`` is installed and zlib otherwise; the codec is
+recorded per record so archives written with either stay readable.
+
+Any number of processes may read and write. Writers take an exclusive lock
+on ``writer.lock`` for each ``put_many`` and re-resolve the active segment
+under it, so appends from different processes never interleave. Within a
+process the index connection is shared by every thread, so its use is
+serialized by a lock.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import sqlite3
+import threading
+import time
+import zlib
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from bio_mcp.config.logging_config import get_logger
+
+try:
+    import zstandard  # type: ignore[import-untyped]
+
+    DEFAULT_CODEC = "zstd"
+except ImportError:  # pragma: no cover - depends on optional dependency
+    zstandard = None
+
+    DEFAULT_CODEC = "zlib"
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+logger = get_logger(__name__)
+
+SEGMENT_SUFFIX = ".seg"
+WRITER_LOCK = "writer.lock"
+
+
+def _compress(data: bytes, codec: str) -> bytes:
+    if codec == "zstd":
+        return zstandard.ZstdCompressor(level=3).compress(data)
+    return zlib.compress(data, 6)
+
+
+def _decompress(data: bytes, codec: str) -> bytes:
+    if codec == "zstd":
+        if zstandard is None:
+            raise RuntimeError("zstandard is required to read zstd archive records")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return zlib.decompress(data)
+
+
+def serialize_payload(payload: dict[str, Any]) -> bytes:
+    """Canonical JSON bytes for a raw payload (the content hash input)."""
+    return json.dumps(
+        payload, sort_keys=True, separators=(",", ":"), default=str
+    ).encode()
+
+
+@dataclass(frozen=True)
+class ArchivedRecord:
+    """Location and hash of an archived raw payload."""
+
+    uid: str
+    uri: str
+    content_hash: str
+
+
+class LocalSegmentBackend:
+    """Segments in a local directory, read through cached mmaps.
+
+    Reads may come from several threads; a lock keeps one thread from closing
+    a map (to remap the growing active segment) while another reads from it.
+    """
+
+    def __init__(self, directory: str | Path):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._maps: dict[str, tuple[Any, mmap.mmap]] = {}
+        self._maps_lock = threading.Lock()
+
+    def path(self, segment: str) -> Path:
+        return self.directory / segment
+
+    def uri(self, segment: str) -> str:
+        return self.path(segment).resolve().as_uri()
+
+    def publish(self, segment: str) -> None:
+        """Called once a segment is sealed; local segments need nothing."""
+
+    def read(self, segment: str, offset: int, length: int) -> bytes:
+        """Read ``length`` bytes at ``offset`` of a segment."""
+        with self._maps_lock:
+            view = self._map(segment, offset + length)
+            return view[offset : offset + length]
+
+    def _map(self, segment: str, min_size: int) -> mmap.mmap:
+        entry = self._maps.get(segment)
+        # The active segment grows; remap once a read goes past the old end
+        if entry is None or len(entry[1]) < min_size:
+            if entry is not None:
+                entry[1].close()
+                entry[0].close()
+            handle = open(self.path(segment), "rb")
+            entry = (handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ))
+            self._maps[segment] = entry
+        return entry[1]
+
+    def close(self) -> None:
+        with self._maps_lock:
+            for handle, view in self._maps.values():
+                view.close()
+                handle.close()
+            self._maps.clear()
+
+
+class S3SegmentBackend(LocalSegmentBackend):
+    """Sealed segments are uploaded to an S3-compatible bucket.
+
+    Reads use the local copy when it is present and ranged GETs otherwise, so
+    readers on other hosts only need the index and bucket access.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        bucket: str,
+        prefix: str = "raw/",
+        endpoint_url: str | None = None,
+        client: Any = None,
+    ):
+        super().__init__(directory)
+        self.bucket = bucket
+        self.prefix = prefix
+        if client is None:
+            try:
+                import boto3  # type: ignore[import-untyped]
+            except ImportError as e:
+                raise RuntimeError(
+                    "boto3 is required for the S3 raw archive backend"
+                ) from e
+            client = boto3.client("s3", endpoint_url=endpoint_url)
+        self.client = client
+
+    def key(self, segment: str) -> str:
+        return f"{self.prefix}{segment}"
+
+    def uri(self, segment: str) -> str:
+        return f"s3://{self.bucket}/{self.key(segment)}"
+
+    def publish(self, segment: str) -> None:
+        self.client.upload_file(str(self.path(segment)), self.bucket, self.key(segment))
+        logger.info(
+            "Published raw archive segment", segment=segment, uri=self.uri(segment)
+        )
+
+    def read(self, segment: str, offset: int, length: int) -> bytes:
+        if self.path(segment).exists():
+            return super().read(segment, offset, length)
+
+        response = self.client.get_object(
+            Bucket=self.bucket,
+            Key=self.key(segment),
+            Range=f"bytes={offset}-{offset + length - 1}",
+        )
+        return response["Body"].read()
+
+
+class RawDocumentArchive:
+    """Append-only, compressed raw payload store with a uid offset index."""
+
+    def __init__(
+        self,
+        root: str | Path,
+        backend: LocalSegmentBackend | None = None,
+        max_segment_bytes: int = 256 * 1024 * 1024,
+        codec: str = DEFAULT_CODEC,
+    ):
+        """Open (or create) an archive.
+
+        Args:
+            root: Directory holding the index and local segment files
+            backend: Segment storage; defaults to local files under ``root``
+            max_segment_bytes: Size at which the active segment is sealed
+            codec: Compression for new records ("zstd" or "zlib")
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.backend = backend or LocalSegmentBackend(self.root / "segments")
+        self.max_segment_bytes = max_segment_bytes
+        self.codec = codec
+        self.conn = sqlite3.connect(self.root / "index.db", check_same_thread=False)
+        self._initialize_tables()
+        self._active: str | None = None
+        self._writer = None
+        self._write_lock = threading.Lock()
+        self._index_lock = threading.Lock()
+
+    def _initialize_tables(self) -> None:
+        """Create the index tables if needed."""
+        cursor = self.conn.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS raw_records (
+                uid TEXT PRIMARY KEY,
+                segment TEXT NOT NULL,
+                offset INTEGER NOT NULL,
+                length INTEGER NOT NULL,
+                codec TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                stored_at REAL NOT NULL
+            )
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_raw_records_location
+            ON raw_records (segment, offset)
+        """)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS raw_segments (
+                name TEXT PRIMARY KEY,
+                size INTEGER NOT NULL DEFAULT 0,
+                sealed INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+        self.conn.commit()
+
+    def __len__(self) -> int:
+        return self._fetch("SELECT COUNT(*) FROM raw_records")[0][0]
+
+    def __contains__(self, uid: str) -> bool:
+        return bool(self._fetch("SELECT 1 FROM raw_records WHERE uid = ?", (uid,)))
+
+    def _fetch(self, query: str, params: Iterable[Any] = ()) -> list[tuple]:
+        """Run an index query under the index lock."""
+        with self._index_lock:
+            return self.conn.execute(query, tuple(params)).fetchall()
+
+    # Writes
+
+    def put(self, uid: str, payload: dict[str, Any]) -> ArchivedRecord:
+        """Archive one raw payload."""
+        return self.put_many([(uid, payload)])[0]
+
+    def put_many(
+        self, items: Iterable[tuple[str, dict[str, Any]]]
+    ) -> list[ArchivedRecord]:
+        """Archive raw payloads, committing the index once per segment.
+
+        A payload identical to the uid's latest archived version is not
+        written again.
+        """
+        with self._writing():
+            return self._put_many(items)
+
+    @contextmanager
+    def _writing(self) -> Iterator[None]:
+        """Hold the writer lock, across threads and processes, for one write.
+
+        The active segment is looked up again under the lock (another process
+        may have sealed it) and closed before the lock is released.
+        """
+        with self._write_lock, open(self.root / WRITER_LOCK, "ab") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                self._close_writer()
+
+    def _put_many(
+        self, items: Iterable[tuple[str, dict[str, Any]]]
+    ) -> list[ArchivedRecord]:
+        records = []
+        rows = []
+        for uid, payload in items:
+            data = serialize_payload(payload)
+            content_hash = hashlib.sha256(data).hexdigest()
+
+            existing = self._fetch(
+                "SELECT segment, content_hash FROM raw_records WHERE uid = ?", (uid,)
+            )
+            if existing and existing[0][1] == content_hash:
+                records.append(
+                    ArchivedRecord(uid, self.backend.uri(existing[0][0]), content_hash)
+                )
+                continue
+
+            segment, offset, length = self._append(_compress(data, self.codec))
+            rows.append(
+                (uid, segment, offset, length, self.codec, content_hash, time.time())
+            )
+            records.append(ArchivedRecord(uid, self.backend.uri(segment), content_hash))
+
+            if self._writer.tell() >= self.max_segment_bytes:
+                self._commit(rows)
+                rows = []
+                self._seal_active()
+
+        self._commit(rows)
+        return records
+
+    def _commit(self, rows: list[tuple]) -> None:
+        """Flush appended frames, then index them."""
+        if not rows:
+            return
+
+        self._writer.flush()
+        with self._index_lock:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO raw_records "
+                "(uid, segment, offset, length, codec, content_hash, stored_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self.conn.execute(
+                "UPDATE raw_segments SET size = ? WHERE name = ?",
+                (self._writer.tell(), self._active),
+            )
+            self.conn.commit()
+
+    def _append(self, frame: bytes) -> tuple[str, int, int]:
+        if self._writer is None:
+            self._open_active_segment()
+        offset = self._writer.tell()
+        self._writer.write(frame)
+        return self._active, offset, len(frame)
+
+    def _open_active_segment(self) -> None:
+        with self._index_lock:
+            row = self.conn.execute(
+                "SELECT name FROM raw_segments WHERE sealed = 0 "
+                "ORDER BY name DESC LIMIT 1"
+            ).fetchone()
+            if row is None:
+                count = self.conn.execute(
+                    "SELECT COUNT(*) FROM raw_segments"
+                ).fetchone()[0]
+                name = f"{count + 1:08d}{SEGMENT_SUFFIX}"
+                self.conn.execute("INSERT INTO raw_segments (name) VALUES (?)", (name,))
+                self.conn.commit()
+            else:
+                name = row[0]
+
+        self._active = name
+        self._writer = open(self.backend.path(name), "ab")
+
+    def _close_writer(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+            self._active = None
+
+    def _seal_active(self) -> None:
+        name = self._active
+        self._close_writer()
+        with self._index_lock:
+            self.conn.execute(
+                "UPDATE raw_segments SET sealed = 1 WHERE name = ?", (name,)
+            )
+            self.conn.commit()
+        self.backend.publish(name)
+        logger.info("Sealed raw archive segment", segment=name)
+
+    # Reads
+
+    def get(self, uid: str) -> dict[str, Any] | None:
+        """Random access to a uid's latest raw payload."""
+        rows = self._fetch(
+            "SELECT segment, offset, length, codec FROM raw_records WHERE uid = ?",
+            (uid,),
+        )
+        if not rows:
+            return None
+        return self._load(*rows[0])
+
+    def get_many(self, uids: Iterable[str]) -> dict[str, dict[str, Any]]:
+        """Fetch several payloads, reading them in on-disk order."""
+        uids = list(dict.fromkeys(uids))
+        rows = []
+        for i in range(0, len(uids), 500):
+            batch = uids[i : i + 500]
+            rows.extend(
+                self._fetch(
+                    "SELECT uid, segment, offset, length, codec FROM raw_records "
+                    f"WHERE uid IN ({','.join('?' * len(batch))})",
+                    batch,
+                )
+            )
+        rows.sort(key=lambda row: (row[1], row[2]))
+        return {row[0]: self._load(*row[1:]) for row in rows}
+
+    def iter_records(
+        self, uid_prefix: str | None = None
+    ) -> Iterator[tuple[str, dict[str, Any]]]:
+        """Stream (uid, payload) for all records in segment order."""
+        query = "SELECT uid, segment, offset, length, codec FROM raw_records"
+        params: tuple[str, ...] = ()
+        if uid_prefix:
+            query += " WHERE uid >= ? AND uid < ?"
+            params = (uid_prefix, uid_prefix + "\uffff")
+        query += " ORDER BY segment, offset"
+
+        with self._index_lock:
+            cursor = self.conn.execute(query, params)
+        while True:
+            with self._index_lock:
+                rows = cursor.fetchmany(1000)
+            if not rows:
+                return
+            for uid, segment, offset, length, codec in rows:
+                yield uid, self._load(segment, offset, length, codec)
+
+    def get_content_hash(self, uid: str) -> str | None:
+        rows = self._fetch("SELECT content_hash FROM raw_records WHERE uid = ?", (uid,))
+        return rows[0][0] if rows else None
+
+    def _load(self, segment: str, offset: int, length: int, codec: str) -> dict:
+        frame = self.backend.read(segment, offset, length)
+        return json.loads(_decompress(frame, codec))
+
+    def close(self) -> None:
+        """Release segment files and the index."""
+        self.backend.close()
+        with self._index_lock:
+            self.conn.close()
+
+
+def create_raw_archive(config: Any) -> RawDocumentArchive | None:
+    """Build the configured raw archive, or None when it is disabled."""
+    if not getattr(config, "raw_archive_path", None):
+        return None
+
+    backend = None
+    if getattr(config, "raw_archive_s3_bucket", None):
+        backend = S3SegmentBackend(
+            Path(config.raw_archive_path) / "segments",
+            bucket=config.raw_archive_s3_bucket,
+            prefix=config.raw_archive_s3_prefix,
+            endpoint_url=config.raw_archive_s3_endpoint,
+        )
+
+    return RawDocumentArchive(
+        config.raw_archive_path,
+        backend=backend,
+        max_segment_bytes=config.raw_archive_segment_mb * 1024 * 1024,
+    )
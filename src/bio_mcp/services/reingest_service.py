@@ -10,10 +10,12 @@ from typing import Any
 from bio_mcp.config.config import Config
 from bio_mcp.models.document import Document
 from bio_mcp.services.db_service import DatabaseService
-from bio_mcp.services.document_chunk_service import DocumentChunkService
+from bio_mcp.services.document_chunk_service import (
+    DocumentChunkService,
+    DocumentManifest,
+)
 from bio_mcp.services.normalization.pubmed import PubMedNormalizer
-
-# from bio_mcp.services.s3_service import S3Service  # TODO: Implement S3Service
+from bio_mcp.services.raw_archive import create_raw_archive
 from bio_mcp.shared.models.database_models import JobStatus
 
 logger = logging.getLogger(__name__)
@@ -33,9 +35,13 @@ class ReingestionStats:
         self.start_time = datetime.now()
         self.documents_processed = 0
         self.documents_failed = 0
+        self.documents_skipped = 0
         self.chunks_created = 0
         self.chunks_updated = 0
+        self.chunks_deleted = 0
         self.bytes_processed = 0
+        self.embedding_cache_hits = 0
+        self.embedding_cache_misses = 0
         self.errors: list[dict[str, Any]] = []
 
     def add_success(self, doc_uid: str, chunks_count: int, doc_size: int):
@@ -43,6 +49,12 @@ class ReingestionStats:
         self.chunks_created += chunks_count
         self.bytes_processed += doc_size
 
+    def add_skipped(self, doc_uid: str):
+        self.documents_skipped += 1
+
+    def add_deleted_chunks(self, doc_uid: str, chunks_count: int):
+        self.chunks_deleted += chunks_count
+
     def add_failure(
         self, doc_uid: str, error: str, context: dict[str, Any] | None = None
     ):
@@ -56,21 +68,33 @@ class ReingestionStats:
             }
         )
 
+    def set_embedding_cache_counts(self, hits: int, misses: int):
+        self.embedding_cache_hits = hits
+        self.embedding_cache_misses = misses
+
     def get_summary(self) -> dict[str, Any]:
         elapsed = datetime.now() - self.start_time
         total_docs = self.documents_processed + self.documents_failed
+        cache_lookups = self.embedding_cache_hits + self.embedding_cache_misses
 
         return {
             "elapsed_seconds": elapsed.total_seconds(),
             "total_documents": total_docs,
             "documents_processed": self.documents_processed,
             "documents_failed": self.documents_failed,
+            "documents_skipped": self.documents_skipped,
             "success_rate": self.documents_processed / total_docs
             if total_docs > 0
             else 0,
             "chunks_created": self.chunks_created,
             "chunks_updated": self.chunks_updated,
+            "chunks_deleted": self.chunks_deleted,
             "bytes_processed": self.bytes_processed,
+            "embedding_cache_hits": self.embedding_cache_hits,
+            "embedding_cache_misses": self.embedding_cache_misses,
+            "embedding_cache_hit_rate": self.embedding_cache_hits / cache_lookups
+            if cache_lookups > 0
+            else 0,
             "docs_per_minute": (total_docs / elapsed.total_seconds() * 60)
             if elapsed.total_seconds() > 0
             else 0,
@@ -84,8 +108,7 @@ class ReingestionService:
     def __init__(self, config: Config):
         self.config = config
         self.document_chunk_service = DocumentChunkService()
-        # self.s3_service = S3Service(config)  # TODO: Implement S3Service
-        self.s3_service = None
+        self.raw_archive = create_raw_archive(config)
         self.db_service = DatabaseService(config)
 
         # Batch processing configuration
@@ -103,8 +126,13 @@ class ReingestionService:
         date_filter: tuple[datetime, datetime] | None = None,
         pmid_list: list[str] | None = None,
         dry_run: bool = False,
+        force: bool = False,
     ) -> str:
-        """Start a re-ingestion job and return job ID."""
+        """Start a re-ingestion job and return job ID.
+
+        Documents whose stored chunks already match their content hash and the
+        current chunker version are skipped unless ``force`` is set.
+        """
 
         job_params = {
             "mode": mode.value,
@@ -114,6 +142,7 @@ class ReingestionService:
             ],
             "pmid_list": pmid_list,
             "dry_run": dry_run,
+            "force": force,
             "batch_size": self.batch_size,
             "max_concurrent": self.max_concurrent,
         }
@@ -130,6 +159,8 @@ class ReingestionService:
         """Execute a re-ingestion job with comprehensive error handling."""
 
         stats = ReingestionStats()
+        # Cache counters are service-wide; the job reports its own delta
+        cache_baseline = self.document_chunk_service.embedding_cache_counts()
 
         try:
             # Update job status
@@ -149,7 +180,11 @@ class ReingestionService:
                 logger.warning(
                     "No OpenAI API key configured - embeddings will use fallback"
                 )
-            # await self.s3_service.connect()  # TODO: Implement S3Service
+            if self.raw_archive is None:
+                logger.warning(
+                    "No raw document archive configured (BIO_MCP_RAW_ARCHIVE_PATH) "
+                    "- documents cannot be loaded"
+                )
 
             # Get document list based on mode and filters
             document_refs = await self._get_document_list(
@@ -162,18 +197,35 @@ class ReingestionService:
             logger.info(f"Found {len(document_refs)} documents to process")
 
             # Process documents in batches
-            semaphore = asyncio.Semaphore(self.max_concurrent)
+            dry_run = params.get("dry_run", False)
+            # Repair runs rewrite their documents even if they look current
+            skip_unchanged = not params.get("force", False) and (
+                mode != ReingestionMode.REPAIR
+            )
 
             async def process_batch(batch_refs: list[dict[str, Any]]):
                 """Process a batch of documents."""
-                tasks = []
+                # Compare against what the collection holds (not needed when
+                # nothing is written)
+                manifests = {} if dry_run else await self._get_manifests(batch_refs)
+
+                pending = []
                 for doc_ref in batch_refs:
-                    task = self._process_document_with_semaphore(
-                        semaphore, doc_ref, stats, params.get("dry_run", False)
-                    )
-                    tasks.append(task)
+                    stored = manifests.get(doc_ref.get("uid"))
+                    if (
+                        skip_unchanged
+                        and stored
+                        and stored.is_current(
+                            doc_ref.get("content_hash"),
+                            self.document_chunk_service.config.chunker_version,
+                        )
+                    ):
+                        stats.add_skipped(doc_ref.get("uid", "unknown"))
+                        continue
+                    pending.append(doc_ref)
 
-                await asyncio.gather(*tasks, return_exceptions=True)
+                if pending:
+                    await self._process_documents(pending, stats, dry_run, manifests)
 
             # Process in batches to manage memory
             for i in range(0, len(document_refs), self.batch_size):
@@ -182,6 +234,7 @@ class ReingestionService:
 
                 # Update job progress
                 progress = min(100, int((i + len(batch)) / len(document_refs) * 100))
+                self._record_embedding_cache_counts(stats, cache_baseline)
                 await self._update_job_progress(job_id, progress, stats)
 
                 logger.info(
@@ -189,6 +242,7 @@ class ReingestionService:
                 )
 
             # Final statistics
+            self._record_embedding_cache_counts(stats, cache_baseline)
             final_stats = stats.get_summary()
 
             # Determine final status
@@ -217,7 +271,123 @@ class ReingestionService:
 
         finally:
             await self.document_chunk_service.disconnect()
-            # await self.s3_service.disconnect()  # TODO: Implement S3Service
+
+    async def _process_documents(
+        self,
+        doc_refs: list[dict[str, Any]],
+        stats: ReingestionStats,
+        dry_run: bool,
+        manifests: dict[str, DocumentManifest],
+    ):
+        """Process a batch of documents with one batched chunk-and-store pass.
+
+        The batch is chunked together (across ``chunker_workers`` processes)
+        and written through a Weaviate batch import. Documents that cannot be
+        loaded or stored that way go through ``_process_single_document`` and
+        its retries.
+        """
+        retry: list[dict[str, Any]] = []
+        documents: list[Document] = []
+        refs: dict[str, dict[str, Any]] = {}
+        sizes: dict[str, int] = {}
+
+        if self.raw_archive is None:
+            retry = doc_refs
+        else:
+            uids = [doc_ref["uid"] for doc_ref in doc_refs if doc_ref.get("uid")]
+            raw_payloads = await asyncio.to_thread(self.raw_archive.get_many, uids)
+            for doc_ref in doc_refs:
+                raw_data = raw_payloads.get(doc_ref.get("uid"))
+                if raw_data is None:
+                    retry.append(doc_ref)
+                    continue
+                try:
+                    document = PubMedNormalizer.from_raw_dict(
+                        raw_data,
+                        s3_raw_uri=doc_ref.get("s3_key", "unknown"),
+                        content_hash=doc_ref.get("content_hash", "unknown"),
+                    )
+                except Exception as e:
+                    logger.warning(f"Could not normalize {doc_ref['uid']}: {e}")
+                    retry.append(doc_ref)
+                    continue
+                documents.append(document)
+                refs[document.uid] = doc_ref
+                sizes[document.uid] = len(json.dumps(raw_data))
+
+        if documents:
+            try:
+                failed = await self._store_documents(
+                    documents, stats, dry_run, manifests, sizes
+                )
+            except Exception as e:
+                logger.warning(f"Batch re-ingestion failed, retrying per document: {e}")
+                failed = [document.uid for document in documents]
+            retry.extend(refs[uid] for uid in failed)
+
+        semaphore = asyncio.Semaphore(self.max_concurrent)
+        await asyncio.gather(
+            *(
+                self._process_document_with_semaphore(
+                    semaphore,
+                    doc_ref,
+                    stats,
+                    dry_run,
+                    manifests.get(doc_ref.get("uid")),
+                )
+                for doc_ref in retry
+            ),
+            return_exceptions=True,
+        )
+
+    async def _store_documents(
+        self,
+        documents: list[Document],
+        stats: ReingestionStats,
+        dry_run: bool,
+        manifests: dict[str, DocumentManifest],
+        sizes: dict[str, int],
+    ) -> list[str]:
+        """Chunk and store loaded documents; returns the uids that failed."""
+        chunk_service = self.document_chunk_service
+
+        if dry_run:
+            # Validate only, don't store
+            chunked = await asyncio.to_thread(
+                chunk_service.chunking_service.chunk_documents,
+                documents,
+                n_workers=chunk_service.config.chunker_workers,
+            )
+            for document, chunks in zip(documents, chunked):
+                stats.add_success(document.uid, len(chunks), sizes[document.uid])
+            return []
+
+        results = await chunk_service.store_documents_chunks(
+            documents,
+            # Default quality score for testing
+            quality_scores=dict.fromkeys(sizes, 0.5),
+        )
+
+        failed = []
+        for document, result in zip(documents, results):
+            if not result.success:
+                failed.append(document.uid)
+                continue
+
+            # Remove chunks the new chunking no longer produces
+            stored = manifests.get(document.uid)
+            if stored:
+                vanished = stored.chunk_uuids - set(result.chunk_uuids)
+                if vanished:
+                    deleted = await chunk_service.delete_chunks(
+                        vanished, parent_uid=document.uid
+                    )
+                    stats.add_deleted_chunks(document.uid, deleted)
+
+            stats.add_success(
+                document.uid, len(result.chunk_uuids), sizes[document.uid]
+            )
+        return failed
 
     async def _process_document_with_semaphore(
         self,
@@ -225,32 +395,48 @@ class ReingestionService:
         doc_ref: dict[str, Any],
         stats: ReingestionStats,
         dry_run: bool,
+        stored: DocumentManifest | None = None,
     ):
         """Process a single document with concurrency control."""
         async with semaphore:
-            await self._process_single_document(doc_ref, stats, dry_run)
+            await self._process_single_document(doc_ref, stats, dry_run, stored)
+
+    async def _get_manifests(
+        self, doc_refs: list[dict[str, Any]]
+    ) -> dict[str, DocumentManifest]:
+        """Fetch stored manifests for a batch; on failure nothing is skipped."""
+        try:
+            return await self.document_chunk_service.get_document_manifests(
+                [doc_ref["uid"] for doc_ref in doc_refs if doc_ref.get("uid")]
+            )
+        except Exception as e:
+            logger.warning(f"Could not read stored chunk manifests: {e}")
+            return {}
 
     async def _process_single_document(
-        self, doc_ref: dict[str, Any], stats: ReingestionStats, dry_run: bool
+        self,
+        doc_ref: dict[str, Any],
+        stats: ReingestionStats,
+        dry_run: bool,
+        stored: DocumentManifest | None = None,
     ):
-        """Process a single document with retry logic."""
+        """Process a single document with retry logic.
+
+        ``stored`` is what the collection held for the document before this
+        run; chunks it lists that are no longer produced are deleted.
+        """
         doc_uid = doc_ref.get("uid", "unknown")
 
+        if self.raw_archive is None:
+            stats.add_failure(doc_uid, "Raw document archive not configured")
+            return
+
         for attempt in range(self.retry_attempts):
             try:
-                # Load document from S3 (TODO: implement S3Service)
-                # raw_data = await self.s3_service.load_document(doc_ref["s3_key"])
-                # For now, create mock data for testing
-                raw_data = {
-                    "pmid": doc_ref.get("source_id", "unknown"),
-                    "title": "Mock title for testing",
-                    "abstract": "Mock abstract for testing re-ingestion",
-                    "authors": [],
-                    "publication_date": None,
-                    "journal": None,
-                    "doi": None,
-                    "keywords": [],
-                }
+                # Load the raw payload archived at ingestion time
+                raw_data = await asyncio.to_thread(self.raw_archive.get, doc_uid)
+                if raw_data is None:
+                    raise LookupError(f"No archived raw payload for {doc_uid}")
 
                 # Normalize to Document model
                 document = PubMedNormalizer.from_raw_dict(
@@ -271,6 +457,16 @@ class ReingestionService:
                             quality_score=0.5,  # Default quality score for testing
                         )
                     )
+
+                    # Remove chunks the new chunking no longer produces
+                    if stored:
+                        vanished = stored.chunk_uuids - set(chunk_uuids)
+                        if vanished:
+                            deleted = await self.document_chunk_service.delete_chunks(
+                                vanished, parent_uid=doc_uid
+                            )
+                            stats.add_deleted_chunks(doc_uid, deleted)
+
                     stats.add_success(
                         doc_uid, len(chunk_uuids), len(json.dumps(raw_data))
                     )
@@ -334,6 +530,13 @@ class ReingestionService:
         else:
             raise ValueError(f"Unknown reingest mode: {mode}")
 
+    def _record_embedding_cache_counts(
+        self, stats: ReingestionStats, baseline: tuple[int, int]
+    ):
+        """Record this job's embedding cache hits and misses on its stats."""
+        hits, misses = self.document_chunk_service.embedding_cache_counts()
+        stats.set_embedding_cache_counts(hits - baseline[0], misses - baseline[1])
+
     async def _update_job_progress(
         self, job_id: str, progress: int, stats: ReingestionStats
     ):
@@ -4,16 +4,38 @@ Focused service classes that follow Single Responsibility Principle.
 """
 # type: ignore  # Legacy code with complex typing issues
 
+import asyncio
+from collections.abc import AsyncIterator, Sequence
 from typing import Any
 
+from bio_mcp.config.config import config
 from bio_mcp.config.logging_config import get_logger
 from bio_mcp.models.document import Document
-from bio_mcp.services.document_chunk_service import DocumentChunkService
-from bio_mcp.shared.clients.database import DatabaseConfig, DatabaseManager
+from bio_mcp.services.document_chunk_service import (
+    DocumentChunkService,
+    DocumentStoreResult,
+)
+from bio_mcp.services.raw_archive import (
+    ArchivedRecord,
+    RawDocumentArchive,
+    create_raw_archive,
+)
+from bio_mcp.shared.clients.database import (
+    DatabaseConfig,
+    DatabaseManager,
+    validate_document_row,
+)
+from bio_mcp.shared.core.error_handling import ValidationError
+from bio_mcp.shared.core.rate_governor import background_priority
 from bio_mcp.shared.utils.checkpoints import CheckpointManager
 from bio_mcp.sources.clinicaltrials.config import ClinicalTrialsConfig
 from bio_mcp.sources.clinicaltrials.service import ClinicalTrialsService
-from bio_mcp.sources.pubmed.client import PubMedClient
+from bio_mcp.sources.clinicaltrials.store import ClinicalTrialsStudyStore
+from bio_mcp.sources.pubmed.client import (
+    PubMedClient,
+    PubMedDocument,
+    PubMedSearchResult,
+)
 from bio_mcp.sources.pubmed.config import PubMedConfig
 
 logger = get_logger(__name__)
@@ -78,6 +100,21 @@ class PubMedService:
 
         return await self.client.fetch_documents(pmids)
 
+    async def iter_documents(
+        self,
+        search_result: PubMedSearchResult,
+        batch_size: int = 200,
+        pmids: list[str] | None = None,
+    ) -> AsyncIterator[list[PubMedDocument]]:
+        """Stream documents for a search result in EFetch-sized batches."""
+        if not self._initialized:
+            await self.initialize()
+
+        async for documents in self.client.iter_documents(
+            search_result, batch_size=batch_size, pmids=pmids
+        ):
+            yield documents
+
 
 class DocumentService:
     """Service for database document operations only."""
@@ -120,6 +157,20 @@ class DocumentService:
 
         return await self.manager.document_exists(pmid)
 
+    async def existing_pmids(self, pmids: list[str]) -> set[str]:
+        """Return the PMIDs from ``pmids`` that are already in the database."""
+        if not self._initialized:
+            await self.initialize()
+
+        return await self.manager.existing_pmids(pmids)
+
+    async def bulk_upsert_documents(self, rows: list[dict[str, Any]]) -> int:
+        """Insert or update many documents in a single statement."""
+        if not self._initialized:
+            await self.initialize()
+
+        return await self.manager.bulk_upsert_documents(rows)
+
     async def create_document(self, document_data: dict[str, Any]) -> None:
         """Create document in database."""
         if not self._initialized:
@@ -137,6 +188,7 @@ class VectorService:
         """Initialize VectorService with chunk-based approach."""
         self.use_v2 = use_v2
         self.document_chunk_service: DocumentChunkService | None = None
+        self.raw_archive: RawDocumentArchive | None = None
         self._initialized = False
 
     async def initialize(self) -> None:
@@ -149,6 +201,8 @@ class VectorService:
         if self.use_v2:
             self.document_chunk_service = DocumentChunkService()
             await self.document_chunk_service.connect()
+            # Raw payloads are archived so re-ingestion can rebuild documents
+            self.raw_archive = create_raw_archive(config)
         else:
             raise ValueError(
                 "Legacy embedding service (use_v2=False) is no longer supported"
@@ -162,6 +216,9 @@ class VectorService:
         if self.document_chunk_service:
             await self.document_chunk_service.disconnect()
             self.document_chunk_service = None
+        if self.raw_archive:
+            self.raw_archive.close()
+            self.raw_archive = None
         self._initialized = False
         logger.info("Vector service closed")
 
@@ -198,6 +255,7 @@ class VectorService:
         year_filter: tuple[int, int] | None = None,
         section_filter: list[str] | None = None,
         quality_threshold: float | None = None,
+        return_properties: Sequence[str] | None = None,
     ) -> list[dict[str, Any]]:
         """
         Search chunks using different search modes.
@@ -212,6 +270,7 @@ class VectorService:
             year_filter: Filter by year range (convenience parameter)
             section_filter: Filter by sections (convenience parameter)
             quality_threshold: Filter by quality threshold (convenience parameter)
+            return_properties: Properties to return (compact default set)
 
         Returns:
             List of matching chunk results with metadata
@@ -231,6 +290,7 @@ class VectorService:
             year_filter=year_filter,
             section_filter=section_filter,
             quality_threshold=quality_threshold,
+            return_properties=return_properties,
         )
 
     async def store_document(
@@ -259,9 +319,6 @@ class VectorService:
         if not self.document_chunk_service:
             raise ValueError("Document chunk service not initialized")
 
-        # Convert legacy parameters to Document model using the normalizer
-        from bio_mcp.services.normalization.pubmed import PubMedNormalizer
-
         raw_data = {
             "pmid": pmid,
             "title": title,
@@ -272,12 +329,8 @@ class VectorService:
             "doi": doi,
             "keywords": keywords or [],
         }
-
-        document = PubMedNormalizer.from_raw_dict(
-            raw_data,
-            s3_raw_uri=f"s3://bio-mcp-temp/pubmed/{pmid}.json",  # Placeholder S3 URI
-            content_hash=f"temp_{pmid}",  # Placeholder hash
-        )
+        archived = self._archive_raw([raw_data])
+        document = self._to_chunk_document(raw_data, archived.get(f"pubmed:{pmid}"))
 
         chunk_uuids = await self.document_chunk_service.store_document_chunks(document)
         logger.info(
@@ -285,6 +338,67 @@ class VectorService:
         )
         return chunk_uuids
 
+    async def store_documents(
+        self, raw_documents: list[dict[str, Any]]
+    ) -> list[DocumentStoreResult]:
+        """
+        Store many PubMed records as chunks using a single batched import.
+
+        Each raw document takes the same fields as ``store_document``.
+
+        Returns:
+            One DocumentStoreResult per input document
+        """
+        if not self._initialized:
+            await self.initialize()
+
+        if not self.document_chunk_service:
+            raise ValueError("Document chunk service not initialized")
+
+        # Hashing, compression and segment/index I/O run off the event loop
+        archived = await asyncio.to_thread(self._archive_raw, raw_documents)
+        documents = (
+            self._to_chunk_document(raw, archived.get(f"pubmed:{raw['pmid']}"))
+            for raw in raw_documents
+        )
+        results = await self.document_chunk_service.store_documents_chunks(documents)
+        logger.info(
+            "Stored documents as chunks",
+            documents=len(results),
+            chunk_count=sum(len(r.chunk_uuids) for r in results),
+        )
+        return results
+
+    def _archive_raw(
+        self, raw_documents: list[dict[str, Any]]
+    ) -> dict[str, ArchivedRecord]:
+        """Archive raw PubMed payloads, keyed by document uid."""
+        if self.raw_archive is None:
+            return {}
+
+        records = self.raw_archive.put_many(
+            (f"pubmed:{raw['pmid']}", raw) for raw in raw_documents
+        )
+        return {record.uid: record for record in records}
+
+    @staticmethod
+    def _to_chunk_document(
+        raw_data: dict[str, Any], archived: ArchivedRecord | None = None
+    ) -> Document:
+        """Convert legacy PubMed fields to the Document model using the normalizer."""
+        from bio_mcp.services.normalization.pubmed import PubMedNormalizer
+
+        pmid = raw_data["pmid"]
+        if archived is None:
+            s3_raw_uri = f"s3://bio-mcp-temp/pubmed/{pmid}.json"  # Placeholder URI
+            content_hash = f"temp_{pmid}"  # Placeholder hash
+        else:
+            s3_raw_uri, content_hash = archived.uri, archived.content_hash
+
+        return PubMedNormalizer.from_raw_dict(
+            raw_data, s3_raw_uri=s3_raw_uri, content_hash=content_hash
+        )
+
     async def search_documents(
         self,
         query: str,
@@ -344,6 +458,7 @@ class SyncOrchestrator:
         self._initialized = False
         logger.info("Sync orchestrator closed")
 
+    @background_priority
     async def sync_documents(self, query: str, limit: int = 10):
         """
         Orchestrate complete document sync process:
@@ -485,6 +600,7 @@ class SyncOrchestrator:
         )
         return result
 
+    @background_priority
     async def sync_documents_incremental(self, query: str, limit: int = 100):
         """
         Orchestrate incremental document sync using EDAT watermarks:
@@ -570,16 +686,10 @@ class SyncOrchestrator:
                 "query_key": query_key,
             }
 
-        # Step 3: Check which documents already exist
-        existing_pmids = []
-        new_pmids = []
-
-        for pmid in pmids:
-            exists = await self.document_service.document_exists(pmid)
-            if exists:
-                existing_pmids.append(pmid)
-            else:
-                new_pmids.append(pmid)
+        # Step 3: Check which documents already exist (single set-based query)
+        existing = await self.document_service.existing_pmids(pmids)
+        existing_pmids = [pmid for pmid in pmids if pmid in existing]
+        new_pmids = [pmid for pmid in pmids if pmid not in existing]
 
         logger.info(
             "Document existence check completed",
@@ -588,47 +698,19 @@ class SyncOrchestrator:
             new=len(new_pmids),
         )
 
-        # Step 4: Fetch and store new documents
+        # Step 4: Stream new documents in pages, storing each page in bulk
         synced_pmids = []
         failed_pmids = []
 
         if new_pmids:
-            try:
-                documents = await self.pubmed_service.fetch_documents(new_pmids)
-
-                for doc in documents:
-                    try:
-                        # Store in database
-                        db_data = doc.to_database_format()
-                        await self.document_service.create_document(db_data)
-
-                        # Store in vector store if available
-                        if self.vector_service:
-                            await self.vector_service.store_document(
-                                pmid=doc.pmid,
-                                title=doc.title,
-                                abstract=doc.abstract or "",
-                                authors=doc.authors or [],
-                                journal=doc.journal,
-                                publication_date=doc.publication_date.isoformat()
-                                if doc.publication_date
-                                else None,
-                                doi=doc.doi,
-                                keywords=doc.keywords or [],
-                            )
-
-                        synced_pmids.append(doc.pmid)
-                        logger.debug("Document successfully synced", pmid=doc.pmid)
-
-                    except Exception as e:
-                        logger.error(
-                            "Failed to store document", pmid=doc.pmid, error=str(e)
-                        )
-                        failed_pmids.append(doc.pmid)
-
-            except Exception as e:
-                logger.error("Failed to fetch documents from PubMed", error=str(e))
-                failed_pmids.extend(new_pmids)
+            # Page the whole search window through the history server when nothing
+            # was filtered out; otherwise fetch the new subset by ID
+            batches = self.pubmed_service.iter_documents(
+                search_result, pmids=new_pmids if existing else None
+            )
+            synced_pmids, failed_pmids = await self._sync_document_batches(
+                batches, new_pmids
+            )
 
         # Step 5: Update sync watermark with current date
         from datetime import datetime
@@ -684,6 +766,138 @@ class SyncOrchestrator:
         )
         return result
 
+    async def _sync_document_batches(
+        self,
+        batches: AsyncIterator[list[PubMedDocument]],
+        expected_pmids: list[str],
+    ) -> tuple[list[str], list[str]]:
+        """Store fetched batches while the next batch is being fetched.
+
+        Batch N is stored in a background task while batch N+1 is requested, so
+        sync time approaches max(fetch, store) per batch rather than their sum.
+
+        Returns (synced_pmids, failed_pmids).
+        """
+        synced_pmids: list[str] = []
+        failed_pmids: list[str] = []
+        store_task: asyncio.Task | None = None
+        fetch_failed = False
+
+        async def collect(task: asyncio.Task) -> None:
+            synced, failed = await task
+            synced_pmids.extend(synced)
+            failed_pmids.extend(failed)
+
+        try:
+            async for documents in batches:
+                if store_task:
+                    await collect(store_task)
+                    store_task = None
+                if documents:
+                    store_task = asyncio.create_task(
+                        self._store_documents_bulk(documents)
+                    )
+        except Exception as e:
+            logger.error("Failed to fetch documents from PubMed", error=str(e))
+            fetch_failed = True
+
+        if store_task:
+            await collect(store_task)
+
+        if fetch_failed:
+            processed = set(synced_pmids) | set(failed_pmids)
+            failed_pmids.extend(p for p in expected_pmids if p not in processed)
+
+        return synced_pmids, failed_pmids
+
+    async def _store_documents_bulk(
+        self, documents: list[PubMedDocument]
+    ) -> tuple[list[str], list[str]]:
+        """Upsert fetched documents into the database and vector store in bulk.
+
+        Documents missing required fields fail on their own; the rest are
+        still written.
+
+        Returns (synced_pmids, failed_pmids).
+        """
+        valid = []
+        invalid_pmids = []
+        for doc in documents:
+            try:
+                validate_document_row(doc.to_database_format())
+            except ValidationError as e:
+                logger.error("Skipping invalid document", pmid=doc.pmid, error=str(e))
+                invalid_pmids.append(doc.pmid)
+            else:
+                valid.append(doc)
+
+        synced_pmids, failed_pmids = (
+            await self._write_documents_bulk(valid) if valid else ([], [])
+        )
+        return synced_pmids, invalid_pmids + failed_pmids
+
+    async def _write_documents_bulk(
+        self, documents: list[PubMedDocument]
+    ) -> tuple[list[str], list[str]]:
+        """Write validated documents to the database and vector store.
+
+        Returns (synced_pmids, failed_pmids).
+        """
+        try:
+            await self.document_service.bulk_upsert_documents(
+                [doc.to_database_format() for doc in documents]
+            )
+        except Exception as e:
+            logger.error(
+                "Failed to bulk store documents", count=len(documents), error=str(e)
+            )
+            return [], [doc.pmid for doc in documents]
+
+        if not self.vector_service:
+            return [doc.pmid for doc in documents], []
+
+        try:
+            results = await self.vector_service.store_documents(
+                [
+                    {
+                        "pmid": doc.pmid,
+                        "title": doc.title,
+                        "abstract": doc.abstract or "",
+                        "authors": doc.authors or [],
+                        "journal": doc.journal,
+                        "publication_date": doc.publication_date.isoformat()
+                        if doc.publication_date
+                        else None,
+                        "doi": doc.doi,
+                        "keywords": doc.keywords or [],
+                        "mesh_terms": doc.mesh_terms or [],
+                    }
+                    for doc in documents
+                ]
+            )
+        except Exception as e:
+            logger.error(
+                "Failed to bulk store document vectors",
+                count=len(documents),
+                error=str(e),
+            )
+            return [], [doc.pmid for doc in documents]
+
+        synced_pmids = []
+        failed_pmids = []
+        for doc, result in zip(documents, results, strict=True):
+            if result.success:
+                synced_pmids.append(doc.pmid)
+            else:
+                logger.error(
+                    "Failed to store document vectors",
+                    pmid=doc.pmid,
+                    error=result.error or result.failed_chunks,
+                )
+                failed_pmids.append(doc.pmid)
+
+        return synced_pmids, failed_pmids
+
 
 class CorpusCheckpointService:
     """Service for corpus checkpoint management and research reproducibility."""
@@ -804,13 +1018,15 @@ class ServiceManager:
     async def get_clinicaltrials_service(self) -> ClinicalTrialsService:
         """Get or create ClinicalTrials.gov service."""
         if not self._clinicaltrials_service:
-            # Try to initialize checkpoint manager if possible
+            # Try to initialize checkpoint manager and study store if possible
             checkpoint_manager = None
+            study_store = None
             try:
+                db_manager = await self._get_database_manager()
                 if not self._checkpoint_manager:
-                    db_manager = await self._get_database_manager()
                     self._checkpoint_manager = CheckpointManager(db_manager)
                 checkpoint_manager = self._checkpoint_manager
+                study_store = ClinicalTrialsStudyStore(lambda: db_manager.get_session())
             except Exception as e:
                 logger.warning(f"Failed to initialize checkpoint manager: {e}")
                 logger.info(
@@ -819,7 +1035,9 @@ class ServiceManager:
 
             config = ClinicalTrialsConfig.from_env()
             self._clinicaltrials_service = ClinicalTrialsService(
-                config=config, checkpoint_manager=checkpoint_manager
+                config=config,
+                checkpoint_manager=checkpoint_manager,
+                study_store=study_store,
             )
             await self._clinicaltrials_service.initialize()
 
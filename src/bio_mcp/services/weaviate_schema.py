@@ -5,6 +5,11 @@ This module handles creation, migration, and management of the new
 biomedical document chunk collection with BioBERT embeddings.
 """
 
+import asyncio
+import json
+import os
+import time
+from collections.abc import Mapping
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any
@@ -17,6 +22,18 @@ from bio_mcp.config.logging_config import get_logger
 logger = get_logger(__name__)
 
 
+def default_vector(obj: Any) -> list[float] | None:
+    """Extract the default vector from a fetched Weaviate object.
+
+    With ``include_vector=True`` the v4 client returns vectors keyed by name
+    (``{"default": [...]}``); collections here have a single unnamed vector.
+    """
+    vector = obj.vector
+    if isinstance(vector, Mapping):
+        vector = vector.get("default") or next(iter(vector.values()), None)
+    return list(vector) if vector else None
+
+
 class VectorizerType(Enum):
     """Supported vectorizer types."""
 
@@ -150,6 +167,23 @@ class WeaviateSchemaManager:
                 index_filterable=True,
                 index_searchable=False,
             ),
+            Property(
+                name="chunk_id",
+                data_type=DataType.TEXT,
+                description="Chunk id within the parent document (s0, w1, ...)",
+                index_filterable=True,
+                index_searchable=False,
+                # Positional label, not content: keep it out of the vector
+                # (and out of embedding_cache.VECTORIZED_PROPERTIES)
+                skip_vectorization=True,
+            ),
+            Property(
+                name="chunk_idx",
+                data_type=DataType.INT,
+                description="0-based chunk position within the parent document",
+                index_filterable=True,
+                index_searchable=False,
+            ),
             # Temporal metadata (filterable)
             Property(
                 name="published_at",
@@ -195,6 +229,7 @@ class WeaviateSchemaManager:
                 description="Structured metadata including chunker info and source-specific data",
                 nested_properties=[
                     Property(name="chunker_version", data_type=DataType.TEXT),
+                    Property(name="content_hash", data_type=DataType.TEXT),
                     Property(
                         name="src",
                         data_type=DataType.OBJECT,
@@ -350,20 +385,66 @@ class WeaviateSchemaManager:
 class CollectionMigration:
     """Handles collection migrations and upgrades."""
 
+    # Per-object errors kept in the returned stats
+    MAX_REPORTED_ERRORS = 100
+    # Pages between progress log lines
+    PROGRESS_EVERY_PAGES = 10
+
     def __init__(self, client: weaviate.WeaviateClient):
         self.client = client
         self.schema_manager = WeaviateSchemaManager(client)
 
     async def migrate_from_old_collection(
-        self, old_collection: str, new_collection: str, batch_size: int = 100
+        self,
+        old_collection: str,
+        new_collection: str,
+        batch_size: int = 100,
+        checkpoint_path: str | None = None,
+        resume_after: str | None = None,
+        concurrent_requests: int = 2,
+    ) -> dict[str, Any]:
+        """Migrate data from old collection to new collection.
+
+        Objects are paged with the ``after`` cursor, so every page costs the
+        same and the query maximum does not apply, and are read with their
+        vectors so embeddings are copied rather than regenerated. Each page is
+        written through a batch import before the cursor is saved to
+        ``checkpoint_path``; rerunning with the same path (or passing
+        ``resume_after``) continues after the last completed page.
+        """
+        # The sync client blocks; keep it off the event loop
+        return await asyncio.to_thread(
+            self._migrate,
+            old_collection,
+            new_collection,
+            batch_size,
+            checkpoint_path,
+            resume_after,
+            concurrent_requests,
+        )
+
+    def _migrate(
+        self,
+        old_collection: str,
+        new_collection: str,
+        batch_size: int,
+        checkpoint_path: str | None,
+        resume_after: str | None,
+        concurrent_requests: int,
     ) -> dict[str, Any]:
-        """Migrate data from old collection to new collection."""
         logger.info(f"Starting migration from {old_collection} to {new_collection}")
 
+        checkpoint = self._load_checkpoint(checkpoint_path)
+        cursor = resume_after or checkpoint.get("cursor")
+
         migration_stats = {
-            "documents_processed": 0,
-            "documents_migrated": 0,
-            "documents_failed": 0,
+            "documents_processed": checkpoint.get("documents_processed", 0),
+            "documents_migrated": checkpoint.get("documents_migrated", 0),
+            "documents_failed": checkpoint.get("documents_failed", 0),
+            "resumed_from": cursor,
+            "last_cursor": cursor,
+            "elapsed_seconds": 0.0,
+            "objects_per_second": 0.0,
             "errors": [],
         }
 
@@ -382,58 +463,94 @@ class CollectionMigration:
             total_result = old_col.aggregate.over_all(total_count=True)
             total_docs = total_result.total_count
 
-            logger.info(f"Migrating {total_docs} documents")
+            logger.info(f"Migrating {total_docs} documents", resume_after=cursor)
 
-            # Migrate in batches
-            offset = 0
-            while offset < total_docs:
-                try:
-                    # Fetch batch from old collection
-                    batch_result = old_col.query.fetch_objects(
-                        limit=batch_size, offset=offset
+            start = time.perf_counter()
+            copied = 0
+            pages = 0
+            while True:
+                page = old_col.query.fetch_objects(
+                    limit=batch_size, after=cursor, include_vector=True
+                )
+                if not page.objects:
+                    break
+
+                with new_col.batch.fixed_size(
+                    batch_size=batch_size, concurrent_requests=concurrent_requests
+                ) as batch:
+                    for obj in page.objects:
+                        batch.add_object(
+                            properties=self._transform_properties(obj.properties),
+                            uuid=obj.uuid,
+                            vector=default_vector(obj),
+                        )
+
+                failed = new_col.batch.failed_objects
+                for failure in failed:
+                    if len(migration_stats["errors"]) < self.MAX_REPORTED_ERRORS:
+                        migration_stats["errors"].append(
+                            f"Failed to migrate {failure.original_uuid}: "
+                            f"{failure.message}"
+                        )
+
+                migration_stats["documents_processed"] += len(page.objects)
+                migration_stats["documents_migrated"] += len(page.objects) - len(failed)
+                migration_stats["documents_failed"] += len(failed)
+
+                # Only advance the cursor once the page has been written
+                cursor = str(page.objects[-1].uuid)
+                migration_stats["last_cursor"] = cursor
+                self._save_checkpoint(checkpoint_path, migration_stats)
+
+                copied += len(page.objects)
+                pages += 1
+                elapsed = time.perf_counter() - start
+                migration_stats["elapsed_seconds"] = elapsed
+                migration_stats["objects_per_second"] = (
+                    copied / elapsed if elapsed else 0.0
+                )
+                if pages % self.PROGRESS_EVERY_PAGES == 0:
+                    logger.info(
+                        f"Migration progress: "
+                        f"{migration_stats['documents_processed']}/{total_docs}",
+                        objects_per_second=round(
+                            migration_stats["objects_per_second"], 1
+                        ),
                     )
 
-                    if not batch_result.objects:
-                        break
-
-                    # Transform and insert into new collection
-                    for obj in batch_result.objects:
-                        try:
-                            # Transform old format to new format
-                            new_properties = self._transform_properties(obj.properties)
-
-                            # Insert with original UUID to maintain references
-                            new_col.data.insert(
-                                uuid=obj.uuid, properties=new_properties
-                            )
-
-                            migration_stats["documents_migrated"] += 1
-
-                        except Exception as e:
-                            migration_stats["documents_failed"] += 1
-                            migration_stats["errors"].append(
-                                f"Failed to migrate {obj.uuid}: {e!s}"
-                            )
-
-                    migration_stats["documents_processed"] += len(batch_result.objects)
-                    offset += batch_size
-
-                    if offset % 1000 == 0:
-                        logger.info(f"Migration progress: {offset}/{total_docs}")
-
-                except Exception as e:
-                    logger.error(f"Batch migration failed at offset {offset}: {e}")
-                    migration_stats["errors"].append(f"Batch failed at {offset}: {e!s}")
-                    offset += batch_size  # Skip failed batch
-
             logger.info("Migration completed", **migration_stats)
             return migration_stats
 
         except Exception as e:
-            logger.error(f"Migration failed: {e}")
+            logger.error(f"Migration failed: {e}", last_cursor=cursor)
             migration_stats["errors"].append(f"Migration failed: {e!s}")
             return migration_stats
 
+    @staticmethod
+    def _load_checkpoint(checkpoint_path: str | None) -> dict[str, Any]:
+        """Read a saved migration checkpoint, if any."""
+        if not checkpoint_path or not os.path.exists(checkpoint_path):
+            return {}
+        with open(checkpoint_path) as f:
+            return json.load(f)
+
+    @staticmethod
+    def _save_checkpoint(checkpoint_path: str | None, stats: dict[str, Any]) -> None:
+        """Atomically save the cursor and counters after a completed page."""
+        if not checkpoint_path:
+            return
+
+        state = {
+            "cursor": stats["last_cursor"],
+            "documents_processed": stats["documents_processed"],
+            "documents_migrated": stats["documents_migrated"],
+            "documents_failed": stats["documents_failed"],
+        }
+        tmp_path = f"{checkpoint_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(state, f)
+        os.replace(tmp_path, checkpoint_path)
+
     def _transform_properties(self, old_properties: dict[str, Any]) -> dict[str, Any]:
         """Transform old collection properties to new schema."""
         # This is a placeholder - implement based on actual old schema
@@ -6,6 +6,7 @@ Phase 2A: Basic Database with SQLAlchemy models for PubMed documents.
 import json
 import os
 import time
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any
@@ -16,8 +17,10 @@ from sqlalchemy import (
     Date,
     String,
     Text,
+    select,
     text,
 )
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.dialects.postgresql import TIMESTAMP
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import (
@@ -33,6 +36,19 @@ from bio_mcp.shared.core.error_handling import ValidationError
 
 logger = get_logger(__name__)
 
+
+def validate_document_row(row: dict[str, Any]) -> None:
+    """Check a document row has the fields every write requires.
+
+    Raises:
+        ValidationError: If the PMID or title is missing
+    """
+    if not row.get("pmid"):
+        raise ValidationError("PMID is required")
+    if not row.get("title"):
+        raise ValidationError("Title is required")
+
+
 # SQLAlchemy declarative base
 Base = declarative_base()
 
@@ -525,6 +541,107 @@ class DatabaseManager:
             logger.error("Failed to check document existence", pmid=pmid, error=str(e))
             raise
 
+    async def existing_pmids(self, pmids: Iterable[str]) -> set[str]:
+        """Return the subset of PMIDs already stored, using a single query."""
+        ids = list(dict.fromkeys(pmids))
+        if not ids:
+            return set()
+
+        logger.debug("Checking document existence in bulk", count=len(ids))
+
+        try:
+            async with self.get_session() as session:
+                if session.bind.dialect.name == "postgresql":
+                    result = await session.execute(
+                        text(
+                            "SELECT pmid FROM pubmed_documents WHERE pmid = ANY(:ids)"
+                        ),
+                        {"ids": ids},
+                    )
+                else:
+                    result = await session.execute(
+                        select(PubMedDocument.pmid).where(PubMedDocument.pmid.in_(ids))
+                    )
+
+                existing = set(result.scalars().all())
+                logger.debug(
+                    "Bulk existence check completed",
+                    requested=len(ids),
+                    existing=len(existing),
+                )
+                return existing
+
+        except Exception as e:
+            logger.error(
+                "Failed to check document existence in bulk",
+                count=len(ids),
+                error=str(e),
+            )
+            raise
+
+    async def bulk_upsert_documents(self, rows: list[dict[str, Any]]) -> int:
+        """Insert or update many documents in one executemany round trip.
+
+        Conflicting PMIDs have their content columns and ``updated_at`` replaced;
+        ``created_at`` is preserved. Returns the number of rows written.
+        """
+        if not rows:
+            return 0
+
+        logger.debug("Bulk upserting documents", count=len(rows))
+
+        now = datetime.now(UTC)
+        params = []
+        for row in rows:
+            validate_document_row(row)
+            params.append(
+                {
+                    "pmid": row["pmid"],
+                    "title": row["title"],
+                    "abstract": row.get("abstract"),
+                    "authors": row.get("authors") or [],
+                    "publication_date": row.get("publication_date"),
+                    "journal": row.get("journal"),
+                    "doi": row.get("doi"),
+                    "keywords": row.get("keywords") or [],
+                    "created_at": now,
+                    "updated_at": now,
+                }
+            )
+
+        try:
+            async with self.get_session() as session:
+                dialect = session.bind.dialect.name
+                insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+                stmt = insert(PubMedDocument.__table__)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[PubMedDocument.pmid],
+                    set_={
+                        column: stmt.excluded[column]
+                        for column in (
+                            "title",
+                            "abstract",
+                            "authors",
+                            "publication_date",
+                            "journal",
+                            "doi",
+                            "keywords",
+                            "updated_at",
+                        )
+                    },
+                )
+                await session.execute(stmt, params)
+                await session.commit()
+
+                logger.info("Bulk document upsert completed", count=len(params))
+                return len(params)
+
+        except Exception as e:
+            logger.error(
+                "Failed to bulk upsert documents", count=len(rows), error=str(e)
+            )
+            raise
+
     # Sync Watermark Methods for Incremental Sync
 
     async def get_sync_watermark(self, query_key: str) -> SyncWatermark | None:
@@ -16,11 +16,18 @@ logger = get_logger(__name__)
 
 
 class WeaviateClient:
-    """Client for Weaviate vector database operations."""
+    """Client for Weaviate vector database operations.
+
+    Holds two connections: ``async_client`` (``WeaviateAsyncClient``) serves
+    queries and single-object writes without blocking the event loop, while
+    the synchronous ``client`` is kept for schema management and batch imports,
+    which the async client does not support.
+    """
 
     def __init__(self, url: str | None = None):
         self.url = url or config.weaviate_url
         self.client: weaviate.WeaviateClient | None = None
+        self.async_client: weaviate.WeaviateAsyncClient | None = None
         self.collection_name = "PubMedDocument"
         self._initialized = False
 
@@ -40,38 +47,28 @@ class WeaviateClient:
                 headers["X-OpenAI-Api-Key"] = config.openai_api_key
                 logger.debug("Added OpenAI API key to Weaviate headers")
 
-            # Use the provided URL instead of hardcoded localhost
-            if self.url.startswith("http://localhost:8080"):
+            connection_args = self._connection_args(headers)
+
+            # Synchronous client for schema management and batch imports
+            if connection_args is None:
                 if headers:
                     self.client = weaviate.connect_to_local(headers=headers)
                 else:
                     self.client = weaviate.connect_to_local()
             else:
-                # Parse URL components
-                host = self.url.split("://")[1].split(":")[0]
-                port = int(self.url.split(":")[-1])
-                secure = self.url.startswith("https")
-
-                # Use dynamic gRPC settings if available (for testcontainers)
-                grpc_host = getattr(self, "_grpc_host", host)
-                grpc_port = getattr(self, "_grpc_port", 50051)
-
-                connection_args = {
-                    "http_host": host,
-                    "http_port": port,
-                    "http_secure": secure,
-                    "grpc_host": grpc_host,
-                    "grpc_port": grpc_port,
-                    "grpc_secure": secure,
-                }
-
-                if headers:
-                    connection_args["headers"] = headers
-
                 self.client = weaviate.connect_to_custom(**connection_args)
 
+            # Async client for request-path queries so they never block the loop
+            if connection_args is None:
+                self.async_client = weaviate.use_async_with_local(
+                    headers=headers or None
+                )
+            else:
+                self.async_client = weaviate.use_async_with_custom(**connection_args)
+            await self.async_client.connect()
+
             logger.debug("Testing Weaviate connection")
-            meta = self.client.get_meta()
+            meta = await self.async_client.get_meta()
             logger.debug("Weaviate meta", meta=meta)
 
             await self._ensure_collection_exists()
@@ -83,23 +80,56 @@ class WeaviateClient:
             logger.error("Failed to initialize Weaviate client", error=str(e))
             raise
 
+    def _connection_args(self, headers: dict[str, str]) -> dict[str, Any] | None:
+        """Connection settings for ``self.url``; None means the local defaults."""
+        # Use the provided URL instead of hardcoded localhost
+        if self.url.startswith("http://localhost:8080"):
+            return None
+
+        # Parse URL components
+        host = self.url.split("://")[1].split(":")[0]
+        port = int(self.url.split(":")[-1])
+        secure = self.url.startswith("https")
+
+        # Use dynamic gRPC settings if available (for testcontainers)
+        grpc_host = getattr(self, "_grpc_host", host)
+        grpc_port = getattr(self, "_grpc_port", config.weaviate_grpc_port)
+
+        connection_args = {
+            "http_host": host,
+            "http_port": port,
+            "http_secure": secure,
+            "grpc_host": grpc_host,
+            "grpc_port": grpc_port,
+            "grpc_secure": secure,
+        }
+
+        if headers:
+            connection_args["headers"] = headers
+
+        return connection_args
+
     async def close(self) -> None:
-        """Close Weaviate client connection."""
+        """Close Weaviate client connections."""
+        if self.async_client:
+            await self.async_client.close()
+            self.async_client = None
         if self.client:
             self.client.close()
             self.client = None
+        if self._initialized:
             self._initialized = False
             logger.info("Weaviate client closed")
 
     async def _ensure_collection_exists(self) -> None:
         """Ensure the PubMedDocument collection exists with proper schema."""
-        if not self.client:
+        if not self.async_client:
             raise RuntimeError("Weaviate client not initialized")
 
         collection_name = self.collection_name
 
         # Check if collection exists
-        if self.client.collections.exists(collection_name):
+        if await self.async_client.collections.exists(collection_name):
             logger.debug(
                 "Weaviate collection already exists", collection=collection_name
             )
@@ -112,7 +142,7 @@ class WeaviateClient:
         vectorizer_config = None
         try:
             # Test if transformers module is available
-            meta = self.client.get_meta()
+            meta = await self.async_client.get_meta()
             modules = meta.get("modules", {})
             if "text2vec-transformers" in modules:
                 vectorizer_config = Configure.Vectorizer.text2vec_transformers()
@@ -140,7 +170,7 @@ class WeaviateClient:
         if vectorizer_config:
             create_args["vectorizer_config"] = vectorizer_config
 
-        self.client.collections.create(**create_args)
+        await self.async_client.collections.create(**create_args)
 
         logger.info(
             "Weaviate collection created successfully", collection=collection_name
@@ -161,7 +191,7 @@ class WeaviateClient:
         if not self._initialized:
             await self.initialize()
 
-        collection = self.client.collections.get(self.collection_name)
+        collection = self.async_client.collections.get(self.collection_name)
 
         # Create combined searchable content
         content_parts = [title or ""]
@@ -193,7 +223,7 @@ class WeaviateClient:
         }
 
         # Store document - Weaviate will automatically generate embeddings
-        uuid = collection.data.insert(properties=doc_data)
+        uuid = await collection.data.insert(properties=doc_data)
 
         logger.debug("Document stored in Weaviate", pmid=pmid, uuid=str(uuid))
         return str(uuid)
@@ -221,7 +251,7 @@ class WeaviateClient:
         if not self._initialized:
             await self.initialize()
 
-        collection = self.client.collections.get(self.collection_name)
+        collection = self.async_client.collections.get(self.collection_name)
 
         logger.debug(
             "Performing search",
@@ -238,20 +268,20 @@ class WeaviateClient:
         if search_mode == "bm25":
             # Pure BM25 keyword search
             if weaviate_filter:
-                response = collection.query.bm25(
+                response = await collection.query.bm25(
                     query=query,
                     limit=limit,
                     filters=weaviate_filter,
                     return_metadata=MetadataQuery(score=True),
                 )
             else:
-                response = collection.query.bm25(
+                response = await collection.query.bm25(
                     query=query, limit=limit, return_metadata=MetadataQuery(score=True)
                 )
         elif search_mode == "hybrid":
             # Hybrid search combining BM25 and vector similarity
             if weaviate_filter:
-                response = collection.query.hybrid(
+                response = await collection.query.hybrid(
                     query=query,
                     alpha=alpha,  # 0.0=pure BM25, 1.0=pure vector
                     limit=limit,
@@ -259,7 +289,7 @@ class WeaviateClient:
                     return_metadata=MetadataQuery(score=True, explain_score=True),
                 )
             else:
-                response = collection.query.hybrid(
+                response = await collection.query.hybrid(
                     query=query,
                     alpha=alpha,  # 0.0=pure BM25, 1.0=pure vector
                     limit=limit,
@@ -268,14 +298,14 @@ class WeaviateClient:
         else:  # semantic (default)
             # Pure semantic search with vectors
             if weaviate_filter:
-                response = collection.query.near_text(
+                response = await collection.query.near_text(
                     query=query,
                     limit=limit,
                     filters=weaviate_filter,
                     return_metadata=MetadataQuery(score=True, distance=True),
                 )
             else:
-                response = collection.query.near_text(
+                response = await collection.query.near_text(
                     query=query,
                     limit=limit,
                     return_metadata=MetadataQuery(score=True, distance=True),
@@ -380,12 +410,12 @@ class WeaviateClient:
         if not self._initialized:
             await self.initialize()
 
-        collection = self.client.collections.get(self.collection_name)
+        collection = self.async_client.collections.get(self.collection_name)
 
         # Use Weaviate v4 query syntax
         from weaviate.classes.query import Filter
 
-        response = collection.query.fetch_objects(
+        response = await collection.query.fetch_objects(
             filters=Filter.by_property("pmid").equal(pmid), limit=1
         )
 
@@ -403,11 +433,13 @@ class WeaviateClient:
     async def health_check(self) -> dict[str, Any]:
         """Perform health check on Weaviate connection."""
         try:
-            if not self.client:
+            if not self.async_client:
                 return {"status": "error", "message": "Client not initialized"}
 
-            is_ready = self.client.is_ready()
-            collection_exists = self.client.collections.exists(self.collection_name)
+            is_ready = await self.async_client.is_ready()
+            collection_exists = await self.async_client.collections.exists(
+                self.collection_name
+            )
 
             return {
                 "status": "healthy" if is_ready and collection_exists else "degraded",
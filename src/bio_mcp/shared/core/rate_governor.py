@@ -0,0 +1,375 @@
+"""
+Process-wide rate governor for upstream APIs.
+
+Every client and orchestrator node that calls an upstream API acquires from
+one named budget per upstream ("ncbi-eutils", "ctgov-v2", "openai"), so
+concurrent syncs, orchestrator queries and HTTP jobs share a single request
+rate instead of each running their own limiter.
+
+Budgets are token buckets that:
+
+- serve interactive callers before background sync (see ``upstream_priority``)
+- halve their rate on a 429 and pause for ``Retry-After``, then recover
+  additively on success (AIMD)
+- record acquisitions and queueing time per priority for the metrics endpoint
+"""
+
+import asyncio
+import contextvars
+import functools
+import heapq
+import itertools
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from enum import IntEnum
+from typing import Any
+
+from bio_mcp.config.config import config
+from bio_mcp.config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Upstream budget names
+NCBI_EUTILS = "ncbi-eutils"
+CTGOV_V2 = "ctgov-v2"
+OPENAI = "openai"
+
+
+class Priority(IntEnum):
+    """Queueing class for upstream requests (lower is served first)."""
+
+    INTERACTIVE = 0
+    BACKGROUND = 1
+
+
+_current_priority: contextvars.ContextVar[Priority] = contextvars.ContextVar(
+    "upstream_priority", default=Priority.INTERACTIVE
+)
+
+
+@contextmanager
+def upstream_priority(priority: Priority) -> Iterator[None]:
+    """Run upstream requests made in this context at the given priority."""
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+def background_priority[F: Callable[..., Any]](func: F) -> F:
+    """Decorator running an async function's upstream requests as background."""
+
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with upstream_priority(Priority.BACKGROUND):
+            return await func(*args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)."""
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+
+
+class UpstreamBudget:
+    """Shared token bucket for one upstream API, with priorities and AIMD."""
+
+    # Rate multiplier applied on each 429
+    DECREASE_FACTOR = 0.5
+
+    # Successes needed to climb from the floor back to the configured rate
+    RECOVERY_STEPS = 20
+
+    def __init__(
+        self,
+        name: str,
+        rate_per_second: float,
+        burst: float | None = None,
+        min_rate: float | None = None,
+    ):
+        """Initialize the budget.
+
+        Args:
+            name: Upstream name used in logs and metrics
+            rate_per_second: Configured (maximum) request rate
+            burst: Bucket capacity (default 1 = evenly spaced requests)
+            min_rate: Floor for 429 back-off (default a tenth of the rate)
+        """
+        if rate_per_second <= 0:
+            raise ValueError("rate_per_second must be positive")
+
+        self.name = name
+        self.max_rate = float(rate_per_second)
+        self.min_rate = min(min_rate or self.max_rate / 10, self.max_rate)
+        self.rate = self.max_rate
+        self.capacity = float(burst or 1.0)
+        self.tokens = self.capacity
+
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._waiters: list[tuple[int, int, float, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+        self._wakeup: asyncio.TimerHandle | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+        self.throttled = 0
+        self._acquired = dict.fromkeys(Priority, 0)
+        self._wait_total = dict.fromkeys(Priority, 0.0)
+        self._wait_max = dict.fromkeys(Priority, 0.0)
+
+    async def acquire(
+        self, tokens: float = 1, priority: Priority | None = None
+    ) -> None:
+        """Wait for tokens, behind any queued caller of the same or higher priority.
+
+        Args:
+            tokens: Number of tokens to take
+            priority: Queueing class (default: the context's upstream_priority)
+
+        Raises:
+            ValueError: If requesting more tokens than the bucket holds
+        """
+        if tokens > self.capacity:
+            raise ValueError("Cannot acquire more tokens than bucket capacity")
+        if priority is None:
+            priority = _current_priority.get()
+
+        loop = asyncio.get_running_loop()
+        self._bind(loop)
+        started = time.monotonic()
+
+        if tokens <= 0:
+            return
+        if not self._waiters and self._try_take(tokens):
+            self._record(priority, 0.0)
+            return
+
+        future: asyncio.Future[None] = loop.create_future()
+        entry = (int(priority), next(self._sequence), tokens, future)
+        heapq.heappush(self._waiters, entry)
+        self._dispatch()
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Granted just as we were cancelled; hand the tokens back
+                self.tokens = min(self.capacity, self.tokens + tokens)
+            elif entry in self._waiters:
+                self._waiters.remove(entry)
+                heapq.heapify(self._waiters)
+            self._dispatch()
+            raise
+
+        self._record(priority, time.monotonic() - started)
+
+    def on_success(self) -> None:
+        """Additive increase after a request the upstream accepted."""
+        if self.rate < self.max_rate:
+            self._refill()
+            step = (self.max_rate - self.min_rate) / self.RECOVERY_STEPS
+            self.rate = min(self.max_rate, self.rate + step)
+
+    def on_throttled(self, retry_after: float | None = None) -> None:
+        """Multiplicative decrease after a 429, pausing for Retry-After."""
+        self._refill()
+        self.rate = max(self.min_rate, self.rate * self.DECREASE_FACTOR)
+        self.tokens = 0.0
+        pause = retry_after if retry_after is not None else 1.0 / self.rate
+        self._blocked_until = max(self._blocked_until, time.monotonic() + pause)
+        self.throttled += 1
+
+        logger.warning(
+            "Upstream rate limited, backing off",
+            upstream=self.name,
+            rate_per_second=round(self.rate, 3),
+            pause_seconds=round(pause, 3),
+        )
+        if self._loop is not None and self._waiters:
+            self._dispatch()
+
+    def restrict(self, rate_per_second: float) -> None:
+        """Lower the configured rate (and back-off floor) to ``rate_per_second``."""
+        if rate_per_second <= 0:
+            raise ValueError("rate_per_second must be positive")
+        if rate_per_second >= self.max_rate:
+            return
+        self._refill()
+        self.max_rate = float(rate_per_second)
+        self.min_rate = min(self.min_rate, self.max_rate / 10)
+        self.rate = min(self.rate, self.max_rate)
+        if self._loop is not None and self._waiters:
+            self._dispatch()
+
+    def get_current_rate(self) -> float:
+        """Current (possibly backed-off) request rate."""
+        return self.rate
+
+    def get_available_tokens(self) -> int:
+        """Tokens currently available (without refilling)."""
+        return int(self.tokens)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Rate, queue and wait-time metrics for this budget."""
+        return {
+            "rate_per_second": round(self.rate, 3),
+            "max_rate_per_second": self.max_rate,
+            "queued": len(self._waiters),
+            "throttled": self.throttled,
+            "acquired": {p.name.lower(): self._acquired[p] for p in Priority},
+            "wait_seconds_total": {
+                p.name.lower(): round(self._wait_total[p], 6) for p in Priority
+            },
+            "wait_seconds_max": {
+                p.name.lower(): round(self._wait_max[p], 6) for p in Priority
+            },
+        }
+
+    def _bind(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Attach to the running loop, dropping state left on a previous one."""
+        if self._loop is loop:
+            return
+        if self._wakeup is not None:
+            self._wakeup.cancel()
+            self._wakeup = None
+        self._waiters.clear()
+        self._loop = loop
+
+    def _refill(self) -> None:
+        """Add tokens for the time elapsed at the current rate."""
+        now = time.monotonic()
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self._updated = now
+
+    def _try_take(self, tokens: float) -> bool:
+        """Take tokens if available and the upstream is not paused."""
+        self._refill()
+        if time.monotonic() < self._blocked_until or self.tokens < tokens:
+            return False
+        self.tokens -= tokens
+        return True
+
+    def _dispatch(self) -> None:
+        """Grant queued callers in priority order, then schedule the next wakeup."""
+        if self._wakeup is not None:
+            self._wakeup.cancel()
+            self._wakeup = None
+
+        while self._waiters:
+            _, _, tokens, future = self._waiters[0]
+            if future.done():
+                heapq.heappop(self._waiters)
+                continue
+            if not self._try_take(tokens):
+                break
+            heapq.heappop(self._waiters)
+            future.set_result(None)
+
+        if self._waiters and self._loop is not None:
+            tokens = self._waiters[0][2]
+            now = time.monotonic()
+            delay = max(
+                self._blocked_until - now,
+                (tokens - self.tokens) / self.rate,
+                0.001,
+            )
+            self._wakeup = self._loop.call_later(delay, self._dispatch)
+
+    def _record(self, priority: Priority, waited: float) -> None:
+        """Count an acquisition and its queueing time."""
+        self._acquired[priority] += 1
+        self._wait_total[priority] += waited
+        self._wait_max[priority] = max(self._wait_max[priority], waited)
+
+
+class RateGovernor:
+    """Registry of named upstream budgets shared across the process."""
+
+    def __init__(self) -> None:
+        self._budgets: dict[str, UpstreamBudget] = {}
+        self._lock = threading.Lock()
+
+    def register(
+        self,
+        name: str,
+        rate_per_second: float,
+        burst: float | None = None,
+        min_rate: float | None = None,
+    ) -> UpstreamBudget:
+        """Get the budget for an upstream, creating it on first registration.
+
+        Later callers share the existing budget. If one asks for a lower rate
+        the budget is lowered to it, so the most restrictive rate wins; a
+        higher rate is ignored with a warning.
+        """
+        with self._lock:
+            budget = self._budgets.get(name)
+            if budget is None:
+                budget = UpstreamBudget(name, rate_per_second, burst, min_rate)
+                self._budgets[name] = budget
+                logger.info(
+                    "Registered upstream budget",
+                    upstream=name,
+                    rate_per_second=rate_per_second,
+                    burst=budget.capacity,
+                )
+            elif rate_per_second != budget.max_rate:
+                logger.warning(
+                    "Upstream budget registered with a different rate",
+                    upstream=name,
+                    requested_rate_per_second=rate_per_second,
+                    rate_per_second=min(rate_per_second, budget.max_rate),
+                )
+                budget.restrict(rate_per_second)
+            return budget
+
+    def get(self, name: str) -> UpstreamBudget | None:
+        """Get a registered budget by name."""
+        return self._budgets.get(name)
+
+    def metrics(self) -> dict[str, dict[str, Any]]:
+        """Metrics snapshot for every registered budget."""
+        with self._lock:
+            budgets = list(self._budgets.values())
+        return {budget.name: budget.snapshot() for budget in budgets}
+
+    def reset(self) -> None:
+        """Drop all budgets (useful for testing)."""
+        with self._lock:
+            self._budgets.clear()
+
+
+# Global governor instance
+rate_governor = RateGovernor()
+
+
+def get_rate_governor() -> RateGovernor:
+    """Get the process-wide rate governor."""
+    return rate_governor
+
+
+def openai_budget() -> UpstreamBudget:
+    """Get the shared OpenAI budget, registering it from config if needed."""
+    return rate_governor.register(
+        OPENAI, config.openai_rate_limit, burst=config.openai_rate_burst
+    )
@@ -0,0 +1,339 @@
+"""
+Request coalescing for upstream APIs.
+
+Sits directly above the HTTP layer (below the local study store and any
+result cache) so that identical work requested concurrently is only sent
+upstream once:
+
+- ``SingleFlight`` shares one in-flight call between concurrent callers of
+  the same canonical (endpoint, params) key.
+- ``BatchCoalescer`` merges concurrent lookups for overlapping ID sets into
+  batched requests and hands each caller back the items it asked for. A
+  batch is fetched with the first caller's ``fetch_batch``, so clients
+  register coalescers under a ``scoped_name`` covering the settings their
+  fetch depends on (endpoint, credentials, batch size).
+
+Results are shared between callers and should be treated as read-only.
+"""
+
+import asyncio
+import hashlib
+import threading
+from collections.abc import Awaitable, Callable, Hashable, Iterable, Mapping
+from typing import Any
+
+from bio_mcp.config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+def scoped_name(name: str, *settings: Any) -> str:
+    """Name for a group shared only by callers with the same settings.
+
+    The settings are hashed, so credentials never show up in metrics.
+    """
+    digest = hashlib.sha256(repr(settings).encode()).hexdigest()[:12]
+    return f"{name}:{digest}"
+
+
+def request_key(endpoint: str, params: Mapping[str, Any]) -> tuple[Any, ...]:
+    """Canonical key for a GET request (parameter order and None values ignored)."""
+    return (
+        endpoint,
+        tuple(sorted((str(k), str(v)) for k, v in params.items() if v is not None)),
+    )
+
+
+class _Call:
+    """One in-flight call and the number of callers waiting on it."""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Future[Any]):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Share one in-flight call between concurrent callers with the same key."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._calls: dict[Hashable, _Call] = {}
+        self.calls = 0
+        self.shared = 0
+
+    async def do[T](self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run ``fn`` for ``key``, or join the call already in flight for it.
+
+        The call runs as its own task, so a caller that is cancelled does not
+        cancel it for the others; it is only cancelled once every caller has
+        gone away.
+        """
+        loop = asyncio.get_running_loop()
+        self.calls += 1
+
+        call = self._calls.get(key)
+        if call is None or call.task.get_loop() is not loop:
+            call = _Call(asyncio.ensure_future(fn()))
+            self._calls[key] = call
+            call.task.add_done_callback(lambda _task: self._forget(key, call))
+        else:
+            self.shared += 1
+
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                call.task.cancel()
+                self._forget(key, call)
+
+    def stats(self) -> dict[str, int]:
+        """Call counters for the metrics endpoint."""
+        return {
+            "calls": self.calls,
+            "shared": self.shared,
+            "in_flight": len(self._calls),
+        }
+
+    def _forget(self, key: Hashable, call: _Call) -> None:
+        """Drop a finished call unless a newer one has replaced it."""
+        if self._calls.get(key) is call:
+            del self._calls[key]
+
+
+class BatchCoalescer[K: Hashable, T]:
+    """Merge concurrent ID lookups into shared batched requests.
+
+    Keys requested while a lookup for them is already in flight join that
+    lookup; the rest are collected until the end of the current event loop
+    iteration and fetched together, ``batch_size`` keys per request.
+    """
+
+    def __init__(self, name: str, key_of: Callable[[T], K]):
+        """Initialize the coalescer.
+
+        Args:
+            name: Name used in logs and metrics
+            key_of: Extracts the lookup key from a fetched item
+        """
+        self.name = name
+        self.key_of = key_of
+        self._inflight: dict[K, asyncio.Future[tuple[T | None, tuple[T, ...]]]] = {}
+        self._pending: list[K] = []
+        self._flush_handle: asyncio.Handle | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+        self.requested = 0
+        self.shared = 0
+        self.batches = 0
+
+    async def fetch(
+        self,
+        keys: Iterable[K],
+        fetch_batch: Callable[[list[K]], Awaitable[list[T]]],
+        batch_size: int,
+    ) -> list[T]:
+        """Fetch items for ``keys``, sharing requests with concurrent callers.
+
+        Args:
+            keys: Keys to look up (duplicates are ignored)
+            fetch_batch: Fetches the items for one batch of keys
+            batch_size: Maximum keys per ``fetch_batch`` call
+
+        Returns:
+            Found items in requested order, followed by any items a batch
+            returned under keys nobody asked for (e.g. alias matches)
+
+        Raises:
+            Exception: Whatever ``fetch_batch`` raised for a batch holding
+                one of ``keys``
+        """
+        loop = asyncio.get_running_loop()
+        self._bind(loop)
+
+        futures: dict[K, asyncio.Future[tuple[T | None, tuple[T, ...]]]] = {}
+        for key in keys:
+            if key in futures:
+                continue
+            self.requested += 1
+            future = self._inflight.get(key)
+            if future is None:
+                future = loop.create_future()
+                self._inflight[key] = future
+                self._pending.append(key)
+            else:
+                self.shared += 1
+            futures[key] = future
+
+        if self._pending and self._flush_handle is None:
+            self._flush_handle = loop.call_soon(
+                self._flush, fetch_batch, max(1, batch_size)
+            )
+
+        results = await asyncio.gather(
+            *(asyncio.shield(future) for future in futures.values()),
+            return_exceptions=True,
+        )
+
+        items: list[T] = []
+        extras: list[T] = []
+        seen_extras: set[int] = set()
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+            item, unmatched = result
+            if item is not None:
+                items.append(item)
+            if unmatched and id(unmatched) not in seen_extras:
+                seen_extras.add(id(unmatched))
+                extras.extend(unmatched)
+        return items + extras
+
+    def stats(self) -> dict[str, int]:
+        """Lookup counters for the metrics endpoint."""
+        return {
+            "requested": self.requested,
+            "shared": self.shared,
+            "batches": self.batches,
+            "in_flight": len(self._inflight),
+        }
+
+    def _bind(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Attach to the running loop, dropping state left on a previous one."""
+        if self._loop is loop:
+            return
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._inflight.clear()
+        self._pending.clear()
+        self._tasks.clear()
+        self._loop = loop
+
+    def _flush(
+        self,
+        fetch_batch: Callable[[list[K]], Awaitable[list[T]]],
+        batch_size: int,
+    ) -> None:
+        """Start fetching every key collected since the last flush."""
+        self._flush_handle = None
+        keys, self._pending = self._pending, []
+        if keys and self._loop is not None:
+            task = self._loop.create_task(self._run(keys, fetch_batch, batch_size))
+            # Hold a reference until done so the task is not garbage collected
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(
+        self,
+        keys: list[K],
+        fetch_batch: Callable[[list[K]], Awaitable[list[T]]],
+        batch_size: int,
+    ) -> None:
+        """Fetch keys batch by batch, settling each caller's futures as we go."""
+        try:
+            for start in range(0, len(keys), batch_size):
+                batch = keys[start : start + batch_size]
+                self.batches += 1
+                try:
+                    fetched = await fetch_batch(batch)
+                except Exception as e:
+                    logger.warning(
+                        "Coalesced batch fetch failed",
+                        coalescer=self.name,
+                        key_count=len(batch),
+                        error=str(e),
+                    )
+                    for key in batch:
+                        self._settle(key, error=e)
+                    continue
+
+                wanted = set(batch)
+                matched: dict[K, T] = {}
+                unmatched: list[T] = []
+                for item in fetched:
+                    key = self.key_of(item)
+                    if key in wanted:
+                        matched.setdefault(key, item)
+                    else:
+                        unmatched.append(item)
+
+                extras = tuple(unmatched)
+                for key in batch:
+                    self._settle(key, result=(matched.get(key), extras))
+        finally:
+            # Cancelled mid-way (e.g. loop shutdown): release remaining callers
+            for key in keys:
+                self._settle(key, error=asyncio.CancelledError())
+
+    def _settle(
+        self,
+        key: K,
+        result: tuple[T | None, tuple[T, ...]] | None = None,
+        error: BaseException | None = None,
+    ) -> None:
+        """Resolve and forget the future for a key, if it is still pending."""
+        future = self._inflight.get(key)
+        if future is None or future.done():
+            return
+        del self._inflight[key]
+        if error is None:
+            future.set_result(result)
+        elif isinstance(error, asyncio.CancelledError):
+            future.cancel()
+        else:
+            future.set_exception(error)
+            # Callers that went away must not leave it logged as unretrieved
+            future.exception()
+
+
+class CoalescingRegistry:
+    """Registry of named single-flight groups and batch coalescers."""
+
+    def __init__(self) -> None:
+        self._flights: dict[str, SingleFlight] = {}
+        self._batches: dict[str, BatchCoalescer[Any, Any]] = {}
+        self._lock = threading.Lock()
+
+    def single_flight(self, name: str) -> SingleFlight:
+        """Get the single-flight group for an upstream, creating it if needed."""
+        with self._lock:
+            flight = self._flights.get(name)
+            if flight is None:
+                flight = self._flights[name] = SingleFlight(name)
+            return flight
+
+    def batch[K: Hashable, T](
+        self, name: str, key_of: Callable[[T], K]
+    ) -> BatchCoalescer[K, T]:
+        """Get a batch coalescer, creating it on first registration."""
+        with self._lock:
+            coalescer = self._batches.get(name)
+            if coalescer is None:
+                coalescer = self._batches[name] = BatchCoalescer(name, key_of)
+            return coalescer
+
+    def metrics(self) -> dict[str, dict[str, int]]:
+        """Counters for every single-flight group and batch coalescer."""
+        with self._lock:
+            groups = [*self._flights.values(), *self._batches.values()]
+        return {group.name: group.stats() for group in groups}
+
+    def reset(self) -> None:
+        """Drop all groups (useful for testing)."""
+        with self._lock:
+            self._flights.clear()
+            self._batches.clear()
+
+
+# Global registry instance
+coalescing = CoalescingRegistry()
+
+
+def get_coalescing_registry() -> CoalescingRegistry:
+    """Get the process-wide coalescing registry."""
+    return coalescing
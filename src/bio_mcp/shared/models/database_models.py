@@ -5,7 +5,18 @@ Universal database models for multi-source documents.
 import enum
 from datetime import UTC, datetime
 
-from sqlalchemy import JSON, Column, DateTime, Enum, Integer, String, Text
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    Column,
+    Date,
+    DateTime,
+    Enum,
+    Float,
+    Integer,
+    String,
+    Text,
+)
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import declarative_base
 
@@ -174,6 +185,10 @@ class JobRecord(Base):
     completed_at = Column(DateTime(timezone=True), nullable=True)
     expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
 
+    # Worker lease (set by claim_jobs, extended by heartbeats)
+    worker_id = Column(String(100), nullable=True)
+    lease_expires_at = Column(DateTime(timezone=True), nullable=True, index=True)
+
     def to_job_data(self):
         """Convert SQLAlchemy record to business logic model."""
         from bio_mcp.http.jobs.models import JobData
@@ -190,6 +205,8 @@ class JobRecord(Base):
             started_at=self.started_at,
             completed_at=self.completed_at,
             expires_at=self.expires_at,
+            worker_id=self.worker_id,
+            lease_expires_at=self.lease_expires_at,
         )
 
     @classmethod
@@ -209,7 +226,68 @@ class JobRecord(Base):
             started_at=job_data.started_at,
             completed_at=job_data.completed_at,
             expires_at=job_data.expires_at,
+            worker_id=job_data.worker_id,
+            lease_expires_at=job_data.lease_expires_at,
         )
 
     def __repr__(self) -> str:
         return f"<JobRecord(id='{self.id}', tool='{self.tool_name}', status='{self.status.value}')>"
+
+
+class IdempotencyRecord(Base):
+    """Stored /v1/mcp/invoke response keyed by (tool, idempotency_key)."""
+
+    __tablename__ = "idempotency_keys"
+
+    tool_name = Column(String(100), primary_key=True)
+    idempotency_key = Column(String(255), primary_key=True)
+    params_hash = Column(String(64), nullable=False)  # SHA-256 of canonical params
+    status = Column(String(20), nullable=False)  # in_flight | completed
+    response = Column(JSONB, nullable=True)
+    created_at = Column(DateTime(timezone=True), nullable=False)
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
+
+    def __repr__(self) -> str:
+        return f"<IdempotencyRecord(tool='{self.tool_name}', key='{self.idempotency_key}', status='{self.status}')>"
+
+
+class CtgovStudy(Base):
+    """Locally persisted ClinicalTrials.gov study with normalized columns."""
+
+    __tablename__ = "ctgov_studies"
+
+    nct_id = Column(String(20), primary_key=True)
+    title = Column(Text)
+    phase = Column(String(50), index=True)
+    status = Column(String(50), index=True)
+    study_type = Column(String(50))
+    sponsor_name = Column(Text)
+    sponsor_class = Column(String(50), index=True)
+    enrollment_count = Column(Integer)
+    start_date = Column(Date)
+    primary_completion_date = Column(Date)
+    completion_date = Column(Date)
+    last_update_posted_date = Column(Date, index=True)
+    conditions = Column(JSON().with_variant(JSONB(), "postgresql"))
+    interventions = Column(JSON().with_variant(JSONB(), "postgresql"))
+    investment_score = Column(Float, index=True)
+    has_results = Column(Boolean, nullable=False, default=False)
+
+    # Raw API study and SHA-256 of its canonical JSON for change detection
+    raw = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=False)
+    content_hash = Column(String(64), nullable=False)
+
+    # Last time the study was confirmed against the API (freshness window)
+    fetched_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    created_at = Column(
+        DateTime(timezone=True), default=lambda: datetime.now(UTC), nullable=False
+    )
+    updated_at = Column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(UTC),
+        onupdate=lambda: datetime.now(UTC),
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:
+        return f"<CtgovStudy(nct_id='{self.nct_id}', phase='{self.phase}', status='{self.status}')>"
@@ -7,7 +7,8 @@ clinical trial data retrieval.
 """
 
 import asyncio
-import time
+import importlib.util
+from collections.abc import AsyncIterator, Sequence
 from datetime import date, datetime
 from typing import TYPE_CHECKING, Any
 
@@ -17,11 +18,43 @@ if TYPE_CHECKING:
     from bio_mcp.sources.clinicaltrials.models import ClinicalTrialDocument
 
 from bio_mcp.config.logging_config import get_logger
+from bio_mcp.shared.core.rate_governor import (
+    CTGOV_V2,
+    get_rate_governor,
+    parse_retry_after,
+)
+from bio_mcp.shared.core.single_flight import (
+    get_coalescing_registry,
+    request_key,
+    scoped_name,
+)
 from bio_mcp.shared.models.base_models import BaseClient
 from bio_mcp.sources.clinicaltrials.config import ClinicalTrialsConfig
 
 logger = get_logger(__name__)
 
+# The v2 API coerces larger pageSize values down to this
+MAX_PAGE_SIZE = 1000
+
+# NCT IDs per filter.ids request; ~12 URL characters each, so a request
+# stays well inside common proxy and server URL limits
+MAX_IDS_PER_REQUEST = 200
+
+# Study pieces read by ClinicalTrialDocument.from_api_data, for ``fields=``
+STUDY_DOCUMENT_FIELDS = (
+    "IdentificationModule",
+    "StatusModule",
+    "SponsorCollaboratorsModule",
+    "DescriptionModule",
+    "ConditionsModule",
+    "DesignModule",
+    "EligibilityModule",
+    "ArmsInterventionsModule",
+    "OutcomesModule",
+    "ContactsLocationsModule",
+    "HasResults",
+)
+
 
 class ClinicalTrialsAPIError(Exception):
     """Base exception for ClinicalTrials.gov API errors."""
@@ -35,32 +68,29 @@ class RateLimitError(ClinicalTrialsAPIError):
     pass
 
 
-class RateLimiter:
-    """Simple rate limiter for API requests."""
-
-    def __init__(self, rate_per_second: int):
-        self.rate_per_second = rate_per_second
-        self.min_interval = 1.0 / rate_per_second
-        self.last_request_time = 0.0
-
-    async def wait_if_needed(self) -> None:
-        """Wait if necessary to respect rate limit."""
-        now = time.time()
-        time_since_last = now - self.last_request_time
-
-        if time_since_last < self.min_interval:
-            wait_time = self.min_interval - time_since_last
-            await asyncio.sleep(wait_time)
-
-        self.last_request_time = time.time()
-
-
 class ClinicalTrialsClient(BaseClient["ClinicalTrialDocument"]):
     """Client for ClinicalTrials.gov API v2."""
 
     def __init__(self, config: ClinicalTrialsConfig | None = None):
         self.config = config or ClinicalTrialsConfig.from_env()
-        self._rate_limiter = RateLimiter(self.config.rate_limit_per_second)
+        # Shared with every other ClinicalTrials.gov caller in the process
+        self._rate_limiter = get_rate_governor().register(
+            CTGOV_V2, self.config.rate_limit_per_second
+        )
+        # Identical concurrent requests and overlapping study ID sets are
+        # sent once, for every ClinicalTrialsClient in the process (study
+        # batches only between clients with the same endpoint and batch size)
+        coalescing = get_coalescing_registry()
+        self._flights = coalescing.single_flight(CTGOV_V2)
+        self._study_batches = coalescing.batch(
+            scoped_name(
+                "ctgov-v2.studies",
+                self.config.base_url,
+                self.config.batch_fetch_size,
+            ),
+            _study_nct_id,
+        )
+        self.session: httpx.AsyncClient | None = None
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -68,56 +98,83 @@ class ClinicalTrialsClient(BaseClient["ClinicalTrialDocument"]):
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        pass
+        await self.close()
+
+    def _init_session(self) -> None:
+        """Initialize the shared, pooled HTTP session."""
+        http2 = self.config.http2 and importlib.util.find_spec("h2") is not None
+        if self.config.http2 and not http2:
+            logger.debug("h2 package not installed, using HTTP/1.1 keep-alive")
+
+        self.session = httpx.AsyncClient(
+            http2=http2,
+            timeout=httpx.Timeout(self.config.timeout),
+            limits=httpx.Limits(
+                max_connections=self.config.max_connections,
+                max_keepalive_connections=self.config.max_keepalive_connections,
+                keepalive_expiry=self.config.keepalive_expiry,
+            ),
+            headers={
+                "User-Agent": "Bio-MCP/1.0 (biomedical research; contact: bio-mcp@example.com)"
+            },
+        )
 
     async def close(self) -> None:
-        """Cleanup resources (no-op since we don't maintain sessions)."""
-        pass
+        """Close HTTP session and cleanup resources."""
+        if self.session:
+            await self.session.aclose()
+            self.session = None
 
     async def _make_request(self, url: str, params: dict[str, Any]) -> dict[str, Any]:
+        """Make HTTP request, joining an identical one already in flight."""
+        return await self._flights.do(
+            request_key(url, params), lambda: self._request_json(url, params)
+        )
+
+    async def _request_json(self, url: str, params: dict[str, Any]) -> dict[str, Any]:
         """Make HTTP request with rate limiting and error handling."""
-        await self._rate_limiter.wait_if_needed()
+        if not self.session:
+            self._init_session()
+
+        await self._rate_limiter.acquire()
 
         # Convert all parameters to strings
         str_params = {k: str(v) for k, v in params.items() if v is not None}
 
-        # Create a fresh HTTP client for this request
-        async with httpx.AsyncClient(
-            timeout=httpx.Timeout(self.config.timeout),
-            headers={
-                "User-Agent": "Bio-MCP/1.0 (biomedical research; contact: bio-mcp@example.com)"
-            },
-        ) as session:
-            try:
-                logger.debug(
-                    "Making ClinicalTrials.gov API request", url=url, params=str_params
-                )
+        try:
+            logger.debug(
+                "Making ClinicalTrials.gov API request", url=url, params=str_params
+            )
 
-                response = await session.get(url, params=str_params)
-                response.raise_for_status()
+            response = await self.session.get(url, params=str_params)
+            response.raise_for_status()
+            self._rate_limiter.on_success()
 
-                data = response.json()
-                logger.debug(
-                    "ClinicalTrials.gov API response received",
-                    status=response.status_code,
-                )
+            data = response.json()
+            logger.debug(
+                "ClinicalTrials.gov API response received",
+                status=response.status_code,
+            )
 
-                return data
-
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 429:
-                    logger.warning("ClinicalTrials.gov API rate limit exceeded")
-                    raise RateLimitError("Rate limit exceeded")
-                else:
-                    logger.error(
-                        "ClinicalTrials.gov API HTTP error",
-                        status=e.response.status_code,
-                        error=str(e),
-                    )
-                    raise ClinicalTrialsAPIError(f"HTTP {e.response.status_code}: {e}")
-            except Exception as e:
-                logger.error("ClinicalTrials.gov API request failed", error=str(e))
-                raise ClinicalTrialsAPIError(f"Request failed: {e}")
+            return data
+
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 429:
+                logger.warning("ClinicalTrials.gov API rate limit exceeded")
+                self._rate_limiter.on_throttled(
+                    parse_retry_after(e.response.headers.get("Retry-After"))
+                )
+                raise RateLimitError("Rate limit exceeded")
+            else:
+                logger.error(
+                    "ClinicalTrials.gov API HTTP error",
+                    status=e.response.status_code,
+                    error=str(e),
+                )
+                raise ClinicalTrialsAPIError(f"HTTP {e.response.status_code}: {e}")
+        except Exception as e:
+            logger.error("ClinicalTrials.gov API request failed", error=str(e))
+            raise ClinicalTrialsAPIError(f"Request failed: {e}")
 
     async def search_trials(
         self,
@@ -133,6 +190,9 @@ class ClinicalTrialsClient(BaseClient["ClinicalTrialDocument"]):
         """
         Search clinical trials and return NCT IDs.
 
+        Follows ``nextPageToken`` until ``limit`` IDs are collected, requesting
+        only the ``NCTId`` field.
+
         Args:
             condition: Medical condition or disease
             intervention: Drug, device, or treatment
@@ -146,13 +206,118 @@ class ClinicalTrialsClient(BaseClient["ClinicalTrialDocument"]):
         Returns:
             List of NCT IDs matching the search criteria
         """
+        logger.info(
+            "Searching ClinicalTrials.gov",
+            condition=condition,
+            intervention=intervention,
+            phase=phase,
+            status=status,
+            sponsor_class=sponsor_class,
+            limit=limit,
+        )
+
+        nct_ids: list[str] = []
+        async for studies in self.iter_search(
+            condition=condition,
+            intervention=intervention,
+            phase=phase,
+            status=status,
+            sponsor_class=sponsor_class,
+            updated_after=updated_after,
+            limit=limit,
+            fields=("NCTId",),
+            retries=retries,
+        ):
+            nct_ids.extend(self._parse_search_response({"studies": studies}))
+
+        logger.info(
+            "ClinicalTrials.gov search completed",
+            returned_count=len(nct_ids),
+            condition=condition,
+            intervention=intervention,
+        )
+
+        return nct_ids[:limit]  # Ensure we don't exceed requested limit
+
+    async def iter_search(
+        self,
+        condition: str | None = None,
+        intervention: str | None = None,
+        phase: str | None = None,
+        status: str | None = None,
+        sponsor_class: str | None = None,
+        updated_after: date | None = None,
+        limit: int | None = None,
+        fields: Sequence[str] | None = STUDY_DOCUMENT_FIELDS,
+        page_size: int | None = None,
+        retries: int | None = None,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """
+        Yield pages of study records matching a search, following nextPageToken.
+
+        Pages are yielded as they arrive so callers can parse and store each one
+        before the next is requested.
+
+        Args:
+            condition, intervention, phase, status, sponsor_class, updated_after:
+                Search filters, as for ``search_trials``
+            limit: Maximum number of studies to yield in total (None for all)
+            fields: Study pieces to return; defaults to the modules
+                ``ClinicalTrialDocument.from_api_data`` reads. None returns
+                complete records.
+            page_size: Studies per request (defaults to ``config.page_size``)
+            retries: Number of retry attempts per page
+
+        Yields:
+            Lists of raw study dictionaries, one per API page
+        """
         if retries is None:
             retries = self.config.retries
+        page_size = min(page_size or self.config.page_size, MAX_PAGE_SIZE)
 
         url = f"{self.config.base_url}/studies"
-        params: dict[str, Any] = {"pageSize": min(limit, self.config.page_size)}
+        params = self._build_search_params(
+            condition, intervention, phase, status, sponsor_class, updated_after
+        )
+        if fields:
+            params["fields"] = ",".join(fields)
+
+        remaining = limit
+        page_token: str | None = None
+        while remaining is None or remaining > 0:
+            page_params = {
+                **params,
+                "pageSize": page_size
+                if remaining is None
+                else min(remaining, page_size),
+            }
+            if page_token:
+                page_params["pageToken"] = page_token
+
+            response_data = await self._request_with_retries(url, page_params, retries)
+            studies = response_data.get("studies", [])
+            if remaining is not None:
+                studies = studies[:remaining]
+                remaining -= len(studies)
+
+            if studies:
+                yield studies
 
-        # Build query and filter parameters (API v2 format)
+            page_token = response_data.get("nextPageToken")
+            if not page_token:
+                break
+
+    def _build_search_params(
+        self,
+        condition: str | None,
+        intervention: str | None,
+        phase: str | None,
+        status: str | None,
+        sponsor_class: str | None,
+        updated_after: date | None,
+    ) -> dict[str, Any]:
+        """Build query and filter parameters (API v2 format)."""
+        params: dict[str, Any] = {}
         if condition:
             params["query.cond"] = condition
         if intervention:
@@ -169,30 +334,15 @@ class ClinicalTrialsClient(BaseClient["ClinicalTrialDocument"]):
             params["query.term"] = (
                 f"AREA[LastUpdatePostDate]RANGE[{updated_after.isoformat()},MAX]"
             )
+        return params
 
-        logger.info(
-            "Searching ClinicalTrials.gov",
-            condition=condition,
-            intervention=intervention,
-            phase=phase,
-            status=status,
-            sponsor_class=sponsor_class,
-            limit=limit,
-        )
-
+    async def _request_with_retries(
+        self, url: str, params: dict[str, Any], retries: int
+    ) -> dict[str, Any]:
+        """Request one search page, retrying unexpected failures with backoff."""
         for attempt in range(retries + 1):
             try:
-                response_data = await self._make_request(url, params)
-                nct_ids = self._parse_search_response(response_data)
-
-                logger.info(
-                    "ClinicalTrials.gov search completed",
-                    returned_count=len(nct_ids),
-                    condition=condition,
-                    intervention=intervention,
-                )
-
-                return nct_ids[:limit]  # Ensure we don't exceed requested limit
+                return await self._make_request(url, params)
 
             except (ClinicalTrialsAPIError, RateLimitError):
                 raise
@@ -246,41 +396,30 @@ class ClinicalTrialsClient(BaseClient["ClinicalTrialDocument"]):
         """
         Get multiple studies in batch for efficiency.
 
+        IDs are sent ``batch_fetch_size`` at a time through ``filter.ids``, and
+        each request follows ``nextPageToken`` until all matching studies are
+        returned. A failed request is logged and skipped so one bad chunk does
+        not lose the rest of the batch. Concurrent batch lookups are merged, so
+        IDs another caller is already fetching are not requested again.
+
         Args:
             nct_ids: List of NCT IDs to fetch
 
         Returns:
-            List of study data dictionaries
+            List of study data dictionaries, in the order requested
         """
         if not nct_ids:
             return []
 
-        # ClinicalTrials.gov API doesn't support multi-ID queries like PubMed,
-        # so we need to fetch individually but with concurrency control
         logger.info("Fetching clinical trials batch", nct_count=len(nct_ids))
 
-        # Limit concurrency to respect rate limits
-        semaphore = asyncio.Semaphore(self.config.rate_limit_per_second)
-
-        async def fetch_single(nct_id: str) -> dict[str, Any] | None:
-            async with semaphore:
-                return await self.get_study(nct_id)
-
-        # Execute requests concurrently
-        tasks = [fetch_single(nct_id) for nct_id in nct_ids]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        chunk_size = max(1, min(self.config.batch_fetch_size, MAX_IDS_PER_REQUEST))
 
-        # Filter out None results and exceptions
-        studies: list[dict[str, Any]] = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                logger.warning(
-                    "Failed to fetch study in batch",
-                    nct_id=nct_ids[i],
-                    error=str(result),
-                )
-            elif result is not None and isinstance(result, dict):
-                studies.append(result)
+        # Requested order; filter.ids also matches NCTIdAlias, and studies
+        # found only through an alias come last
+        studies = await self._study_batches.fetch(
+            [nct_id.upper() for nct_id in nct_ids], self._fetch_studies, chunk_size
+        )
 
         logger.info(
             "Clinical trials batch fetch completed",
@@ -290,6 +429,33 @@ class ClinicalTrialsClient(BaseClient["ClinicalTrialDocument"]):
 
         return studies
 
+    async def _fetch_studies(self, nct_ids: list[str]) -> list[dict[str, Any]]:
+        """Fetch one ``filter.ids`` chunk, following ``nextPageToken``."""
+        url = f"{self.config.base_url}/studies"
+        params: dict[str, Any] = {
+            "filter.ids": ",".join(nct_ids),
+            "pageSize": len(nct_ids),
+        }
+        studies: list[dict[str, Any]] = []
+        try:
+            while True:
+                response_data = await self._make_request(url, params)
+                studies.extend(response_data.get("studies", []))
+
+                page_token = response_data.get("nextPageToken")
+                if not page_token:
+                    break
+                params = {**params, "pageToken": page_token}
+
+        except ClinicalTrialsAPIError as e:
+            logger.warning(
+                "Failed to fetch studies in batch",
+                nct_ids=nct_ids[:5],
+                nct_count=len(nct_ids),
+                error=str(e),
+            )
+        return studies
+
     def _parse_search_response(self, response_data: dict[str, Any]) -> list[str]:
         """Parse search response and extract NCT IDs."""
         try:
@@ -382,3 +548,13 @@ class ClinicalTrialsClient(BaseClient["ClinicalTrialDocument"]):
         since_date = timestamp.date()
         nct_ids = await self.search_updated_since(since_date, limit)
         return await self.get_documents(nct_ids)
+
+
+def _study_nct_id(study: dict[str, Any]) -> str:
+    """Extract the upper-cased NCT ID from a study record."""
+    return (
+        study.get("protocolSection", {})
+        .get("identificationModule", {})
+        .get("nctId", "")
+        .upper()
+    )
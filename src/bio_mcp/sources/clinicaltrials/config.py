@@ -16,6 +16,18 @@ class ClinicalTrialsConfig:
     retries: int = 3
     page_size: int = 100
 
+    # Connection pool for the shared HTTP client
+    http2: bool = True
+    max_connections: int = 10
+    max_keepalive_connections: int = 5
+    keepalive_expiry: float = 30.0
+
+    # NCT IDs per filter.ids request (capped at the client's URL-safe maximum)
+    batch_fetch_size: int = 200
+
+    # Locally stored studies younger than this are served without an API call
+    local_max_age_hours: float = 24.0
+
     @classmethod
     def from_env(cls) -> "ClinicalTrialsConfig":
         """Create configuration from environment variables."""
@@ -27,4 +39,14 @@ class ClinicalTrialsConfig:
             timeout=float(os.getenv("BIO_MCP_CTGOV_TIMEOUT", "30.0")),
             retries=int(os.getenv("BIO_MCP_CTGOV_RETRIES", "3")),
             page_size=int(os.getenv("BIO_MCP_CTGOV_PAGE_SIZE", "100")),
+            http2=os.getenv("BIO_MCP_CTGOV_HTTP2", "true").lower() == "true",
+            max_connections=int(os.getenv("BIO_MCP_CTGOV_MAX_CONNECTIONS", "10")),
+            max_keepalive_connections=int(
+                os.getenv("BIO_MCP_CTGOV_MAX_KEEPALIVE_CONNECTIONS", "5")
+            ),
+            keepalive_expiry=float(os.getenv("BIO_MCP_CTGOV_KEEPALIVE_EXPIRY", "30.0")),
+            batch_fetch_size=int(os.getenv("BIO_MCP_CTGOV_BATCH_FETCH_SIZE", "200")),
+            local_max_age_hours=float(
+                os.getenv("BIO_MCP_CTGOV_LOCAL_MAX_AGE_HOURS", "24.0")
+            ),
         )
@@ -2,6 +2,7 @@
 ClinicalTrials.gov service implementation with investment-focused features.
 """
 
+from datetime import timedelta
 from typing import Any
 
 from bio_mcp.config.logging_config import get_logger
@@ -10,6 +11,8 @@ from bio_mcp.shared.utils.checkpoints import CheckpointManager
 from bio_mcp.sources.clinicaltrials.client import ClinicalTrialsClient
 from bio_mcp.sources.clinicaltrials.config import ClinicalTrialsConfig
 from bio_mcp.sources.clinicaltrials.models import ClinicalTrialDocument
+from bio_mcp.sources.clinicaltrials.quality import calculate_clinical_trial_quality
+from bio_mcp.sources.clinicaltrials.store import ClinicalTrialsStudyStore
 from bio_mcp.sources.clinicaltrials.sync_strategy import ClinicalTrialsSyncStrategy
 
 logger = get_logger(__name__)
@@ -22,10 +25,12 @@ class ClinicalTrialsService(BaseSourceService[ClinicalTrialDocument]):
         self,
         config: ClinicalTrialsConfig | None = None,
         checkpoint_manager: CheckpointManager | None = None,
+        study_store: ClinicalTrialsStudyStore | None = None,
     ):
         super().__init__("ctgov")
         self.config = config or ClinicalTrialsConfig.from_env()
         self.checkpoint_manager = checkpoint_manager
+        self.study_store = study_store
         self.client: ClinicalTrialsClient | None = None
         self.sync_strategy: ClinicalTrialsSyncStrategy | None = None
 
@@ -42,7 +47,7 @@ class ClinicalTrialsService(BaseSourceService[ClinicalTrialDocument]):
         # Initialize sync strategy if checkpoint manager available
         if self.checkpoint_manager:
             self.sync_strategy = ClinicalTrialsSyncStrategy(
-                self.checkpoint_manager, self.client
+                self.checkpoint_manager, self.client, self.study_store
             )
 
         self._initialized = True
@@ -105,6 +110,11 @@ class ClinicalTrialsService(BaseSourceService[ClinicalTrialDocument]):
         if not self.client:
             raise RuntimeError("ClinicalTrials.gov client not initialized")
 
+        stored = await self._load_local([nct_id])
+        if nct_id in stored:
+            logger.debug(f"Serving clinical trial {nct_id} from local store")
+            return stored[nct_id]
+
         logger.debug(f"Fetching clinical trial: {nct_id}")
 
         try:
@@ -115,7 +125,8 @@ class ClinicalTrialsService(BaseSourceService[ClinicalTrialDocument]):
                 raise ValueError(f"Clinical trial {nct_id} not found")
 
             # Convert to document model
-            document = ClinicalTrialDocument.from_api_data(api_data)
+            document = self._parse_study(api_data)
+            await self._store_local([(document, api_data)])
 
             logger.debug(
                 f"Retrieved trial: {nct_id} (investment score: {document.investment_relevance_score:.2f})"
@@ -144,20 +155,40 @@ class ClinicalTrialsService(BaseSourceService[ClinicalTrialDocument]):
         if not nct_ids:
             return []
 
-        logger.info(f"Fetching {len(nct_ids)} clinical trials in batch")
+        # Fresh local studies first; only the rest go to the API
+        stored = await self._load_local(nct_ids)
+        documents = [
+            stored[nct_id] for nct_id in dict.fromkeys(nct_ids) if nct_id in stored
+        ]
+        missing = [nct_id for nct_id in nct_ids if nct_id not in stored]
+        if not missing:
+            logger.info(f"Served {len(documents)} clinical trials from local store")
+            return documents
+
+        logger.info(
+            f"Fetching {len(missing)} clinical trials in batch "
+            f"({len(documents)} served from local store)"
+        )
+
+        documents.extend(await self._fetch_remote(missing))
+        logger.info(f"Successfully processed {len(documents)} clinical trials")
+        return documents
+
+    async def _fetch_remote(self, nct_ids: list[str]) -> list[ClinicalTrialDocument]:
+        """Fetch studies from the API, writing them through to the local store."""
+        if not self.client:
+            raise RuntimeError("ClinicalTrials.gov client not initialized")
 
         try:
-            # Get raw API data for all trials
             api_data_list = await self.client.get_studies_batch(nct_ids)
 
             # Convert to document models
-            documents = []
+            fetched = []
             parse_errors = 0
 
             for api_data in api_data_list:
                 try:
-                    doc = ClinicalTrialDocument.from_api_data(api_data)
-                    documents.append(doc)
+                    fetched.append((self._parse_study(api_data), api_data))
                 except Exception as e:
                     parse_errors += 1
                     logger.warning(f"Failed to parse trial data: {e}")
@@ -167,13 +198,59 @@ class ClinicalTrialsService(BaseSourceService[ClinicalTrialDocument]):
                     f"Failed to parse {parse_errors} out of {len(api_data_list)} trials"
                 )
 
-            logger.info(f"Successfully processed {len(documents)} clinical trials")
-            return documents
+            await self._store_local(fetched)
+            return [doc for doc, _ in fetched]
 
         except Exception as e:
             logger.error(f"Failed to fetch clinical trials in batch: {e}")
             raise
 
+    async def _ensure_stored(self, nct_ids: list[str]) -> None:
+        """Fetch into the local store the studies missing or outside the window."""
+        if not self.study_store:
+            return
+
+        fresh = await self.study_store.fresh_nct_ids(
+            nct_ids, max_age=timedelta(hours=self.config.local_max_age_hours)
+        )
+        missing = [nct_id for nct_id in dict.fromkeys(nct_ids) if nct_id not in fresh]
+        if missing:
+            logger.info(f"Fetching {len(missing)} clinical trials into local store")
+            await self._fetch_remote(missing)
+
+    @staticmethod
+    def _parse_study(api_data: dict[str, Any]) -> ClinicalTrialDocument:
+        """Parse an API study and score it once with the quality module."""
+        document = ClinicalTrialDocument.from_api_data(api_data)
+        document.investment_relevance_score = calculate_clinical_trial_quality(document)
+        return document
+
+    async def _load_local(self, nct_ids: list[str]) -> dict[str, ClinicalTrialDocument]:
+        """Load studies fetched within the freshness window from the local store."""
+        if not self.study_store:
+            return {}
+
+        try:
+            return await self.study_store.get_studies(
+                nct_ids, max_age=timedelta(hours=self.config.local_max_age_hours)
+            )
+        except Exception as e:
+            # The store is an optimization; fall back to the API
+            logger.warning(f"Local study store read failed: {e}")
+            return {}
+
+    async def _store_local(
+        self, studies: list[tuple[ClinicalTrialDocument, dict[str, Any]]]
+    ) -> None:
+        """Write API-fetched studies through to the local store."""
+        if not self.study_store or not studies:
+            return
+
+        try:
+            await self.study_store.upsert_studies(studies)
+        except Exception as e:
+            logger.warning(f"Local study store write failed: {e}")
+
     async def sync_documents(
         self, query: str, query_key: str, limit: int
     ) -> dict[str, Any]:
@@ -294,6 +371,22 @@ class ClinicalTrialsService(BaseSourceService[ClinicalTrialDocument]):
             if not nct_ids or min_investment_score <= 0:
                 return nct_ids[:limit]
 
+            # Scores are stored at ingest; rank candidates in one query
+            if self.study_store:
+                try:
+                    await self._ensure_stored(nct_ids)
+                    result_nct_ids = await self.study_store.rank_by_investment(
+                        nct_ids, min_investment_score, limit
+                    )
+                    logger.info(
+                        f"Investment filtering: {len(nct_ids)} total -> "
+                        f"{len(result_nct_ids)} returned "
+                        f"(score >= {min_investment_score})"
+                    )
+                    return result_nct_ids
+                except Exception as e:
+                    logger.warning(f"Local investment ranking failed: {e}")
+
             # Get documents to calculate investment scores
             documents = await self.get_documents(nct_ids)
 
@@ -413,6 +506,15 @@ class ClinicalTrialsService(BaseSourceService[ClinicalTrialDocument]):
                 "top_conditions": [],
             }
 
+        # Aggregate over stored trials in the database
+        if self.study_store:
+            try:
+                await self.ensure_initialized()
+                await self._ensure_stored(nct_ids)
+                return await self.study_store.investment_summary(nct_ids)
+            except Exception as e:
+                logger.warning(f"Local investment summary failed: {e}")
+
         try:
             documents = await self.get_documents(nct_ids)
 
@@ -436,6 +538,12 @@ class ClinicalTrialsService(BaseSourceService[ClinicalTrialDocument]):
                 sponsor = doc.sponsor_class or "UNKNOWN"
                 sponsor_dist[sponsor] = sponsor_dist.get(sponsor, 0) + 1
 
+            # Status distribution
+            status_dist: dict[str, int] = {}
+            for doc in documents:
+                status = doc.status or "UNKNOWN"
+                status_dist[status] = status_dist.get(status, 0) + 1
+
             # Top conditions
             condition_counts: dict[str, int] = {}
             for doc in documents:
@@ -453,6 +561,7 @@ class ClinicalTrialsService(BaseSourceService[ClinicalTrialDocument]):
                 "avg_investment_score": round(avg_score, 2),
                 "phase_distribution": phase_dist,
                 "sponsor_distribution": sponsor_dist,
+                "status_distribution": status_dist,
                 "top_conditions": [
                     {"condition": cond, "count": count}
                     for cond, count in top_conditions
@@ -0,0 +1,381 @@
+"""
+Local persisted store for ClinicalTrials.gov studies.
+
+Studies are kept in the ``ctgov_studies`` table with normalized columns for
+filtering and aggregation, the raw API study for rebuilding documents, and a
+SHA-256 content hash so re-syncing an unchanged study only bumps its
+``fetched_at`` timestamp. A study whose investment score changed (e.g. after
+a scoring update) is rewritten even if its content is unchanged.
+"""
+
+import hashlib
+import json
+from collections import Counter
+from collections.abc import Callable, Iterable, Sequence
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import case, func, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+
+from bio_mcp.config.logging_config import get_logger
+from bio_mcp.shared.models.database_models import CtgovStudy
+from bio_mcp.sources.clinicaltrials.models import ClinicalTrialDocument
+
+logger = get_logger(__name__)
+
+# Columns replaced when a changed study is upserted (created_at is preserved)
+UPSERT_COLUMNS = (
+    "title",
+    "phase",
+    "status",
+    "study_type",
+    "sponsor_name",
+    "sponsor_class",
+    "enrollment_count",
+    "start_date",
+    "primary_completion_date",
+    "completion_date",
+    "last_update_posted_date",
+    "conditions",
+    "interventions",
+    "investment_score",
+    "has_results",
+    "raw",
+    "content_hash",
+    "fetched_at",
+    "updated_at",
+)
+
+
+# Trials scoring above this count as investment relevant in summaries
+INVESTMENT_RELEVANT_THRESHOLD = 0.5
+
+
+def study_content_hash(raw: dict[str, Any]) -> str:
+    """SHA-256 of a raw study's canonical JSON."""
+    canonical = json.dumps(raw, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def raw_nct_id(raw: dict[str, Any]) -> str:
+    """NCT ID of a raw API study, or "" if it has none."""
+    return (
+        raw.get("protocolSection", {}).get("identificationModule", {}).get("nctId")
+        or ""
+    )
+
+
+class ClinicalTrialsStudyStore:
+    """ClinicalTrials.gov studies persisted in the shared database."""
+
+    # NCT IDs per IN (...) query (below SQLite's variable limit)
+    LOOKUP_BATCH = 500
+
+    def __init__(self, session_factory: Callable[[], Any]):
+        """Initialize store.
+
+        Args:
+            session_factory: Callable returning a new AsyncSession
+        """
+        self.session_factory = session_factory
+
+    async def upsert_studies(
+        self, studies: Iterable[tuple[ClinicalTrialDocument, dict[str, Any]]]
+    ) -> dict[str, int]:
+        """Bulk upsert parsed studies with their raw API data.
+
+        Studies whose content hash and investment score are unchanged only
+        have ``fetched_at`` refreshed. Returns counts of new, updated and
+        unchanged studies.
+        """
+        rows: dict[str, dict[str, Any]] = {}
+        now = datetime.now(UTC)
+        for document, raw in studies:
+            if not document.nct_id:
+                continue
+            rows[document.nct_id] = self._to_row(document, raw, now)
+
+        counts = {"new": 0, "updated": 0, "unchanged": 0}
+        if not rows:
+            return counts
+
+        async with self.session_factory() as session:
+            existing = await self._existing_state(session, list(rows))
+
+            changed = []
+            unchanged = []
+            for nct_id, row in rows.items():
+                stored = existing.get(nct_id)
+                if stored is None:
+                    counts["new"] += 1
+                    changed.append(row)
+                elif stored != (row["content_hash"], row["investment_score"]):
+                    counts["updated"] += 1
+                    changed.append(row)
+                else:
+                    counts["unchanged"] += 1
+                    unchanged.append(nct_id)
+
+            if changed:
+                dialect = session.bind.dialect.name
+                insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+                stmt = insert(CtgovStudy.__table__)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[CtgovStudy.nct_id],
+                    set_={column: stmt.excluded[column] for column in UPSERT_COLUMNS},
+                )
+                await session.execute(stmt, changed)
+
+            for i in range(0, len(unchanged), self.LOOKUP_BATCH):
+                await session.execute(
+                    update(CtgovStudy)
+                    .where(CtgovStudy.nct_id.in_(unchanged[i : i + self.LOOKUP_BATCH]))
+                    .values(fetched_at=now)
+                )
+
+            await session.commit()
+
+        logger.debug("Upserted ClinicalTrials.gov studies", **counts)
+        return counts
+
+    async def get_studies(
+        self, nct_ids: Sequence[str], max_age: timedelta | None = None
+    ) -> dict[str, ClinicalTrialDocument]:
+        """Load stored studies by NCT ID.
+
+        Args:
+            nct_ids: NCT IDs to load
+            max_age: Only return studies fetched within this window (None = any)
+
+        Returns:
+            Mapping of NCT ID to document for the studies found
+        """
+        unique_ids = list(dict.fromkeys(nct_ids))
+        documents: dict[str, ClinicalTrialDocument] = {}
+        if not unique_ids:
+            return documents
+
+        async with self.session_factory() as session:
+            for i in range(0, len(unique_ids), self.LOOKUP_BATCH):
+                stmt = select(
+                    CtgovStudy.nct_id, CtgovStudy.raw, CtgovStudy.investment_score
+                ).where(CtgovStudy.nct_id.in_(unique_ids[i : i + self.LOOKUP_BATCH]))
+                if max_age is not None:
+                    stmt = stmt.where(
+                        CtgovStudy.fetched_at >= datetime.now(UTC) - max_age
+                    )
+                result = await session.execute(stmt)
+                for nct_id, raw, investment_score in result.all():
+                    documents[nct_id] = self._to_document(raw, investment_score)
+
+        return documents
+
+    async def fresh_nct_ids(
+        self, nct_ids: Sequence[str], max_age: timedelta | None = None
+    ) -> set[str]:
+        """NCT IDs among nct_ids stored and fetched within max_age."""
+        unique_ids = list(dict.fromkeys(nct_ids))
+        found: set[str] = set()
+        if not unique_ids:
+            return found
+
+        async with self.session_factory() as session:
+            for i in range(0, len(unique_ids), self.LOOKUP_BATCH):
+                stmt = select(CtgovStudy.nct_id).where(
+                    CtgovStudy.nct_id.in_(unique_ids[i : i + self.LOOKUP_BATCH])
+                )
+                if max_age is not None:
+                    stmt = stmt.where(
+                        CtgovStudy.fetched_at >= datetime.now(UTC) - max_age
+                    )
+                result = await session.execute(stmt)
+                found.update(result.scalars().all())
+
+        return found
+
+    async def rank_by_investment(
+        self, nct_ids: Sequence[str], min_score: float, limit: int
+    ) -> list[str]:
+        """Stored NCT IDs scoring at least min_score, highest score first."""
+        unique_ids = list(dict.fromkeys(nct_ids))
+        ranked: list[tuple[float, str]] = []
+        if not unique_ids or limit <= 0:
+            return []
+
+        async with self.session_factory() as session:
+            for i in range(0, len(unique_ids), self.LOOKUP_BATCH):
+                result = await session.execute(
+                    select(CtgovStudy.investment_score, CtgovStudy.nct_id)
+                    .where(
+                        CtgovStudy.nct_id.in_(unique_ids[i : i + self.LOOKUP_BATCH]),
+                        CtgovStudy.investment_score >= min_score,
+                    )
+                    .order_by(CtgovStudy.investment_score.desc())
+                    .limit(limit)
+                )
+                ranked.extend(result.tuples().all())
+
+        # Batches are each ranked in SQL; merge their heads
+        ranked.sort(key=lambda row: row[0], reverse=True)
+        return [nct_id for _, nct_id in ranked[:limit]]
+
+    async def investment_summary(
+        self, nct_ids: Sequence[str], top_n: int = 5
+    ) -> dict[str, Any]:
+        """Aggregate investment metrics over stored trials.
+
+        Phase, sponsor class and status distributions come from one
+        GROUP BY query per batch of IDs, with counts and score sums
+        computed in the database.
+        """
+        unique_ids = list(dict.fromkeys(nct_ids))
+        total = 0
+        relevant = 0
+        score_sum = 0.0
+        phase_dist: Counter[str] = Counter()
+        sponsor_dist: Counter[str] = Counter()
+        status_dist: Counter[str] = Counter()
+        condition_counts: Counter[str] = Counter()
+        top_trials: list[Any] = []
+
+        score = func.coalesce(CtgovStudy.investment_score, 0.0)
+        async with self.session_factory() as session:
+            for i in range(0, len(unique_ids), self.LOOKUP_BATCH):
+                in_batch = CtgovStudy.nct_id.in_(unique_ids[i : i + self.LOOKUP_BATCH])
+
+                facets = await session.execute(
+                    select(
+                        CtgovStudy.phase,
+                        CtgovStudy.sponsor_class,
+                        CtgovStudy.status,
+                        func.count(),
+                        func.sum(score),
+                        func.sum(
+                            case((score > INVESTMENT_RELEVANT_THRESHOLD, 1), else_=0)
+                        ),
+                    )
+                    .where(in_batch)
+                    .group_by(
+                        CtgovStudy.phase, CtgovStudy.sponsor_class, CtgovStudy.status
+                    )
+                )
+                for phase, sponsor_class, status, count, scores, hits in facets:
+                    total += count
+                    score_sum += scores or 0.0
+                    relevant += hits or 0
+                    phase_dist[phase or "UNKNOWN"] += count
+                    sponsor_dist[sponsor_class or "UNKNOWN"] += count
+                    status_dist[status or "UNKNOWN"] += count
+
+                # Conditions are JSON arrays; count them over the slim column
+                conditions = await session.execute(
+                    select(CtgovStudy.conditions).where(in_batch)
+                )
+                for trial_conditions in conditions.scalars():
+                    condition_counts.update(trial_conditions or [])
+
+                top = await session.execute(
+                    select(
+                        CtgovStudy.nct_id,
+                        CtgovStudy.title,
+                        score,
+                        CtgovStudy.phase,
+                        CtgovStudy.sponsor_name,
+                    )
+                    .where(in_batch)
+                    .order_by(score.desc())
+                    .limit(top_n)
+                )
+                top_trials.extend(top.tuples().all())
+
+        if not total:
+            return {
+                "total_trials": 0,
+                "investment_relevant": 0,
+                "avg_investment_score": 0.0,
+                "phase_distribution": {},
+                "sponsor_distribution": {},
+                "top_conditions": [],
+            }
+
+        top_trials = sorted(top_trials, key=lambda row: row[2], reverse=True)[:top_n]
+        return {
+            "total_trials": total,
+            "investment_relevant": relevant,
+            "investment_percentage": (relevant / total) * 100,
+            "avg_investment_score": round(score_sum / total, 2),
+            "phase_distribution": dict(phase_dist),
+            "sponsor_distribution": dict(sponsor_dist),
+            "status_distribution": dict(status_dist),
+            "top_conditions": [
+                {"condition": condition, "count": count}
+                for condition, count in condition_counts.most_common(5)
+            ],
+            "high_value_trials": [
+                {
+                    "nct_id": nct_id,
+                    "title": title or f"Clinical Trial {nct_id}",
+                    "investment_score": round(investment_score, 2),
+                    "phase": phase,
+                    "sponsor": sponsor_name,
+                }
+                for nct_id, title, investment_score, phase, sponsor_name in top_trials
+            ],
+        }
+
+    async def _existing_state(
+        self, session: Any, nct_ids: list[str]
+    ) -> dict[str, tuple[str, float | None]]:
+        """(content hash, investment score) of the stored studies among nct_ids."""
+        state: dict[str, tuple[str, float | None]] = {}
+        for i in range(0, len(nct_ids), self.LOOKUP_BATCH):
+            result = await session.execute(
+                select(
+                    CtgovStudy.nct_id,
+                    CtgovStudy.content_hash,
+                    CtgovStudy.investment_score,
+                ).where(CtgovStudy.nct_id.in_(nct_ids[i : i + self.LOOKUP_BATCH]))
+            )
+            for nct_id, content_hash, investment_score in result.all():
+                state[nct_id] = (content_hash, investment_score)
+        return state
+
+    @staticmethod
+    def _to_row(
+        document: ClinicalTrialDocument, raw: dict[str, Any], now: datetime
+    ) -> dict[str, Any]:
+        """Build a ctgov_studies row from a parsed document and its raw study."""
+        return {
+            "nct_id": document.nct_id,
+            "title": document.title,
+            "phase": document.phase,
+            "status": document.status,
+            "study_type": document.study_type,
+            "sponsor_name": document.sponsor_name,
+            "sponsor_class": document.sponsor_class,
+            "enrollment_count": document.enrollment_count,
+            "start_date": document.start_date,
+            "primary_completion_date": document.primary_completion_date,
+            "completion_date": document.completion_date,
+            "last_update_posted_date": document.last_update_posted_date,
+            "conditions": list(document.conditions),
+            "interventions": list(document.interventions),
+            "investment_score": document.investment_relevance_score,
+            "has_results": document.has_results,
+            "raw": raw,
+            "content_hash": study_content_hash(raw),
+            "fetched_at": now,
+            "created_at": now,
+            "updated_at": now,
+        }
+
+    @staticmethod
+    def _to_document(
+        raw: dict[str, Any], investment_score: float | None
+    ) -> ClinicalTrialDocument:
+        """Rebuild a document from its raw study, keeping the stored score."""
+        document = ClinicalTrialDocument.from_api_data(raw)
+        if investment_score is not None:
+            document.investment_relevance_score = investment_score
+        return document
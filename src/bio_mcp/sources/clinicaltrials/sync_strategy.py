@@ -7,6 +7,7 @@ from datetime import datetime, timedelta
 from typing import Any
 
 from bio_mcp.config.logging_config import get_logger
+from bio_mcp.shared.core.rate_governor import background_priority
 from bio_mcp.shared.models.base_models import BaseSyncStrategy
 from bio_mcp.shared.utils.checkpoints import CheckpointManager
 from bio_mcp.sources.clinicaltrials.client import ClinicalTrialsClient
@@ -15,6 +16,7 @@ from bio_mcp.sources.clinicaltrials.quality import (
     calculate_clinical_trial_quality,
     calculate_quality_metrics,
 )
+from bio_mcp.sources.clinicaltrials.store import ClinicalTrialsStudyStore, raw_nct_id
 
 logger = get_logger(__name__)
 
@@ -23,10 +25,14 @@ class ClinicalTrialsSyncStrategy(BaseSyncStrategy):
     """lastUpdatePostedDate-based incremental sync for ClinicalTrials.gov."""
 
     def __init__(
-        self, checkpoint_manager: CheckpointManager, client: ClinicalTrialsClient
+        self,
+        checkpoint_manager: CheckpointManager,
+        client: ClinicalTrialsClient,
+        study_store: ClinicalTrialsStudyStore | None = None,
     ):
         self.checkpoint_manager = checkpoint_manager
         self.client = client
+        self.study_store = study_store
         self.source_name = "ctgov"
 
     async def get_sync_watermark(self, query_key: str) -> datetime | None:
@@ -39,6 +45,7 @@ class ClinicalTrialsSyncStrategy(BaseSyncStrategy):
             self.source_name, query_key, timestamp
         )
 
+    @background_priority
     async def sync_incremental(
         self, query: str, query_key: str, limit: int, batch_size: int = 50
     ) -> dict[str, Any]:
@@ -76,47 +83,64 @@ class ClinicalTrialsSyncStrategy(BaseSyncStrategy):
             search_params["updated_after"] = start_date
             search_params["limit"] = limit
 
-            # Search for trials to sync
+            # Page through matching trials, parsing each page as it arrives.
+            # Search results carry the projected study modules, so no
+            # per-ID detail fetch is needed.
             search_start_time = time.time()
-            nct_ids = await self.client.search(**search_params)
-            search_duration = time.time() - search_start_time
-
-            logger.info(
-                f"Found {len(nct_ids)} trials to sync in {search_duration:.2f}s"
-            )
+            search_duration: float | None = None
+            parse_duration = 0.0
+            documents: list[ClinicalTrialDocument] = []
+            parse_errors = 0
+            retrieved_count = 0
+            store_counts = {"new": 0, "updated": 0, "unchanged": 0}
+            store_duration = 0.0
 
-            if nct_ids:
-                # Fetch trial details in optimized batches
-                fetch_start_time = time.time()
-                trial_data = await self._fetch_trials_in_batches(nct_ids, batch_size)
-                fetch_duration = time.time() - fetch_start_time
+            async for page in self.client.iter_search(
+                **search_params, page_size=batch_size
+            ):
+                if search_duration is None:
+                    search_duration = time.time() - search_start_time
 
-                # Convert API data to documents with quality scoring
                 parse_start_time = time.time()
-                documents, parse_errors = await self._parse_and_score_trials(trial_data)
-                parse_duration = time.time() - parse_start_time
+                page_documents, page_errors = await self._parse_and_score_trials(page)
+                parse_duration += time.time() - parse_start_time
+
+                # Persist each page as it arrives so a failed sync keeps
+                # the pages already stored
+                if self.study_store and page_documents:
+                    store_start_time = time.time()
+                    page_counts = await self._store_trials(page, page_documents)
+                    store_duration += time.time() - store_start_time
+                    for key, count in page_counts.items():
+                        store_counts[key] += count
+
+                documents.extend(page_documents)
+                parse_errors += page_errors
+                retrieved_count += len(page)
+
+            if search_duration is None:
+                search_duration = time.time() - search_start_time
+            fetch_duration = (
+                time.time() - search_start_time - parse_duration - store_duration
+            )
+
+            logger.info(
+                f"Found {retrieved_count} trials to sync in {fetch_duration:.2f}s"
+            )
 
+            if retrieved_count:
                 if parse_errors > 0:
                     logger.warning(
-                        f"Failed to parse {parse_errors} out of {len(trial_data)} trials"
+                        f"Failed to parse {parse_errors} out of {retrieved_count} trials"
                     )
 
                 # Calculate quality metrics
                 quality_metrics = calculate_quality_metrics(documents)
 
-                # Count new vs updated documents
-                new_count = 0
-                updated_count = 0
-
-                # Here we would typically:
-                # 1. Check which documents are new vs updates by comparing with database
-                # 2. Store/update documents in database
-                # 3. Update vector embeddings
-                # 4. Calculate quality scores and investment metrics
-
-                # For now, assume all are new for simplicity
-                # In production, this would check against existing database records
-                new_count = len(documents)
+                # Without a study store nothing is compared, so every
+                # document counts as new
+                if not self.study_store:
+                    store_counts["new"] = len(documents)
 
                 # Update watermark to current time
                 await self.set_sync_watermark(query_key, current_time)
@@ -135,8 +159,9 @@ class ClinicalTrialsSyncStrategy(BaseSyncStrategy):
                     "source": self.source_name,
                     "query_key": query_key,
                     "synced": len(documents),
-                    "new": new_count,
-                    "updated": updated_count,
+                    "new": store_counts["new"],
+                    "updated": store_counts["updated"],
+                    "unchanged": store_counts["unchanged"],
                     "parse_errors": parse_errors,
                     "watermark_updated": current_time.isoformat(),
                     "success": True,
@@ -153,6 +178,7 @@ class ClinicalTrialsSyncStrategy(BaseSyncStrategy):
                         "search_duration_seconds": search_duration,
                         "fetch_duration_seconds": fetch_duration,
                         "parse_duration_seconds": parse_duration,
+                        "store_duration_seconds": store_duration,
                         "trials_per_second": trials_per_second,
                         "batch_size": batch_size,
                     },
@@ -168,6 +194,7 @@ class ClinicalTrialsSyncStrategy(BaseSyncStrategy):
                     "synced": 0,
                     "new": 0,
                     "updated": 0,
+                    "unchanged": 0,
                     "parse_errors": 0,
                     "watermark_updated": current_time.isoformat(),
                     "success": True,
@@ -193,6 +220,7 @@ class ClinicalTrialsSyncStrategy(BaseSyncStrategy):
                 "synced": 0,
                 "new": 0,
                 "updated": 0,
+                "unchanged": 0,
                 "parse_errors": 0,
                 "error": str(e),
                 "success": False,
@@ -249,6 +277,7 @@ class ClinicalTrialsSyncStrategy(BaseSyncStrategy):
 
         return params
 
+    @background_priority
     async def sync_by_nct_ids(self, nct_ids: list[str]) -> dict[str, Any]:
         """
         Sync specific clinical trials by NCT IDs.
@@ -275,23 +304,19 @@ class ClinicalTrialsSyncStrategy(BaseSyncStrategy):
             # Fetch trial details
             trial_data = await self.client.get_studies_batch(nct_ids)
 
-            # Convert API data to documents
-            documents = []
-            parse_errors = 0
-
-            for api_data in trial_data:
-                try:
-                    doc = ClinicalTrialDocument.from_api_data(api_data)
-                    documents.append(doc)
-                except Exception as e:
-                    parse_errors += 1
-                    logger.warning(f"Failed to parse trial data: {e}")
+            # Convert API data to documents scored like incremental syncs
+            documents, parse_errors = await self._parse_and_score_trials(trial_data)
 
             logger.info(
                 f"Successfully processed {len(documents)} trials with {parse_errors} parse errors"
             )
 
+            store_counts: dict[str, int] = {}
+            if self.study_store and documents:
+                store_counts = await self._store_trials(trial_data, documents)
+
             return {
+                **store_counts,
                 "source": self.source_name,
                 "sync_type": "targeted_nct_ids",
                 "requested_count": len(nct_ids),
@@ -323,49 +348,22 @@ class ClinicalTrialsSyncStrategy(BaseSyncStrategy):
                 "success": False,
             }
 
-    async def _fetch_trials_in_batches(
-        self, nct_ids: list[str], batch_size: int
-    ) -> list[dict[str, Any]]:
-        """
-        Fetch trial data in optimized batches for better performance.
-
-        Args:
-            nct_ids: List of NCT IDs to fetch
-            batch_size: Number of trials to fetch per batch
-
-        Returns:
-            List of trial API data dictionaries
-        """
-        all_trial_data = []
-        total_batches = len(nct_ids) // batch_size + (
-            1 if len(nct_ids) % batch_size > 0 else 0
+    async def _store_trials(
+        self,
+        trial_data: list[dict[str, Any]],
+        documents: list[ClinicalTrialDocument],
+    ) -> dict[str, int]:
+        """Upsert parsed trials with their raw API data into the study store."""
+        if not self.study_store:
+            return {}
+
+        raw_by_nct_id = {raw_nct_id(api_data): api_data for api_data in trial_data}
+        return await self.study_store.upsert_studies(
+            (doc, raw_by_nct_id[doc.nct_id])
+            for doc in documents
+            if doc.nct_id in raw_by_nct_id
         )
 
-        for i in range(0, len(nct_ids), batch_size):
-            batch_ids = nct_ids[i : i + batch_size]
-            batch_num = i // batch_size + 1
-
-            logger.debug(
-                f"Fetching batch {batch_num}/{total_batches} ({len(batch_ids)} trials)"
-            )
-
-            try:
-                batch_data = await self.client.get_studies_batch(batch_ids)
-                all_trial_data.extend(batch_data)
-
-                # Log progress for large syncs
-                if total_batches > 5 and batch_num % max(1, total_batches // 10) == 0:
-                    logger.info(
-                        f"Fetch progress: {batch_num}/{total_batches} batches completed"
-                    )
-
-            except Exception as e:
-                logger.error(f"Failed to fetch batch {batch_num}: {e}")
-                # Continue with other batches
-                continue
-
-        return all_trial_data
-
     async def _parse_and_score_trials(
         self, trial_data: list[dict[str, Any]]
     ) -> tuple[list[ClinicalTrialDocument], int]:
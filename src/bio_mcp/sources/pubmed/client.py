@@ -5,18 +5,31 @@ Phase 3A: Basic Biomedical Tools - PubMed integration with E-utilities API.
 
 import asyncio
 import os
-import time
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from datetime import date, datetime
-from typing import Any
+from typing import Any, NoReturn
 
 import httpx
 import xmltodict
 
 from bio_mcp.config.logging_config import get_logger
+from bio_mcp.shared.core.rate_governor import (
+    NCBI_EUTILS,
+    get_rate_governor,
+    parse_retry_after,
+)
+from bio_mcp.shared.core.single_flight import (
+    get_coalescing_registry,
+    request_key,
+    scoped_name,
+)
 
 logger = get_logger(__name__)
 
+# IDs per EFetch GET; larger comma-joined lists run into URL length limits
+EFETCH_MAX_IDS_PER_REQUEST = 200
+
 
 # Custom exceptions
 class PubMedAPIError(Exception):
@@ -138,33 +151,30 @@ class PubMedSearchResult:
         return (self.retstart + self.retmax) < self.total_count
 
 
-class RateLimiter:
-    """Simple rate limiter for API requests."""
-
-    def __init__(self, rate_per_second: int):
-        self.rate_per_second = rate_per_second
-        self.min_interval = 1.0 / rate_per_second
-        self.last_request_time = 0.0
-
-    async def wait_if_needed(self) -> None:
-        """Wait if necessary to respect rate limit."""
-        now = time.time()
-        time_since_last = now - self.last_request_time
-
-        if time_since_last < self.min_interval:
-            wait_time = self.min_interval - time_since_last
-            await asyncio.sleep(wait_time)
-
-        self.last_request_time = time.time()
-
-
 class PubMedClient:
     """HTTP client for PubMed E-utilities API."""
 
     def __init__(self, config: PubMedConfig):
         self.config = config
         self.session: httpx.AsyncClient | None = None
-        self._rate_limiter = RateLimiter(config.rate_limit_per_second)
+        # Shared with every other NCBI caller in the process
+        self._rate_limiter = get_rate_governor().register(
+            NCBI_EUTILS, config.rate_limit_per_second
+        )
+        # Identical concurrent requests and overlapping EFetch ID sets are
+        # sent once, for every PubMedClient in the process (EFetch batches
+        # only between clients with the same endpoint and API key)
+        coalescing = get_coalescing_registry()
+        self._flights = coalescing.single_flight(NCBI_EUTILS)
+        self._efetch_batches = coalescing.batch(
+            scoped_name(
+                "ncbi-eutils.efetch",
+                config.base_url,
+                config.api_key,
+                EFETCH_MAX_IDS_PER_REQUEST,
+            ),
+            lambda doc: doc.pmid,
+        )
         self.last_request_time = 0.0
 
         # Initialize session
@@ -185,15 +195,34 @@ class PubMedClient:
 
     async def _enforce_rate_limit(self) -> None:
         """Enforce rate limiting between API requests."""
-        await self._rate_limiter.wait_if_needed()
+        await self._rate_limiter.acquire()
+
+    def _raise_for_status(self, e: httpx.HTTPStatusError) -> NoReturn:
+        """Map an HTTP error to a PubMed exception, backing off on 429."""
+        if e.response.status_code == 429:
+            logger.warning("PubMed API rate limit exceeded")
+            self._rate_limiter.on_throttled(
+                parse_retry_after(e.response.headers.get("Retry-After"))
+            )
+            raise RateLimitError("Rate limit exceeded")
+        logger.error(
+            "PubMed API HTTP error", status=e.response.status_code, error=str(e)
+        )
+        raise PubMedAPIError(f"HTTP {e.response.status_code}: {e}")
 
     async def _make_request(self, url: str, params: dict[str, str]) -> dict[str, Any]:
+        """Make HTTP request, joining an identical one already in flight."""
+        return await self._flights.do(
+            request_key(url, params), lambda: self._request_json(url, dict(params))
+        )
+
+    async def _request_json(self, url: str, params: dict[str, str]) -> dict[str, Any]:
         """Make HTTP request with rate limiting and error handling."""
         if not self.session:
             self._init_session()
 
         # Apply rate limiting
-        await self._rate_limiter.wait_if_needed()
+        await self._enforce_rate_limit()
 
         # Add API key if available
         if self.config.api_key:
@@ -207,6 +236,7 @@ class PubMedClient:
 
             response = await self.session.get(url, params=params)
             response.raise_for_status()
+            self._rate_limiter.on_success()
 
             data = response.json()
             logger.debug("PubMed API response received", status=response.status_code)
@@ -214,14 +244,7 @@ class PubMedClient:
             return data
 
         except httpx.HTTPStatusError as e:
-            if e.response.status_code == 429:
-                logger.warning("PubMed API rate limit exceeded")
-                raise RateLimitError("Rate limit exceeded")
-            else:
-                logger.error(
-                    "PubMed API HTTP error", status=e.response.status_code, error=str(e)
-                )
-                raise PubMedAPIError(f"HTTP {e.response.status_code}: {e}")
+            self._raise_for_status(e)
         except Exception as e:
             logger.error("PubMed API request failed", error=str(e))
             raise PubMedAPIError(f"Request failed: {e}")
@@ -240,6 +263,7 @@ class PubMedClient:
 
             response = await self.session.get(url, params=params)
             response.raise_for_status()
+            self._rate_limiter.on_success()
 
             # Convert XML response to dict for parsing
             xml_text = response.text
@@ -261,14 +285,34 @@ class PubMedClient:
                 return {}
 
         except httpx.HTTPStatusError as e:
-            if e.response.status_code == 429:
-                logger.warning("PubMed API rate limit exceeded")
-                raise RateLimitError("Rate limit exceeded")
-            else:
-                logger.error(
-                    "PubMed API HTTP error", status=e.response.status_code, error=str(e)
-                )
-                raise PubMedAPIError(f"HTTP {e.response.status_code}: {e}")
+            self._raise_for_status(e)
+        except Exception as e:
+            logger.error("PubMed API request failed", error=str(e))
+            raise PubMedAPIError(f"Request failed: {e}")
+
+    async def _stream_xml(
+        self, url: str, params: dict[str, str]
+    ) -> AsyncIterator[bytes]:
+        """Make request that returns XML and yield the raw body in chunks."""
+        if not self.session:
+            self._init_session()
+
+        await self._enforce_rate_limit()
+
+        if self.config.api_key:
+            params = {**params, "api_key": self.config.api_key}
+
+        logger.debug("Streaming PubMed XML API request", url=url, params=params)
+
+        try:
+            async with self.session.stream("GET", url, params=params) as response:
+                response.raise_for_status()
+                self._rate_limiter.on_success()
+                async for chunk in response.aiter_bytes():
+                    yield chunk
+
+        except httpx.HTTPStatusError as e:
+            self._raise_for_status(e)
         except Exception as e:
             logger.error("PubMed API request failed", error=str(e))
             raise PubMedAPIError(f"Request failed: {e}")
@@ -421,18 +465,13 @@ class PubMedClient:
         if not pmids:
             return []
 
-        url = f"{self.config.base_url}efetch.fcgi"
-        params = {
-            "db": "pubmed",
-            "id": ",".join(pmids),
-            "retmode": "xml",
-        }
-
         logger.info("Fetching PubMed documents", pmid_count=len(pmids))
 
         try:
-            response_data = await self._make_xml_request(url, params)
-            documents = parse_efetch_response(response_data)
+            # Merged with concurrent fetches; PMIDs already in flight are shared
+            documents = await self._efetch_batches.fetch(
+                pmids, self._efetch_ids, EFETCH_MAX_IDS_PER_REQUEST
+            )
 
             logger.info(
                 "PubMed documents fetched",
@@ -446,6 +485,76 @@ class PubMedClient:
             logger.error("Failed to fetch PubMed documents", pmids=pmids, error=str(e))
             raise
 
+    async def iter_documents(
+        self,
+        search_result: PubMedSearchResult,
+        batch_size: int = 200,
+        pmids: list[str] | None = None,
+    ) -> AsyncIterator[list[PubMedDocument]]:
+        """Yield parsed documents for a search result one EFetch page at a time.
+
+        When the search was stored on the history server (``usehistory=y``), pages
+        are requested with ``WebEnv``/``query_key`` and ``retstart``/``retmax`` so
+        no PMIDs travel in the URL. The window covered is the one the search
+        returned (``retstart`` plus the PMIDs it listed). Passing ``pmids`` fetches
+        that explicit subset instead, ``batch_size`` IDs per request.
+
+        Only one page of XML is held in memory at a time.
+        """
+        if pmids is None and search_result.web_env and search_result.query_key:
+            start = search_result.retstart
+            end = start + (len(search_result.pmids) or search_result.total_count)
+            logger.info(
+                "Paging PubMed documents via history server",
+                retstart=start,
+                count=end - start,
+                batch_size=batch_size,
+            )
+            for retstart in range(start, end, batch_size):
+                yield await self._efetch(
+                    {
+                        "WebEnv": search_result.web_env,
+                        "query_key": search_result.query_key,
+                        "retstart": str(retstart),
+                        "retmax": str(min(batch_size, end - retstart)),
+                    }
+                )
+            return
+
+        ids = search_result.pmids if pmids is None else pmids
+        batch_size = min(batch_size, EFETCH_MAX_IDS_PER_REQUEST)
+        for start in range(0, len(ids), batch_size):
+            yield await self._efetch({"id": ",".join(ids[start : start + batch_size])})
+
+    async def _efetch_ids(self, pmids: list[str]) -> list[PubMedDocument]:
+        """Run one EFetch request for an explicit list of PMIDs."""
+        return await self._efetch({"id": ",".join(pmids)})
+
+    async def _efetch(self, params: dict[str, str]) -> list[PubMedDocument]:
+        """Run one EFetch request, parsing articles as the body streams in."""
+        # Imported here: the parser module builds PubMedDocument from this module
+        from bio_mcp.sources.pubmed.parser import EFetchStreamParser
+
+        url = f"{self.config.base_url}efetch.fcgi"
+        parser = EFetchStreamParser()
+        documents: list[PubMedDocument] = []
+        try:
+            async for chunk in self._stream_xml(
+                url, {"db": "pubmed", "retmode": "xml", **params}
+            ):
+                documents.extend(parser.feed(chunk))
+            documents.extend(parser.close())
+        except PubMedAPIError:
+            raise
+        except Exception as xml_error:
+            # Keep whatever parsed cleanly before the malformed section
+            logger.error(
+                "Failed to parse XML response",
+                error=str(xml_error),
+                parsed_count=len(documents),
+            )
+        return documents
+
 
 def parse_esearch_response(
     response_data: dict[str, Any], query: str
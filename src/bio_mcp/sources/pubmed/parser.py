@@ -0,0 +1,183 @@
+"""
+Streaming parser for PubMed EFetch XML.
+
+Articles are emitted one at a time as each ``<PubmedArticle>`` element closes,
+and the element is cleared immediately afterwards, so memory stays bounded by a
+single article rather than the whole response. Uses lxml when it is installed
+and falls back to the standard library ElementTree otherwise.
+"""
+
+from collections.abc import Iterable, Iterator
+from datetime import date
+from typing import IO, Any
+
+from bio_mcp.config.logging_config import get_logger
+from bio_mcp.sources.pubmed.client import PubMedDocument
+
+try:
+    from lxml import etree  # type: ignore[import-untyped]
+
+    PARSER_BACKEND = "lxml"
+except ImportError:  # pragma: no cover - depends on optional dependency
+    import xml.etree.ElementTree as etree  # noqa: N813
+
+    PARSER_BACKEND = "elementtree"
+
+logger = get_logger(__name__)
+
+ARTICLE_TAG = "PubmedArticle"
+# Top-level records we do not parse but still need to release
+_RECORD_TAGS = frozenset({ARTICLE_TAG, "PubmedBookArticle", "DeleteCitation"})
+
+
+class EFetchStreamParser:
+    """Incremental EFetch parser fed with raw byte chunks.
+
+    Suitable for streaming HTTP bodies::
+
+        parser = EFetchStreamParser()
+        async for chunk in response.aiter_bytes():
+            documents.extend(parser.feed(chunk))
+        documents.extend(parser.close())
+    """
+
+    def __init__(self) -> None:
+        self._parser = etree.XMLPullParser(events=("start", "end"))
+        self._root: Any = None
+
+    def feed(self, data: bytes) -> list[PubMedDocument]:
+        """Feed a chunk of XML and return the articles completed by it."""
+        self._parser.feed(data)
+        return list(self._drain())
+
+    def close(self) -> list[PubMedDocument]:
+        """Signal end of input and return any remaining articles."""
+        self._parser.close()
+        return list(self._drain())
+
+    def _drain(self) -> Iterator[PubMedDocument]:
+        for event, elem in self._parser.read_events():
+            if event == "start":
+                if self._root is None:
+                    self._root = elem
+                continue
+
+            if elem.tag not in _RECORD_TAGS:
+                continue
+
+            if elem.tag == ARTICLE_TAG:
+                document = parse_article_element(elem)
+                if document:
+                    yield document
+
+            # Release the finished record (and any earlier siblings)
+            elem.clear()
+            if self._root is not None:
+                self._root.clear()
+
+
+def iter_efetch_documents(source: bytes | IO[bytes]) -> Iterator[PubMedDocument]:
+    """Yield documents from an EFetch XML payload or binary file object."""
+    parser = EFetchStreamParser()
+    if isinstance(source, bytes | bytearray):
+        yield from parser.feed(bytes(source))
+    else:
+        for chunk in iter(lambda: source.read(64 * 1024), b""):
+            yield from parser.feed(chunk)
+    yield from parser.close()
+
+
+def parse_efetch_xml(source: bytes | Iterable[bytes]) -> list[PubMedDocument]:
+    """Parse a complete EFetch response (bytes or byte chunks) into documents."""
+    if isinstance(source, bytes | bytearray):
+        return list(iter_efetch_documents(source))
+
+    parser = EFetchStreamParser()
+    documents: list[PubMedDocument] = []
+    for chunk in source:
+        documents.extend(parser.feed(chunk))
+    documents.extend(parser.close())
+    return documents
+
+
+def parse_article_element(article: Any) -> PubMedDocument | None:
+    """Build a PubMedDocument from a ``<PubmedArticle>`` element."""
+    try:
+        citation = article.find("MedlineCitation")
+        if citation is None:
+            return None
+
+        pmid = _text(citation.find("PMID"))
+        art = citation.find("Article")
+        title = _text(art.find("ArticleTitle")) if art is not None else ""
+
+        if not pmid or not title:
+            logger.warning("Skipping article with missing PMID or title")
+            return None
+
+        abstract_parts = [_text(part) for part in art.iterfind("Abstract/AbstractText")]
+        abstract = " ".join(part for part in abstract_parts if part) or None
+
+        authors = []
+        for author in art.iterfind("AuthorList/Author"):
+            last_name = _text(author.find("LastName"))
+            fore_name = _text(author.find("ForeName"))
+            if last_name:
+                # Format as "LastName F" (first initial)
+                authors.append(
+                    f"{last_name} {fore_name[0]}" if fore_name else last_name
+                )
+
+        doi = None
+        for article_id in article.iterfind("PubmedData/ArticleIdList/ArticleId"):
+            if article_id.get("IdType") == "doi":
+                doi = _text(article_id) or None
+                break
+
+        return PubMedDocument(
+            pmid=pmid,
+            title=title,
+            abstract=abstract,
+            authors=authors,
+            journal=_text(art.find("Journal/Title")),
+            publication_date=_article_date(art.find("ArticleDate")),
+            doi=doi,
+            keywords=[
+                kw
+                for kw in (_text(k) for k in citation.iterfind("KeywordList/Keyword"))
+                if kw
+            ],
+            mesh_terms=[
+                term
+                for term in (
+                    _text(d)
+                    for d in citation.iterfind(
+                        "MeshHeadingList/MeshHeading/DescriptorName"
+                    )
+                )
+                if term
+            ],
+        )
+
+    except Exception as e:
+        logger.error("Failed to parse single article", error=str(e))
+        return None
+
+
+def _text(elem: Any) -> str:
+    """Full text content of an element, including inline markup like <i>."""
+    if elem is None:
+        return ""
+    return " ".join("".join(elem.itertext()).split())
+
+
+def _article_date(elem: Any) -> date | None:
+    if elem is None:
+        return None
+    try:
+        year = int(_text(elem.find("Year")) or "0")
+        month = int(_text(elem.find("Month")) or "1")
+        day = int(_text(elem.find("Day")) or "1")
+        return date(year, month, day) if year > 0 else None
+    except (ValueError, TypeError):
+        return None
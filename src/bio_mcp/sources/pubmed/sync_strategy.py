@@ -6,6 +6,7 @@ from datetime import datetime, timedelta
 from typing import Any
 
 from bio_mcp.config.logging_config import get_logger
+from bio_mcp.shared.core.rate_governor import background_priority
 from bio_mcp.shared.models.base_models import BaseSyncStrategy
 from bio_mcp.shared.utils.checkpoints import CheckpointManager
 from bio_mcp.sources.pubmed.client import PubMedClient
@@ -31,6 +32,7 @@ class PubMedSyncStrategy(BaseSyncStrategy):
             self.source_name, query_key, timestamp
         )
 
+    @background_priority
     async def sync_incremental(
         self, query: str, query_key: str, limit: int
     ) -> dict[str, Any]:
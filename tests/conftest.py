@@ -7,6 +7,16 @@ from unittest.mock import patch
 import pytest
 
 from bio_mcp.config.config import Config
+from bio_mcp.shared.core.rate_governor import get_rate_governor
+from bio_mcp.shared.core.single_flight import get_coalescing_registry
+
+
+@pytest.fixture(autouse=True)
+def reset_rate_governor():
+    """Give each test fresh upstream budgets and coalescers (process-wide)."""
+    yield
+    get_rate_governor().reset()
+    get_coalescing_registry().reset()
 
 
 @pytest.fixture
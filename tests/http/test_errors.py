@@ -1,10 +1,13 @@
 """Tests for error envelope and classification system."""
 
+from mcp.types import TextContent
+
 from bio_mcp.http.errors import (
     ErrorCode,
     ErrorEnvelope,
     classify_exception,
     create_error_envelope,
+    is_error_result,
 )
 
 
@@ -195,3 +198,32 @@ class TestErrorFromException:
             "password=" not in envelope.message
             or envelope.message == "Database connection failed"
         )
+
+
+class TestErrorResults:
+    """Test detection of failures tools report in their result."""
+
+    def test_error_text_and_flags(self):
+        """Test error text, isError and success=false are failures."""
+        error = TextContent(type="text", text="Error searching PubMed: timeout")
+
+        assert is_error_result([error])
+        assert is_error_result([error.model_dump(mode="json")])
+        assert is_error_result({"content": [], "isError": True})
+        assert is_error_result({"success": False})
+
+    def test_builder_json_error(self):
+        """Test MCPResponseBuilder error responses are failures."""
+        text = '```json\n{"success": false, "error": {"code": "X"}}\n```'
+
+        assert is_error_result([TextContent(type="text", text=text)])
+        assert not is_error_result(
+            [TextContent(type="text", text='```json\n{"success": true}\n```')]
+        )
+
+    def test_successful_results(self):
+        """Test ordinary results are not failures."""
+        assert not is_error_result([TextContent(type="text", text="Found 3 papers")])
+        assert not is_error_result({"synced": 1})
+        assert not is_error_result([])
+        assert not is_error_result("done")
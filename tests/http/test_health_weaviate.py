@@ -1,7 +1,7 @@
 """Tests for Weaviate health checker."""
 
 from contextlib import asynccontextmanager
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -9,6 +9,13 @@ from bio_mcp.http.health.interface import HealthCheckResult
 from bio_mcp.http.health.weaviate import WeaviateHealthChecker
 
 
+def _node(name: str, status: str) -> MagicMock:
+    """Build a cluster node as returned by ``client.cluster.nodes()``."""
+    node = MagicMock(status=status, version="1.24.0")
+    node.name = name
+    return node
+
+
 class TestWeaviateHealthChecker:
     """Test Weaviate connectivity health checker."""
 
@@ -38,26 +45,20 @@ class TestWeaviateHealthChecker:
         # Mock Weaviate client and responses
         mock_client = AsyncMock()
 
-        # Mock cluster health check (needs to be awaitable)
-        async def mock_get_nodes_status():
-            return {
-                "nodes": [{"name": "node-1", "status": "HEALTHY", "version": "1.24.0"}]
-            }
-
-        mock_client.cluster.get_nodes_status = mock_get_nodes_status
+        # Mock cluster health check
+        mock_client.cluster.nodes = AsyncMock(return_value=[_node("node-1", "HEALTHY")])
 
-        # Mock schema check (needs to be awaitable)
-        async def mock_get_schema():
-            return {"classes": [{"class": "PubmedDocument", "vectorizer": "none"}]}
-
-        mock_client.schema.get = mock_get_schema
+        # Mock schema check
+        mock_client.collections.list_all = AsyncMock(
+            return_value={"PubmedDocument": MagicMock()}
+        )
 
         # Mock live/ready endpoints
         mock_client.is_live.return_value = True
         mock_client.is_ready.return_value = True
 
         with patch(
-            "bio_mcp.http.health.weaviate.weaviate.connect_to_weaviate_cloud"
+            "bio_mcp.http.health.weaviate.weaviate.use_async_with_custom"
         ) as mock_connect:
 
             @asynccontextmanager
@@ -82,7 +83,7 @@ class TestWeaviateHealthChecker:
         """Test Weaviate health check with connection failure."""
 
         with patch(
-            "bio_mcp.http.health.weaviate.weaviate.connect_to_weaviate_cloud"
+            "bio_mcp.http.health.weaviate.weaviate.use_async_with_custom"
         ) as mock_connect:
             mock_connect.side_effect = Exception("Weaviate connection timeout")
 
@@ -99,27 +100,21 @@ class TestWeaviateHealthChecker:
         """Test Weaviate health check with unhealthy cluster."""
         mock_client = AsyncMock()
 
-        # Mock unhealthy cluster (needs to be awaitable)
-        async def mock_get_nodes_status():
-            return {
-                "nodes": [
-                    {"name": "node-1", "status": "UNHEALTHY", "version": "1.24.0"}
-                ]
-            }
-
-        mock_client.cluster.get_nodes_status = mock_get_nodes_status
+        # Mock unhealthy cluster
+        mock_client.cluster.nodes = AsyncMock(
+            return_value=[_node("node-1", "UNHEALTHY")]
+        )
 
         # Mock schema check (still needed even for unhealthy cluster)
-        async def mock_get_schema():
-            return {"classes": [{"class": "PubmedDocument", "vectorizer": "none"}]}
-
-        mock_client.schema.get = mock_get_schema
+        mock_client.collections.list_all = AsyncMock(
+            return_value={"PubmedDocument": MagicMock()}
+        )
 
         mock_client.is_live.return_value = True
         mock_client.is_ready.return_value = True
 
         with patch(
-            "bio_mcp.http.health.weaviate.weaviate.connect_to_weaviate_cloud"
+            "bio_mcp.http.health.weaviate.weaviate.use_async_with_custom"
         ) as mock_connect:
 
             @asynccontextmanager
@@ -140,25 +135,17 @@ class TestWeaviateHealthChecker:
         """Test Weaviate health check with missing schema."""
         mock_client = AsyncMock()
 
-        # Mock healthy cluster but missing schema (needs to be awaitable)
-        async def mock_get_nodes_status():
-            return {
-                "nodes": [{"name": "node-1", "status": "HEALTHY", "version": "1.24.0"}]
-            }
-
-        mock_client.cluster.get_nodes_status = mock_get_nodes_status
+        # Mock healthy cluster but missing schema
+        mock_client.cluster.nodes = AsyncMock(return_value=[_node("node-1", "HEALTHY")])
 
-        # Empty schema (needs to be awaitable)
-        async def mock_get_schema():
-            return {"classes": []}
-
-        mock_client.schema.get = mock_get_schema
+        # Empty schema
+        mock_client.collections.list_all = AsyncMock(return_value={})
 
         mock_client.is_live.return_value = True
         mock_client.is_ready.return_value = True
 
         with patch(
-            "bio_mcp.http.health.weaviate.weaviate.connect_to_weaviate_cloud"
+            "bio_mcp.http.health.weaviate.weaviate.use_async_with_custom"
         ) as mock_connect:
 
             @asynccontextmanager
@@ -174,3 +161,23 @@ class TestWeaviateHealthChecker:
         assert result.details is not None
         assert result.details["schema_classes"] == []
         assert result.details["missing_classes"] == ["PubmedDocument"]
+
+    def test_connects_to_configured_grpc_port(self):
+        """Test the gRPC port follows the Weaviate client configuration."""
+        with (
+            patch("bio_mcp.http.health.weaviate.config.weaviate_grpc_port", 51051),
+            patch(
+                "bio_mcp.http.health.weaviate.weaviate.use_async_with_custom"
+            ) as mock_connect,
+        ):
+            WeaviateHealthChecker("https://weaviate.internal:8443")._connect()
+
+        mock_connect.assert_called_once_with(
+            http_host="weaviate.internal",
+            http_port=8443,
+            http_secure=True,
+            grpc_host="weaviate.internal",
+            grpc_port=51051,
+            grpc_secure=True,
+            skip_init_checks=True,
+        )
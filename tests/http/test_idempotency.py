@@ -0,0 +1,333 @@
+"""Tests for idempotent tool invocation."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+from mcp.types import TextContent
+from sqlalchemy.dialects import postgresql
+
+from bio_mcp.http.app import create_app
+from bio_mcp.http.idempotency import (
+    COMPLETED,
+    IdempotencyInProgressError,
+    IdempotencyKeyReuseError,
+    IdempotencyManager,
+    MemoryIdempotencyStore,
+    SQLAlchemyIdempotencyStore,
+    params_fingerprint,
+)
+from bio_mcp.http.registry import ToolRegistry
+
+
+class CountingOperation:
+    """Operation that records how many times it executed."""
+
+    def __init__(self, response=None, error=None, delay=0.0):
+        self.calls = 0
+        self.response = response or {"ok": True, "result": "done"}
+        self.error = error
+        self.delay = delay
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return self.response
+
+
+class TestIdempotencyManager:
+    """Test replay and coalescing semantics."""
+
+    def setup_method(self):
+        self.store = MemoryIdempotencyStore()
+        self.manager = IdempotencyManager(
+            self.store, ttl_seconds=60, poll_interval_seconds=0.01
+        )
+
+    def test_params_fingerprint_ignores_key_order(self):
+        """Test fingerprints are stable across dict ordering."""
+        assert params_fingerprint({"a": 1, "b": 2}) == params_fingerprint(
+            {"b": 2, "a": 1}
+        )
+        assert params_fingerprint({"a": 1}) != params_fingerprint({"a": 2})
+
+    @pytest.mark.asyncio
+    async def test_replays_stored_response(self):
+        """Test a repeated key returns the stored response without executing."""
+        operation = CountingOperation()
+
+        first, first_replayed = await self.manager.execute(
+            "pubmed.sync", "k1", {"query": "x"}, operation
+        )
+        second, second_replayed = await self.manager.execute(
+            "pubmed.sync", "k1", {"query": "x"}, operation
+        )
+
+        assert operation.calls == 1
+        assert first == second
+        assert (first_replayed, second_replayed) == (False, True)
+
+    @pytest.mark.asyncio
+    async def test_coalesces_concurrent_duplicates(self):
+        """Test in-flight duplicates share one execution."""
+        operation = CountingOperation(delay=0.05)
+
+        results = await asyncio.gather(
+            *[
+                self.manager.execute("pubmed.sync", "k1", {"query": "x"}, operation)
+                for _ in range(5)
+            ]
+        )
+
+        assert operation.calls == 1
+        assert sorted(replayed for _, replayed in results) == [
+            False,
+            True,
+            True,
+            True,
+            True,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_keys_scoped_per_tool(self):
+        """Test the same key on different tools executes both."""
+        operation = CountingOperation()
+
+        await self.manager.execute("pubmed.sync", "k1", {}, operation)
+        await self.manager.execute("clinicaltrials.sync", "k1", {}, operation)
+
+        assert operation.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_key_reuse_with_different_params_rejected(self):
+        """Test reusing a key with other parameters raises."""
+        await self.manager.execute(
+            "pubmed.sync", "k1", {"query": "x"}, CountingOperation()
+        )
+
+        with pytest.raises(IdempotencyKeyReuseError):
+            await self.manager.execute(
+                "pubmed.sync", "k1", {"query": "y"}, CountingOperation()
+            )
+
+    @pytest.mark.asyncio
+    async def test_failures_are_not_replayed(self):
+        """Test a failed execution releases the key for retries."""
+        failing = CountingOperation(error=RuntimeError("upstream down"))
+        with pytest.raises(RuntimeError):
+            await self.manager.execute("pubmed.sync", "k1", {}, failing)
+
+        operation = CountingOperation()
+        _, replayed = await self.manager.execute("pubmed.sync", "k1", {}, operation)
+
+        assert operation.calls == 1
+        assert not replayed
+
+    @pytest.mark.asyncio
+    async def test_failed_responses_are_not_replayed(self):
+        """Test a response flagged as a failure is returned but not stored."""
+        failed = CountingOperation(response={"ok": True, "result": "Error: down"})
+        response, replayed = await self.manager.execute(
+            "pubmed.sync",
+            "k1",
+            {},
+            failed,
+            is_failure=lambda body: body["result"].startswith("Error"),
+        )
+
+        assert response["result"] == "Error: down"
+        assert not replayed
+        assert await self.store.get("pubmed.sync", "k1") is None
+
+        operation = CountingOperation()
+        _, replayed = await self.manager.execute("pubmed.sync", "k1", {}, operation)
+        assert operation.calls == 1
+        assert not replayed
+
+    @pytest.mark.asyncio
+    async def test_waits_for_other_replica_then_times_out(self):
+        """Test a claim held elsewhere is waited on, then reported in progress."""
+        await self.store.claim("pubmed.sync", "k1", params_fingerprint({}), 60)
+        self.manager.wait_timeout_seconds = 0.05
+        operation = CountingOperation()
+
+        with pytest.raises(IdempotencyInProgressError):
+            await self.manager.execute("pubmed.sync", "k1", {}, operation)
+
+        assert operation.calls == 0
+
+    @pytest.mark.asyncio
+    async def test_waits_for_other_replica_response(self):
+        """Test a response completed elsewhere during the wait is replayed."""
+        await self.store.claim("pubmed.sync", "k1", params_fingerprint({}), 60)
+
+        async def finish_elsewhere():
+            await asyncio.sleep(0.03)
+            await self.store.complete("pubmed.sync", "k1", {"result": "remote"}, 60)
+
+        operation = CountingOperation()
+        (response, replayed), _ = await asyncio.gather(
+            self.manager.execute("pubmed.sync", "k1", {}, operation),
+            finish_elsewhere(),
+        )
+
+        assert response == {"result": "remote"}
+        assert replayed
+        assert operation.calls == 0
+
+
+class TestMemoryIdempotencyStore:
+    """Test the in-process store."""
+
+    @pytest.mark.asyncio
+    async def test_entries_expire(self):
+        """Test entries are dropped after their TTL."""
+        store = MemoryIdempotencyStore()
+        await store.claim("t", "k", "h", 0)
+
+        assert await store.get("t", "k") is None
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self):
+        """Test the store is bounded."""
+        store = MemoryIdempotencyStore(max_entries=2)
+        for key in ("a", "b", "c"):
+            await store.claim("t", key, "h", 60)
+
+        assert await store.get("t", "a") is None
+        assert await store.get("t", "c") is not None
+
+
+class TestSQLAlchemyIdempotencyStore:
+    """Test SQL issued by the shared store."""
+
+    @staticmethod
+    def _session(result=None):
+        session = MagicMock()
+        session.execute = AsyncMock(return_value=result or MagicMock())
+        session.commit = AsyncMock()
+        session.__aenter__ = AsyncMock(return_value=session)
+        session.__aexit__ = AsyncMock(return_value=None)
+        return session
+
+    @pytest.mark.asyncio
+    async def test_claim_only_takes_over_expired_rows(self):
+        """Test claims insert or replace only expired rows."""
+        result = MagicMock()
+        result.first.return_value = ("pubmed.sync",)
+        session = self._session(result)
+        store = SQLAlchemyIdempotencyStore(lambda: session)
+
+        assert await store.claim("pubmed.sync", "k1", "hash", 60)
+
+        sql = str(
+            session.execute.await_args.args[0].compile(dialect=postgresql.dialect())
+        )
+        assert "ON CONFLICT (tool_name, idempotency_key) DO UPDATE" in sql
+        assert "WHERE idempotency_keys.expires_at <=" in sql
+        session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_claim_conflict_returns_false(self):
+        """Test an unexpired row held by another replica is not claimed."""
+        result = MagicMock()
+        result.first.return_value = None
+        store = SQLAlchemyIdempotencyStore(lambda: self._session(result))
+
+        assert not await store.claim("pubmed.sync", "k1", "hash", 60)
+
+    @pytest.mark.asyncio
+    async def test_get_maps_record(self):
+        """Test stored rows are returned as StoredResponse."""
+        record = MagicMock(params_hash="hash", status=COMPLETED, response={"a": 1})
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = record
+        store = SQLAlchemyIdempotencyStore(lambda: self._session(result))
+
+        stored = await store.get("pubmed.sync", "k1")
+
+        assert stored.is_completed
+        assert stored.response == {"a": 1}
+
+
+class TestInvokeIdempotency:
+    """Test /v1/mcp/invoke honors idempotency_key."""
+
+    def setup_method(self):
+        self.calls = 0
+
+        def sync_tool(name: str, arguments: dict):
+            self.calls += 1
+            return {"synced": self.calls}
+
+        def failing_tool(name: str, arguments: dict):
+            self.calls += 1
+            return [TextContent(type="text", text="Error syncing documents: down")]
+
+        registry = ToolRegistry()
+        registry.register("pubmed.sync", sync_tool)
+        registry.register("pubmed.sync_incremental", failing_tool)
+        self.client = TestClient(
+            create_app(
+                registry=registry,
+                idempotency=IdempotencyManager(MemoryIdempotencyStore()),
+            )
+        )
+
+    def test_retry_replays_response(self):
+        """Test a retried request is replayed without re-running the tool."""
+        payload = {
+            "tool": "pubmed.sync",
+            "params": {"query": "x"},
+            "idempotency_key": "retry-1",
+        }
+
+        first = self.client.post("/v1/mcp/invoke", json=payload)
+        second = self.client.post("/v1/mcp/invoke", json=payload)
+
+        assert self.calls == 1
+        assert first.json() == second.json()
+        assert first.headers["Idempotent-Replayed"] == "false"
+        assert second.headers["Idempotent-Replayed"] == "true"
+
+    def test_requests_without_key_always_execute(self):
+        """Test requests without a key are unaffected."""
+        payload = {"tool": "pubmed.sync", "params": {"query": "x"}}
+
+        self.client.post("/v1/mcp/invoke", json=payload)
+        self.client.post("/v1/mcp/invoke", json=payload)
+
+        assert self.calls == 2
+
+    def test_key_reuse_with_different_params_returns_422(self):
+        """Test reusing a key for different parameters is rejected."""
+        self.client.post(
+            "/v1/mcp/invoke",
+            json={"tool": "pubmed.sync", "params": {"q": 1}, "idempotency_key": "k"},
+        )
+        response = self.client.post(
+            "/v1/mcp/invoke",
+            json={"tool": "pubmed.sync", "params": {"q": 2}, "idempotency_key": "k"},
+        )
+
+        assert response.status_code == 422
+        assert response.json()["detail"]["error_code"] == "IDEMPOTENCY_KEY_REUSED"
+        assert self.calls == 1
+
+    def test_error_results_are_not_replayed(self):
+        """Test a tool that reports an error in its result runs again on retry."""
+        payload = {
+            "tool": "pubmed.sync_incremental",
+            "params": {"query": "x"},
+            "idempotency_key": "retry-err",
+        }
+
+        first = self.client.post("/v1/mcp/invoke", json=payload)
+        second = self.client.post("/v1/mcp/invoke", json=payload)
+
+        assert self.calls == 2
+        assert first.headers["Idempotent-Replayed"] == "false"
+        assert second.headers["Idempotent-Replayed"] == "false"
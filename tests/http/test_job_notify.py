@@ -0,0 +1,118 @@
+"""Tests for installing the process-wide job notifier."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from bio_mcp.http import lifecycle
+from bio_mcp.http.jobs.notify import (
+    InProcessJobNotifier,
+    PostgresJobNotifier,
+    get_job_notifier,
+    set_job_notifier,
+    start_job_notifier,
+    stop_job_notifier,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_notifier():
+    set_job_notifier(None)
+    yield
+    set_job_notifier(None)
+
+
+class TestStartJobNotifier:
+    """Choosing the notifier from the job database URL."""
+
+    @pytest.mark.asyncio
+    async def test_sqlite_keeps_in_process_notifier(self):
+        notifier = await start_job_notifier("sqlite:///:memory:")
+
+        assert type(notifier) is InProcessJobNotifier
+        assert get_job_notifier() is notifier
+
+    @pytest.mark.asyncio
+    async def test_postgres_installs_listen_notify(self):
+        woken = []
+        get_job_notifier().add_listener(woken.append)
+
+        with patch.object(PostgresJobNotifier, "start", AsyncMock()) as start:
+            notifier = await start_job_notifier(
+                "postgresql+asyncpg://bio:bio@db:5432/bio_mcp"
+            )
+
+        start.assert_awaited_once()
+        assert isinstance(notifier, PostgresJobNotifier)
+        assert notifier.dsn == "postgresql://bio:bio@db:5432/bio_mcp"
+        assert get_job_notifier() is notifier
+
+        # Listeners registered before startup move to the new notifier
+        await notifier.notify("job-1")
+        assert woken == ["job-1"]
+
+    @pytest.mark.asyncio
+    async def test_unreachable_postgres_falls_back_to_local_wakeups(self):
+        woken = []
+
+        with patch.object(
+            PostgresJobNotifier, "start", AsyncMock(side_effect=OSError("refused"))
+        ):
+            notifier = await start_job_notifier("postgresql://db/bio_mcp")
+        notifier.add_listener(woken.append)
+        await notifier.notify("job-1")
+
+        assert woken == ["job-1"]
+
+    @pytest.mark.asyncio
+    async def test_lifecycle_starts_and_stops_notifier(self):
+        with (
+            patch.object(lifecycle.config, "database_url", "postgresql://db/bio_mcp"),
+            patch.object(PostgresJobNotifier, "start", AsyncMock()),
+            patch.object(PostgresJobNotifier, "close", AsyncMock()) as close,
+        ):
+            await lifecycle.startup()
+            assert isinstance(get_job_notifier(), PostgresJobNotifier)
+
+            await lifecycle.shutdown()
+            close.assert_awaited_once()
+
+        assert type(get_job_notifier()) is InProcessJobNotifier
+
+    @pytest.mark.asyncio
+    async def test_stop_without_notifier_is_noop(self):
+        await stop_job_notifier()
+
+
+class _SingleQueryConnection:
+    """Fake asyncpg connection that, like asyncpg, runs one query at a time."""
+
+    def __init__(self):
+        self.busy = False
+        self.sent = []
+
+    async def execute(self, query, *args):
+        if self.busy:
+            raise RuntimeError("another operation is in progress")
+        self.busy = True
+        try:
+            await asyncio.sleep(0.01)
+            self.sent.append(args)
+        finally:
+            self.busy = False
+
+
+class TestPostgresJobNotifier:
+    """Publishing job notifications on the listening connection."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_notifications_take_turns(self):
+        notifier = PostgresJobNotifier("postgresql://db/bio_mcp")
+        notifier._connection = _SingleQueryConnection()
+
+        await asyncio.gather(*(notifier.notify(f"job-{i}") for i in range(5)))
+
+        assert sorted(job_id for _, job_id in notifier._connection.sent) == [
+            f"job-{i}" for i in range(5)
+        ]
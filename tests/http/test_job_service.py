@@ -1,12 +1,18 @@
 """Tests for job service business logic layer."""
 
+import asyncio
 import uuid
 from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from sqlalchemy.dialects import postgresql
 
 from bio_mcp.http.jobs.models import JobData, JobStatus
+from bio_mcp.http.jobs.notify import InProcessJobNotifier
 from bio_mcp.http.jobs.service import JobNotFoundError, JobService
+from bio_mcp.http.jobs.storage import SQLAlchemyJobRepository
+from bio_mcp.shared.models.database_models import JobRecord
 
 
 class MockJobRepository:
@@ -291,3 +297,72 @@ class TestJobService:
         remaining_jobs = await job_service.list_jobs()
         assert len(remaining_jobs) == 1
         assert remaining_jobs[0].id == current_job_id
+
+    @pytest.mark.asyncio
+    async def test_create_job_notifies_workers(self, mock_repo):
+        """Test job creation wakes workers through the notifier."""
+        notifier = InProcessJobNotifier()
+        woken = []
+        notifier.add_listener(woken.append)
+        job_service = JobService(repository=mock_repo, notifier=notifier)
+
+        job_id = await job_service.create_job("test-tool", {}, "trace-123")
+
+        assert woken == [job_id]
+
+    @pytest.mark.asyncio
+    async def test_create_job_survives_notify_failure(self, mock_repo):
+        """Test concurrent creates return saved jobs even if wake-ups fail."""
+        notifier = MagicMock()
+        notifier.notify = AsyncMock(side_effect=RuntimeError("connection lost"))
+        job_service = JobService(repository=mock_repo, notifier=notifier)
+
+        job_ids = await asyncio.gather(
+            *(job_service.create_job("test-tool", {}, f"trace-{i}") for i in range(3))
+        )
+
+        assert sorted(job_ids) == sorted(mock_repo.jobs)
+        assert notifier.notify.await_count == 3
+
+
+class TestSQLAlchemyJobRepositoryClaims:
+    """Test SQL issued for job leasing."""
+
+    @staticmethod
+    def _compile(stmt) -> str:
+        return str(stmt.compile(dialect=postgresql.dialect()))
+
+    @pytest.mark.asyncio
+    async def test_claim_jobs_uses_skip_locked(self):
+        """Test claims lock candidate rows with SKIP LOCKED in one UPDATE."""
+        record = JobRecord.from_job_data(JobData.create_new("ping", {}, "trace-1"))
+        session = MagicMock()
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = [record]
+        session.execute = AsyncMock(return_value=result)
+        session.commit = AsyncMock()
+
+        jobs = await SQLAlchemyJobRepository(session).claim_jobs(5, "worker-1", 30)
+
+        sql = self._compile(session.execute.await_args.args[0])
+        assert sql.startswith("UPDATE jobs SET")
+        assert "FOR UPDATE SKIP LOCKED" in sql
+        assert "lease_expires_at <" in sql  # Reclaims abandoned leases
+        assert "RETURNING" in sql
+        session.commit.assert_awaited_once()
+        assert [job.id for job in jobs] == [str(record.id)]
+
+    @pytest.mark.asyncio
+    async def test_extend_leases_scoped_to_worker(self):
+        """Test heartbeats only extend leases the worker still holds."""
+        session = MagicMock()
+        session.execute = AsyncMock(return_value=MagicMock(rowcount=1))
+        session.commit = AsyncMock()
+        repository = SQLAlchemyJobRepository(session)
+
+        extended = await repository.extend_leases([str(uuid.uuid4())], "worker-1", 30)
+
+        sql = self._compile(session.execute.await_args.args[0])
+        assert "jobs.worker_id = " in sql
+        assert extended == 1
+        assert await repository.extend_leases([], "worker-1", 30) == 0
@@ -5,6 +5,7 @@ import asyncio
 import pytest
 
 from bio_mcp.http.jobs.models import JobData
+from bio_mcp.http.jobs.notify import InProcessJobNotifier
 from bio_mcp.http.jobs.worker import JobWorker
 
 
@@ -48,18 +49,33 @@ class MockJobService:
         self.jobs = {}
         self.pending_jobs = []
         self.status_updates = []  # Track status changes
+        self.claims = []  # Track (worker_id, job_id) leases
+        self.heartbeats = []  # Track lease renewals
 
     def add_pending_job(self, job_data: JobData):
         """Add job to pending queue."""
         self.jobs[job_data.id] = job_data
         self.pending_jobs.append(job_data)
 
-    async def get_pending_jobs(self, limit: int = 10) -> list[JobData]:
-        """Get pending jobs for processing."""
+    async def claim_jobs(
+        self, limit: int, worker_id: str, lease_seconds: float = 60.0
+    ) -> list[JobData]:
+        """Lease pending jobs to a worker."""
         jobs = self.pending_jobs[:limit]
         self.pending_jobs = self.pending_jobs[limit:]
+        for job in jobs:
+            job.start_execution()
+            job.worker_id = worker_id
+            self.claims.append((worker_id, job.id))
         return jobs
 
+    async def heartbeat(
+        self, job_ids: list[str], worker_id: str, lease_seconds: float = 60.0
+    ) -> int:
+        """Record lease renewals."""
+        self.heartbeats.append((worker_id, sorted(job_ids)))
+        return len(job_ids)
+
     async def start_job(self, job_id: str) -> None:
         """Mark job as started."""
         if job_id in self.jobs:
@@ -308,3 +324,69 @@ class TestJobWorker:
         assert len(completed) == 1
         assert len(failed) == 1
         assert failed[0][2] == "Critical error"  # Error message
+
+    @pytest.mark.asyncio
+    async def test_claimed_jobs_not_restarted(
+        self, job_worker, mock_tool_executor, mock_job_service
+    ):
+        """Test jobs leased by claim_jobs skip the start_job transition."""
+        mock_tool_executor.set_result("ping", {"status": "pong"}, delay=0.01)
+        mock_job_service.add_pending_job(JobData.create_new("ping", {}, "trace-1"))
+
+        claimed = await mock_job_service.claim_jobs(1, job_worker.worker_id)
+        await job_worker.execute_job(claimed[0])
+
+        assert [u[0] for u in mock_job_service.status_updates] == ["complete"]
+
+    @pytest.mark.asyncio
+    async def test_notification_starts_job_without_polling(
+        self, mock_tool_executor, mock_job_service
+    ):
+        """Test a job notification wakes the pool before the poll interval."""
+        mock_tool_executor.set_result("fast-tool", {"ok": True}, delay=0.01)
+        notifier = InProcessJobNotifier()
+        worker = JobWorker(
+            tool_executor=mock_tool_executor,
+            job_service=mock_job_service,
+            poll_interval_seconds=30.0,
+            notifier=notifier,
+        )
+
+        worker_task = asyncio.create_task(worker.start_worker_pool())
+        await asyncio.sleep(0.05)
+
+        job_data = JobData.create_new("fast-tool", {}, "trace-1")
+        mock_job_service.add_pending_job(job_data)
+        await notifier.notify(job_data.id)
+        await asyncio.sleep(0.1)
+
+        await worker.stop_worker_pool()
+        await asyncio.wait_for(worker_task, timeout=1.0)
+
+        assert ("complete", job_data.id, {"ok": True}) in (
+            mock_job_service.status_updates
+        )
+        assert mock_job_service.claims == [(worker.worker_id, job_data.id)]
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_renews_running_leases(
+        self, mock_tool_executor, mock_job_service
+    ):
+        """Test leases of long-running jobs are renewed by heartbeats."""
+        mock_tool_executor.set_result("slow-tool", {"done": True}, delay=0.3)
+        job_data = JobData.create_new("slow-tool", {}, "trace-1")
+        mock_job_service.add_pending_job(job_data)
+        worker = JobWorker(
+            tool_executor=mock_tool_executor,
+            job_service=mock_job_service,
+            poll_interval_seconds=0.05,
+            worker_id="worker-a",
+            lease_seconds=0.3,
+        )
+
+        worker_task = asyncio.create_task(worker.start_worker_pool())
+        await asyncio.sleep(0.25)
+        await worker.stop_worker_pool()
+        await asyncio.wait_for(worker_task, timeout=1.0)
+
+        assert ("worker-a", [job_data.id]) in mock_job_service.heartbeats
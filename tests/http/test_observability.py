@@ -279,6 +279,41 @@ class TestMetricsExport:
         )
         assert total_labels <= 100
 
+    def test_cardinality_cap_counts_series_not_samples(self):
+        """Test repeated samples for known series are never dropped."""
+        from bio_mcp.http.observability.metrics import MetricsCollector
+
+        collector = MetricsCollector(max_labels=2)
+
+        for _ in range(10):
+            collector.increment_request("rag.search", "success")
+        collector.record_latency("rag.search", 12.0)
+        collector.increment_request("pubmed.sync", "success")
+
+        metrics = collector.get_metrics()
+        assert metrics["bio_mcp_requests_total"]["rag.search"]["success"] == 10
+        assert "pubmed.sync" not in metrics["bio_mcp_requests_total"]
+        assert collector.label_count == 2
+        assert collector.dropped_samples == 1
+
+    def test_prometheus_latency_buckets(self):
+        """Test latency is exported as cumulative le buckets."""
+        from bio_mcp.http.observability.metrics import (
+            MetricsCollector,
+            PrometheusExporter,
+        )
+
+        collector = MetricsCollector()
+        for latency in [4, 40, 400]:
+            collector.record_latency('odd"tool', latency)
+
+        text = PrometheusExporter(collector, latency_bounds_ms=(5, 50)).export()
+
+        assert 'bio_mcp_latency_ms_bucket{tool="odd\\"tool",le="5"} 1' in text
+        assert 'bio_mcp_latency_ms_bucket{tool="odd\\"tool",le="50"} 2' in text
+        assert 'bio_mcp_latency_ms_bucket{tool="odd\\"tool",le="+Inf"} 3' in text
+        assert 'bio_mcp_latency_ms_count{tool="odd\\"tool"} 3' in text
+
 
 class TestObservabilityIntegration:
     """Test complete observability pipeline."""
@@ -328,17 +363,35 @@ class TestObservabilityIntegration:
         assert metrics["bio_mcp_requests_total"]["failing_tool"]["error"] == 1
         assert metrics["bio_mcp_errors_total"]["failing_tool"]["ValueError"] == 1
 
-    # TODO: Add metrics endpoint test when HTTP app is implemented
-    # @pytest.mark.asyncio
-    # async def test_metrics_endpoint(self, test_client):
-    #     """Test /metrics endpoint returns valid Prometheus metrics."""
-    #     response = await test_client.get("/metrics")
-    #
-    #     assert response.status_code == 200
-    #     assert response.headers["content-type"] == "text/plain; version=0.0.4"
-    #
-    #     # Parse Prometheus format
-    #     text = response.text
-    #     assert "# HELP" in text
-    #     assert "# TYPE" in text
-    #     assert "bio_mcp_requests_total" in text
+    def test_metrics_endpoint(self):
+        """Test /metrics returns Prometheus series for invoked tools."""
+        from fastapi.testclient import TestClient
+
+        from bio_mcp.http.app import create_app
+        from bio_mcp.http.registry import ToolRegistry
+
+        def metrics_probe_tool(name: str, arguments: dict):
+            if arguments.get("fail"):
+                raise ValueError("Probe failure")
+            return {"ok": True}
+
+        registry = ToolRegistry()
+        registry.register("metrics.probe", metrics_probe_tool)
+        client = TestClient(create_app(registry=registry))
+
+        client.post("/v1/mcp/invoke", json={"tool": "metrics.probe", "params": {}})
+        client.post(
+            "/v1/mcp/invoke",
+            json={"tool": "metrics.probe", "params": {"fail": True}},
+        )
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        text = response.text
+        assert 'bio_mcp_requests_total{tool="metrics.probe",status="success"} 1' in text
+        assert 'bio_mcp_requests_total{tool="metrics.probe",status="error"} 1' in text
+        assert 'bio_mcp_errors_total{tool="metrics.probe",error_code=' in text
+        assert 'bio_mcp_latency_ms_bucket{tool="metrics.probe",le="+Inf"} 2' in text
+        assert 'bio_mcp_latency_ms_count{tool="metrics.probe"} 2' in text
+        assert 'bio_mcp_inflight_requests{tool="metrics.probe"} 0' in text
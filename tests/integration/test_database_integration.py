@@ -518,6 +518,25 @@ class TestDatabaseManagerDocuments:
         assert await manager.document_exists(created_doc.pmid) is True
         assert await manager.document_exists(non_existent_pmid) is False
 
+    @pytest.mark.asyncio
+    async def test_existing_pmids_and_bulk_upsert(self, database_manager):
+        """Test set-based existence check and ON CONFLICT bulk upsert."""
+        manager = database_manager
+
+        docs_data = [BiomedicDataGenerator.generate_document_data() for _ in range(5)]
+        await manager.bulk_upsert_documents(docs_data[:3])
+        pmids = [doc["pmid"] for doc in docs_data]
+
+        assert await manager.existing_pmids(pmids) == set(pmids[:3])
+
+        updated = {**docs_data[0], "title": "Updated title"}
+        written = await manager.bulk_upsert_documents([updated, *docs_data[3:]])
+
+        assert written == 3
+        assert await manager.existing_pmids(pmids) == set(pmids)
+        stored = await manager.get_document_by_pmid(updated["pmid"])
+        assert stored.title == "Updated title"
+
     @pytest.mark.asyncio
     async def test_list_documents_empty(self, database_manager):
         """Test listing documents when database is empty."""
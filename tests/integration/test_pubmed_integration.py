@@ -182,17 +182,17 @@ class TestPubMedClientConfiguration:
     @pytest.mark.asyncio
     async def test_rate_limiter_timing(self):
         """Test rate limiter without making actual API calls."""
-        from bio_mcp.sources.pubmed.client import RateLimiter
+        from bio_mcp.shared.core.rate_governor import UpstreamBudget
 
         # Test rate limiter with 2 requests per second
-        rate_limiter = RateLimiter(2)
+        rate_limiter = UpstreamBudget("ncbi-eutils", 2)
 
         start_time = asyncio.get_event_loop().time()
 
         # Simulate 3 "requests"
-        await rate_limiter.wait_if_needed()  # First request - no wait
-        await rate_limiter.wait_if_needed()  # Second request - some wait
-        await rate_limiter.wait_if_needed()  # Third request - more wait
+        await rate_limiter.acquire()  # First request - no wait
+        await rate_limiter.acquire()  # Second request - some wait
+        await rate_limiter.acquire()  # Third request - more wait
 
         elapsed = asyncio.get_event_loop().time() - start_time
 
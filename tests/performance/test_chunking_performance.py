@@ -1,9 +1,26 @@
 import time
+from unittest.mock import patch
 
 import pytest
 
 from bio_mcp.models.document import Document
-from bio_mcp.services.chunking import AbstractChunker
+from bio_mcp.services.chunking import (
+    AbstractChunker,
+    ChunkingConfig,
+    FallbackTokenizer,
+    SectionDetector,
+)
+
+
+class CountingTokenizer(FallbackTokenizer):
+    """Fallback tokenizer that records every text it tokenizes."""
+
+    def __init__(self):
+        self.texts: list[str] = []
+
+    def count_tokens(self, text: str) -> int:
+        self.texts.append(text)
+        return super().count_tokens(text)
 
 
 class TestChunkingPerformance:
@@ -60,10 +77,39 @@ class TestChunkingPerformance:
         # Should generate UUID in under 0.1ms per chunk
         assert per_uuid_time < 0.0001
 
+    def test_sentences_tokenized_once(self, large_document):
+        """Windowing sizes sentences from one tokenization pass per section."""
+        tokenizer = CountingTokenizer()
+        chunker = AbstractChunker(ChunkingConfig(), tokenizer=tokenizer)
+
+        chunks = chunker.chunk_document(large_document)
+        n_sentences = len(
+            chunker.sentence_splitter.split_sentences(large_document.text)
+        )
+
+        assert len(chunks) > 1
+        # Section + each sentence once, then per window: its text and at most
+        # two expansion checks, plus the title-prefixed first chunk
+        assert len(tokenizer.texts) <= 2 + n_sentences + 3 * len(chunks)
+
+    def test_section_detection_once_per_document(self, large_document):
+        """Chunk IDs do not re-run section detection for every window."""
+        chunker = AbstractChunker(ChunkingConfig(), tokenizer=FallbackTokenizer())
+
+        with patch.object(
+            SectionDetector,
+            "detect_sections",
+            autospec=True,
+            side_effect=SectionDetector.detect_sections,
+        ) as detect:
+            chunks = chunker.chunk_document(large_document)
+
+        assert len(chunks) > 1
+        # Once on normalized text for sections, once on raw text for chunk IDs
+        assert detect.call_count == 2
+
     def test_section_detection_speed(self):
         """Test section detection performance."""
-        from bio_mcp.services.chunking import SectionDetector
-
         # Large structured abstract
         large_structured_text = (
             """
@@ -0,0 +1,71 @@
+"""
+Tests for set-based existence checks and bulk upserts in DatabaseManager.
+
+Uses in-memory SQLite so the ON CONFLICT path runs against a real engine.
+"""
+
+from datetime import date
+
+import pytest
+import pytest_asyncio
+
+from bio_mcp.shared.clients.database import DatabaseConfig, DatabaseManager
+from bio_mcp.shared.core.error_handling import ValidationError
+
+
+@pytest_asyncio.fixture
+async def manager():
+    manager = DatabaseManager(DatabaseConfig(url="sqlite+aiosqlite:///:memory:"))
+    await manager.initialize()
+    yield manager
+    await manager.close()
+
+
+class TestBulkDocumentOperations:
+    """Bulk existence and upsert operations."""
+
+    @pytest.mark.asyncio
+    async def test_existing_pmids_returns_stored_subset(self, manager):
+        await manager.bulk_upsert_documents(
+            [{"pmid": "100", "title": "A"}, {"pmid": "200", "title": "B"}]
+        )
+
+        assert await manager.existing_pmids(["100", "200", "300", "100"]) == {
+            "100",
+            "200",
+        }
+        assert await manager.existing_pmids([]) == set()
+
+    @pytest.mark.asyncio
+    async def test_bulk_upsert_inserts_and_updates(self, manager):
+        written = await manager.bulk_upsert_documents(
+            [
+                {
+                    "pmid": "100",
+                    "title": "Original",
+                    "authors": ["Smith J"],
+                    "publication_date": date(2024, 1, 15),
+                    "keywords": ["oncology"],
+                }
+            ]
+        )
+        original = await manager.get_document_by_pmid("100")
+
+        written += await manager.bulk_upsert_documents(
+            [
+                {"pmid": "100", "title": "Revised", "journal": "Nature"},
+                {"pmid": "200", "title": "New"},
+            ]
+        )
+        revised = await manager.get_document_by_pmid("100")
+
+        assert written == 3
+        assert revised.title == "Revised"
+        assert revised.journal == "Nature"
+        assert revised.created_at == original.created_at
+        assert await manager.document_exists("200")
+
+    @pytest.mark.asyncio
+    async def test_bulk_upsert_requires_title(self, manager):
+        with pytest.raises(ValidationError):
+            await manager.bulk_upsert_documents([{"pmid": "100", "title": ""}])
@@ -6,6 +6,7 @@ import pytest
 
 from bio_mcp.orchestrator.adapters.mcp_adapter import MCPToolAdapter
 from bio_mcp.orchestrator.config import OrchestratorConfig
+from bio_mcp.orchestrator.middleware.tool_cache import ToolResultCache
 
 
 class TestMCPToolAdapter:
@@ -80,3 +81,91 @@ class TestMCPToolAdapter:
         assert all(result.success for result in results)
         pubmed_tool.execute.assert_called_once()
         ctgov_tool.execute.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_cache_then_network_serves_repeat_calls(self):
+        """Test repeated calls are served from cache."""
+        adapter = MCPToolAdapter(OrchestratorConfig(), Mock())
+        mock_tool = Mock()
+        mock_tool.execute = AsyncMock(return_value={"results": [], "total": 0})
+        adapter._tools = {"pubmed.search": mock_tool}
+
+        first = await adapter.execute_tool("pubmed.search", {"term": "nsclc"})
+        second = await adapter.execute_tool("pubmed.search", {"term": " nsclc "})
+
+        assert not first.cache_hit
+        assert second.cache_hit
+        assert second.data == first.data
+        mock_tool.execute.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_cache_shared_between_adapters(self):
+        """Test adapters created by different nodes share the default cache."""
+        config = OrchestratorConfig()
+        mock_tool = Mock()
+        mock_tool.execute = AsyncMock(return_value={"results": []})
+
+        first = MCPToolAdapter(config, Mock())
+        first._tools = {"rag.search": mock_tool}
+        await first.execute_tool("rag.search", {"query": "egfr"})
+
+        second = MCPToolAdapter(config, Mock())
+        result = await second.execute_tool("rag.search", {"query": "egfr"})
+
+        assert second.cache is first.cache
+        assert result.cache_hit
+
+    @pytest.mark.asyncio
+    async def test_cache_only_miss(self):
+        """Test cache_only never executes the tool."""
+        adapter = MCPToolAdapter(OrchestratorConfig(), Mock(), cache=ToolResultCache())
+        mock_tool = Mock()
+        mock_tool.execute = AsyncMock()
+        adapter._tools = {"pubmed.search": mock_tool}
+
+        result = await adapter.execute_tool(
+            "pubmed.search", {"term": "x"}, cache_policy="cache_only"
+        )
+
+        assert not result.success
+        assert result.error_code == "CACHE_MISS"
+        mock_tool.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_network_only_bypasses_and_refreshes_cache(self):
+        """Test network_only always executes but updates the cache."""
+        cache = ToolResultCache()
+        await cache.set("pubmed.search", {"term": "x"}, {"total": 1})
+        adapter = MCPToolAdapter(OrchestratorConfig(), Mock(), cache=cache)
+        mock_tool = Mock()
+        mock_tool.execute = AsyncMock(return_value={"total": 2})
+        adapter._tools = {"pubmed.search": mock_tool}
+
+        result = await adapter.execute_tool(
+            "pubmed.search", {"term": "x"}, cache_policy="network_only"
+        )
+
+        assert not result.cache_hit
+        assert result.data == {"total": 2}
+        assert await cache.get("pubmed.search", {"term": "x"}) == (True, {"total": 2})
+
+    @pytest.mark.asyncio
+    async def test_failures_are_not_cached(self):
+        """Test tool errors are retried on the next call."""
+        adapter = MCPToolAdapter(OrchestratorConfig(), Mock(), cache=ToolResultCache())
+        mock_tool = Mock()
+        mock_tool.execute = AsyncMock(side_effect=[RuntimeError("503"), {"total": 1}])
+        adapter._tools = {"pubmed.search": mock_tool}
+
+        failed = await adapter.execute_tool("pubmed.search", {"term": "x"})
+        retried = await adapter.execute_tool("pubmed.search", {"term": "x"})
+
+        assert failed.error_code == "EXECUTION_ERROR"
+        assert retried.success and not retried.cache_hit
+
+    @pytest.mark.asyncio
+    async def test_cache_disabled(self):
+        """Test cache_enabled=False leaves the adapter uncached."""
+        adapter = MCPToolAdapter(OrchestratorConfig(cache_enabled=False), Mock())
+
+        assert adapter.cache is None
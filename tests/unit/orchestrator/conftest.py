@@ -0,0 +1,13 @@
+"""Shared fixtures for orchestrator unit tests."""
+
+import pytest
+
+from bio_mcp.orchestrator.middleware.tool_cache import reset_tool_cache
+
+
+@pytest.fixture(autouse=True)
+def isolated_tool_cache():
+    """Give each test a fresh process-wide tool-result cache."""
+    reset_tool_cache()
+    yield
+    reset_tool_cache()
@@ -0,0 +1,210 @@
+"""Test tool-result cache."""
+
+import asyncio
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+
+from bio_mcp.orchestrator.config import OrchestratorConfig
+from bio_mcp.orchestrator.middleware.tool_cache import (
+    LRUTTLCache,
+    SQLiteCacheTier,
+    ToolResultCache,
+    get_tool_cache,
+    make_cache_key,
+)
+
+
+class TestCacheKey:
+    """Test cache key canonicalization."""
+
+    def test_equivalent_args_share_key(self):
+        """Test key ignores arg order, None values and whitespace."""
+        key1 = make_cache_key("PubMed.Search ", {"term": "EGFR  NSCLC", "limit": 10})
+        key2 = make_cache_key(
+            "pubmed.search", {"limit": 10, "term": " EGFR NSCLC", "offset": None}
+        )
+
+        assert key1 == key2
+        assert key1.startswith("pubmed.search:")
+
+    def test_different_args_differ(self):
+        """Test distinct args produce distinct keys."""
+        assert make_cache_key("pubmed.search", {"term": "a"}) != make_cache_key(
+            "pubmed.search", {"term": "b"}
+        )
+        assert make_cache_key("pubmed.search", {"ids": ["1", "2"]}) != make_cache_key(
+            "pubmed.search", {"ids": ["2", "1"]}
+        )
+
+
+class TestLRUTTLCache:
+    """Test in-process LRU+TTL tier."""
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self):
+        """Test size-bounded eviction keeps recently read entries."""
+        cache = LRUTTLCache(max_entries=2)
+        await cache.set("a", 1)
+        await cache.set("b", 2)
+        await cache.get("a")
+        await cache.set("c", 3)
+
+        assert await cache.get("a") == 1
+        assert await cache.get("b") is None
+        assert await cache.get("c") == 3
+        assert cache.evictions == 1
+
+    @pytest.mark.asyncio
+    async def test_entries_expire(self):
+        """Test entries are dropped after their TTL."""
+        cache = LRUTTLCache()
+        with patch("bio_mcp.orchestrator.middleware.tool_cache.time") as mock_time:
+            mock_time.monotonic.return_value = 100.0
+            await cache.set("a", 1, ttl=10)
+
+            mock_time.monotonic.return_value = 109.0
+            assert await cache.get("a") == 1
+
+            mock_time.monotonic.return_value = 111.0
+            assert await cache.get("a") is None
+            assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_returns_copies(self):
+        """Test callers cannot mutate cached values."""
+        cache = LRUTTLCache()
+        await cache.set("a", {"results": [1]})
+
+        value = await cache.get("a")
+        value["results"].append(2)
+
+        assert await cache.get("a") == {"results": [1]}
+
+
+class TestSQLiteCacheTier:
+    """Test shared SQLite tier."""
+
+    @pytest.mark.asyncio
+    async def test_shared_between_instances(self, tmp_path):
+        """Test two tiers on the same file see each other's writes."""
+        db_path = str(tmp_path / "cache.db")
+        writer = SQLiteCacheTier(db_path)
+        reader = SQLiteCacheTier(db_path)
+
+        await writer.set("pubmed.search:abc", {"total": 1}, ttl=60)
+
+        assert await reader.get("pubmed.search:abc") == {"total": 1}
+        writer.close()
+        reader.close()
+
+    @pytest.mark.asyncio
+    async def test_prune_bounds_size(self, tmp_path):
+        """Test pruning drops expired and oldest rows."""
+        tier = SQLiteCacheTier(str(tmp_path / "cache.db"), max_entries=2)
+        await tier.set("t:expired", 0, ttl=-1)
+        for i in range(3):
+            await tier.set(f"t:{i}", i, ttl=60)
+
+        tier.prune()
+
+        assert len(tier) == 2
+        assert await tier.get("t:0") is None
+        assert await tier.get("t:2") == 2
+        tier.close()
+
+    @pytest.mark.asyncio
+    async def test_runs_off_event_loop(self, tmp_path):
+        """Test SQLite work runs in worker threads, safely in parallel."""
+        tier = SQLiteCacheTier(str(tmp_path / "cache.db"))
+        loop_thread = threading.get_ident()
+        threads = set()
+        execute = tier._execute
+
+        def record_execute(*args):
+            threads.add(threading.get_ident())
+            execute(*args)
+
+        with patch.object(tier, "_execute", record_execute):
+            await asyncio.gather(
+                *(tier.set(f"t:{i}", i, ttl=60) for i in range(20)),
+                *(tier.delete(f"t:{i}") for i in range(10)),
+            )
+
+        assert loop_thread not in threads
+        assert len(tier) == 10
+        assert await asyncio.gather(*(tier.get(f"t:{i}") for i in range(20))) == [
+            None
+        ] * 10 + list(range(10, 20))
+        tier.close()
+
+
+class TestToolResultCache:
+    """Test two-tier tool-result cache."""
+
+    @pytest.mark.asyncio
+    async def test_hit_miss_metrics(self):
+        """Test hits and misses are counted per tool and reported."""
+        metrics = Mock()
+        cache = ToolResultCache(metrics=metrics)
+
+        assert await cache.get("pubmed.search", {"term": "x"}) == (False, None)
+        await cache.set("pubmed.search", {"term": "x"}, {"total": 1})
+        assert await cache.get("pubmed.search", {"term": "x"}) == (True, {"total": 1})
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+        assert stats["by_tool"]["pubmed.search"] == {"hits": 1, "misses": 1}
+        metrics.record_cache_hit.assert_called_with("pubmed.search", True)
+
+    @pytest.mark.asyncio
+    async def test_per_tool_ttl(self):
+        """Test per-tool TTL overrides, with 0 disabling caching."""
+        cache = ToolResultCache(
+            default_ttl=60, tool_ttls={"pubmed.get": 600, "rag.search": 0}
+        )
+
+        assert cache.ttl_for("PubMed.Get") == 600
+        assert cache.ttl_for("clinicaltrials.search") == 60
+
+        await cache.set("rag.search", {"query": "x"}, {"results": []})
+        assert await cache.get("rag.search", {"query": "x"}) == (False, None)
+
+    @pytest.mark.asyncio
+    async def test_shared_tier_promotes_to_local(self, tmp_path):
+        """Test a shared-tier hit is copied into the local tier."""
+        config = OrchestratorConfig(cache_db_path=str(tmp_path / "cache.db"))
+        first = ToolResultCache.from_config(config)
+        await first.set("clinicaltrials.search", {"condition": "nsclc"}, {"n": 3})
+
+        second = ToolResultCache.from_config(config)
+        hit, value = await second.get("clinicaltrials.search", {"condition": "nsclc"})
+
+        assert hit and value == {"n": 3}
+        assert second.stats()["shared_hits"] == 1
+        assert len(second.local) == 1
+        first.close()
+        second.close()
+
+
+class TestGetToolCache:
+    """Test the process-wide cache."""
+
+    def test_same_settings_share_cache(self):
+        """Test configs with the same cache settings get the same cache."""
+        cache = get_tool_cache(OrchestratorConfig(cache_ttl=60))
+
+        other = OrchestratorConfig(cache_ttl=60, node_timeout_ms=500)
+
+        assert get_tool_cache(other) is cache
+        assert get_tool_cache() is cache
+
+    def test_rejects_different_settings(self):
+        """Test a config with other cache settings is not silently ignored."""
+        get_tool_cache(OrchestratorConfig(cache_ttl=60))
+
+        with pytest.raises(ValueError, match="reset_tool_cache"):
+            get_tool_cache(OrchestratorConfig(cache_ttl=120))
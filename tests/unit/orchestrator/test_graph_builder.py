@@ -0,0 +1,142 @@
+"""Test orchestrator graph routing and parallel fan-out."""
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+
+from bio_mcp.orchestrator.config import OrchestratorConfig
+from bio_mcp.orchestrator.graph_builder import build_orchestrator_graph
+from bio_mcp.orchestrator.interfaces import NodeRegistration
+from bio_mcp.orchestrator.nodes.router_node import RouterNode, routing_function
+from bio_mcp.orchestrator.registry import NodeRegistry
+from bio_mcp.orchestrator.types import merge_branch_lists
+
+TOOL_DELAY = 0.2
+
+
+def _parse_node(intent: str):
+    async def parse(state):
+        return {
+            "frame": {"intent": intent, "entities": {}, "filters": {}},
+            "intent_confidence": 0.9,
+            "node_path": state["node_path"] + ["llm_parse"],
+        }
+
+    return parse
+
+
+def _tool_node(name: str, result_key: str):
+    async def tool(state):
+        await asyncio.sleep(TOOL_DELAY)
+        return {
+            result_key: {"results": [name]},
+            "tool_calls_made": state["tool_calls_made"] + [name],
+            "cache_hits": {**state["cache_hits"], name: False},
+            "latencies": {**state["latencies"], name: TOOL_DELAY * 1000},
+            "node_path": state["node_path"] + [name],
+        }
+
+    return tool
+
+
+async def _synthesizer(state):
+    sources = [
+        key
+        for key in ("pubmed_results", "ctgov_results", "rag_results")
+        if state.get(key)
+    ]
+    return {
+        "answer": ",".join(sources),
+        "node_path": state["node_path"] + ["synthesizer"],
+    }
+
+
+def _registry(intent: str) -> NodeRegistry:
+    registry = NodeRegistry()
+    nodes = {
+        "llm_parse": _parse_node(intent),
+        "router": RouterNode(OrchestratorConfig()),
+        "pubmed_search": _tool_node("pubmed_search", "pubmed_results"),
+        "ctgov_search": _tool_node("ctgov_search", "ctgov_results"),
+        "rag_search": _tool_node("rag_search", "rag_results"),
+        "synthesizer": _synthesizer,
+    }
+    for name, node in nodes.items():
+        registry.register(NodeRegistration(name, lambda config, node=node: node))
+    return registry
+
+
+async def _run(intent: str) -> tuple[dict, float]:
+    with (
+        patch("bio_mcp.orchestrator.graph_builder.ensure_registry_initialized"),
+        patch(
+            "bio_mcp.orchestrator.graph_builder.get_registry",
+            return_value=_registry(intent),
+        ),
+    ):
+        graph = build_orchestrator_graph(OrchestratorConfig()).compile()
+
+    start = time.perf_counter()
+    result = await graph.ainvoke(
+        {
+            "query": "q",
+            "config": {},
+            "tool_calls_made": [],
+            "cache_hits": {},
+            "latencies": {},
+            "errors": [],
+            "node_path": [],
+            "messages": [],
+        }
+    )
+    return result, time.perf_counter() - start
+
+
+class TestParallelRouting:
+    """Test multi-source intents fan out and join at the synthesizer."""
+
+    def test_routing_function_fans_out_multi_source_intents(self):
+        """Test multi-source intents return several targets."""
+        state = {"frame": {"intent": "trials_with_pubs"}, "intent_confidence": 0.9}
+
+        assert routing_function(state) == ["ctgov_search", "pubmed_search"]
+
+        state["frame"]["intent"] = "indication_phase_trials"
+        assert routing_function(state) == "ctgov_search"
+
+    @pytest.mark.asyncio
+    async def test_trials_with_pubs_runs_tools_concurrently(self):
+        """Test latency is the max of the branches, not the sum."""
+        result, elapsed = await _run("trials_with_pubs")
+
+        assert result["answer"] == "pubmed_results,ctgov_results"
+        assert sorted(result["tool_calls_made"]) == ["ctgov_search", "pubmed_search"]
+        assert set(result["latencies"]) >= {"ctgov_search", "pubmed_search"}
+        assert result["node_path"][:2] == ["llm_parse", "router"]
+        assert result["node_path"].count("synthesizer") == 1
+        assert elapsed < TOOL_DELAY * 1.75
+
+    @pytest.mark.asyncio
+    async def test_single_source_intent(self):
+        """Test single-source intents still take one branch."""
+        result, _ = await _run("recent_pubs_by_topic")
+
+        assert result["answer"] == "pubmed_results"
+        assert result["node_path"] == [
+            "llm_parse",
+            "router",
+            "pubmed_search",
+            "synthesizer",
+        ]
+
+
+class TestStateReducers:
+    """Test reducers used to merge parallel branch updates."""
+
+    def test_merge_branch_lists(self):
+        """Test sequential updates replace and parallel updates append."""
+        assert merge_branch_lists(["a"], ["a", "b"]) == ["a", "b"]
+        assert merge_branch_lists(["a", "b"], ["a", "c"]) == ["a", "b", "c"]
+        assert merge_branch_lists([], []) == []
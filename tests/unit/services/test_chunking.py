@@ -105,6 +105,20 @@ class TestSentenceSplitter:
             "p=0.001" in sentences[0] or "p = 0.001" in sentences[0]
         )  # Handle spacing
 
+    def test_batch_splitting_matches_single(self):
+        """Batch splitting returns the same sentences as per-text splitting."""
+        texts = [
+            "This is sentence one. This is sentence two.",
+            "Results improved by 12.5% vs. placebo. Safety was acceptable.",
+            "",
+        ]
+
+        splitter = SentenceSplitter()
+
+        assert splitter.split_sentences_batch(texts, batch_size=2) == [
+            splitter.split_sentences(text) for text in texts
+        ]
+
 
 class TestNumericSafetyExpander:
     """Test numeric safety expansion logic."""
@@ -301,6 +315,57 @@ Conclusions: Pembrolizumab significantly improved survival outcomes compared to
             assert chunk.meta["src"][sample_document.source] == sample_document.detail
 
 
+class TestBatchChunking:
+    """Test multi-document chunking."""
+
+    @pytest.fixture
+    def documents(self):
+        """Create a mix of structured and unstructured documents."""
+        return [
+            Document(
+                uid=f"pubmed:{i}",
+                source="pubmed",
+                source_id=str(i),
+                title=f"Batch Document {i}",
+                text=(
+                    f"Background: Study {i} background. "
+                    f"Results: Response was {i}.5% compared to placebo. "
+                    "Conclusions: Treatment was effective."
+                    if i % 2
+                    else f"Unstructured abstract {i}. It reports 3.{i} months survival."
+                ),
+            )
+            for i in range(6)
+        ]
+
+    def test_chunk_documents_matches_chunk_document(self, documents):
+        """Batch chunking yields the same chunks as one-at-a-time chunking."""
+        chunker = AbstractChunker(ChunkingConfig(), tokenizer=FallbackTokenizer())
+
+        batched = chunker.chunk_documents(documents)
+
+        assert len(batched) == len(documents)
+        for doc, chunks in zip(documents, batched):
+            assert chunks == chunker.chunk_document(doc)
+
+    def test_chunk_documents_with_workers(self, documents):
+        """Process-pool chunking preserves input order and chunk output."""
+        chunker = AbstractChunker(ChunkingConfig(), tokenizer=FallbackTokenizer())
+
+        try:
+            parallel = chunker.chunk_documents(documents, n_workers=2, batch_size=2)
+            pool = chunker._pool
+            again = chunker.chunk_documents(documents, n_workers=2, batch_size=2)
+
+            assert parallel == again == chunker.chunk_documents(documents)
+            # One long-lived pool of spawned (not forked) workers
+            assert chunker._pool is pool
+            assert pool._mp_context.get_start_method() == "spawn"
+        finally:
+            chunker.close()
+        assert chunker._pool is None
+
+
 class TestTokenizerParity:
     """Test tokenizer consistency."""
 
@@ -353,7 +418,7 @@ class TestChunkingConfig:
         assert config.max_tokens == 450
         assert config.min_tokens == 120
         assert config.overlap_tokens == 50
-        assert config.chunker_version == "v1.2.0"
+        assert config.chunker_version == "v1.3.0"
 
         # Check section boosts
         assert config.section_boosts["Results"] == 0.1
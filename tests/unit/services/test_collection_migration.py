@@ -0,0 +1,108 @@
+"""
+Unit tests for cursor-based collection migration.
+"""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from bio_mcp.services.weaviate_schema import CollectionMigration
+
+
+def _objects(count: int) -> list[MagicMock]:
+    return [
+        MagicMock(
+            uuid=f"00000000-0000-0000-0000-{i:012d}",
+            properties={"parent_uid": f"pubmed:{i}", "text": f"chunk {i}"},
+            vector={"default": [float(i), 0.5]},
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def collections():
+    """Source collection paged by ``after`` cursor, mocked target collection."""
+    objects = _objects(7)
+    old_col = MagicMock()
+    old_col.aggregate.over_all.return_value = MagicMock(total_count=len(objects))
+
+    def fetch_objects(limit, after=None, include_vector=False):
+        assert include_vector
+        start = 0
+        if after is not None:
+            start = next(i for i, o in enumerate(objects) if o.uuid == after) + 1
+        return MagicMock(objects=objects[start : start + limit])
+
+    old_col.query.fetch_objects.side_effect = fetch_objects
+
+    new_col = MagicMock()
+    new_col.batch.failed_objects = []
+
+    client = MagicMock()
+    client.collections.exists.return_value = True
+    client.collections.get.side_effect = lambda name: (
+        old_col if name == "Old" else new_col
+    )
+    return client, objects, old_col, new_col
+
+
+class TestCollectionMigration:
+    """Test cursor paging, vector copying and resumption."""
+
+    @pytest.mark.asyncio
+    async def test_copies_objects_with_vectors(self, collections):
+        client, objects, old_col, new_col = collections
+        batch = new_col.batch.fixed_size.return_value.__enter__.return_value
+
+        stats = await CollectionMigration(client).migrate_from_old_collection(
+            "Old", "New", batch_size=3
+        )
+
+        assert stats["documents_migrated"] == 7
+        assert stats["last_cursor"] == objects[-1].uuid
+        assert stats["objects_per_second"] > 0
+        # Pages follow the cursor instead of an offset
+        afters = [c.kwargs["after"] for c in old_col.query.fetch_objects.call_args_list]
+        assert afters == [None, objects[2].uuid, objects[5].uuid, objects[6].uuid]
+        added = batch.add_object.call_args_list
+        assert [c.kwargs["uuid"] for c in added] == [o.uuid for o in objects]
+        # Named "default" vectors are written as the unnamed vector
+        assert added[4].kwargs["vector"] == [4.0, 0.5]
+        new_col.data.insert.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_resumes_from_checkpoint(self, collections, tmp_path):
+        client, objects, _old_col, new_col = collections
+        checkpoint = tmp_path / "migration.json"
+        checkpoint.write_text(
+            json.dumps({"cursor": objects[3].uuid, "documents_migrated": 4})
+        )
+        batch = new_col.batch.fixed_size.return_value.__enter__.return_value
+
+        stats = await CollectionMigration(client).migrate_from_old_collection(
+            "Old", "New", batch_size=10, checkpoint_path=str(checkpoint)
+        )
+
+        assert [c.kwargs["uuid"] for c in batch.add_object.call_args_list] == [
+            o.uuid for o in objects[4:]
+        ]
+        assert stats["resumed_from"] == objects[3].uuid
+        assert stats["documents_migrated"] == 7
+        assert json.loads(checkpoint.read_text())["cursor"] == objects[-1].uuid
+
+    @pytest.mark.asyncio
+    async def test_failed_objects_reported(self, collections):
+        client, objects, _, new_col = collections
+        new_col.batch.failed_objects = [
+            MagicMock(original_uuid=objects[0].uuid, message="bad vector")
+        ]
+
+        stats = await CollectionMigration(client).migrate_from_old_collection(
+            "Old", "New", batch_size=10
+        )
+
+        assert stats["documents_failed"] == 1
+        assert stats["documents_migrated"] == 6
+        assert "bad vector" in stats["errors"][0]
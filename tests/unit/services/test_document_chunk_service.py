@@ -2,15 +2,20 @@
 Unit tests for DocumentChunkService with Weaviate BioBERT vectorizer.
 """
 
+import asyncio
 import os
+import time
+import uuid
 from datetime import datetime
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 
 from bio_mcp.config.config import Config
 from bio_mcp.models.document import Document
-from bio_mcp.services.document_chunk_service import DocumentChunkService
+from bio_mcp.services.chunking import AbstractChunker, FallbackTokenizer
+from bio_mcp.services.document_chunk_service import DocumentChunkService, DocumentLRU
+from bio_mcp.services.embedding_cache import EmbeddingCache
 
 
 @pytest.mark.skipif(
@@ -104,3 +109,463 @@ class TestDocumentChunkService:
         assert meta["src"]["ctgov"]["status"] == "Recruiting"
 
     # Health check test removed - complex mocking required for OpenAI embedding test
+
+
+class TestBulkDocumentStore:
+    """Test batched multi-document chunk storage."""
+
+    @pytest.fixture
+    def service(self):
+        """Service with a whitespace tokenizer and a mocked Weaviate collection."""
+        with patch(
+            "bio_mcp.services.document_chunk_service.AbstractChunker",
+            lambda cfg: AbstractChunker(cfg, tokenizer=FallbackTokenizer()),
+        ):
+            service = DocumentChunkService(collection_name="DocumentChunk_v2")
+
+        collection = MagicMock()
+        collection.batch.failed_objects = []
+        service.weaviate_client = MagicMock()
+        service.weaviate_client.client.collections.get.return_value = collection
+        service._initialized = True
+        return service, collection
+
+    @staticmethod
+    def _documents(count: int) -> list[Document]:
+        return [
+            Document(
+                uid=f"pubmed:{i}",
+                source="pubmed",
+                source_id=str(i),
+                title=f"Paper {i}",
+                text=f"Background: Study {i} background. Results: Outcome {i} improved.",
+            )
+            for i in range(count)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_streams_chunks_into_fixed_size_batch(self, service):
+        service, collection = service
+        batch = collection.batch.fixed_size.return_value.__enter__.return_value
+
+        results = await service.store_documents_chunks(
+            iter(self._documents(3)), quality_scores={"pubmed:1": 0.9}, batch_size=50
+        )
+
+        collection.batch.fixed_size.assert_called_once_with(
+            batch_size=50, concurrent_requests=service.config.weaviate_batch_concurrency
+        )
+        assert [r.uid for r in results] == ["pubmed:0", "pubmed:1", "pubmed:2"]
+        assert all(r.success and r.chunk_uuids for r in results)
+
+        added = batch.add_object.call_args_list
+        assert len(added) == sum(len(r.chunk_uuids) for r in results)
+        assert {call.kwargs["uuid"] for call in added} == {
+            u for r in results for u in r.chunk_uuids
+        }
+        scores = {
+            call.kwargs["properties"]["parent_uid"]: call.kwargs["properties"][
+                "quality_total"
+            ]
+            for call in added
+        }
+        assert scores == {"pubmed:0": 0.0, "pubmed:1": 0.9, "pubmed:2": 0.0}
+
+    @pytest.mark.asyncio
+    async def test_zero_batch_size_uses_dynamic_batching(self, service):
+        service, collection = service
+
+        await service.store_documents_chunks(self._documents(1), batch_size=0)
+
+        collection.batch.dynamic.assert_called_once()
+        collection.batch.fixed_size.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_read_during_batch_is_not_left_cached(self, service):
+        service, collection = service
+        batch = collection.batch.fixed_size.return_value.__enter__.return_value
+        # A concurrent rag.get caches the old document while the batch is written
+        batch.add_object.side_effect = lambda **kwargs: service.document_cache.put(
+            kwargs["properties"]["parent_uid"], {"chunks": ["old"]}
+        )
+
+        await service.store_documents_chunks(self._documents(2))
+
+        assert len(service.document_cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_repeated_uids_stored_once(self, service):
+        service, collection = service
+        batch = collection.batch.fixed_size.return_value.__enter__.return_value
+        first, second = self._documents(2)
+        documents = [first, second, first.model_copy(update={"title": "Revised"})]
+
+        results = await service.store_documents_chunks(documents)
+
+        assert [r.uid for r in results] == ["pubmed:0", "pubmed:1", "pubmed:0"]
+        assert results[2] is results[0]
+        added = batch.add_object.call_args_list
+        assert len(added) == len(results[0].chunk_uuids) + len(results[1].chunk_uuids)
+        assert len({call.kwargs["uuid"] for call in added}) == len(added)
+
+    @pytest.mark.asyncio
+    async def test_failed_objects_reported_per_document(self, service):
+        service, collection = service
+        documents = self._documents(2)
+        failed_uuid = service.chunking_service.chunk_document(documents[1])[0].uuid
+        collection.batch.failed_objects = [
+            MagicMock(original_uuid=failed_uuid, message="vectorizer timeout")
+        ]
+
+        results = await service.store_documents_chunks(documents)
+
+        assert results[0].success
+        assert not results[1].success
+        assert results[1].failed_chunks == {failed_uuid: "vectorizer timeout"}
+        assert failed_uuid not in results[1].chunk_uuids
+
+    @pytest.mark.asyncio
+    async def test_cached_vectors_skip_vectorizer(self, service, tmp_path):
+        service, collection = service
+        service.embedding_cache = EmbeddingCache(
+            str(tmp_path / "embeddings.db"), model="text-embedding-3-small"
+        )
+        batch = collection.batch.fixed_size.return_value.__enter__.return_value
+        # Weaviate returns the vectorizer's output for every added object
+        collection.query.fetch_objects.side_effect = lambda **kwargs: MagicMock(
+            objects=[
+                MagicMock(uuid=call.kwargs["uuid"], vector={"default": [0.1, 0.2]})
+                for call in batch.add_object.call_args_list
+            ]
+        )
+
+        # First ingest misses and back-fills the cache from Weaviate
+        await service.store_documents_chunks(self._documents(2))
+        first = batch.add_object.call_args_list
+        assert all(call.kwargs["vector"] is None for call in first)
+        assert service.embedding_cache_counts() == (0, len(first))
+
+        # Re-ingesting unchanged text supplies every vector from the cache
+        batch.add_object.reset_mock()
+        await service.store_documents_chunks(self._documents(2))
+        second = batch.add_object.call_args_list
+        assert len(second) == len(first)
+        assert all(
+            call.kwargs["vector"] == pytest.approx([0.1, 0.2]) for call in second
+        )
+        assert service.embedding_cache_counts() == (len(first), len(first))
+
+
+class TestAsyncQueries:
+    """Queries go through the async Weaviate client."""
+
+    QUERY_DELAY = 0.1
+
+    @pytest.fixture
+    def service(self):
+        with patch(
+            "bio_mcp.services.document_chunk_service.AbstractChunker",
+            lambda cfg: AbstractChunker(cfg, tokenizer=FallbackTokenizer()),
+        ):
+            service = DocumentChunkService(collection_name="DocumentChunk_v2")
+
+        async def slow_hybrid(**kwargs):
+            await asyncio.sleep(self.QUERY_DELAY)
+            item = MagicMock(uuid="u1", properties={"section": "Results", "year": 2020})
+            item.metadata.score = 0.5
+            return MagicMock(objects=[item])
+
+        collection = MagicMock()
+        collection.query.hybrid = AsyncMock(side_effect=slow_hybrid)
+        service.weaviate_client = MagicMock()
+        service.weaviate_client.async_client.collections.get.return_value = collection
+        service._initialized = True
+        return service, collection
+
+    @pytest.mark.asyncio
+    async def test_search_awaits_async_collection(self, service):
+        service, collection = service
+
+        results = await service.search_chunks("metformin", limit=5)
+
+        collection.query.hybrid.assert_awaited_once()
+        service.weaviate_client.client.collections.get.assert_not_called()
+        assert results[0]["uuid"] == "u1"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_searches_do_not_block_each_other(self, service):
+        service, _ = service
+
+        start = time.perf_counter()
+        await asyncio.gather(*[service.search_chunks(f"q{i}") for i in range(5)])
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < self.QUERY_DELAY * 3
+
+    @pytest.mark.asyncio
+    async def test_default_projection_skips_meta(self, service):
+        service, collection = service
+
+        results = await service.search_chunks("metformin")
+
+        projection = collection.query.hybrid.call_args.kwargs["return_properties"]
+        assert "meta" not in projection
+        assert set(service.SCORING_PROPERTIES) <= set(projection)
+        assert "meta" not in results[0]
+
+        await service.search_chunks("metformin", return_properties=["text", "meta"])
+        assert collection.query.hybrid.call_args.kwargs["return_properties"] is None
+
+    @pytest.mark.asyncio
+    async def test_load_chunk_meta_fetches_only_missing(self, service):
+        service, collection = service
+        missing, loaded = str(uuid.uuid4()), str(uuid.uuid4())
+        meta = {"src": {"pubmed": {"authors": ["Smith, J."]}}}
+        collection.query.fetch_objects = AsyncMock(
+            return_value=MagicMock(
+                objects=[MagicMock(uuid=missing, properties={"meta": meta})]
+            )
+        )
+        chunks = [
+            {"uuid": missing},
+            {"uuid": loaded, "meta": {"chunker_version": "v1"}},
+        ]
+
+        await service.load_chunk_meta(chunks)
+
+        collection.query.fetch_objects.assert_awaited_once()
+        assert collection.query.fetch_objects.call_args.kwargs["limit"] == 1
+        assert chunks[0]["meta"] == meta
+        assert chunks[1]["meta"] == {"chunker_version": "v1"}
+
+
+class TestGroupedDocumentSearch:
+    """Document-level search groups chunk hits by parent_uid server-side."""
+
+    @staticmethod
+    def _chunk(uuid: str, parent_uid: str, score: float = 0.0) -> MagicMock:
+        item = MagicMock(
+            uuid=uuid,
+            properties={"parent_uid": parent_uid, "section": "Results", "text": uuid},
+        )
+        item.metadata.score = score
+        return item
+
+    @pytest.fixture
+    def service(self):
+        with patch(
+            "bio_mcp.services.document_chunk_service.AbstractChunker",
+            lambda cfg: AbstractChunker(cfg, tokenizer=FallbackTokenizer()),
+        ):
+            service = DocumentChunkService(collection_name="DocumentChunk_v2")
+
+        groups = {
+            "pubmed:1": MagicMock(objects=[self._chunk("a1", "pubmed:1", 0.2)]),
+            "pubmed:2": MagicMock(
+                objects=[
+                    self._chunk("b1", "pubmed:2", 0.9),
+                    self._chunk("b2", "pubmed:2", 0.8),
+                ]
+            ),
+        }
+        for name, group in groups.items():
+            group.name = name
+
+        collection = MagicMock()
+        collection.query.hybrid = AsyncMock(return_value=MagicMock(groups=groups))
+        collection.query.fetch_objects = AsyncMock(
+            return_value=MagicMock(
+                objects=[
+                    self._chunk("a1", "pubmed:1"),
+                    self._chunk("a2", "pubmed:1"),
+                    self._chunk("b3", "pubmed:2"),
+                ]
+            )
+        )
+        service.weaviate_client = MagicMock()
+        service.weaviate_client.async_client.collections.get.return_value = collection
+        service._initialized = True
+        return service, collection
+
+    @pytest.mark.asyncio
+    async def test_groups_by_parent_uid_in_one_query(self, service):
+        service, collection = service
+
+        documents = await service.search_documents("metformin", top_k=2)
+
+        group_by = collection.query.hybrid.call_args.kwargs["group_by"]
+        assert group_by.prop == "parent_uid"
+        assert group_by.number_of_groups == 2
+        assert group_by.objects_per_group == service.GROUP_CHUNKS_PER_DOCUMENT
+        assert [d["parent_uid"] for d in documents] == ["pubmed:2", "pubmed:1"]
+        assert [c["uuid"] for c in documents[0]["chunks"]] == ["b1", "b2"]
+        assert documents[0]["siblings"] == []
+        collection.query.fetch_objects.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_fetch_siblings_adds_unmatched_chunks(self, service):
+        service, collection = service
+
+        documents = await service.search_documents(
+            "metformin", top_k=2, fetch_siblings=True
+        )
+
+        collection.query.fetch_objects.assert_awaited_once()
+        siblings = {
+            d["parent_uid"]: [c["uuid"] for c in d["siblings"]] for d in documents
+        }
+        assert siblings == {"pubmed:1": ["a2"], "pubmed:2": ["b3"]}
+        assert all("score" not in c for d in documents for c in d["siblings"])
+
+
+class TestDocumentRetrieval:
+    """Batch document fetch with the hot-document cache."""
+
+    @staticmethod
+    def _chunk_uuid(parent_uid: str, idx: int) -> str:
+        return str(uuid.uuid5(uuid.NAMESPACE_URL, f"{parent_uid}-{idx}"))
+
+    @classmethod
+    def _chunk(cls, parent_uid: str, idx: int) -> MagicMock:
+        return MagicMock(
+            uuid=cls._chunk_uuid(parent_uid, idx),
+            properties={
+                "parent_uid": parent_uid,
+                "source": "pubmed",
+                "title": f"Paper {parent_uid}",
+                "text": f"part {idx}",
+                "chunk_id": f"w{idx}",
+                "chunk_idx": idx,
+            },
+        )
+
+    @pytest.fixture
+    def service(self):
+        with patch(
+            "bio_mcp.services.document_chunk_service.AbstractChunker",
+            lambda cfg: AbstractChunker(cfg, tokenizer=FallbackTokenizer()),
+        ):
+            service = DocumentChunkService(collection_name="DocumentChunk_v2")
+
+        collection = MagicMock()
+        # Sorted by chunk_idx across documents, as Weaviate returns them
+        collection.query.fetch_objects = AsyncMock(
+            return_value=MagicMock(
+                objects=[
+                    self._chunk("pubmed:1", 0),
+                    self._chunk("pubmed:2", 0),
+                    self._chunk("pubmed:1", 1),
+                ]
+            )
+        )
+        collection.data.delete_many = AsyncMock(return_value=MagicMock(successful=1))
+        service.weaviate_client = MagicMock()
+        service.weaviate_client.async_client.collections.get.return_value = collection
+        service._initialized = True
+        return service, collection
+
+    @pytest.mark.asyncio
+    async def test_resolves_many_documents_in_one_query(self, service):
+        service, collection = service
+
+        documents = await service.get_documents(["pubmed:2", "pubmed:1", "pubmed:9"])
+
+        collection.query.fetch_objects.assert_awaited_once()
+        assert list(documents) == ["pubmed:2", "pubmed:1"]
+        assert [c["text"] for c in documents["pubmed:1"]["chunks"]] == [
+            "part 0",
+            "part 1",
+        ]
+        assert documents["pubmed:1"]["title"] == "Paper pubmed:1"
+
+    @pytest.mark.asyncio
+    async def test_cached_documents_skip_weaviate(self, service):
+        service, collection = service
+        await service.get_documents(["pubmed:1", "pubmed:2"])
+
+        documents = await service.get_documents(["pubmed:1"])
+
+        assert collection.query.fetch_objects.await_count == 1
+        assert documents["pubmed:1"]["chunks"][1]["chunk_id"] == "w1"
+        assert service.document_cache.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_delete_invalidates_cached_document(self, service):
+        service, collection = service
+        await service.get_documents(["pubmed:1", "pubmed:2"])
+
+        await service.delete_chunks(
+            [self._chunk_uuid("pubmed:1", 1)], parent_uid="pubmed:1"
+        )
+        await service.get_documents(["pubmed:1", "pubmed:2"])
+
+        assert collection.query.fetch_objects.await_count == 2
+        filters = collection.query.fetch_objects.call_args.kwargs["filters"]
+        assert filters.value == ["pubmed:1"]
+
+    @pytest.mark.asyncio
+    async def test_read_during_delete_is_not_left_cached(self, service):
+        service, collection = service
+
+        async def delete_many(**kwargs):
+            # A concurrent rag.get reloads the old chunks mid-delete
+            await service.get_documents(["pubmed:1"])
+            return MagicMock(successful=1)
+
+        collection.data.delete_many = AsyncMock(side_effect=delete_many)
+
+        await service.delete_chunks(
+            [self._chunk_uuid("pubmed:1", 1)], parent_uid="pubmed:1"
+        )
+
+        assert service.document_cache.get("pubmed:1") is None
+
+    @pytest.mark.asyncio
+    async def test_long_documents_are_read_in_pages(self, service):
+        service, collection = service
+        page_size = service.MAX_SIBLINGS_PER_DOCUMENT
+        chunks = [self._chunk("pubmed:1", idx) for idx in range(page_size + 1)]
+        collection.query.fetch_objects = AsyncMock(
+            side_effect=lambda **kwargs: MagicMock(
+                objects=chunks[kwargs["offset"] : kwargs["offset"] + kwargs["limit"]]
+            )
+        )
+
+        documents = await service.get_documents(["pubmed:1"])
+
+        assert len(documents["pubmed:1"]["chunks"]) == page_size + 1
+        offsets = [
+            call.kwargs["offset"]
+            for call in collection.query.fetch_objects.call_args_list
+        ]
+        assert offsets == [0, page_size]
+
+
+class TestDocumentLRU:
+    """Test the reconstructed-document LRU."""
+
+    def test_evicts_least_recently_used(self):
+        cache = DocumentLRU(max_entries=2)
+        cache.put("a", {"title": "A"})
+        cache.put("b", {"title": "B"})
+        cache.get("a")
+        cache.put("c", {"title": "C"})
+
+        assert cache.get("b") is None
+        assert cache.get("a") == {"title": "A"}
+        assert len(cache) == 2
+
+    def test_returns_copies(self):
+        cache = DocumentLRU()
+        cache.put("a", {"chunks": []})
+
+        cache.get("a")["chunks"].append("mutated")
+
+        assert cache.get("a") == {"chunks": []}
+
+    def test_expired_entries_are_misses(self):
+        cache = DocumentLRU(ttl=0)
+        cache.put("a", {"title": "A"})
+
+        assert cache.get("a") is None
+        assert cache.misses == 1
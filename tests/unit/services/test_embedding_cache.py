@@ -0,0 +1,53 @@
+"""
+Unit tests for the content-hash embedding cache.
+"""
+
+import pytest
+
+from bio_mcp.services.embedding_cache import EmbeddingCache, vectorized_text
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = EmbeddingCache(
+        str(tmp_path / "embeddings.db"), model="text-embedding-3-small", dimensions=4
+    )
+    yield cache
+    cache.close()
+
+
+class TestEmbeddingCache:
+    """Test vector storage and hit accounting."""
+
+    def test_round_trip_and_counts(self, cache):
+        key = cache.make_key("metformin lowers glucose")
+
+        assert cache.get_many([key]) == {}
+        cache.put_many([(key, [0.5, -0.25, 1.0, 0.0])])
+
+        assert cache.get_many([key]) == {key: [0.5, -0.25, 1.0, 0.0]}
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert len(cache) == 1
+
+    def test_key_depends_on_model_and_dimensions(self, cache, tmp_path):
+        other = EmbeddingCache(
+            str(tmp_path / "embeddings.db"),
+            model="text-embedding-3-small",
+            dimensions=8,
+        )
+        try:
+            assert cache.make_key("same text") == cache.make_key("same text")
+            assert cache.make_key("same text") != other.make_key("same text")
+            assert cache.make_key("same text") != cache.make_key("other text")
+        finally:
+            other.close()
+
+    def test_empty_vectors_not_stored(self, cache):
+        assert cache.put_many([(cache.make_key("no vector"), [])]) == 0
+        assert len(cache) == 0
+
+    def test_vectorized_text_ignores_non_text_properties(self):
+        base = {"parent_uid": "pubmed:1", "title": "T", "text": "Body"}
+
+        assert vectorized_text({**base, "quality_total": 0.9}) == vectorized_text(base)
+        assert vectorized_text({**base, "text": "Changed"}) != vectorized_text(base)
@@ -0,0 +1,139 @@
+"""
+Unit tests for the append-only raw document archive.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+
+from bio_mcp.services.raw_archive import RawDocumentArchive, S3SegmentBackend
+
+
+def _payload(i: int) -> dict:
+    return {"pmid": str(i), "title": f"Paper {i}", "abstract": "text " * (i + 1)}
+
+
+@pytest.fixture
+def archive(tmp_path):
+    archive = RawDocumentArchive(tmp_path / "raw", max_segment_bytes=256)
+    yield archive
+    archive.close()
+
+
+class TestRawDocumentArchive:
+    """Test writes, random access and sequential reads."""
+
+    def test_round_trip_by_uid(self, archive):
+        records = archive.put_many((f"pubmed:{i}", _payload(i)) for i in range(10))
+
+        assert len(archive) == 10
+        assert "pubmed:3" in archive
+        assert archive.get("pubmed:3") == _payload(3)
+        assert archive.get("pubmed:missing") is None
+        assert records[3].content_hash == archive.get_content_hash("pubmed:3")
+
+    def test_segments_roll_over(self, archive):
+        records = archive.put_many((f"pubmed:{i}", _payload(i)) for i in range(30))
+
+        assert len({record.uri for record in records}) > 1
+        assert all(archive.get(f"pubmed:{i}") == _payload(i) for i in (0, 15, 29))
+
+    def test_unchanged_payload_not_rewritten(self, archive):
+        first = archive.put("pubmed:1", _payload(1))
+        size = archive.backend.path(first.uri.rsplit("/", 1)[1]).stat().st_size
+
+        again = archive.put("pubmed:1", _payload(1))
+        updated = archive.put("pubmed:1", {**_payload(1), "title": "Revised"})
+
+        assert again == first
+        assert updated.content_hash != first.content_hash
+        assert archive.get("pubmed:1")["title"] == "Revised"
+        assert archive.backend.path(first.uri.rsplit("/", 1)[1]).stat().st_size > size
+
+    def test_iter_records_in_segment_order(self, archive):
+        archive.put_many((f"pubmed:{i}", _payload(i)) for i in range(12))
+        archive.put("ctgov:NCT1", {"nct_id": "NCT1"})
+
+        records = list(archive.iter_records("pubmed:"))
+
+        assert [uid for uid, _ in records] == [f"pubmed:{i}" for i in range(12)]
+        assert records[4][1] == _payload(4)
+
+    def test_reopen_keeps_appending(self, archive, tmp_path):
+        archive.put("pubmed:1", _payload(1))
+        archive.close()
+
+        reopened = RawDocumentArchive(tmp_path / "raw", max_segment_bytes=256)
+        try:
+            reopened.put("pubmed:2", _payload(2))
+            assert reopened.get_many(["pubmed:1", "pubmed:2"]) == {
+                "pubmed:1": _payload(1),
+                "pubmed:2": _payload(2),
+            }
+        finally:
+            reopened.close()
+
+    def test_writers_sharing_an_archive_do_not_interleave(self, archive, tmp_path):
+        other = RawDocumentArchive(tmp_path / "raw", max_segment_bytes=256)
+        try:
+            for i in range(20):
+                writer = archive if i % 2 else other
+                writer.put(f"pubmed:{i}", _payload(i))
+
+            sealed = archive.conn.execute(
+                "SELECT name FROM raw_segments WHERE sealed = 1"
+            ).fetchall()
+            assert len(sealed) > 1
+            for reader in (archive, other):
+                assert all(reader.get(f"pubmed:{i}") == _payload(i) for i in range(20))
+        finally:
+            other.close()
+
+    def test_reads_race_with_growing_active_segment(self, tmp_path):
+        archive = RawDocumentArchive(tmp_path / "raw")
+        archive.put_many((f"pubmed:{i}", _payload(i)) for i in range(20))
+
+        def read_back(i: int) -> bool:
+            # Each write grows the active segment, so reading it back remaps
+            # while other threads read from the previous map
+            archive.put(f"pubmed:{i}", _payload(i))
+            return archive.get(f"pubmed:{i}") == _payload(i) and all(
+                archive.get(f"pubmed:{j}") == _payload(j) for j in range(20)
+            )
+
+        try:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                assert all(pool.map(read_back, range(20, 200)))
+        finally:
+            archive.close()
+
+
+class TestS3SegmentBackend:
+    """Test publishing sealed segments to an S3-compatible bucket."""
+
+    def test_sealed_segments_uploaded_and_range_read(self, tmp_path):
+        client = MagicMock()
+        backend = S3SegmentBackend(tmp_path / "segments", bucket="raw", client=client)
+        archive = RawDocumentArchive(
+            tmp_path / "raw", backend=backend, max_segment_bytes=1
+        )
+        try:
+            record = archive.put("pubmed:1", _payload(1))
+            segment = record.uri.rsplit("/", 1)[1]
+
+            client.upload_file.assert_called_once_with(
+                str(backend.path(segment)), "raw", f"raw/{segment}"
+            )
+            assert record.uri == f"s3://raw/raw/{segment}"
+
+            # Without the local copy, reads fall back to ranged GETs
+            data = backend.path(segment).read_bytes()
+            backend.path(segment).unlink()
+            client.get_object.return_value = {"Body": MagicMock(read=lambda: data)}
+            assert archive.get("pubmed:1") == _payload(1)
+            assert client.get_object.call_args.kwargs["Range"] == (
+                f"bytes=0-{len(data) - 1}"
+            )
+        finally:
+            archive.close()
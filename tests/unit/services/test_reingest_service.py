@@ -0,0 +1,250 @@
+"""
+Unit tests for skip-unchanged re-ingestion.
+"""
+
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from bio_mcp.config.config import Config
+from bio_mcp.services.chunking import AbstractChunker, FallbackTokenizer
+from bio_mcp.services.document_chunk_service import (
+    DocumentManifest,
+    DocumentStoreResult,
+)
+from bio_mcp.services.raw_archive import RawDocumentArchive
+from bio_mcp.services.reingest_service import ReingestionService, ReingestionStats
+
+
+@pytest.fixture
+def service(tmp_path):
+    """Re-ingestion service with mocked database and collection access."""
+    with patch(
+        "bio_mcp.services.document_chunk_service.AbstractChunker",
+        lambda cfg: AbstractChunker(cfg, tokenizer=FallbackTokenizer()),
+    ):
+        service = ReingestionService(Config())
+
+    service.db_service = AsyncMock()
+    service.document_chunk_service.connect = AsyncMock()
+    service.document_chunk_service.disconnect = AsyncMock()
+    service.retry_delay = 0
+    service.raw_archive = RawDocumentArchive(tmp_path / "raw")
+    yield service
+    service.raw_archive.close()
+
+
+def _manifest(uid: str, content_hash: str, chunker_version: str) -> DocumentManifest:
+    manifest = DocumentManifest(uid=uid)
+    manifest.add_chunk(f"{uid}-chunk", content_hash, chunker_version)
+    return manifest
+
+
+class TestDocumentManifest:
+    """Test manifest comparison."""
+
+    def test_is_current(self):
+        manifest = _manifest("pubmed:1", "abc", "v1")
+
+        assert manifest.is_current("abc", "v1")
+        assert not manifest.is_current("def", "v1")
+        assert not manifest.is_current("abc", "v2")
+        assert not manifest.is_current(None, "v1")
+
+    def test_mixed_chunks_are_not_current(self):
+        manifest = _manifest("pubmed:1", "abc", "v1")
+        manifest.add_chunk("pubmed:1-other", "abc", "v0")
+
+        assert manifest.chunker_version is None
+        assert not manifest.is_current("abc", "v1")
+
+
+class TestSkipUnchanged:
+    """Test that only changed documents are re-processed."""
+
+    async def _run(self, service, params, manifests):
+        version = service.document_chunk_service.config.chunker_version
+        refs = [
+            {"uid": "pubmed:1", "content_hash": "same"},
+            {"uid": "pubmed:2", "content_hash": "new"},
+            {"uid": "pubmed:3", "content_hash": "same"},
+        ]
+        service.db_service.get_job.return_value = Mock(parameters=params)
+        service.document_chunk_service.get_document_manifests = AsyncMock(
+            return_value={
+                uid: _manifest(uid, content_hash, version)
+                for uid, content_hash in manifests.items()
+            }
+        )
+
+        with (
+            patch.object(service, "_get_document_list", return_value=refs),
+            patch.object(
+                service, "_process_documents", new_callable=AsyncMock
+            ) as process,
+        ):
+            summary = await service.execute_reingest_job("job-1")
+
+        return summary, [
+            doc_ref["uid"]
+            for call in process.call_args_list
+            for doc_ref in call.args[0]
+        ]
+
+    @pytest.mark.asyncio
+    async def test_current_documents_skipped(self, service):
+        summary, processed = await self._run(
+            service,
+            {"mode": "full", "dry_run": False},
+            {"pubmed:1": "same", "pubmed:2": "old"},
+        )
+
+        # pubmed:2 changed and pubmed:3 has never been stored
+        assert processed == ["pubmed:2", "pubmed:3"]
+        assert summary["documents_skipped"] == 1
+
+    @pytest.mark.asyncio
+    async def test_force_processes_everything(self, service):
+        summary, processed = await self._run(
+            service,
+            {"mode": "full", "dry_run": False, "force": True},
+            {"pubmed:1": "same", "pubmed:2": "old"},
+        )
+
+        assert processed == ["pubmed:1", "pubmed:2", "pubmed:3"]
+        assert summary["documents_skipped"] == 0
+
+
+class TestVanishedChunks:
+    """Test deletion of chunks a changed document no longer produces."""
+
+    @pytest.mark.asyncio
+    async def test_vanished_chunks_deleted(self, service):
+        stored = _manifest("pubmed:1", "old", "v0")
+        stored.add_chunk("kept-chunk", "old", "v0")
+        chunk_service = service.document_chunk_service
+        chunk_service.store_document_chunks = AsyncMock(
+            return_value=["kept-chunk", "new-chunk"]
+        )
+        chunk_service.delete_chunks = AsyncMock(return_value=1)
+        service.raw_archive.put(
+            "pubmed:1", {"pmid": "1", "title": "Title", "abstract": "Abstract."}
+        )
+        stats = ReingestionStats()
+
+        await service._process_single_document(
+            {"uid": "pubmed:1", "source_id": "1", "content_hash": "new"},
+            stats,
+            dry_run=False,
+            stored=stored,
+        )
+
+        chunk_service.delete_chunks.assert_awaited_once_with(
+            {"pubmed:1-chunk"}, parent_uid="pubmed:1"
+        )
+        assert stats.chunks_deleted == 1
+        assert stats.documents_processed == 1
+
+
+class TestBatchedReingestion:
+    """Test that a batch is chunked and stored together."""
+
+    @pytest.mark.asyncio
+    async def test_batch_stored_in_one_pass(self, service):
+        chunk_service = service.document_chunk_service
+        chunk_service.store_documents_chunks = AsyncMock(
+            return_value=[
+                DocumentStoreResult(uid="pubmed:1", chunk_uuids=["kept-chunk"]),
+                DocumentStoreResult(uid="pubmed:2", chunk_uuids=["other-chunk"]),
+            ]
+        )
+        chunk_service.delete_chunks = AsyncMock(return_value=1)
+        for pmid in ("1", "2"):
+            service.raw_archive.put(
+                f"pubmed:{pmid}",
+                {"pmid": pmid, "title": f"Title {pmid}", "abstract": "Abstract."},
+            )
+        stored = _manifest("pubmed:1", "old", "v0")
+        stored.add_chunk("kept-chunk", "old", "v0")
+        stats = ReingestionStats()
+
+        await service._process_documents(
+            [{"uid": "pubmed:1"}, {"uid": "pubmed:2"}],
+            stats,
+            dry_run=False,
+            manifests={"pubmed:1": stored},
+        )
+
+        documents = chunk_service.store_documents_chunks.call_args.args[0]
+        assert [d.uid for d in documents] == ["pubmed:1", "pubmed:2"]
+        chunk_service.delete_chunks.assert_awaited_once_with(
+            {"pubmed:1-chunk"}, parent_uid="pubmed:1"
+        )
+        assert stats.documents_processed == 2
+        assert stats.chunks_deleted == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_documents_fall_back_to_single_path(self, service):
+        chunk_service = service.document_chunk_service
+        chunk_service.store_documents_chunks = AsyncMock(
+            return_value=[
+                DocumentStoreResult(uid="pubmed:1", chunk_uuids=["chunk"]),
+                DocumentStoreResult(uid="pubmed:2", error="Chunking failed"),
+            ]
+        )
+        chunk_service.store_document_chunks = AsyncMock(return_value=["chunk"])
+        for pmid in ("1", "2"):
+            service.raw_archive.put(
+                f"pubmed:{pmid}",
+                {"pmid": pmid, "title": f"Title {pmid}", "abstract": "Abstract."},
+            )
+        service.retry_attempts = 1
+        stats = ReingestionStats()
+
+        await service._process_documents(
+            [{"uid": "pubmed:1"}, {"uid": "pubmed:2"}, {"uid": "pubmed:404"}],
+            stats,
+            dry_run=False,
+            manifests={},
+        )
+
+        retried = chunk_service.store_document_chunks.call_args.kwargs["document"]
+        assert retried.uid == "pubmed:2"
+        assert stats.documents_processed == 2
+        assert stats.documents_failed == 1
+        assert "pubmed:404" in stats.errors[0]["error"]
+
+
+class TestRawArchiveLoading:
+    """Test that documents are rebuilt from archived raw payloads."""
+
+    @pytest.mark.asyncio
+    async def test_document_built_from_archive(self, service):
+        chunk_service = service.document_chunk_service
+        chunk_service.store_document_chunks = AsyncMock(return_value=["chunk"])
+        service.raw_archive.put(
+            "pubmed:7",
+            {"pmid": "7", "title": "Archived title", "abstract": "Archived text."},
+        )
+
+        await service._process_single_document(
+            {"uid": "pubmed:7", "s3_key": "file:///raw", "content_hash": "h"},
+            ReingestionStats(),
+            dry_run=False,
+        )
+
+        document = chunk_service.store_document_chunks.call_args.kwargs["document"]
+        assert document.title == "Archived title"
+        assert document.text == "Archived text."
+
+    @pytest.mark.asyncio
+    async def test_missing_payload_is_a_failure(self, service):
+        service.retry_attempts = 1
+        stats = ReingestionStats()
+
+        await service._process_single_document(
+            {"uid": "pubmed:404"}, stats, dry_run=False
+        )
+
+        assert stats.documents_failed == 1
+        assert "pubmed:404" in stats.errors[0]["error"]
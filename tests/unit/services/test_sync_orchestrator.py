@@ -0,0 +1,136 @@
+"""
+Unit tests for SyncOrchestrator incremental sync batching.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from bio_mcp.services.document_chunk_service import DocumentStoreResult
+from bio_mcp.services.services import SyncOrchestrator
+from bio_mcp.sources.pubmed.client import PubMedDocument, PubMedSearchResult
+
+
+@pytest.fixture
+def orchestrator():
+    pubmed_service = MagicMock()
+    document_service = MagicMock()
+    vector_service = MagicMock()
+
+    document_service.manager.get_sync_watermark = AsyncMock(return_value=None)
+    document_service.manager.create_or_update_sync_watermark = AsyncMock()
+    document_service.existing_pmids = AsyncMock(return_value={"2"})
+    document_service.bulk_upsert_documents = AsyncMock(return_value=2)
+    document_service.document_exists = AsyncMock()
+    document_service.create_document = AsyncMock()
+
+    pmids = ["1", "2", "3"]
+    pubmed_service.client.search_incremental = AsyncMock(
+        return_value=PubMedSearchResult(query="q", total_count=3, pmids=pmids)
+    )
+
+    async def iter_documents(search_result, batch_size=200, pmids=None):
+        for pmid in pmids or search_result.pmids:
+            yield [PubMedDocument(pmid=pmid, title=f"Title {pmid}")]
+
+    pubmed_service.iter_documents = MagicMock(side_effect=iter_documents)
+    vector_service.store_documents = AsyncMock(
+        side_effect=[
+            [DocumentStoreResult(uid="pubmed:1", chunk_uuids=["a"])],
+            [DocumentStoreResult(uid="pubmed:3", error="Chunking failed")],
+        ]
+    )
+
+    orchestrator = SyncOrchestrator(pubmed_service, document_service, vector_service)
+    orchestrator._initialized = True
+    return orchestrator
+
+
+class TestIncrementalSync:
+    """Incremental sync uses set-based checks, paged fetches and bulk writes."""
+
+    @pytest.mark.asyncio
+    async def test_constant_queries_per_batch(self, orchestrator):
+        result = await orchestrator.sync_documents_incremental("query", limit=3)
+
+        documents = orchestrator.document_service
+        documents.existing_pmids.assert_awaited_once_with(["1", "2", "3"])
+        documents.document_exists.assert_not_awaited()
+        documents.create_document.assert_not_awaited()
+        assert orchestrator.pubmed_service.iter_documents.call_args.kwargs == {
+            "pmids": ["1", "3"]
+        }
+        upserted = [
+            [row["pmid"] for row in call.args[0]]
+            for call in documents.bulk_upsert_documents.await_args_list
+        ]
+        assert upserted == [["1"], ["3"]]
+        assert orchestrator.vector_service.store_documents.await_count == 2
+
+        assert result["already_existed"] == 1
+        assert result["pmids_synced"] == ["1"]
+        assert result["pmids_failed"] == ["3"]
+
+    @pytest.mark.asyncio
+    async def test_bulk_upsert_failure_fails_whole_batch(self, orchestrator):
+        orchestrator.document_service.bulk_upsert_documents.side_effect = RuntimeError(
+            "connection reset"
+        )
+
+        result = await orchestrator.sync_documents_incremental("query", limit=3)
+
+        assert result["successfully_synced"] == 0
+        assert result["pmids_failed"] == ["1", "3"]
+        orchestrator.vector_service.store_documents.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_invalid_document_fails_alone(self, orchestrator):
+        orchestrator.document_service.existing_pmids.return_value = set()
+
+        async def iter_documents(search_result, batch_size=200, pmids=None):
+            yield [
+                PubMedDocument(pmid="1", title="Title 1"),
+                PubMedDocument(pmid="2", title=""),
+                PubMedDocument(pmid="3", title="Title 3"),
+            ]
+
+        orchestrator.pubmed_service.iter_documents.side_effect = iter_documents
+        orchestrator.vector_service.store_documents.side_effect = lambda raw: [
+            DocumentStoreResult(uid=f"pubmed:{doc['pmid']}", chunk_uuids=["a"])
+            for doc in raw
+        ]
+
+        result = await orchestrator.sync_documents_incremental("query", limit=3)
+
+        rows = orchestrator.document_service.bulk_upsert_documents.await_args.args[0]
+        assert [row["pmid"] for row in rows] == ["1", "3"]
+        assert result["pmids_synced"] == ["1", "3"]
+        assert result["pmids_failed"] == ["2"]
+
+    @pytest.mark.asyncio
+    async def test_pages_history_server_when_all_pmids_new(self, orchestrator):
+        orchestrator.document_service.existing_pmids.return_value = set()
+        orchestrator.vector_service.store_documents.side_effect = lambda raw: [
+            DocumentStoreResult(uid=f"pubmed:{doc['pmid']}", chunk_uuids=["a"])
+            for doc in raw
+        ]
+
+        result = await orchestrator.sync_documents_incremental("query", limit=3)
+
+        assert orchestrator.pubmed_service.iter_documents.call_args.kwargs == {
+            "pmids": None
+        }
+        assert result["pmids_synced"] == ["1", "2", "3"]
+
+    @pytest.mark.asyncio
+    async def test_fetch_error_fails_unfetched_pmids(self, orchestrator):
+        async def failing_iter(search_result, batch_size=200, pmids=None):
+            yield [PubMedDocument(pmid="1", title="One")]
+            raise RuntimeError("EFetch timed out")
+
+        orchestrator.pubmed_service.iter_documents.side_effect = failing_iter
+
+        result = await orchestrator.sync_documents_incremental("query", limit=3)
+
+        assert result["pmids_synced"] == ["1"]
+        assert result["pmids_failed"] == ["3"]
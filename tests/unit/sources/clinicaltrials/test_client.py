@@ -9,54 +9,17 @@ from unittest.mock import AsyncMock, Mock, patch
 import httpx
 import pytest
 
+from bio_mcp.shared.core.rate_governor import CTGOV_V2, get_rate_governor
 from bio_mcp.sources.clinicaltrials.client import (
+    MAX_IDS_PER_REQUEST,
+    STUDY_DOCUMENT_FIELDS,
     ClinicalTrialsAPIError,
     ClinicalTrialsClient,
-    RateLimiter,
     RateLimitError,
 )
 from bio_mcp.sources.clinicaltrials.config import ClinicalTrialsConfig
 
 
-class TestRateLimiter:
-    """Test rate limiting functionality."""
-
-    @pytest.mark.asyncio
-    async def test_rate_limiter_enforces_delay(self):
-        """Test that rate limiter enforces minimum delay between calls."""
-        rate_limiter = RateLimiter(rate_per_second=2)  # 0.5 second intervals
-
-        # First call should not delay
-        await rate_limiter.wait_if_needed()
-        first_call_time = asyncio.get_event_loop().time()
-
-        # Second call should be delayed
-        await rate_limiter.wait_if_needed()
-        second_call_time = asyncio.get_event_loop().time()
-
-        # Should have waited at least 0.5 seconds
-        elapsed = second_call_time - first_call_time
-        assert elapsed >= 0.5, f"Expected at least 0.5s delay, got {elapsed}s"
-
-    @pytest.mark.asyncio
-    async def test_rate_limiter_no_delay_when_time_passed(self):
-        """Test that no delay occurs if enough time has already passed."""
-        rate_limiter = RateLimiter(rate_per_second=10)  # 0.1 second intervals
-
-        await rate_limiter.wait_if_needed()
-
-        # Simulate time passage
-        await asyncio.sleep(0.2)
-
-        start_time = asyncio.get_event_loop().time()
-        await rate_limiter.wait_if_needed()
-        end_time = asyncio.get_event_loop().time()
-
-        # Should not have added any significant delay
-        elapsed = end_time - start_time
-        assert elapsed < 0.05, f"Expected minimal delay, got {elapsed}s"
-
-
 class TestClinicalTrialsClient:
     """Test ClinicalTrials.gov API client."""
 
@@ -82,25 +45,73 @@ class TestClinicalTrialsClient:
         client = ClinicalTrialsClient(custom_config)
         assert client.config.rate_limit_per_second == 1
 
+    def test_clients_share_upstream_budget(self):
+        """Test that every client acquires from the process-wide ctgov budget."""
+        other = ClinicalTrialsClient(ClinicalTrialsConfig(rate_limit_per_second=1))
+
+        assert other._rate_limiter is self.client._rate_limiter
+        assert get_rate_governor().get(CTGOV_V2) is self.client._rate_limiter
+        # The most restrictive registration sets the shared rate
+        assert self.client._rate_limiter.max_rate == 1
+
     @pytest.mark.asyncio
     async def test_session_management(self):
-        """Test that client doesn't maintain persistent sessions."""
+        """Test that one pooled session is reused until the client is closed."""
         client = ClinicalTrialsClient(self.config)
+        assert client.session is None
 
-        # Client should not have a session attribute
-        assert not hasattr(client, "session")
+        mock_response = Mock()
+        mock_response.json.return_value = {"studies": []}
+        mock_response.raise_for_status.return_value = None
 
-        # Close should be a no-op
-        await client.close()
+        with patch(
+            "bio_mcp.sources.clinicaltrials.client.httpx.AsyncClient"
+        ) as mock_client_class:
+            mock_session = Mock()
+            mock_session.get = AsyncMock(return_value=mock_response)
+            mock_session.aclose = AsyncMock()
+            mock_client_class.return_value = mock_session
+
+            await client._make_request("https://test.com/1", {})
+            await client._make_request("https://test.com/2", {})
+
+            mock_client_class.assert_called_once()
+            kwargs = mock_client_class.call_args.kwargs
+            assert kwargs["limits"].max_connections == self.config.max_connections
+            assert kwargs["limits"].max_keepalive_connections == (
+                self.config.max_keepalive_connections
+            )
+            assert mock_session.get.await_count == 2
+
+            await client.close()
+            mock_session.aclose.assert_awaited_once()
+            assert client.session is None
+
+    @pytest.mark.asyncio
+    async def test_http2_requires_h2_package(self):
+        """Test that HTTP/2 is only enabled when the h2 package is importable."""
+        with (
+            patch(
+                "bio_mcp.sources.clinicaltrials.client.importlib.util.find_spec",
+                return_value=None,
+            ),
+            patch(
+                "bio_mcp.sources.clinicaltrials.client.httpx.AsyncClient"
+            ) as mock_client_class,
+        ):
+            ClinicalTrialsClient(self.config)._init_session()
+
+        assert mock_client_class.call_args.kwargs["http2"] is False
 
     @pytest.mark.asyncio
     async def test_context_manager(self):
-        """Test async context manager functionality."""
+        """Test async context manager closes the pooled session."""
         async with ClinicalTrialsClient(self.config) as client:
-            # Client should not maintain a session
-            assert not hasattr(client, "session")
-            # But client should be usable
             assert client.config is not None
+            client._init_session()
+            assert client.session is not None
+
+        assert client.session is None
 
     @pytest.mark.asyncio
     async def test_make_request_success(self):
@@ -137,6 +148,7 @@ class TestClinicalTrialsClient:
         """Test handling of rate limit errors."""
         mock_response = Mock()
         mock_response.status_code = 429
+        mock_response.headers = {"Retry-After": "0"}
 
         # Create a mock context manager that raises the exception
         class MockAsyncClient:
@@ -160,6 +172,10 @@ class TestClinicalTrialsClient:
             with pytest.raises(RateLimitError, match="Rate limit exceeded"):
                 await self.client._make_request("https://test.com/api", {})
 
+        # The shared budget backs off multiplicatively
+        assert self.client._rate_limiter.throttled == 1
+        assert self.client._rate_limiter.rate == 5
+
     @pytest.mark.asyncio
     async def test_make_request_http_error(self):
         """Test handling of HTTP errors."""
@@ -293,6 +309,82 @@ class TestClinicalTrialsClient:
 
             assert mock_request.call_count == 2  # Initial + 1 retry
 
+    @pytest.mark.asyncio
+    async def test_iter_search_follows_next_page_token(self):
+        """Test cursor pagination with the document field projection."""
+
+        def study(nct_id):
+            return {"protocolSection": {"identificationModule": {"nctId": nct_id}}}
+
+        with patch.object(self.client, "_make_request") as mock_request:
+            mock_request.side_effect = [
+                {"studies": [study("NCT1"), study("NCT2")], "nextPageToken": "t1"},
+                {"studies": [study("NCT3")], "nextPageToken": "t2"},
+                {"studies": [study("NCT4")]},
+            ]
+
+            pages = [
+                page
+                async for page in self.client.iter_search(
+                    condition="cancer", page_size=2
+                )
+            ]
+
+        assert [len(page) for page in pages] == [2, 1, 1]
+        calls = [call.args[1] for call in mock_request.call_args_list]
+        assert [c.get("pageToken") for c in calls] == [None, "t1", "t2"]
+        assert all(c["query.cond"] == "cancer" for c in calls)
+        assert all(c["fields"] == ",".join(STUDY_DOCUMENT_FIELDS) for c in calls)
+
+    @pytest.mark.asyncio
+    async def test_iter_search_stops_at_limit(self):
+        """Test that the cursor stops once the limit is reached."""
+        studies = [
+            {"protocolSection": {"identificationModule": {"nctId": f"NCT{i}"}}}
+            for i in range(3)
+        ]
+
+        with patch.object(self.client, "_make_request") as mock_request:
+            mock_request.side_effect = [
+                {"studies": studies, "nextPageToken": "t1"},
+                {"studies": studies, "nextPageToken": "t2"},
+            ]
+
+            pages = [
+                page
+                async for page in self.client.iter_search(
+                    limit=5, page_size=3, fields=None
+                )
+            ]
+
+        assert [len(page) for page in pages] == [3, 2]
+        calls = [call.args[1] for call in mock_request.call_args_list]
+        assert [c["pageSize"] for c in calls] == [3, 2]
+        assert "fields" not in calls[0]
+
+    @pytest.mark.asyncio
+    async def test_search_collects_ids_across_pages(self):
+        """Test that search_trials is no longer truncated to one page."""
+        with patch.object(self.client, "_make_request") as mock_request:
+            mock_request.side_effect = [
+                {
+                    "studies": [
+                        {"protocolSection": {"identificationModule": {"nctId": "NCT1"}}}
+                    ],
+                    "nextPageToken": "t1",
+                },
+                {
+                    "studies": [
+                        {"protocolSection": {"identificationModule": {"nctId": "NCT2"}}}
+                    ]
+                },
+            ]
+
+            nct_ids = await self.client.search_trials(condition="cancer", limit=200)
+
+        assert nct_ids == ["NCT1", "NCT2"]
+        assert mock_request.call_args_list[0].args[1]["fields"] == "NCTId"
+
     @pytest.mark.asyncio
     async def test_get_study_success(self):
         """Test successful single study retrieval."""
@@ -315,6 +407,33 @@ class TestClinicalTrialsClient:
                 == "NCT12345678"
             )
 
+    @pytest.mark.asyncio
+    async def test_concurrent_get_study_shares_one_request(self):
+        """Test identical concurrent lookups are sent upstream once."""
+        mock_study_data = {
+            "protocolSection": {"identificationModule": {"nctId": "NCT12345678"}}
+        }
+        mock_response_obj = Mock()
+        mock_response_obj.json.return_value = {"studies": [mock_study_data]}
+        mock_response_obj.raise_for_status.return_value = None
+
+        async def slow_get(url, params):
+            await asyncio.sleep(0.01)
+            return mock_response_obj
+
+        self.client.session = Mock()
+        self.client.session.get = AsyncMock(side_effect=slow_get)
+        other = ClinicalTrialsClient(self.client.config)
+
+        studies = await asyncio.gather(
+            self.client.get_study("NCT12345678"),
+            self.client.get_study("NCT12345678"),
+            other.get_study("NCT12345678"),
+        )
+
+        assert studies == [mock_study_data] * 3
+        assert self.client.session.get.call_count == 1
+
     @pytest.mark.asyncio
     async def test_get_study_not_found(self):
         """Test handling when study is not found."""
@@ -343,7 +462,7 @@ class TestClinicalTrialsClient:
 
     @pytest.mark.asyncio
     async def test_get_studies_batch_success(self):
-        """Test successful batch study retrieval."""
+        """Test batch retrieval uses filter.ids and follows nextPageToken."""
         mock_study1 = {
             "protocolSection": {"identificationModule": {"nctId": "NCT11111111"}}
         }
@@ -351,27 +470,80 @@ class TestClinicalTrialsClient:
             "protocolSection": {"identificationModule": {"nctId": "NCT22222222"}}
         }
 
-        with patch.object(self.client, "get_study") as mock_get_study:
-            mock_get_study.side_effect = [mock_study1, mock_study2]
+        with patch.object(self.client, "_make_request") as mock_request:
+            mock_request.side_effect = [
+                {"studies": [mock_study2], "nextPageToken": "page2"},
+                {"studies": [mock_study1]},
+            ]
 
             studies = await self.client.get_studies_batch(
                 ["NCT11111111", "NCT22222222"]
             )
 
-            assert len(studies) == 2
-            assert studies[0] == mock_study1
-            assert studies[1] == mock_study2
+            # Returned in requested order
+            assert studies == [mock_study1, mock_study2]
+
+            first_params = mock_request.call_args_list[0].args[1]
+            second_params = mock_request.call_args_list[1].args[1]
+            assert first_params["filter.ids"] == "NCT11111111,NCT22222222"
+            assert first_params["pageSize"] == 2
+            assert "pageToken" not in first_params
+            assert second_params["pageToken"] == "page2"
+            assert second_params["filter.ids"] == first_params["filter.ids"]
+
+    @pytest.mark.asyncio
+    async def test_get_studies_batch_splits_ids(self):
+        """Test that long ID lists are split into batch_fetch_size requests."""
+        self.client.config.batch_fetch_size = 2
+        nct_ids = [f"NCT0000000{i}" for i in range(1, 6)]
+
+        with patch.object(self.client, "_make_request") as mock_request:
+            mock_request.side_effect = lambda url, params: {
+                "studies": [
+                    {"protocolSection": {"identificationModule": {"nctId": nct_id}}}
+                    for nct_id in params["filter.ids"].split(",")
+                ]
+            }
+
+            studies = await self.client.get_studies_batch(nct_ids)
+
+            assert mock_request.call_count == 3
+            assert [
+                s["protocolSection"]["identificationModule"]["nctId"] for s in studies
+            ] == nct_ids
+
+    @pytest.mark.asyncio
+    async def test_get_studies_batch_urls_stay_short(self):
+        """Test large batches are split into URL-safe filter.ids requests."""
+        self.client.config.batch_fetch_size = 1000
+        nct_ids = [f"NCT{i:08d}" for i in range(1000)]
+        urls = []
+
+        def respond(url, params):
+            urls.append(httpx.Request("GET", url, params=params).url)
+            return {"studies": []}
+
+        with patch.object(self.client, "_make_request", side_effect=respond):
+            await self.client.get_studies_batch(nct_ids)
+
+        assert len(urls) == 1000 // MAX_IDS_PER_REQUEST
+        assert max(len(str(url)) for url in urls) < 4096
 
     @pytest.mark.asyncio
     async def test_get_studies_batch_partial_failures(self):
-        """Test batch retrieval with some failures."""
+        """Test batch retrieval keeps studies from requests that succeeded."""
+        self.client.config.batch_fetch_size = 1
         mock_study1 = {
             "protocolSection": {"identificationModule": {"nctId": "NCT11111111"}}
         }
 
-        with patch.object(self.client, "get_study") as mock_get_study:
-            # First succeeds, second returns None, third raises exception
-            mock_get_study.side_effect = [mock_study1, None, Exception("Error")]
+        with patch.object(self.client, "_make_request") as mock_request:
+            # First succeeds, second matches nothing, third fails
+            mock_request.side_effect = [
+                {"studies": [mock_study1]},
+                {"studies": []},
+                ClinicalTrialsAPIError("HTTP 500"),
+            ]
 
             studies = await self.client.get_studies_batch(
                 ["NCT11111111", "NCT22222222", "NCT33333333"]
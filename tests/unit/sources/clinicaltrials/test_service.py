@@ -460,6 +460,7 @@ class TestClinicalTrialsService:
         assert result["sponsor_distribution"]["INDUSTRY"] == 2
         assert result["sponsor_distribution"]["ACADEMIC"] == 1
         assert result["sponsor_distribution"]["NIH"] == 1
+        assert result["status_distribution"] == {"RECRUITING": 4}
 
         # Verify top conditions (Cancer appears twice)
         assert result["top_conditions"][0]["condition"] == "Cancer"
@@ -511,6 +512,7 @@ class TestClinicalTrialsService:
         doc.phase = phase
         doc.sponsor_class = sponsor_class
         doc.sponsor_name = f"Sponsor for {nct_id}"
+        doc.status = "RECRUITING"
         doc.conditions = [condition]
         doc.investment_relevance_score = investment_score
         doc.get_display_title.return_value = f"Study {nct_id}"
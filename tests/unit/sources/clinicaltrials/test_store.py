@@ -0,0 +1,194 @@
+"""
+Tests for the local ClinicalTrials.gov study store.
+
+Uses in-memory SQLite so the ON CONFLICT upsert runs against a real engine.
+"""
+
+from datetime import timedelta
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+import pytest_asyncio
+
+from bio_mcp.shared.clients.database import DatabaseConfig, DatabaseManager
+from bio_mcp.shared.models.database_models import CtgovStudy
+from bio_mcp.sources.clinicaltrials.client import ClinicalTrialsClient
+from bio_mcp.sources.clinicaltrials.models import ClinicalTrialDocument
+from bio_mcp.sources.clinicaltrials.service import ClinicalTrialsService
+from bio_mcp.sources.clinicaltrials.store import ClinicalTrialsStudyStore
+
+
+def _raw_study(nct_id: str, status: str = "RECRUITING") -> dict:
+    return {
+        "protocolSection": {
+            "identificationModule": {"nctId": nct_id, "briefTitle": f"Study {nct_id}"},
+            "statusModule": {
+                "overallStatus": status,
+                "startDateStruct": {"date": "2024-01-15"},
+            },
+            "designModule": {"phases": ["PHASE3"]},
+            "sponsorCollaboratorsModule": {
+                "leadSponsor": {"name": "Acme Bio", "class": "INDUSTRY"}
+            },
+            "conditionsModule": {"conditions": ["Cancer"]},
+        }
+    }
+
+
+def _studies(*raws: dict) -> list[tuple[ClinicalTrialDocument, dict]]:
+    return [(ClinicalTrialDocument.from_api_data(raw), raw) for raw in raws]
+
+
+@pytest_asyncio.fixture
+async def store():
+    manager = DatabaseManager(DatabaseConfig(url="sqlite+aiosqlite:///:memory:"))
+    await manager.initialize()
+    async with manager.engine.begin() as conn:
+        await conn.run_sync(CtgovStudy.__table__.create)
+    yield ClinicalTrialsStudyStore(lambda: manager.get_session())
+    await manager.close()
+
+
+class TestClinicalTrialsStudyStore:
+    """Bulk upsert, change detection and freshness-windowed reads."""
+
+    @pytest.mark.asyncio
+    async def test_upsert_counts_new_updated_unchanged(self, store):
+        first = await store.upsert_studies(
+            _studies(_raw_study("NCT00000001"), _raw_study("NCT00000002"))
+        )
+        second = await store.upsert_studies(
+            _studies(
+                _raw_study("NCT00000001"),
+                _raw_study("NCT00000002", status="COMPLETED"),
+                _raw_study("NCT00000003"),
+            )
+        )
+
+        assert first == {"new": 2, "updated": 0, "unchanged": 0}
+        assert second == {"new": 1, "updated": 1, "unchanged": 1}
+
+        stored = await store.get_studies(["NCT00000002"])
+        assert stored["NCT00000002"].status == "COMPLETED"
+
+    @pytest.mark.asyncio
+    async def test_upsert_rewrites_rescored_studies(self, store):
+        doc, raw = _studies(_raw_study("NCT00000001"))[0]
+        doc.investment_relevance_score = 0.4
+        await store.upsert_studies([(doc, raw)])
+
+        # Same content, new scoring
+        doc.investment_relevance_score = 0.9
+        counts = await store.upsert_studies([(doc, raw)])
+
+        assert counts == {"new": 0, "updated": 1, "unchanged": 0}
+        stored = await store.get_studies(["NCT00000001"])
+        assert stored["NCT00000001"].investment_relevance_score == 0.9
+
+    @pytest.mark.asyncio
+    async def test_get_studies_restores_columns_and_score(self, store):
+        doc, raw = _studies(_raw_study("NCT00000001"))[0]
+        doc.investment_relevance_score = 0.87
+        await store.upsert_studies([(doc, raw)])
+
+        stored = await store.get_studies(["NCT00000001", "NCT99999999"])
+
+        assert list(stored) == ["NCT00000001"]
+        restored = stored["NCT00000001"]
+        assert restored.phase == "PHASE3"
+        assert restored.sponsor_class == "INDUSTRY"
+        assert restored.conditions == ["Cancer"]
+        assert restored.investment_relevance_score == 0.87
+
+    @pytest.mark.asyncio
+    async def test_get_studies_honours_freshness_window(self, store):
+        await store.upsert_studies(_studies(_raw_study("NCT00000001")))
+
+        assert await store.get_studies(["NCT00000001"], max_age=timedelta(hours=1))
+        assert not await store.get_studies(
+            ["NCT00000001"], max_age=timedelta(seconds=-1)
+        )
+
+    @pytest.mark.asyncio
+    async def test_service_reads_local_first_and_writes_through(self, store):
+        await store.upsert_studies(_studies(_raw_study("NCT00000001")))
+
+        client = Mock(spec=ClinicalTrialsClient)
+        client.get_studies_batch = AsyncMock(return_value=[_raw_study("NCT00000002")])
+        service = ClinicalTrialsService(study_store=store)
+        service.client = client
+        service._initialized = True
+
+        documents = await service.get_documents(["NCT00000001", "NCT00000002"])
+        again = await service.get_documents(["NCT00000001", "NCT00000002"])
+
+        assert [doc.nct_id for doc in documents] == ["NCT00000001", "NCT00000002"]
+        assert [doc.nct_id for doc in again] == ["NCT00000001", "NCT00000002"]
+        client.get_studies_batch.assert_called_once_with(["NCT00000002"])
+
+
+class TestInvestmentAggregates:
+    """Investment ranking and summaries computed in SQL over stored trials."""
+
+    async def _store_scored(self, store, scores: dict[str, float]) -> None:
+        studies = []
+        for i, (nct_id, score) in enumerate(scores.items()):
+            raw = _raw_study(nct_id, status="COMPLETED" if i % 2 else "RECRUITING")
+            doc = ClinicalTrialDocument.from_api_data(raw)
+            doc.investment_relevance_score = score
+            studies.append((doc, raw))
+        await store.upsert_studies(studies)
+
+    @pytest.mark.asyncio
+    async def test_rank_by_investment_filters_and_orders(self, store):
+        await self._store_scored(
+            store, {"NCT00000001": 0.4, "NCT00000002": 0.9, "NCT00000003": 0.7}
+        )
+
+        ranked = await store.rank_by_investment(
+            ["NCT00000001", "NCT00000002", "NCT00000003", "NCT99999999"],
+            min_score=0.5,
+            limit=10,
+        )
+
+        assert ranked == ["NCT00000002", "NCT00000003"]
+        assert await store.rank_by_investment(ranked, 0.5, limit=1) == ["NCT00000002"]
+
+    @pytest.mark.asyncio
+    async def test_investment_summary_aggregates_facets(self, store):
+        await self._store_scored(
+            store, {"NCT00000001": 0.4, "NCT00000002": 0.9, "NCT00000003": 0.7}
+        )
+
+        summary = await store.investment_summary(
+            ["NCT00000001", "NCT00000002", "NCT00000003"]
+        )
+
+        assert summary["total_trials"] == 3
+        assert summary["investment_relevant"] == 2
+        assert summary["avg_investment_score"] == 0.67
+        assert summary["phase_distribution"] == {"PHASE3": 3}
+        assert summary["sponsor_distribution"] == {"INDUSTRY": 3}
+        assert summary["status_distribution"] == {"RECRUITING": 2, "COMPLETED": 1}
+        assert summary["top_conditions"] == [{"condition": "Cancer", "count": 3}]
+        assert [trial["nct_id"] for trial in summary["high_value_trials"]] == [
+            "NCT00000002",
+            "NCT00000003",
+            "NCT00000001",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_service_summary_uses_store_without_refetching(self, store):
+        await self._store_scored(store, {"NCT00000001": 0.9})
+
+        client = Mock(spec=ClinicalTrialsClient)
+        client.get_studies_batch = AsyncMock(return_value=[])
+        service = ClinicalTrialsService(study_store=store)
+        service.client = client
+        service._initialized = True
+
+        summary = await service.get_investment_summary(["NCT00000001"])
+
+        assert summary["total_trials"] == 1
+        assert summary["investment_relevant"] == 1
+        client.get_studies_batch.assert_not_called()
@@ -3,15 +3,28 @@ Unit tests for ClinicalTrials.gov sync strategy.
 """
 
 from datetime import datetime, timedelta
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 
 from bio_mcp.shared.utils.checkpoints import CheckpointManager
 from bio_mcp.sources.clinicaltrials.client import ClinicalTrialsClient
+from bio_mcp.sources.clinicaltrials.store import ClinicalTrialsStudyStore
 from bio_mcp.sources.clinicaltrials.sync_strategy import ClinicalTrialsSyncStrategy
 
 
+def _pages(*pages, error: Exception | None = None):
+    """Mock for ClinicalTrialsClient.iter_search yielding the given pages."""
+
+    async def iter_search(**kwargs):
+        for page in pages:
+            yield page
+        if error:
+            raise error
+
+    return MagicMock(side_effect=iter_search)
+
+
 class TestClinicalTrialsSyncStrategy:
     """Test ClinicalTrials.gov sync strategy functionality."""
 
@@ -57,9 +70,6 @@ class TestClinicalTrialsSyncStrategy:
         self.mock_checkpoint_manager.get_watermark = AsyncMock(return_value=None)
         self.mock_checkpoint_manager.set_watermark = AsyncMock()
 
-        # Mock client responses
-        self.mock_client.search = AsyncMock(return_value=["NCT12345678", "NCT87654321"])
-
         mock_api_data = [
             {
                 "protocolSection": {
@@ -89,7 +99,7 @@ class TestClinicalTrialsSyncStrategy:
             },
         ]
 
-        self.mock_client.get_studies_batch = AsyncMock(return_value=mock_api_data)
+        self.mock_client.iter_search = _pages(mock_api_data)
 
         # Test first sync
         with patch(
@@ -114,13 +124,15 @@ class TestClinicalTrialsSyncStrategy:
         assert "avg_quality_score" in result
 
         # Verify client calls
-        self.mock_client.search.assert_called_once()
-        search_args = self.mock_client.search.call_args[1]
+        self.mock_client.iter_search.assert_called_once()
+        search_args = self.mock_client.iter_search.call_args[1]
 
         # Should search with 90-day lookback for first sync
         assert "updated_after" in search_args
         assert "limit" in search_args
         assert search_args["limit"] == 50
+        assert search_args["page_size"] == 50
+        self.mock_client.get_studies_batch.assert_not_called()
 
         # Verify watermark was set
         self.mock_checkpoint_manager.set_watermark.assert_called_once_with(
@@ -136,7 +148,7 @@ class TestClinicalTrialsSyncStrategy:
         self.mock_checkpoint_manager.set_watermark = AsyncMock()
 
         # Mock empty results
-        self.mock_client.search = AsyncMock(return_value=[])
+        self.mock_client.iter_search = _pages()
 
         # Test incremental sync
         with patch(
@@ -156,8 +168,8 @@ class TestClinicalTrialsSyncStrategy:
         assert result["updated"] == 0
 
         # Verify client was called with overlap
-        self.mock_client.search.assert_called_once()
-        search_args = self.mock_client.search.call_args[1]
+        self.mock_client.iter_search.assert_called_once()
+        search_args = self.mock_client.iter_search.call_args[1]
 
         # Should use 2-day overlap (last_sync - 2 days)
         expected_start = (last_sync - timedelta(days=2)).date()
@@ -174,8 +186,6 @@ class TestClinicalTrialsSyncStrategy:
         self.mock_checkpoint_manager.get_watermark = AsyncMock(return_value=None)
         self.mock_checkpoint_manager.set_watermark = AsyncMock()
 
-        self.mock_client.search = AsyncMock(return_value=["NCT12345678", "NCT99999999"])
-
         # Mock API data with one valid and one invalid study
         mock_api_data = [
             {
@@ -192,7 +202,7 @@ class TestClinicalTrialsSyncStrategy:
             },
         ]
 
-        self.mock_client.get_studies_batch = AsyncMock(return_value=mock_api_data)
+        self.mock_client.iter_search = _pages(mock_api_data)
 
         result = await self.sync_strategy.sync_incremental(
             "condition:cancer", "cancer_sync", 50
@@ -205,13 +215,79 @@ class TestClinicalTrialsSyncStrategy:
         # Parse errors might be 0 or 1 depending on how the invalid data is handled
         assert result["parse_errors"] >= 0
 
+    @pytest.mark.asyncio
+    async def test_sync_incremental_parses_every_page(self):
+        """Test that all pages from the cursor are parsed, not just the first."""
+        self.mock_checkpoint_manager.get_watermark = AsyncMock(return_value=None)
+        self.mock_checkpoint_manager.set_watermark = AsyncMock()
+
+        def study(nct_id: str) -> dict:
+            return {
+                "protocolSection": {
+                    "identificationModule": {"nctId": nct_id, "briefTitle": nct_id}
+                }
+            }
+
+        self.mock_client.iter_search = _pages(
+            [study("NCT00000001"), study("NCT00000002")], [study("NCT00000003")]
+        )
+
+        result = await self.sync_strategy.sync_incremental(
+            "condition:cancer", "cancer_sync", 500, batch_size=2
+        )
+
+        assert result["success"] is True
+        assert result["synced"] == 3
+        assert result["quality_metrics"]["total_trials"] == 3
+
+    @pytest.mark.asyncio
+    async def test_sync_incremental_upserts_each_page_into_store(self):
+        """Test that pages are persisted and store counts are reported."""
+        self.mock_checkpoint_manager.get_watermark = AsyncMock(return_value=None)
+        self.mock_checkpoint_manager.set_watermark = AsyncMock()
+
+        def study(nct_id: str) -> dict:
+            return {
+                "protocolSection": {
+                    "identificationModule": {"nctId": nct_id, "briefTitle": nct_id}
+                }
+            }
+
+        pages = [[study("NCT00000001"), study("NCT00000002")], [study("NCT00000003")]]
+        self.mock_client.iter_search = _pages(*pages)
+
+        stored: list[list] = []
+
+        async def upsert_studies(studies):
+            stored.append(list(studies))
+            return {"new": 1, "updated": len(stored[-1]) - 1, "unchanged": 0}
+
+        study_store = Mock(spec=ClinicalTrialsStudyStore)
+        study_store.upsert_studies = AsyncMock(side_effect=upsert_studies)
+        strategy = ClinicalTrialsSyncStrategy(
+            self.mock_checkpoint_manager, self.mock_client, study_store
+        )
+
+        result = await strategy.sync_incremental(
+            "condition:cancer", "cancer_sync", 500, batch_size=2
+        )
+
+        assert result["success"] is True
+        assert (result["new"], result["updated"], result["unchanged"]) == (2, 1, 0)
+        assert [[doc.nct_id for doc, _ in page] for page in stored] == [
+            ["NCT00000001", "NCT00000002"],
+            ["NCT00000003"],
+        ]
+        # Each document is stored alongside its own raw API study
+        assert all(raw is pages[0][i] for i, (_, raw) in enumerate(stored[0]))
+
     @pytest.mark.asyncio
     async def test_sync_incremental_client_error(self):
         """Test incremental sync handling client errors."""
         self.mock_checkpoint_manager.get_watermark = AsyncMock(return_value=None)
 
         # Mock client search failure
-        self.mock_client.search = AsyncMock(side_effect=Exception("API Error"))
+        self.mock_client.iter_search = _pages(error=Exception("API Error"))
 
         result = await self.sync_strategy.sync_incremental(
             "condition:cancer", "cancer_sync", 50
@@ -349,8 +425,6 @@ class TestClinicalTrialsSyncStrategy:
         self.mock_checkpoint_manager.get_watermark = AsyncMock(return_value=None)
         self.mock_checkpoint_manager.set_watermark = AsyncMock()
 
-        self.mock_client.search = AsyncMock(return_value=["NCT12345678"])
-
         # Mock high-value trial data
         mock_api_data = [
             {
@@ -375,7 +449,7 @@ class TestClinicalTrialsSyncStrategy:
             }
         ]
 
-        self.mock_client.get_studies_batch = AsyncMock(return_value=mock_api_data)
+        self.mock_client.iter_search = _pages(mock_api_data)
 
         result = await self.sync_strategy.sync_incremental(
             "condition:cancer", "high_value_cancer", 10
@@ -0,0 +1,150 @@
+"""
+Unit tests for PubMed EFetch paging in PubMedClient.
+"""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from bio_mcp.sources.pubmed.client import (
+    EFETCH_MAX_IDS_PER_REQUEST,
+    PubMedClient,
+    PubMedConfig,
+    PubMedSearchResult,
+)
+
+
+def _efetch_payload(pmids: list[str]) -> bytes:
+    articles = "".join(
+        "<PubmedArticle><MedlineCitation>"
+        f"<PMID>{pmid}</PMID><Article><ArticleTitle>Title {pmid}</ArticleTitle></Article>"
+        "</MedlineCitation></PubmedArticle>"
+        for pmid in pmids
+    )
+    return f"<PubmedArticleSet>{articles}</PubmedArticleSet>".encode()
+
+
+def _stream(payload_for):
+    """Mock for PubMedClient._stream_xml yielding the payload in small chunks."""
+
+    async def stream_xml(url, params):
+        payload = payload_for(params)
+        for start in range(0, len(payload), 64):
+            yield payload[start : start + 64]
+
+    return MagicMock(side_effect=stream_xml)
+
+
+class TestPubMedEFetchPaging:
+    """Test paged EFetch via ID batches and the history server."""
+
+    def setup_method(self):
+        self.client = PubMedClient(PubMedConfig(rate_limit_per_second=100))
+
+    @pytest.mark.asyncio
+    async def test_iter_documents_uses_history_server(self):
+        search_result = PubMedSearchResult(
+            query="glioblastoma",
+            total_count=5000,
+            pmids=[str(i) for i in range(450)],
+            web_env="MCID_abc",
+            query_key="1",
+        )
+        self.client._stream_xml = _stream(
+            lambda params: _efetch_payload(
+                [f"{params['retstart']}-{n}" for n in range(int(params["retmax"]))]
+            )
+        )
+
+        batches = [
+            batch async for batch in self.client.iter_documents(search_result, 200)
+        ]
+
+        assert [len(batch) for batch in batches] == [200, 200, 50]
+        calls = [call.args[1] for call in self.client._stream_xml.call_args_list]
+        assert [(c["retstart"], c["retmax"]) for c in calls] == [
+            ("0", "200"),
+            ("200", "200"),
+            ("400", "50"),
+        ]
+        assert all(c["WebEnv"] == "MCID_abc" and c["query_key"] == "1" for c in calls)
+        assert all("id" not in c for c in calls)
+
+    @pytest.mark.asyncio
+    async def test_iter_documents_fetches_explicit_pmid_subset(self):
+        search_result = PubMedSearchResult(
+            query="q", total_count=3, pmids=["1", "2", "3"], web_env="W", query_key="1"
+        )
+        self.client._stream_xml = _stream(
+            lambda params: _efetch_payload(params["id"].split(","))
+        )
+
+        batches = [
+            batch
+            async for batch in self.client.iter_documents(
+                search_result, batch_size=1, pmids=["1", "3"]
+            )
+        ]
+
+        assert [[doc.pmid for doc in batch] for batch in batches] == [["1"], ["3"]]
+
+    @pytest.mark.asyncio
+    async def test_fetch_documents_splits_long_id_lists(self):
+        pmids = [str(i) for i in range(EFETCH_MAX_IDS_PER_REQUEST + 10)]
+        self.client._stream_xml = _stream(
+            lambda params: _efetch_payload(params["id"].split(","))
+        )
+
+        documents = await self.client.fetch_documents(pmids)
+
+        assert [doc.pmid for doc in documents] == pmids
+        assert self.client._stream_xml.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_malformed_xml_keeps_articles_parsed_so_far(self):
+        self.client._stream_xml = _stream(
+            lambda params: _efetch_payload(["1"])[:-19] + b"<broken"
+        )
+
+        documents = await self.client.fetch_documents(["1", "2"])
+
+        assert [doc.pmid for doc in documents] == ["1"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_fetches_share_overlapping_pmids(self):
+        other = PubMedClient(PubMedConfig(rate_limit_per_second=100))
+        self.client._stream_xml = _stream(
+            lambda params: _efetch_payload(params["id"].split(","))
+        )
+
+        first, second = await asyncio.gather(
+            self.client.fetch_documents(["1", "2"]),
+            other.fetch_documents(["2", "3"]),
+        )
+
+        assert [doc.pmid for doc in first] == ["1", "2"]
+        assert [doc.pmid for doc in second] == ["2", "3"]
+        assert self.client._stream_xml.call_count == 1
+        assert self.client._stream_xml.call_args.args[1]["id"] == "1,2,3"
+
+    @pytest.mark.asyncio
+    async def test_clients_with_other_api_key_fetch_separately(self):
+        other = PubMedClient(PubMedConfig(api_key="other", rate_limit_per_second=100))
+        self.client._stream_xml = _stream(
+            lambda params: _efetch_payload(params["id"].split(","))
+        )
+        other._stream_xml = _stream(
+            lambda params: _efetch_payload(params["id"].split(","))
+        )
+
+        first, second = await asyncio.gather(
+            self.client.fetch_documents(["1", "2"]),
+            other.fetch_documents(["2", "3"]),
+        )
+
+        assert [doc.pmid for doc in first] == ["1", "2"]
+        assert [doc.pmid for doc in second] == ["2", "3"]
+        # Different credentials: each client fetches its own IDs itself
+        assert self.client._stream_xml.call_args.args[1]["id"] == "1,2"
+        assert other._stream_xml.call_args.args[1]["id"] == "2,3"
@@ -0,0 +1,99 @@
+"""
+Unit tests for the streaming PubMed EFetch parser.
+"""
+
+import io
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from bio_mcp.sources.pubmed.parser import (
+    EFetchStreamParser,
+    iter_efetch_documents,
+    parse_efetch_xml,
+)
+
+FIXTURE = Path(__file__).parents[3] / "fixtures" / "pubmed" / "efetch_sample.xml"
+
+
+@pytest.fixture
+def efetch_xml() -> bytes:
+    return FIXTURE.read_bytes()
+
+
+class TestEFetchStreamParser:
+    """Test article extraction from recorded EFetch XML."""
+
+    def test_parses_all_fields(self, efetch_xml):
+        documents = parse_efetch_xml(efetch_xml)
+
+        assert [doc.pmid for doc in documents] == ["38012345", "37998877", "37990001"]
+        doc = documents[0]
+        assert doc.title == (
+            "Neoadjuvant pembrolizumab in EGFR-mutant non-small cell lung cancer: "
+            "a phase 2 trial."
+        )
+        assert doc.abstract.startswith(
+            "Immune checkpoint blockade has shown limited activity in EGFR-mutant"
+        )
+        assert doc.abstract.endswith(
+            "Neoadjuvant pembrolizumab was feasible and active."
+        )
+        assert doc.authors == ["Chen W", "Garcia M"]
+        assert doc.journal == "Nature medicine"
+        assert doc.publication_date == date(2024, 1, 18)
+        assert doc.doi == "10.1038/s41591-023-02745-1"
+
+    def test_extracts_mesh_terms_and_keywords(self, efetch_xml):
+        documents = {doc.pmid: doc for doc in parse_efetch_xml(efetch_xml)}
+
+        assert documents["38012345"].mesh_terms == [
+            "Carcinoma, Non-Small-Cell Lung",
+            "ErbB Receptors",
+            "Neoadjuvant Therapy",
+        ]
+        assert documents["38012345"].keywords == ["immunotherapy", "PD-1"]
+        assert documents["37998877"].mesh_terms == []
+        assert documents["37998877"].keywords == [
+            "CAR-T",
+            "diffuse large B-cell lymphoma",
+        ]
+        assert documents["37990001"].keywords == []
+
+    def test_optional_fields_default_to_empty(self, efetch_xml):
+        doc = parse_efetch_xml(efetch_xml)[2]
+
+        assert doc.abstract is None
+        assert doc.publication_date is None
+        assert parse_efetch_xml(efetch_xml)[1].doi is None
+
+    def test_small_chunks_match_single_feed(self, efetch_xml):
+        chunks = [efetch_xml[i : i + 37] for i in range(0, len(efetch_xml), 37)]
+
+        assert parse_efetch_xml(chunks) == parse_efetch_xml(efetch_xml)
+
+    def test_articles_emitted_as_they_close(self, efetch_xml):
+        split = efetch_xml.index(b"</PubmedArticle>") + len(b"</PubmedArticle>")
+        parser = EFetchStreamParser()
+
+        first = parser.feed(efetch_xml[:split])
+        rest = parser.feed(efetch_xml[split:]) + parser.close()
+
+        assert [doc.pmid for doc in first] == ["38012345"]
+        assert [doc.pmid for doc in rest] == ["37998877", "37990001"]
+
+    def test_finished_articles_are_released(self, efetch_xml):
+        parser = EFetchStreamParser()
+        parser.feed(efetch_xml)
+        parser.close()
+
+        assert len(parser._root) == 0
+
+    def test_iter_from_file_object(self, efetch_xml):
+        documents = list(iter_efetch_documents(io.BytesIO(efetch_xml)))
+
+        assert len(documents) == 3
+
+    def test_empty_result_set(self):
+        assert parse_efetch_xml(b"<PubmedArticleSet></PubmedArticleSet>") == []
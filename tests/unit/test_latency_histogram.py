@@ -0,0 +1,95 @@
+"""
+Tests for the fixed-memory streaming latency histogram.
+"""
+
+import random
+
+import pytest
+
+from bio_mcp.monitoring.histogram import LatencyHistogram
+from bio_mcp.monitoring.metrics import MetricsCollector
+
+
+class TestLatencyHistogram:
+    """Quantile accuracy, bounded memory, export buckets and merging."""
+
+    def test_empty_histogram(self):
+        histogram = LatencyHistogram()
+
+        assert histogram.count == 0
+        assert histogram.quantile(0.5) == 0.0
+        assert histogram.mean == 0.0
+
+    def test_quantiles_within_relative_accuracy(self):
+        rng = random.Random(42)
+        values = sorted(rng.lognormvariate(4, 1) for _ in range(20000))
+        histogram = LatencyHistogram(relative_accuracy=0.01)
+        for value in values:
+            histogram.record(value)
+
+        for q in (0.5, 0.95, 0.99):
+            exact = values[int(q * (len(values) - 1))]
+            assert histogram.quantile(q) == pytest.approx(exact, rel=0.02)
+        assert histogram.count == len(values)
+        assert histogram.sum == pytest.approx(sum(values))
+        assert histogram.min == values[0]
+        assert histogram.max == values[-1]
+
+    def test_memory_bounded_by_range_not_samples(self):
+        histogram = LatencyHistogram()
+        for i in range(100000):
+            histogram.record(1 + i % 1000)
+
+        # 1ms..1s at 1% accuracy needs a few hundred buckets at most
+        assert len(histogram._buckets) < 400
+
+    def test_cumulative_counts_are_prometheus_le_buckets(self):
+        histogram = LatencyHistogram()
+        for value in [0, 10, 50, 100, 200, 500, 1000, 2000, 5000]:
+            histogram.record(value)
+
+        counts = dict(histogram.cumulative_counts([10, 100, 1000, 10000]))
+
+        assert counts == {10: 2, 100: 4, 1000: 7, 10000: 9}
+
+    def test_merge_and_snapshot(self):
+        first, second = LatencyHistogram(), LatencyHistogram()
+        for value in range(1, 101):
+            first.record(value)
+            second.record(value + 100)
+
+        merged = first.snapshot()
+        merged.merge(second)
+
+        assert merged.count == 200
+        assert merged.min == 1 and merged.max == 200
+        assert merged.quantile(0.5) == pytest.approx(100, rel=0.02)
+        assert first.count == 100  # Snapshot is independent
+
+    def test_merge_rejects_different_accuracy(self):
+        with pytest.raises(ValueError):
+            LatencyHistogram(0.01).merge(LatencyHistogram(0.05))
+
+
+class TestToolMetricsCollector:
+    """Tool duration stats come from the streaming histogram."""
+
+    def test_tool_and_server_metrics(self):
+        collector = MetricsCollector()
+        for duration in [10.0, 20.0, 30.0, 40.0]:
+            collector.record_tool_call("pubmed.search", duration)
+        collector.record_tool_call("pubmed.search", 50.0, success=False)
+
+        tool = collector.get_tool_metrics("pubmed.search")
+        assert tool.call_count == 5
+        assert tool.error_count == 1
+        assert tool.total_duration_ms == 150.0
+        assert tool.avg_duration_ms == 30.0
+        assert tool.min_duration_ms == 10.0
+        assert tool.max_duration_ms == 50.0
+        assert tool.p50_duration_ms == pytest.approx(30.0, rel=0.02)
+
+        server = collector.get_all_metrics()
+        assert server.total_requests == 5
+        assert [t.name for t in server.tools] == ["pubmed.search"]
+        assert collector.get_duration_histograms()["pubmed.search"].count == 5
@@ -0,0 +1,168 @@
+"""
+Tests for the process-wide upstream rate governor.
+"""
+
+import asyncio
+import time
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+
+import pytest
+
+from bio_mcp.shared.core.rate_governor import (
+    Priority,
+    RateGovernor,
+    UpstreamBudget,
+    background_priority,
+    parse_retry_after,
+    upstream_priority,
+)
+
+
+class TestParseRetryAfter:
+    """Retry-After header parsing."""
+
+    def test_delta_seconds(self):
+        assert parse_retry_after("3") == 3.0
+        assert parse_retry_after("-1") == 0.0
+
+    def test_http_date(self):
+        retry_at = datetime.now(UTC) + timedelta(seconds=30)
+        seconds = parse_retry_after(format_datetime(retry_at, usegmt=True))
+
+        assert seconds is not None
+        assert 25 <= seconds <= 30
+
+    def test_missing_or_invalid(self):
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("") is None
+        assert parse_retry_after("soon") is None
+
+
+class TestUpstreamBudget:
+    """Token bucket with priorities, AIMD back-off and metrics."""
+
+    def test_rejects_non_positive_rate(self):
+        with pytest.raises(ValueError):
+            UpstreamBudget("test", 0)
+
+    @pytest.mark.asyncio
+    async def test_burst_then_paced(self):
+        budget = UpstreamBudget("test", rate_per_second=20, burst=2)
+
+        start = time.monotonic()
+        for _ in range(3):
+            await budget.acquire()
+        elapsed = time.monotonic() - start
+
+        assert 0.04 <= elapsed < 0.5
+
+    @pytest.mark.asyncio
+    async def test_interactive_served_before_background(self):
+        budget = UpstreamBudget("test", rate_per_second=50)
+        await budget.acquire()  # Drain the bucket so the callers below queue
+        order = []
+
+        async def call(label: str, priority: Priority):
+            await budget.acquire(priority=priority)
+            order.append(label)
+
+        background = [
+            asyncio.create_task(call(f"bg{i}", Priority.BACKGROUND)) for i in range(3)
+        ]
+        await asyncio.sleep(0)
+        interactive = asyncio.create_task(call("live", Priority.INTERACTIVE))
+        await asyncio.gather(*background, interactive)
+
+        assert order[0] == "live"
+        assert order[1:] == ["bg0", "bg1", "bg2"]
+
+    @pytest.mark.asyncio
+    async def test_priority_follows_context(self):
+        budget = UpstreamBudget("test", rate_per_second=100, burst=5)
+
+        @background_priority
+        async def sync_job():
+            await budget.acquire()
+
+        await sync_job()
+        with upstream_priority(Priority.BACKGROUND):
+            await budget.acquire()
+        await budget.acquire()
+
+        acquired = budget.snapshot()["acquired"]
+        assert acquired == {"interactive": 1, "background": 2}
+
+    @pytest.mark.asyncio
+    async def test_throttle_halves_rate_and_recovers(self):
+        budget = UpstreamBudget("test", rate_per_second=10)
+
+        budget.on_throttled(retry_after=0)
+        assert budget.get_current_rate() == 5
+        budget.on_throttled(retry_after=0)
+        budget.on_throttled(retry_after=0)
+        budget.on_throttled(retry_after=0)
+        assert budget.get_current_rate() == 1  # Floor at a tenth of the rate
+
+        for _ in range(UpstreamBudget.RECOVERY_STEPS):
+            budget.on_success()
+        assert budget.get_current_rate() == pytest.approx(10)
+        assert budget.snapshot()["throttled"] == 4
+
+    @pytest.mark.asyncio
+    async def test_retry_after_pauses_waiters(self):
+        budget = UpstreamBudget("test", rate_per_second=1000, burst=10)
+
+        budget.on_throttled(retry_after=0.1)
+        start = time.monotonic()
+        await budget.acquire()
+
+        assert time.monotonic() - start >= 0.09
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_leaves_queue(self):
+        budget = UpstreamBudget("test", rate_per_second=1)
+        await budget.acquire()
+
+        waiter = asyncio.create_task(budget.acquire())
+        await asyncio.sleep(0)
+        assert budget.snapshot()["queued"] == 1
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert budget.snapshot()["queued"] == 0
+
+
+class TestRateGovernor:
+    """Named budget registry."""
+
+    def test_most_restrictive_registration_wins(self):
+        governor = RateGovernor()
+
+        first = governor.register("ncbi-eutils", 3)
+        second = governor.register("ncbi-eutils", 10)
+
+        assert first is second
+        assert second.max_rate == 3
+        assert governor.get("ncbi-eutils") is first
+        assert governor.get("openai") is None
+
+        third = governor.register("ncbi-eutils", 1)
+        assert third is first
+        assert first.max_rate == 1
+        assert first.get_current_rate() == 1
+        assert first.min_rate == pytest.approx(0.1)
+
+    def test_metrics_and_reset(self):
+        governor = RateGovernor()
+        governor.register("ctgov-v2", 5)
+        governor.register("openai", 5, burst=10)
+
+        metrics = governor.metrics()
+        assert set(metrics) == {"ctgov-v2", "openai"}
+        assert metrics["ctgov-v2"]["rate_per_second"] == 5
+        assert metrics["ctgov-v2"]["queued"] == 0
+
+        governor.reset()
+        assert governor.metrics() == {}
@@ -0,0 +1,196 @@
+"""
+Tests for upstream request coalescing (single-flight and batch merging).
+"""
+
+import asyncio
+
+import pytest
+
+from bio_mcp.shared.core.single_flight import (
+    BatchCoalescer,
+    CoalescingRegistry,
+    SingleFlight,
+    request_key,
+    scoped_name,
+)
+
+
+class TestRequestKey:
+    """Canonical request keys."""
+
+    def test_ignores_parameter_order_and_none(self):
+        first = request_key("https://x/esearch", {"term": "egfr", "retmax": 20})
+        second = request_key(
+            "https://x/esearch", {"retmax": "20", "sort": None, "term": "egfr"}
+        )
+
+        assert first == second
+        assert first != request_key("https://x/esearch", {"term": "kras"})
+
+
+class TestSingleFlight:
+    """Sharing one in-flight call between identical concurrent callers."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_calls_share_one_request(self):
+        flight = SingleFlight("test")
+        calls = 0
+
+        async def request():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"count": calls}
+
+        results = await asyncio.gather(*(flight.do("k", request) for _ in range(5)))
+
+        assert calls == 1
+        assert all(result is results[0] for result in results)
+        assert flight.stats() == {"calls": 5, "shared": 4, "in_flight": 0}
+
+    @pytest.mark.asyncio
+    async def test_sequential_calls_are_not_cached(self):
+        flight = SingleFlight("test")
+        calls = 0
+
+        async def request():
+            nonlocal calls
+            calls += 1
+            return calls
+
+        assert await flight.do("k", request) == 1
+        assert await flight.do("k", request) == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_reach_every_caller(self):
+        flight = SingleFlight("test")
+
+        async def request():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("HTTP 500")
+
+        results = await asyncio.gather(
+            flight.do("k", request), flight.do("k", request), return_exceptions=True
+        )
+
+        assert [type(result) for result in results] == [RuntimeError, RuntimeError]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        flight = SingleFlight("test")
+        started = asyncio.Event()
+
+        async def request():
+            started.set()
+            await asyncio.sleep(0.02)
+            return "done"
+
+        first = asyncio.create_task(flight.do("k", request))
+        second = asyncio.create_task(flight.do("k", request))
+        await started.wait()
+        first.cancel()
+
+        assert await second == "done"
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+
+class TestBatchCoalescer:
+    """Merging overlapping ID lookups into shared batches."""
+
+    def setup_method(self):
+        self.coalescer = BatchCoalescer("test", key_of=lambda item: item["id"])
+        self.batches: list[list[str]] = []
+
+    async def _fetch_batch(self, ids: list[str]) -> list[dict]:
+        self.batches.append(ids)
+        await asyncio.sleep(0.01)
+        return [{"id": key} for key in ids if key != "missing"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_merge_into_one_batch(self):
+        first, second = await asyncio.gather(
+            self.coalescer.fetch(["1", "2"], self._fetch_batch, 10),
+            self.coalescer.fetch(["2", "3", "missing"], self._fetch_batch, 10),
+        )
+
+        assert self.batches == [["1", "2", "3", "missing"]]
+        assert [item["id"] for item in first] == ["1", "2"]
+        assert [item["id"] for item in second] == ["2", "3"]
+        assert first[1] is second[0]
+        assert self.coalescer.stats() == {
+            "requested": 5,
+            "shared": 1,
+            "batches": 1,
+            "in_flight": 0,
+        }
+
+    @pytest.mark.asyncio
+    async def test_later_lookup_joins_ids_in_flight(self):
+        first = asyncio.create_task(
+            self.coalescer.fetch(["1", "2"], self._fetch_batch, 10)
+        )
+        await asyncio.sleep(0.001)  # First batch is now in flight
+        second = await self.coalescer.fetch(["2", "3"], self._fetch_batch, 10)
+
+        assert [item["id"] for item in await first] == ["1", "2"]
+        assert [item["id"] for item in second] == ["2", "3"]
+        assert self.batches == [["1", "2"], ["3"]]
+
+    @pytest.mark.asyncio
+    async def test_batches_respect_batch_size(self):
+        items = await self.coalescer.fetch(
+            ["1", "2", "3", "4", "5"], self._fetch_batch, 2
+        )
+
+        assert [item["id"] for item in items] == ["1", "2", "3", "4", "5"]
+        assert self.batches == [["1", "2"], ["3", "4"], ["5"]]
+
+    @pytest.mark.asyncio
+    async def test_unrequested_items_follow_requested_ones(self):
+        async def fetch_with_alias(ids):
+            return [{"id": "NEW1"}, {"id": ids[0]}]
+
+        items = await self.coalescer.fetch(["OLD1", "A"], fetch_with_alias, 10)
+
+        assert [item["id"] for item in items] == ["OLD1", "NEW1"]
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_fails_only_its_callers(self):
+        async def flaky(ids):
+            if "bad" in ids:
+                raise RuntimeError("HTTP 500")
+            return [{"id": key} for key in ids]
+
+        with pytest.raises(RuntimeError):
+            await self.coalescer.fetch(["ok", "bad"], flaky, 1)
+        items = await self.coalescer.fetch(["ok"], flaky, 1)
+        assert [item["id"] for item in items] == ["ok"]
+        assert self.coalescer.stats()["in_flight"] == 0
+
+
+class TestCoalescingRegistry:
+    """Named groups shared across the process."""
+
+    def test_groups_are_shared_by_name(self):
+        registry = CoalescingRegistry()
+
+        assert registry.single_flight("ncbi-eutils") is registry.single_flight(
+            "ncbi-eutils"
+        )
+        batch = registry.batch("ctgov-v2.studies", key_of=str)
+        assert registry.batch("ctgov-v2.studies", key_of=repr) is batch
+        assert set(registry.metrics()) == {"ncbi-eutils", "ctgov-v2.studies"}
+
+        registry.reset()
+        assert registry.metrics() == {}
+
+    def test_scoped_names_separate_settings_and_hide_them(self):
+        name = scoped_name("ncbi-eutils.efetch", "https://x/", "secret-key", 200)
+
+        assert name == scoped_name(
+            "ncbi-eutils.efetch", "https://x/", "secret-key", 200
+        )
+        assert name != scoped_name("ncbi-eutils.efetch", "https://x/", None, 200)
+        assert name.startswith("ncbi-eutils.efetch:")
+        assert "secret-key" not in name